@@ -0,0 +1,83 @@
+"""
+benchmarks of the kinematics predictions of GalKin
+"""
+import numpy as np
+
+from lenstronomy.GalKin.galkin import Galkin
+
+kwargs_model = {'mass_profile_list': ['SPP'], 'light_profile_list': ['HERNQUIST'], 'anisotropy_model': 'OM'}
+kwargs_mass = [{'theta_E': 1.2, 'gamma': 2.}]
+kwargs_light = [{'Rs': 0.551 * 1.5, 'amp': 1.}]
+kwargs_anisotropy = {'r_ani': 2.}
+kwargs_cosmo = {'d_d': 1000, 'd_s': 1500, 'd_ds': 800}
+kwargs_psf = {'psf_type': 'GAUSSIAN', 'fwhm': 0.7}
+kwargs_numerics = {'interpol_grid_num': 1000, 'log_integration': True, 'max_integrate': 100,
+                   'min_integrate': 0.001}
+
+
+class GalkinSlit(object):
+    """
+    luminosity-weighted velocity dispersion in a slit with numerical kinematics
+    """
+    def setup(self):
+        kwargs_aperture = {'aperture_type': 'slit', 'length': 1., 'width': 0.3, 'center_ra': 0, 'center_dec': 0,
+                           'angle': 0}
+        self.galkin = Galkin(kwargs_model, kwargs_aperture, kwargs_psf, kwargs_cosmo, kwargs_numerics)
+
+    def time_dispersion(self):
+        np.random.seed(42)
+        self.galkin.dispersion(kwargs_mass, kwargs_light, kwargs_anisotropy, sampling_number=1000)
+
+
+class GalkinIFU(object):
+    """
+    velocity dispersion map in five IFU shells with numerical kinematics
+    """
+    def setup(self):
+        kwargs_aperture = {'aperture_type': 'IFU_shells', 'r_bins': np.linspace(0, 2, 6), 'center_ra': 0,
+                           'center_dec': 0}
+        self.galkin = Galkin(kwargs_model, kwargs_aperture, kwargs_psf, kwargs_cosmo, kwargs_numerics)
+
+    def time_dispersion_map(self):
+        np.random.seed(42)
+        self.galkin.dispersion_map(kwargs_mass, kwargs_light, kwargs_anisotropy, num_kin_sampling=1000,
+                                   num_psf_sampling=100)
+
+    def peakmem_dispersion_map(self):
+        np.random.seed(42)
+        self.galkin.dispersion_map(kwargs_mass, kwargs_light, kwargs_anisotropy, num_kin_sampling=1000,
+                                   num_psf_sampling=100)
+
+
+class GalkinIFUGrid(object):
+    """
+    velocity dispersion map in five IFU shells with numerical kinematics, integrated on a pixel grid
+    """
+    def setup(self):
+        kwargs_aperture = {'aperture_type': 'IFU_shells', 'r_bins': np.linspace(0, 2, 6), 'center_ra': 0,
+                           'center_dec': 0}
+        self.galkin = Galkin(kwargs_model, kwargs_aperture, kwargs_psf, kwargs_cosmo, kwargs_numerics)
+        # pixel weights of the aperture and PSF kernel
+        self.galkin.dispersion_map_grid(kwargs_mass, kwargs_light, kwargs_anisotropy)
+
+    def time_dispersion_map_grid(self):
+        self.galkin.dispersion_map_grid(kwargs_mass, kwargs_light, kwargs_anisotropy)
+
+
+class GalkinSlitGOM(object):
+    """
+    luminosity-weighted velocity dispersion in a slit with the generalized OM anisotropy, varying beta_inf between
+    the calls as in a sampling of the anisotropy parameters
+    """
+    def setup(self):
+        kwargs_aperture = {'aperture_type': 'slit', 'length': 1., 'width': 0.3, 'center_ra': 0, 'center_dec': 0,
+                           'angle': 0}
+        kwargs_model_gom = dict(kwargs_model, anisotropy_model='GOM')
+        self.galkin = Galkin(kwargs_model_gom, kwargs_aperture, kwargs_psf, kwargs_cosmo, kwargs_numerics)
+        self._beta_inf = 0.5
+
+    def time_dispersion(self):
+        np.random.seed(42)
+        self._beta_inf = 1.3 - self._beta_inf
+        kwargs_anisotropy_gom = {'r_ani': 2., 'beta_inf': self._beta_inf}
+        self.galkin.dispersion(kwargs_mass, kwargs_light, kwargs_anisotropy_gom, sampling_number=1000)
@@ -0,0 +1,132 @@
+"""
+benchmarks of the imaging likelihood (ImageLinearFit and MultiLinear)
+"""
+import numpy as np
+
+import lenstronomy.Util.simulation_util as sim_util
+import lenstronomy.Util.kernel_util as kernel_util
+from lenstronomy.Data.imaging_data import ImageData
+from lenstronomy.Data.psf import PSF
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LensModel.Solver.lens_equation_solver import LensEquationSolver
+from lenstronomy.LightModel.light_model import LightModel
+from lenstronomy.PointSource.point_source import PointSource
+from lenstronomy.ImSim.image_model import ImageModel
+from lenstronomy.ImSim.image_linear_solve import ImageLinearFit
+from lenstronomy.ImSim.MultiBand.multi_linear import MultiLinear
+
+kwargs_lens = [{'theta_E': 1., 'gamma': 2.05, 'e1': 0.1, 'e2': -0.05, 'center_x': 0., 'center_y': 0.},
+               {'gamma1': 0.03, 'gamma2': 0.01}]
+kwargs_lens_light = [{'amp': 20., 'R_sersic': 0.6, 'n_sersic': 3., 'e1': 0.05, 'e2': 0., 'center_x': 0.,
+                      'center_y': 0.}]
+kwargs_source = [{'amp': 30., 'R_sersic': 0.2, 'n_sersic': 1.5, 'e1': -0.1, 'e2': 0.1, 'center_x': 0.05,
+                  'center_y': 0.02}]
+
+
+def _simulate(num_pix, delta_pix, kwargs_psf, kwargs_numerics, lens_model_class, source_model_class,
+              lens_light_model_class, point_source_class, kwargs_source_, kwargs_ps, seed=42):
+    """
+    simulates a noisy image with a fixed seed
+
+    :return: kwargs_data with the simulated image
+    """
+    kwargs_data = sim_util.data_configure_simple(num_pix, delta_pix, exposure_time=500, background_rms=0.05)
+    data_class = ImageData(**kwargs_data)
+    image_model = ImageModel(data_class, PSF(**kwargs_psf), lens_model_class, source_model_class,
+                             lens_light_model_class, point_source_class, kwargs_numerics=kwargs_numerics)
+    image = image_model.image(kwargs_lens, kwargs_source_, kwargs_lens_light, kwargs_ps)
+    np.random.seed(seed)
+    image += np.random.normal(size=image.shape) * 0.05 + np.sqrt(np.maximum(image, 0) / 500.) * \
+        np.random.normal(size=image.shape)
+    kwargs_data['image_data'] = image
+    return kwargs_data
+
+
+class QuadEPLShearSersic(object):
+    """
+    single band 100x100 pixels, EPL+SHEAR lens, Sersic source and lens light and a quadruply imaged point source
+    """
+    def setup(self):
+        lens_model_class = LensModel(['EPL', 'SHEAR'])
+        solver = LensEquationSolver(lens_model_class)
+        x_image, y_image = solver.image_position_from_source(0.05, 0.02, kwargs_lens, min_distance=0.05,
+                                                             search_window=5)
+        self.kwargs_ps = [{'ra_image': x_image, 'dec_image': y_image, 'point_amp': np.ones_like(x_image) * 100}]
+        kernel = kernel_util.kernel_gaussian(kernel_numPix=21, deltaPix=0.05, fwhm=0.15)
+        kwargs_psf = {'psf_type': 'PIXEL', 'kernel_point_source': kernel}
+        kwargs_numerics = {'supersampling_factor': 2}
+        source_model_class = LightModel(['SERSIC_ELLIPSE'])
+        lens_light_model_class = LightModel(['SERSIC_ELLIPSE'])
+        point_source_class = PointSource(['LENSED_POSITION'], fixed_magnification_list=[False])
+        kwargs_data = _simulate(100, 0.05, kwargs_psf, kwargs_numerics, lens_model_class, source_model_class,
+                                lens_light_model_class, point_source_class, kwargs_source, self.kwargs_ps)
+        self.image_fit = ImageLinearFit(ImageData(**kwargs_data), PSF(**kwargs_psf), lens_model_class,
+                                        source_model_class, lens_light_model_class, point_source_class,
+                                        kwargs_numerics=kwargs_numerics)
+
+    def time_likelihood_data_given_model(self):
+        self.image_fit.likelihood_data_given_model(kwargs_lens, kwargs_source, kwargs_lens_light, self.kwargs_ps,
+                                                   source_marg=True)
+
+    def peakmem_likelihood_data_given_model(self):
+        self.image_fit.likelihood_data_given_model(kwargs_lens, kwargs_source, kwargs_lens_light, self.kwargs_ps,
+                                                   source_marg=True)
+
+
+class ShapeletSource(object):
+    """
+    single band 80x80 pixels, EPL+SHEAR lens, Sersic lens light and a shapelet source with n_max=10
+    """
+    def setup(self):
+        lens_model_class = LensModel(['EPL', 'SHEAR'])
+        kwargs_psf = {'psf_type': 'GAUSSIAN', 'fwhm': 0.15, 'truncation': 4, 'pixel_size': 0.05}
+        kwargs_numerics = {'supersampling_factor': 1}
+        source_model_class = LightModel(['SERSIC_ELLIPSE', 'SHAPELETS'])
+        lens_light_model_class = LightModel(['SERSIC_ELLIPSE'])
+        self.kwargs_source = kwargs_source + [{'amp': np.ones(66), 'n_max': 10, 'beta': 0.1, 'center_x': 0.05,
+                                               'center_y': 0.02}]
+        kwargs_data = _simulate(80, 0.05, kwargs_psf, kwargs_numerics, lens_model_class,
+                                LightModel(['SERSIC_ELLIPSE']), lens_light_model_class, None, kwargs_source, None)
+        self.image_fit = ImageLinearFit(ImageData(**kwargs_data), PSF(**kwargs_psf), lens_model_class,
+                                        source_model_class, lens_light_model_class, kwargs_numerics=kwargs_numerics)
+
+    def time_likelihood_data_given_model(self):
+        self.image_fit.likelihood_data_given_model(kwargs_lens, self.kwargs_source, kwargs_lens_light,
+                                                   source_marg=True)
+
+    def time_image_linear_solve(self):
+        self.image_fit.image_linear_solve(kwargs_lens, self.kwargs_source, kwargs_lens_light, inv_bool=True)
+
+    def peakmem_likelihood_data_given_model(self):
+        self.image_fit.likelihood_data_given_model(kwargs_lens, self.kwargs_source, kwargs_lens_light,
+                                                   source_marg=True)
+
+
+class MultiLinearFiveBand(object):
+    """
+    five bands of 60x60 pixels with different PSFs and independent linear amplitudes (MultiLinear)
+    """
+    def setup(self):
+        lens_model_class = LensModel(['EPL', 'SHEAR'])
+        source_model_class = LightModel(['SERSIC_ELLIPSE'])
+        lens_light_model_class = LightModel(['SERSIC_ELLIPSE'])
+        kwargs_numerics = {'supersampling_factor': 2}
+        multi_band_list = []
+        for i, fwhm in enumerate([0.08, 0.1, 0.12, 0.15, 0.2]):
+            kwargs_psf = {'psf_type': 'PIXEL',
+                          'kernel_point_source': kernel_util.kernel_gaussian(kernel_numPix=15, deltaPix=0.05,
+                                                                             fwhm=fwhm)}
+            kwargs_data = _simulate(60, 0.05, kwargs_psf, kwargs_numerics, lens_model_class, source_model_class,
+                                    lens_light_model_class, None, kwargs_source, None, seed=i)
+            multi_band_list.append([kwargs_data, kwargs_psf, kwargs_numerics])
+        kwargs_model = {'lens_model_list': ['EPL', 'SHEAR'], 'source_light_model_list': ['SERSIC_ELLIPSE'],
+                        'lens_light_model_list': ['SERSIC_ELLIPSE']}
+        self.multi_linear = MultiLinear(multi_band_list, kwargs_model)
+
+    def time_likelihood_data_given_model(self):
+        self.multi_linear.likelihood_data_given_model(kwargs_lens, kwargs_source, kwargs_lens_light,
+                                                      source_marg=True)
+
+    def peakmem_likelihood_data_given_model(self):
+        self.multi_linear.likelihood_data_given_model(kwargs_lens, kwargs_source, kwargs_lens_light,
+                                                      source_marg=True)
@@ -0,0 +1,73 @@
+"""
+benchmarks of the import time of lenstronomy and of the construction of a LikelihoodModule, each measured in a fresh
+python interpreter.
+
+IMPORT_BUDGET records the maximal wall time (in seconds, on a single CPU) and the modules which must not be imported
+by the statements. The budget is checked with
+
+    $ python -m benchmarks.run_benchmarks budget
+"""
+from lenstronomy.Util.package_util import measure_import
+
+_likelihood_statement = """
+import numpy as np
+from lenstronomy.Sampling.likelihood import LikelihoodModule
+from lenstronomy.Sampling.parameters import Param
+kwargs_model = {'lens_model_list': ['SIE', 'SHEAR'], 'source_light_model_list': ['SERSIC'],
+                'lens_light_model_list': ['SERSIC'], 'point_source_model_list': ['LENSED_POSITION']}
+kwargs_data = {'image_data': np.zeros((50, 50)), 'background_rms': 0.1, 'exposure_time': 100,
+               'transform_pix2angle': np.eye(2) * 0.05, 'ra_at_xy_0': -1.25, 'dec_at_xy_0': -1.25}
+kwargs_data_joint = {'multi_band_list': [[kwargs_data, {'psf_type': 'GAUSSIAN', 'fwhm': 0.1}, {}]],
+                     'multi_band_type': 'single-band'}
+LikelihoodModule(kwargs_data_joint, kwargs_model, Param(kwargs_model))
+"""
+
+# modules which are slow to import and only needed by specific features (cosmology, plotting, statistics)
+_heavy_modules = ['astropy', 'scipy.stats', 'scipy.signal', 'matplotlib']
+
+IMPORT_BUDGET = {
+    'import_lenstronomy': {'statement': 'import lenstronomy', 'time': 0.05,
+                           'forbidden': ['numpy', 'scipy', 'numba'] + _heavy_modules},
+    'import_fitting_sequence': {'statement': 'import lenstronomy.Workflow.fitting_sequence', 'time': 2.,
+                                'forbidden': _heavy_modules},
+    'likelihood_module': {'statement': _likelihood_statement, 'time': 2.5, 'forbidden': _heavy_modules},
+}
+
+
+def check_budget(repeat=3, verbose=True):
+    """
+    measures the statements of IMPORT_BUDGET and compares them with the budget
+
+    :param repeat: number of measurements per statement (the median is compared with the budget)
+    :param verbose: bool, if True, prints the results
+    :return: list of strings describing the violations of the budget (empty if the budget is met)
+    """
+    violation_list = []
+    for name, budget in IMPORT_BUDGET.items():
+        time_list = []
+        for _ in range(repeat):
+            time_import, modules_imported = measure_import(budget['statement'], modules=budget['forbidden'])
+            time_list.append(time_import)
+        time_median = sorted(time_list)[len(time_list) // 2]
+        if verbose:
+            print('%-30s %8.3f s (budget %.3f s) %s' % (name, time_median, budget['time'],
+                                                         'imports %s' % modules_imported if modules_imported else ''))
+        if time_median > budget['time']:
+            violation_list.append('%s takes %.3f s (budget %.3f s)' % (name, time_median, budget['time']))
+        if len(modules_imported) > 0:
+            violation_list.append('%s imports %s' % (name, modules_imported))
+    return violation_list
+
+
+class Import(object):
+    """
+    wall time of the statements of IMPORT_BUDGET in a fresh interpreter (including the start-up of the interpreter)
+    """
+    def time_import_lenstronomy(self):
+        measure_import(IMPORT_BUDGET['import_lenstronomy']['statement'])
+
+    def time_import_fitting_sequence(self):
+        measure_import(IMPORT_BUDGET['import_fitting_sequence']['statement'])
+
+    def time_likelihood_module(self):
+        measure_import(IMPORT_BUDGET['likelihood_module']['statement'])
@@ -0,0 +1,33 @@
+"""
+benchmarks of the sub-pixel shifting and supersampling of PSF kernels (iterative interpolation vs. Fourier methods)
+"""
+import lenstronomy.Util.kernel_util as kernel_util
+
+
+class KernelShift(object):
+    """
+    de-shifting of a 31x31 Gaussian kernel by a sub-pixel offset
+    """
+    def setup(self):
+        self.kernel = kernel_util.kernel_gaussian(kernel_numPix=31, deltaPix=0.1, fwhm=0.3)
+        self.shift_x, self.shift_y = 0.3, -0.4
+
+    def time_de_shift_kernel(self):
+        kernel_util.de_shift_kernel(self.kernel, self.shift_x, self.shift_y, iterations=20)
+
+    def time_de_shift_kernel_fourier(self):
+        kernel_util.de_shift_kernel_fourier(self.kernel, self.shift_x, self.shift_y)
+
+
+class KernelSupersampling(object):
+    """
+    supersampling of a 31x31 Gaussian kernel by a factor 3
+    """
+    def setup(self):
+        self.kernel = kernel_util.kernel_gaussian(kernel_numPix=31, deltaPix=0.1, fwhm=0.3)
+
+    def time_subgrid_kernel(self):
+        kernel_util.subgrid_kernel(self.kernel, subgrid_res=3, odd=True, num_iter=10)
+
+    def time_subgrid_kernel_fourier(self):
+        kernel_util.subgrid_kernel_fourier(self.kernel, subgrid_res=3, odd=True)
@@ -0,0 +1,234 @@
+"""
+benchmarks of the lens equation solver, multi-plane ray-shooting and numerically integrated lens profiles
+"""
+import numpy as np
+
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LensModel.Solver.lens_equation_solver import LensEquationSolver
+from lenstronomy.Util import util
+
+
+class LensEquationSolverEPLShear(object):
+    """
+    image positions of a quadruply imaged source behind an EPL+SHEAR lens
+    """
+    def setup(self):
+        self.kwargs_lens = [{'theta_E': 1., 'gamma': 2.05, 'e1': 0.1, 'e2': -0.05, 'center_x': 0., 'center_y': 0.},
+                            {'gamma1': 0.03, 'gamma2': 0.01}]
+        self.solver = LensEquationSolver(LensModel(['EPL', 'SHEAR']))
+
+    def time_image_position_from_source(self):
+        self.solver.image_position_from_source(0.05, 0.02, self.kwargs_lens, min_distance=0.05, search_window=5,
+                                               solver='lenstronomy')
+
+    def time_image_position_from_source_analytical(self):
+        self.solver.image_position_from_source(0.05, 0.02, self.kwargs_lens, solver='analytical')
+
+
+class MultiPlaneHalos(object):
+    """
+    multi-plane ray-shooting of 50x50 rays through a main deflector and 1000 NFW halos between z=0.05 and z=1.9
+    """
+    def setup(self):
+        np.random.seed(42)
+        num_halos = 1000
+        lens_model_list = ['EPL', 'SHEAR'] + ['NFW'] * num_halos
+        redshift_list = [0.5, 0.5] + list(np.sort(np.random.uniform(0.05, 1.9, num_halos)))
+        self.kwargs_lens = [{'theta_E': 1., 'gamma': 2.05, 'e1': 0.1, 'e2': -0.05, 'center_x': 0., 'center_y': 0.},
+                            {'gamma1': 0.03, 'gamma2': 0.01}]
+        for i in range(num_halos):
+            self.kwargs_lens.append({'Rs': np.random.uniform(0.05, 0.2), 'alpha_Rs': np.random.uniform(0.001, 0.01),
+                                     'center_x': np.random.uniform(-3, 3), 'center_y': np.random.uniform(-3, 3)})
+        self.lens_model = LensModel(lens_model_list, z_source=2., lens_redshift_list=redshift_list,
+                                    multi_plane=True)
+        self.x, self.y = util.make_grid(numPix=50, deltapix=0.1)
+
+    def time_ray_shooting(self):
+        self.lens_model.ray_shooting(self.x, self.y, self.kwargs_lens)
+
+    def peakmem_ray_shooting(self):
+        self.lens_model.ray_shooting(self.x, self.y, self.kwargs_lens)
+
+
+class SersicEllipseKappaGrid(object):
+    """
+    deflection angles and hessian of SERSIC_ELLIPSE_KAPPA on a 100x100 grid
+    """
+    def setup(self):
+        self.lens_model = LensModel(['SERSIC_ELLIPSE_KAPPA'])
+        self.kwargs_lens = [{'k_eff': 0.3, 'R_sersic': 1.2, 'n_sersic': 4., 'e1': 0.1, 'e2': -0.05, 'center_x': 0.,
+                             'center_y': 0.}]
+        self.x, self.y = util.make_grid(numPix=100, deltapix=0.05)
+
+    def time_alpha(self):
+        self.lens_model.alpha(self.x, self.y, self.kwargs_lens)
+
+    def time_hessian(self):
+        self.lens_model.hessian(self.x, self.y, self.kwargs_lens)
+
+
+class GaussianPotentialGrid(object):
+    """
+    lensing potential of GAUSSIAN_KAPPA, GAUSSIAN_ELLIPSE_KAPPA and a MULTI_GAUSSIAN_KAPPA of 20 components on a 100x100
+    grid
+    """
+    def setup(self):
+        self.lens_model = LensModel(['GAUSSIAN_KAPPA', 'GAUSSIAN_ELLIPSE_KAPPA', 'MULTI_GAUSSIAN_KAPPA'])
+        self.kwargs_lens = [{'amp': 1., 'sigma': 0.5, 'center_x': 0., 'center_y': 0.},
+                            {'amp': 1., 'sigma': 0.5, 'e1': 0.2, 'e2': 0.1, 'center_x': 0., 'center_y': 0.},
+                            {'amp': np.ones(20), 'sigma': np.logspace(-2, 1, 20), 'center_x': 0., 'center_y': 0.}]
+        self.x, self.y = util.make_grid(numPix=100, deltapix=0.05)
+
+    def time_potential_spherical(self):
+        self.lens_model.potential(self.x, self.y, self.kwargs_lens, k=0)
+
+    def time_potential_elliptical(self):
+        self.lens_model.potential(self.x, self.y, self.kwargs_lens, k=1)
+
+    def time_potential_multi_gaussian(self):
+        self.lens_model.potential(self.x, self.y, self.kwargs_lens, k=2)
+
+
+class ElliSLICEStackGrid(object):
+    """
+    deflection angles of 100 nested elliptical slices on a 100x100 grid, as a single ElliSLICE_STACK and as 100
+    ElliSLICE profiles
+    """
+    def setup(self):
+        num_slices = 100
+        a = np.linspace(0.05, 2.5, num_slices)
+        kwargs_stack = {'a': a, 'b': a * 0.7, 'psi': 0.3, 'sigma_0': np.exp(-a), 'center_x': 0., 'center_y': 0.}
+        self.lens_model_stack = LensModel(['ElliSLICE_STACK'])
+        self.kwargs_stack = [kwargs_stack]
+        self.lens_model_list = LensModel(['ElliSLICE'] * num_slices)
+        self.kwargs_list = [{'a': a[i], 'b': a[i] * 0.7, 'psi': 0.3, 'sigma_0': np.exp(-a[i]), 'center_x': 0.,
+                             'center_y': 0.} for i in range(num_slices)]
+        self.x, self.y = util.make_grid(numPix=100, deltapix=0.05)
+
+    def time_alpha_stack(self):
+        self.lens_model_stack.alpha(self.x, self.y, self.kwargs_stack)
+
+    def time_alpha_list(self):
+        self.lens_model_list.alpha(self.x, self.y, self.kwargs_list)
+
+
+class GaussianSetBatched(object):
+    """
+    deflection angles and hessian of sets of 25 concentric Gaussian convergence profiles at 10^4 coordinates,
+    evaluated on a (components, coordinates) layout and with a loop over the components
+    """
+    num_points = 10000
+
+    def setup(self):
+        from lenstronomy.LensModel.Profiles.gaussian_kappa import GaussianKappa
+        from lenstronomy.LensModel.Profiles.gaussian_ellipse_kappa import GaussianEllipseKappa
+        self.gaussian_kappa = GaussianKappa()
+        self.gaussian_ellipse_kappa = GaussianEllipseKappa()
+        np.random.seed(42)
+        self.x = np.random.uniform(-3, 3, self.num_points)
+        self.y = np.random.uniform(-3, 3, self.num_points)
+        self.amp = np.random.uniform(0.5, 2, 25)
+        self.sigma = np.logspace(-2, 1, 25)
+
+    def time_spherical_hessian_set(self):
+        self.gaussian_kappa.hessian_set(self.x, self.y, self.amp, self.sigma)
+
+    def time_spherical_hessian_loop(self):
+        for i in range(len(self.amp)):
+            self.gaussian_kappa.hessian(self.x, self.y, self.amp[i], self.sigma[i])
+
+    def time_elliptical_alpha_set(self):
+        self.gaussian_ellipse_kappa.derivatives_set(self.x, self.y, self.amp, self.sigma, 0.2, 0.1)
+
+    def time_elliptical_alpha_loop(self):
+        for i in range(len(self.amp)):
+            self.gaussian_ellipse_kappa.derivatives(self.x, self.y, self.amp[i], self.sigma[i], 0.2, 0.1)
+
+    def time_elliptical_hessian_set(self):
+        self.gaussian_ellipse_kappa.hessian_set(self.x, self.y, self.amp, self.sigma, 0.2, 0.1)
+
+    def time_elliptical_hessian_loop(self):
+        for i in range(len(self.amp)):
+            self.gaussian_ellipse_kappa.hessian(self.x, self.y, self.amp[i], self.sigma[i], 0.2, 0.1)
+
+
+class GaussianSetBatchedFewPoints(GaussianSetBatched):
+    """
+    as GaussianSetBatched at 10 coordinates (as in the lens equation solver)
+    """
+    num_points = 10
+
+
+class FaddeevaKernel(object):
+    """
+    Faddeeva function of 10^6 complex numbers and deflection angles of the Gauss decomposition of an elliptical Sersic
+    profile on a 100x100 grid, with the compiled kernel and with scipy.special.wofz
+    """
+    def setup(self):
+        from lenstronomy.LensModel.Profiles.gauss_decomposition import SersicEllipseGaussDec
+        np.random.seed(42)
+        self.z = np.random.uniform(-10, 10, 10 ** 6) + 1j * np.random.uniform(0, 10, 10 ** 6)
+        self.sersic_numba = SersicEllipseGaussDec(use_numba_wofz=True)
+        self.sersic_scipy = SersicEllipseGaussDec(use_numba_wofz=False)
+        self.x, self.y = util.make_grid(numPix=100, deltapix=0.06)
+        self.kwargs = {'k_eff': 1., 'R_sersic': 1., 'n_sersic': 4., 'e1': 0.2, 'e2': -0.1}
+
+    def time_wofz_numba(self):
+        from lenstronomy.LensModel.Util.faddeeva_util import wofz
+        wofz(self.z)
+
+    def time_wofz_scipy(self):
+        from scipy.special import wofz
+        wofz(self.z)
+
+    def time_sersic_gauss_dec_alpha_numba(self):
+        self.sersic_numba.derivatives(self.x, self.y, **self.kwargs)
+
+    def time_sersic_gauss_dec_alpha_scipy(self):
+        self.sersic_scipy.derivatives(self.x, self.y, **self.kwargs)
+
+
+class CoredPotentialGrid(object):
+    """
+    lensing potential (as in the arrival time) of the cored NFW and the mass-sheet corrected cored density profiles
+    on a 100x100 grid
+    """
+    def setup(self):
+        self.x, self.y = util.make_grid(numPix=100, deltapix=0.06)
+        self.lens_model_cnfw = LensModel(['CNFW'])
+        self.kwargs_cnfw = [{'Rs': 2., 'alpha_Rs': 1., 'r_core': 0.5, 'center_x': 0., 'center_y': 0.}]
+        self.lens_model_mst = LensModel(['CORED_DENSITY_2_MST'])
+        self.kwargs_mst = [{'lambda_approx': 0.9, 'r_core': 5., 'center_x': 0., 'center_y': 0.}]
+
+    def time_potential_cnfw(self):
+        self.lens_model_cnfw.potential(self.x, self.y, self.kwargs_cnfw)
+
+    def time_potential_cored_density_2_mst(self):
+        self.lens_model_mst.potential(self.x, self.y, self.kwargs_mst)
+
+
+class RadialTableGNFW(object):
+    """
+    deflection angles of the generalized NFW profile on a 100x100 grid, computed with the hypergeometric functions and
+    interpolated from the tables of the radial_table module
+    """
+    def setup(self):
+        from lenstronomy.LensModel.Profiles.general_nfw import GNFW
+        self.x, self.y = util.make_grid(numPix=100, deltapix=0.06)
+        self.gnfw = GNFW()
+        self.gnfw_table = GNFW(use_table=True)
+        self.kwargs = {'Rs': 1.5, 'alpha_Rs': 1., 'gamma_inner': 1.3, 'gamma_outer': 2.8}
+        # builds the tables
+        self.gnfw_table.hessian(self.x[:1], self.y[:1], **self.kwargs)
+
+    def time_alpha_direct(self):
+        self.gnfw.derivatives(self.x, self.y, **self.kwargs)
+
+    def time_alpha_table(self):
+        self.gnfw_table.derivatives(self.x, self.y, **self.kwargs)
+
+    def time_hessian_direct(self):
+        self.gnfw.hessian(self.x, self.y, **self.kwargs)
+
+    def time_hessian_table(self):
+        self.gnfw_table.hessian(self.x, self.y, **self.kwargs)
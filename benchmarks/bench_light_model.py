@@ -0,0 +1,24 @@
+"""
+benchmarks of the surface brightness of light models with several components sharing the center and ellipticity
+"""
+import lenstronomy.Util.util as util
+from lenstronomy.LightModel.light_model import LightModel
+
+
+class SharedFrameComponents(object):
+    """
+    five elliptical Sersic profiles, an elliptical Hernquist and an elliptical Gaussian profile with the same center and
+    ellipticity on a 200x200 grid
+    """
+    def setup(self):
+        self.x, self.y = util.make_grid(numPix=200, deltapix=0.05)
+        self.light_model = LightModel(['SERSIC_ELLIPSE'] * 5 + ['HERNQUIST_ELLIPSE', 'GAUSSIAN_ELLIPSE'])
+        kwargs_frame = {'e1': 0.1, 'e2': 0.05, 'center_x': 0.02, 'center_y': 0}
+        self.kwargs_light = [dict(kwargs_frame, amp=1, R_sersic=0.2 * (i + 1), n_sersic=1 + 0.5 * i) for i in range(5)]
+        self.kwargs_light += [dict(kwargs_frame, amp=1, Rs=1), dict(kwargs_frame, amp=1, sigma=1)]
+
+    def time_surface_brightness(self):
+        self.light_model.surface_brightness(self.x, self.y, self.kwargs_light)
+
+    def time_functions_split(self):
+        self.light_model.functions_split(self.x, self.y, self.kwargs_light)
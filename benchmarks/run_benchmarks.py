@@ -0,0 +1,250 @@
+"""
+runner of the lenstronomy benchmarks.
+
+The benchmarks follow the conventions of airspeed velocity (asv): the modules benchmarks/bench_*.py contain classes
+with a setup() method and benchmark methods with the prefixes 'time_' (wall time per call) and 'peakmem_' (peak memory
+allocated during a call). The runner does not require asv and runs offline on a single CPU.
+
+Run the benchmarks (from the root of the repository) and store the results as JSON:
+
+    $ python -m benchmarks.run_benchmarks run --output results_new.json
+
+Compare two result files and flag regressions (exit code 1 if any benchmark got slower by more than the factor):
+
+    $ python -m benchmarks.run_benchmarks compare results_old.json results_new.json --factor 1.2
+
+Check the import-time budget (exit code 1 if exceeded, see benchmarks/bench_import.py):
+
+    $ python -m benchmarks.run_benchmarks budget
+
+The timings are the median of several repeats, each repeat executing the benchmark often enough to last at least
+min_time seconds. Each benchmark is called once before the measurements to exclude the numba compilation and the
+initialization of caches. The peak memory is measured with tracemalloc (memory allocated by python and numpy during
+the call, on top of the memory held before the call).
+"""
+
+import os
+import sys
+import json
+import time
+import glob
+import inspect
+import argparse
+import platform
+import importlib
+import subprocess
+import tracemalloc
+import numpy as np
+
+__all__ = ['discover', 'run', 'compare', 'main']
+
+_benchmark_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def discover(pattern=None):
+    """
+    finds the benchmark classes in the modules benchmarks/bench_*.py
+
+    :param pattern: string, only returns the benchmarks which names (module.class.method) contain the pattern
+    :return: list of tuples (name, class, method name)
+    """
+    benchmark_list = []
+    for filename in sorted(glob.glob(os.path.join(_benchmark_dir, 'bench_*.py'))):
+        module_name = os.path.splitext(os.path.basename(filename))[0]
+        module = importlib.import_module('benchmarks.%s' % module_name)
+        for class_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            for method_name, _ in inspect.getmembers(cls, inspect.isfunction):
+                if method_name.startswith('time_') or method_name.startswith('peakmem_'):
+                    name = '%s.%s.%s' % (module_name, class_name, method_name)
+                    if pattern is None or pattern in name:
+                        benchmark_list.append((name, cls, method_name))
+    return benchmark_list
+
+
+def _time_benchmark(func, repeat, min_time):
+    """
+
+    :param func: definition without arguments
+    :param repeat: number of repeats
+    :param min_time: minimal duration of a repeat in seconds
+    :return: dictionary with the timing statistics per call
+    """
+    func()
+    time_start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - time_start
+    number = max(1, int(np.ceil(min_time / max(duration, 1e-9))))
+    samples = []
+    for _ in range(repeat):
+        time_start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - time_start) / number)
+    return {'type': 'time', 'unit': 's', 'value': float(np.median(samples)), 'min': float(np.min(samples)),
+            'std': float(np.std(samples)), 'number': number, 'repeat': repeat, 'samples': samples}
+
+
+def _peakmem_benchmark(func):
+    """
+
+    :param func: definition without arguments
+    :return: dictionary with the peak memory allocated during a call in bytes
+    """
+    func()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        memory_start, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'type': 'peakmem', 'unit': 'bytes', 'value': float(peak - memory_start)}
+
+
+def _metadata():
+    """
+
+    :return: dictionary describing the code version and the machine
+    """
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=_benchmark_dir,
+                                         stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    import lenstronomy
+    import scipy
+    return {'commit': commit, 'lenstronomy_version': lenstronomy.__version__, 'python': platform.python_version(),
+            'numpy': np.__version__, 'scipy': scipy.__version__, 'machine': platform.machine(),
+            'processor': platform.processor(), 'cpu_count': os.cpu_count(),
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S')}
+
+
+def run(pattern=None, repeat=5, min_time=0.1, verbose=True):
+    """
+    runs the benchmarks
+
+    :param pattern: string, only runs the benchmarks which names contain the pattern
+    :param repeat: number of repeats of the timing benchmarks
+    :param min_time: minimal duration of a repeat in seconds
+    :param verbose: bool, if True, prints the results
+    :return: dictionary with 'metadata' and 'results'
+    """
+    results = {}
+    instances = {}
+    for name, cls, method_name in discover(pattern):
+        if cls not in instances:
+            instance = cls()
+            if hasattr(instance, 'setup'):
+                instance.setup()
+            instances[cls] = instance
+        func = getattr(instances[cls], method_name)
+        if method_name.startswith('time_'):
+            results[name] = _time_benchmark(func, repeat=repeat, min_time=min_time)
+        else:
+            results[name] = _peakmem_benchmark(func)
+        if verbose:
+            print('%-80s %s' % (name, _format(results[name])))
+    return {'metadata': _metadata(), 'results': results}
+
+
+def compare(results_old, results_new, factor=1.2):
+    """
+    compares two sets of benchmark results
+
+    :param results_old: dictionary as returned by run() (reference)
+    :param results_new: dictionary as returned by run()
+    :param factor: float > 1, ratio new/old above (below 1/factor) which a benchmark is flagged as regression
+     (improvement)
+    :return: list of tuples (name, old value, new value, ratio, flag) for the benchmarks present in both results,
+     with flag being 'regression', 'improvement' or ''
+    """
+    comparison = []
+    old, new = results_old['results'], results_new['results']
+    for name in sorted(set(old.keys()) & set(new.keys())):
+        value_old, value_new = old[name]['value'], new[name]['value']
+        ratio = value_new / value_old if value_old > 0 else np.inf
+        if ratio > factor:
+            flag = 'regression'
+        elif ratio < 1. / factor:
+            flag = 'improvement'
+        else:
+            flag = ''
+        comparison.append((name, value_old, value_new, ratio, flag))
+    return comparison
+
+
+def _format(result):
+    """
+
+    :param result: result dictionary of a benchmark
+    :return: string
+    """
+    if result['type'] == 'time':
+        return '%.4g ms (+- %.2g ms)' % (result['value'] * 1000, result['std'] * 1000)
+    return '%.4g MB' % (result['value'] / 1e6)
+
+
+def main(args=None):
+    """
+    command line interface, see module documentation
+
+    :param args: list of command line arguments (if None, uses sys.argv)
+    :return: exit code
+    """
+    parser = argparse.ArgumentParser(description='lenstronomy benchmarks')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    parser_run = subparsers.add_parser('run', help='runs the benchmarks')
+    parser_run.add_argument('--bench', default=None, help='only runs benchmarks which names contain this string')
+    parser_run.add_argument('--output', default=None, help='JSON file to store the results')
+    parser_run.add_argument('--repeat', type=int, default=5, help='number of repeats of the timings')
+    parser_run.add_argument('--min-time', type=float, default=0.1, help='minimal duration of a repeat [s]')
+    parser_run.add_argument('--list', action='store_true', help='lists the benchmarks without running them')
+    parser_compare = subparsers.add_parser('compare', help='compares two result files')
+    parser_compare.add_argument('old', help='JSON file of the reference results')
+    parser_compare.add_argument('new', help='JSON file of the new results')
+    parser_compare.add_argument('--factor', type=float, default=1.2,
+                                help='ratio new/old above which a benchmark is flagged as regression')
+    parser_budget = subparsers.add_parser('budget', help='checks the import-time budget')
+    parser_budget.add_argument('--repeat', type=int, default=3, help='number of measurements per statement')
+    args = parser.parse_args(args)
+
+    if args.command == 'budget':
+        from benchmarks.bench_import import check_budget
+        violation_list = check_budget(repeat=args.repeat)
+        for violation in violation_list:
+            print('budget exceeded: %s' % violation)
+        return 1 if len(violation_list) > 0 else 0
+
+    if args.command == 'run':
+        if args.list:
+            for name, _, _ in discover(args.bench):
+                print(name)
+            return 0
+        results = run(pattern=args.bench, repeat=args.repeat, min_time=args.min_time)
+        if args.output is not None:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+        return 0
+
+    with open(args.old) as f:
+        results_old = json.load(f)
+    with open(args.new) as f:
+        results_new = json.load(f)
+    comparison = compare(results_old, results_new, factor=args.factor)
+    print('old: %s, new: %s' % (results_old['metadata'].get('commit'), results_new['metadata'].get('commit')))
+    num_regression = 0
+    for name, value_old, value_new, ratio, flag in comparison:
+        print('%-80s %10.4g %10.4g %7.2f %s' % (name, value_old, value_new, ratio, flag))
+        if flag == 'regression':
+            num_regression += 1
+    if num_regression > 0:
+        print('%s benchmark(s) regressed by more than a factor %s.' % (num_regression, args.factor))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
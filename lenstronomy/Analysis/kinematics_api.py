@@ -4,6 +4,8 @@ import numpy as np
 import copy
 from lenstronomy.GalKin.galkin_multiobservation import GalkinMultiObservation
 from lenstronomy.GalKin.galkin import Galkin
+from lenstronomy.GalKin.observation import GalkinObservation
+from lenstronomy.GalKin.aperture_grid import ApertureGrid
 from lenstronomy.Cosmo.lens_cosmo import LensCosmo
 from lenstronomy.Util import class_creator
 from lenstronomy.Analysis.lens_profile import LensProfileAnalysis
@@ -23,7 +25,7 @@ class KinematicsAPI(object):
                  lens_model_kinematics_bool=None, light_model_kinematics_bool=None, multi_observations=False,
                  kwargs_numerics_galkin=None, analytic_kinematics=False, Hernquist_approx=False, MGE_light=False,
                  MGE_mass=False, kwargs_mge_light=None, kwargs_mge_mass=None, sampling_number=1000,
-                 num_kin_sampling=1000, num_psf_sampling=100):
+                 num_kin_sampling=1000, num_psf_sampling=100, grid_kinematics=False, kwargs_grid_kinematics=None):
         """
 
         :param z_lens: redshift of lens
@@ -54,6 +56,11 @@ class KinematicsAPI(object):
          dispersion within the aperture. This keyword should be chosen high enough to result in converged results within the tolerance.
         :param num_kin_sampling: number of kinematic renderings on a total IFU
         :param num_psf_sampling: number of PSF displacements for each kinematic rendering on the IFU
+        :param grid_kinematics: bool, if True, the seeing convolved integrals over the aperture are computed
+         deterministically on a pixel grid (Galkin.dispersion_grid() and dispersion_map_grid()) instead of the spectral
+         rendering. sampling_number, num_kin_sampling and num_psf_sampling are then not used.
+        :param kwargs_grid_kinematics: keyword arguments of the grid integration ('delta_pix', 'supersampling_factor'),
+         see Galkin.dispersion_map_grid() for the defaults and the accuracy
         """
         self.z_d = z_lens
         self.z_s = z_source
@@ -72,6 +79,9 @@ class KinematicsAPI(object):
         self._sampling_number = sampling_number
         self._num_kin_sampling = num_kin_sampling
         self._num_psf_sampling = num_psf_sampling
+        self._grid_kinematics = grid_kinematics
+        self._kwargs_grid_kinematics = {} if kwargs_grid_kinematics is None else kwargs_grid_kinematics
+        self._aperture_grid_cache = None
 
         if kwargs_mge_mass is None:
             self._kwargs_mge_mass = {'n_comp': 20}
@@ -115,8 +125,7 @@ class KinematicsAPI(object):
         """
         galkin, kwargs_profile, kwargs_light = self.galkin_settings(kwargs_lens, kwargs_lens_light, r_eff=r_eff,
                                                                     theta_E=theta_E, gamma=gamma)
-        sigma_v = galkin.dispersion(kwargs_profile, kwargs_light, kwargs_anisotropy,
-                                    sampling_number=self._sampling_number)
+        sigma_v = self._dispersion(galkin, kwargs_profile, kwargs_light, kwargs_anisotropy)
         sigma_v = self.transform_kappa_ext(sigma_v, kappa_ext=kappa_ext)
         return sigma_v
 
@@ -138,8 +147,13 @@ class KinematicsAPI(object):
         """
         galkin, kwargs_profile, kwargs_light = self.galkin_settings(kwargs_lens, kwargs_lens_light, r_eff=r_eff,
                                                                     theta_E=theta_E, gamma=gamma)
-        sigma_v_map = galkin.dispersion_map(kwargs_profile, kwargs_light, kwargs_anisotropy,
-                                        num_kin_sampling=self._num_kin_sampling, num_psf_sampling=self._num_psf_sampling)
+        if self._grid_kinematics:
+            sigma_v_map = galkin.dispersion_map_grid(kwargs_profile, kwargs_light, kwargs_anisotropy,
+                                                     **self._kwargs_grid_kinematics)
+        else:
+            sigma_v_map = galkin.dispersion_map(kwargs_profile, kwargs_light, kwargs_anisotropy,
+                                                num_kin_sampling=self._num_kin_sampling,
+                                                num_psf_sampling=self._num_psf_sampling)
         sigma_v_map = self.transform_kappa_ext(sigma_v_map, kappa_ext=kappa_ext)
         return sigma_v_map
 
@@ -160,15 +174,29 @@ class KinematicsAPI(object):
         """
         galkin = Galkin(kwargs_model={'anisotropy_model': 'OM'}, kwargs_aperture=self._kwargs_aperture_kin,
                         kwargs_psf=self._kwargs_psf_kin, kwargs_cosmo=self._kwargs_cosmo, kwargs_numerics={},
-                        analytic_kinematics=True)
+                        analytic_kinematics=True, aperture_grid=self._aperture_grid())
         kwargs_profile = {'theta_E': theta_E, 'gamma': gamma}
         kwargs_light = {'r_eff': r_eff}
         kwargs_anisotropy = {'r_ani': r_ani}
-        sigma_v = galkin.dispersion(kwargs_profile, kwargs_light, kwargs_anisotropy,
-                                    sampling_number=self._sampling_number)
+        sigma_v = self._dispersion(galkin, kwargs_profile, kwargs_light, kwargs_anisotropy)
         sigma_v = self.transform_kappa_ext(sigma_v, kappa_ext=kappa_ext)
         return sigma_v
 
+    def _dispersion(self, galkin, kwargs_profile, kwargs_light, kwargs_anisotropy):
+        """
+        velocity dispersion in the aperture with the spectral rendering or the grid integration (grid_kinematics)
+
+        :param galkin: Galkin instance
+        :param kwargs_profile: mass keyword arguments of the Galkin instance
+        :param kwargs_light: light keyword arguments of the Galkin instance
+        :param kwargs_anisotropy: stellar anisotropy keyword arguments
+        :return: velocity dispersion [km/s]
+        """
+        if self._grid_kinematics:
+            return galkin.dispersion_grid(kwargs_profile, kwargs_light, kwargs_anisotropy,
+                                          **self._kwargs_grid_kinematics)
+        return galkin.dispersion(kwargs_profile, kwargs_light, kwargs_anisotropy, sampling_number=self._sampling_number)
+
     def galkin_settings(self, kwargs_lens, kwargs_lens_light, r_eff=None, theta_E=None, gamma=None):
         """
 
@@ -210,13 +238,39 @@ class KinematicsAPI(object):
             galkin = GalkinMultiObservation(kwargs_model=kwargs_model, kwargs_aperture_list=self._kwargs_aperture_kin,
                                             kwargs_psf_list=self._kwargs_psf_kin, kwargs_cosmo=self._kwargs_cosmo,
                                             kwargs_numerics=self._kwargs_numerics_kin,
-                                            analytic_kinematics=self._analytic_kinematics)
+                                            analytic_kinematics=self._analytic_kinematics,
+                                            aperture_grid_list=self._aperture_grid())
         else:
             galkin = Galkin(kwargs_model=kwargs_model, kwargs_aperture=self._kwargs_aperture_kin,
                             kwargs_psf=self._kwargs_psf_kin, kwargs_cosmo=self._kwargs_cosmo,
-                            kwargs_numerics=self._kwargs_numerics_kin, analytic_kinematics=self._analytic_kinematics)
+                            kwargs_numerics=self._kwargs_numerics_kin, analytic_kinematics=self._analytic_kinematics,
+                            aperture_grid=self._aperture_grid())
         return galkin, kwargs_profile, kwargs_light
 
+    def _aperture_grid(self):
+        """
+        pixel grid(s) of the aperture and seeing for the grid integration (grid_kinematics), created at the first call
+        and passed to the Galkin instances of the following calls as long as the aperture, seeing and grid settings are
+        unchanged
+
+        :return: ApertureGrid instance (list of instances with multi_observations), None without grid_kinematics
+        """
+        if not self._grid_kinematics:
+            return None
+        key = _settings_key([self._kwargs_aperture_kin, self._kwargs_psf_kin, self._kwargs_grid_kinematics,
+                             self._multi_observations])
+        if self._aperture_grid_cache is None or self._aperture_grid_cache[0] != key:
+            if self._multi_observations is True:
+                aperture_grid = [ApertureGrid(GalkinObservation(kwargs_aperture=kwargs_aperture, kwargs_psf=kwargs_psf),
+                                              **self._kwargs_grid_kinematics)
+                                 for kwargs_aperture, kwargs_psf in zip(self._kwargs_aperture_kin, self._kwargs_psf_kin)]
+            else:
+                observation = GalkinObservation(kwargs_aperture=self._kwargs_aperture_kin,
+                                                kwargs_psf=self._kwargs_psf_kin)
+                aperture_grid = ApertureGrid(observation, **self._kwargs_grid_kinematics)
+            self._aperture_grid_cache = (key, aperture_grid)
+        return self._aperture_grid_cache[1]
+
     def kinematic_lens_profiles(self, kwargs_lens, MGE_fit=False, model_kinematics_bool=None, theta_E=None, gamma=None,
                                 kwargs_mge=None, analytic_kinematics=False):
         """
@@ -340,7 +394,7 @@ class KinematicsAPI(object):
     def kinematics_modeling_settings(self, anisotropy_model, kwargs_numerics_galkin, analytic_kinematics=False,
                                      Hernquist_approx=False, MGE_light=False, MGE_mass=False, kwargs_mge_light=None,
                                      kwargs_mge_mass=None, sampling_number=1000, num_kin_sampling=1000,
-                                     num_psf_sampling=100):
+                                     num_psf_sampling=100, grid_kinematics=False, kwargs_grid_kinematics=None):
         """
 
         :param anisotropy_model: type of stellar anisotropy model. See details in MamonLokasAnisotropy() class of lenstronomy.GalKin.anisotropy
@@ -355,6 +409,11 @@ class KinematicsAPI(object):
         :param sampling_number: number of spectral rendering on a single slit
         :param num_kin_sampling: number of kinematic renderings on a total IFU
         :param num_psf_sampling: number of PSF displacements for each kinematic rendering on the IFU
+        :param grid_kinematics: bool, if True, the seeing convolved integrals over the aperture are computed
+         deterministically on a pixel grid (Galkin.dispersion_grid() and dispersion_map_grid()) instead of the spectral
+         rendering. sampling_number, num_kin_sampling and num_psf_sampling are then not used.
+        :param kwargs_grid_kinematics: keyword arguments of the grid integration ('delta_pix', 'supersampling_factor'),
+         see Galkin.dispersion_map_grid() for the defaults and the accuracy
         :return:
         """
         if kwargs_mge_mass is None:
@@ -376,6 +435,8 @@ class KinematicsAPI(object):
         self._sampling_number = sampling_number
         self._num_kin_sampling = num_kin_sampling
         self._num_psf_sampling = num_psf_sampling
+        self._grid_kinematics = grid_kinematics
+        self._kwargs_grid_kinematics = {} if kwargs_grid_kinematics is None else kwargs_grid_kinematics
 
     @staticmethod
     def transform_kappa_ext(sigma_v, kappa_ext=0):
@@ -387,3 +448,19 @@ class KinematicsAPI(object):
         """
         sigma_v_mst = sigma_v * np.sqrt(1 - kappa_ext)
         return sigma_v_mst
+
+
+def _settings_key(obj):
+    """
+    comparable representation of (nested) keyword arguments, with numpy arrays represented by their content
+
+    :param obj: keyword arguments (dictionaries, lists, arrays and numbers)
+    :return: hashable key
+    """
+    if isinstance(obj, dict):
+        return tuple(sorted((key, _settings_key(value)) for key, value in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_settings_key(value) for value in obj)
+    if isinstance(obj, np.ndarray):
+        return obj.shape, obj.dtype.str, obj.tobytes()
+    return obj
@@ -60,7 +60,8 @@ class PSF(object):
                 warnings.warn('Input PSF model has at least one negative element, which is unphysical except for a PSF of an interferometric array.')
             self._kernel_point_source = kernel_point_source
             if kernel_point_source_normalisation is not False:
-                self._kernel_point_source /= np.sum(kernel_point_source)
+                # not in place, the array of the caller is left unchanged
+                self._kernel_point_source = kernel_point_source / np.sum(kernel_point_source)
 
         elif self.psf_type == 'NONE':
             self._kernel_point_source = np.zeros((3, 3))
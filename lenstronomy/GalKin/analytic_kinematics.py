@@ -6,6 +6,7 @@ import lenstronomy.GalKin.velocity_util as vel_util
 from lenstronomy.GalKin.cosmo import Cosmo
 from lenstronomy.GalKin.anisotropy import Anisotropy
 from lenstronomy.LensModel.Profiles.spp import SPP
+from lenstronomy.LightModel.Profiles.hernquist import Hernquist
 import lenstronomy.Util.constants as const
 import math
 
@@ -51,6 +52,7 @@ class AnalyticKinematics(Anisotropy):
 
         self._cosmo = Cosmo(**kwargs_cosmo)
         self._spp = SPP()
+        self._light_profile = Hernquist()
         Anisotropy.__init__(self, anisotropy_type='OM')
 
     def _rho0_r0_gamma(self, theta_E, gamma):
@@ -101,6 +103,52 @@ class AnalyticKinematics(Anisotropy):
         a, gamma, rho0_r0_gamma, r_ani = self._read_out_params(kwargs_mass, kwargs_light, kwargs_anisotropy)
         return self._sigma_s2(r, R, r_ani, a, gamma, rho0_r0_gamma), 1
 
+    def I_R_sigma2_and_IR(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
+        """
+        luminosity-weighted line-of-sight velocity dispersion I(R)*sigma_s^2(R), interpolated in log(R), and surface
+        brightness I(R) of the Hernquist light profile normalized to unit total light
+
+        :param R: projected radius (in arc seconds), float or numpy array
+        :param kwargs_mass: mass profile keyword arguments
+        :param kwargs_light: light profile keyword arguments
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :return: I(R)*sigma_s^2(R), I(R)
+        """
+        a, gamma, rho0_r0_gamma, r_ani = self._read_out_params(kwargs_mass, kwargs_light, kwargs_anisotropy)
+        R = np.maximum(R, self._min_integrate)
+        if not hasattr(self, '_interp_I_R_sigma2'):
+            min_log = np.log10(self._min_integrate)
+            max_log = np.log10(self._max_integrate)
+            R_array = np.logspace(min_log, max_log, self._interp_grid_num)
+            I_R_sigma2_array = self._I_R_sigma2(R_array, a, gamma, rho0_r0_gamma, r_ani)
+            self._interp_I_R_sigma2 = interp1d(np.log(R_array), I_R_sigma2_array, fill_value="extrapolate")
+        I_R = self._light_profile.function(R, 0, amp=1, Rs=a)
+        return self._interp_I_R_sigma2(np.log(R)), I_R
+
+    def _I_R_sigma2(self, R, a, gamma, rho0_r0_gamma, r_ani):
+        """
+        line-of-sight integral of the Hernquist light profile (normalized to unit total light) times the projected
+        velocity dispersion, 2 * int l(r) sigma_s^2(r, R) dz with the 3d radius r = sqrt(R^2 + z^2)
+
+        :param R: 1d array of projected radii
+        :param a: scale of the Hernquist light profile
+        :param gamma: power-law slope of the mass profile
+        :param rho0_r0_gamma: combination of Einstein radius and power-law slope as equation (14) in Suyu+ 2010
+        :param r_ani: anisotropy radius
+        :return: I(R)*sigma_s^2(R)
+        """
+        # integral in log(z), from min_integrate to max_integrate, and constant integrand below min_integrate
+        min_log = np.log10(self._min_integrate)
+        max_log = np.log10(self._max_integrate)
+        z = np.logspace(min_log, max_log, self._interp_grid_num)
+        dz = np.append(z[0], np.diff(z))
+        r = np.sqrt(R[:, np.newaxis] ** 2 + z[np.newaxis, :] ** 2)
+        sigma_s2 = self._sigma_s2(r, R[:, np.newaxis], r_ani, a, gamma, rho0_r0_gamma)
+        integrand = self._light_profile.light_3d(r, amp=1, Rs=a) * sigma_s2
+        # trapezoidal rule (the first interval from z=0 with the value at min_integrate)
+        integrand_mean = np.append(integrand[:, :1], (integrand[:, 1:] + integrand[:, :-1]) / 2., axis=1)
+        return 2 * np.sum(integrand_mean * dz, axis=1)
+
     def sigma_r2(self, r, kwargs_mass, kwargs_light, kwargs_anisotropy):
         """
         equation (19) in Suyu+ 2010
@@ -191,3 +239,5 @@ class AnalyticKinematics(Anisotropy):
         """
         if hasattr(self, '_interp_sigma_r2'):
             del self._interp_sigma_r2
+        if hasattr(self, '_interp_I_R_sigma2'):
+            del self._interp_I_R_sigma2
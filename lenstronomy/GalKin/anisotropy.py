@@ -1,11 +1,19 @@
 import numpy as np
 import scipy.special as special
 from lenstronomy.GalKin import velocity_util
-from scipy.interpolate import interp1d
+from lenstronomy.Util.interpolation_util import cubic_interpolation
 
 from lenstronomy.Util.package_util import exporter
 export, __all__ = exporter()
 
+# tables of the hypergeometric functions of the generalized OM model in s = log(1 - z) and beta_inf, indexed by the
+# first parameter of the hypergeometric function and shared between all instances of a process
+_F_tables = {}
+_S_MAX_TABLE = 25.
+_NUM_S_TABLE = 501
+_BETA_INF_MIN_TABLE, _BETA_INF_MAX_TABLE = -1., 1.
+_NUM_BETA_INF_TABLE = 401
+
 
 @export
 class Anisotropy(object):
@@ -73,7 +81,8 @@ class Anisotropy(object):
 
     def delete_anisotropy_cache(self):
         """
-        deletes cached interpolations for a fixed anisotropy model
+        deletes cached interpolations for a fixed anisotropy model (the tables of the hypergeometric functions of the
+        generalized OM model do not depend on the anisotropy parameters and are kept)
 
         :return: None
         """
@@ -278,8 +287,7 @@ class GeneralizedOM(object):
     b(r) = beta_inf * r^2 / (r^2 + r_ani^2)
     """
     def __init__(self):
-        self._z_interp = np.append(-np.flip(np.logspace(-1, 3, 200)**2), 0)
-        # self._z_interp = -np.linspace(-200, 0, 200)**2  # z = (R**2 - r**2) / (r_ani**2 + R**2)
+        pass
 
     @staticmethod
     def beta_r(r, r_ani, beta_inf):
@@ -322,14 +330,12 @@ class GeneralizedOM(object):
 
     def delete_cache(self):
         """
-        deletes the interpolation function of the hypergeometic function for a specific beta_inf
+        the tables of the hypergeometric functions do not depend on beta_inf and are shared between all instances of a
+        process, so nothing is deleted. Kept such that Anisotropy.delete_anisotropy_cache() works for all models.
 
-        :return: deleted self variables
+        :return: None
         """
-        if hasattr(self, '_f_12_interp'):
-            del self._f_12_interp
-        if hasattr(self, '_f_32_interp'):
-            del self._f_32_interp
+        pass
 
     def _k_beta(self, r, R, r_ani, beta_inf):
         """
@@ -354,10 +360,7 @@ class GeneralizedOM(object):
         :param beta_inf: anisotropy at infinity
         :return: _F(1/2, z, beta_inf)
         """
-        if not hasattr(self, '_f_12_interp'):
-            f_12_interp = self._F(1 / 2., self._z_interp, beta_inf)
-            self._f_12_interp = interp1d(self._z_interp, f_12_interp, kind='cubic', fill_value="extrapolate")
-        return self._f_12_interp(z)
+        return self._F_interp(1 / 2., z, beta_inf)
 
     def _F_32(self, z, beta_inf):
         """
@@ -366,10 +369,50 @@ class GeneralizedOM(object):
         :param beta_inf: anisotropy at infinity
         :return: _F(3/2, z, beta_inf)
         """
-        if not hasattr(self, '_f_32_interp'):
-            f_32_interp = self._F(3 / 2., self._z_interp, beta_inf)
-            self._f_32_interp = interp1d(self._z_interp, f_32_interp, kind='cubic', fill_value="extrapolate")
-        return self._f_32_interp(z)
+        return self._F_interp(3 / 2., z, beta_inf)
+
+    @staticmethod
+    def _F_interp(a, z, beta_inf):
+        """
+        the hypergeometric function 2F1 (a, 1 + beta_inf, a + 1, z) for z <= 0, interpolated (cubic in log(1 - z) and
+        beta_inf) from a table that is built once per process and shared between all instances. The relative error
+        with respect to mpmath.hyp2f1 is below 2e-7 for beta_inf in [-1, 1] and z >= -7e10 (the largest errors are at
+        the values of beta_inf between the nodes of the table and at the lower end of z). Values outside the table are
+        computed with scipy.special.hyp2f1.
+
+        :param a: first parameter of the hypergeometric function
+        :param z: (R**2 - r**2) / (r_ani**2 + R**2), float or numpy array
+        :param beta_inf: anisotropy at infinity, float
+        :return: 2F1 (a, 1 + beta_inf, a + 1, z) with the shape of z
+        """
+        z_ = np.asarray(z, dtype=float)
+        if not _BETA_INF_MIN_TABLE <= beta_inf <= _BETA_INF_MAX_TABLE:
+            return special.hyp2f1(a, 1 + beta_inf, a + 1, z_)
+        if a not in _F_tables:
+            _F_tables[a] = GeneralizedOM._F_table(a)
+        z_flat = z_.ravel()
+        s = np.log1p(-np.minimum(z_flat, 0))
+        inside = (z_flat <= 0) & (s <= _S_MAX_TABLE)
+        # log(F) along s for beta_inf, interpolated between the four closest values of beta_inf of the table
+        step_beta_inf = (_BETA_INF_MAX_TABLE - _BETA_INF_MIN_TABLE) / (_NUM_BETA_INF_TABLE - 1)
+        log_f_s = cubic_interpolation(np.array([beta_inf]), _BETA_INF_MIN_TABLE, step_beta_inf, _F_tables[a])[0]
+        f = np.empty(len(z_flat))
+        f[inside] = cubic_interpolation(s[inside], 0., _S_MAX_TABLE / (_NUM_S_TABLE - 1), log_f_s, log_values=True)
+        if not np.all(inside):
+            f[~inside] = special.hyp2f1(a, 1 + beta_inf, a + 1, z_flat[~inside])
+        return f.reshape(z_.shape)
+
+    @staticmethod
+    def _F_table(a):
+        """
+        table of log(2F1 (a, 1 + beta_inf, a + 1, z)) on a uniform grid in beta_inf and s = log(1 - z)
+
+        :param a: first parameter of the hypergeometric function
+        :return: 2d array of shape (number of beta_inf, number of s)
+        """
+        s = np.linspace(0, _S_MAX_TABLE, _NUM_S_TABLE)
+        beta_inf = np.linspace(_BETA_INF_MIN_TABLE, _BETA_INF_MAX_TABLE, _NUM_BETA_INF_TABLE)
+        return np.log(special.hyp2f1(a, 1 + beta_inf[:, np.newaxis], a + 1, -np.expm1(s)[np.newaxis, :]))
 
     @staticmethod
     def _j_beta(r, s, r_ani, beta_inf):
@@ -43,12 +43,22 @@ class Aperture(object):
     def aperture_select(self, ra, dec):
         """
 
-        :param ra: angular coordinate of photon/ray
-        :param dec: angular coordinate of photon/ray
-        :return: bool, True if photon/ray is within the slit, False otherwise, int of the segment of the IFU
+        :param ra: angular coordinate of photon/ray, float or numpy array
+        :param dec: angular coordinate of photon/ray, float or numpy array
+        :return: bool, True if photon/ray is within the slit, False otherwise, int of the segment of the IFU. For array
+         input, bool array and integer array of the segments (-1 outside of the aperture)
         """
         return self._aperture.aperture_select(ra, dec)
 
     @property
     def num_segments(self):
         return self._aperture.num_segments
+
+    @property
+    def max_radius(self):
+        """
+        maximal distance of the aperture to the origin of the coordinates (the center of the deflector)
+
+        :return: float
+        """
+        return self._aperture.max_radius
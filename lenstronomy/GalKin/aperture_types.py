@@ -29,11 +29,13 @@ class Slit(object):
     def aperture_select(self, ra, dec):
         """
 
-        :param ra: angular coordinate of photon/ray
-        :param dec: angular coordinate of photon/ray
-        :return: bool, True if photon/ray is within the slit, False otherwise
+        :param ra: angular coordinate of photon/ray, float or numpy array
+        :param dec: angular coordinate of photon/ray, float or numpy array
+        :return: bool, True if photon/ray is within the aperture, False otherwise, and index of the segment (0, or -1
+         outside of the aperture for arrays)
         """
-        return slit_select(ra, dec, self._length, self._width, self._center_ra, self._center_dec, self._angle), 0
+        bool_select = slit_select(ra, dec, self._length, self._width, self._center_ra, self._center_dec, self._angle)
+        return bool_select, _single_segment_index(bool_select)
 
     @property
     def num_segments(self):
@@ -44,29 +46,36 @@ class Slit(object):
         """
         return 1
 
+    @property
+    def max_radius(self):
+        """
+        maximal distance of the aperture to the origin of the coordinates
+
+        :return: float
+        """
+        return np.sqrt(self._center_ra ** 2 + self._center_dec ** 2) + np.sqrt(self._length ** 2 +
+                                                                                 self._width ** 2) / 2.
+
 
 @export
 def slit_select(ra, dec, length, width, center_ra=0, center_dec=0, angle=0):
     """
 
-    :param ra: angular coordinate of photon/ray
-    :param dec: angular coordinate of photon/ray
+    :param ra: angular coordinate of photon/ray, float or numpy array
+    :param dec: angular coordinate of photon/ray, float or numpy array
     :param length: length of slit
     :param width: width of slit
     :param center_ra: center of slit
     :param center_dec: center of slit
     :param angle: orientation angle of slit, angle=0 corresponds length in RA direction
-    :return: bool, True if photon/ray is within the slit, False otherwise
+    :return: bool, True if photon/ray is within the slit, False otherwise (bool array for array input)
     """
     ra_ = ra - center_ra
     dec_ = dec - center_dec
     x = np.cos(angle) * ra_ + np.sin(angle) * dec_
     y = - np.sin(angle) * ra_ + np.cos(angle) * dec_
-
-    if abs(x) < length / 2. and abs(y) < width / 2.:
-        return True
-    else:
-        return False
+    bool_select = (np.abs(x) < length / 2.) & (np.abs(y) < width / 2.)
+    return _bool_output(bool_select)
 
 
 @export
@@ -92,11 +101,14 @@ class Frame(object):
     def aperture_select(self, ra, dec):
         """
 
-        :param ra: angular coordinate of photon/ray
-        :param dec: angular coordinate of photon/ray
-        :return: bool, True if photon/ray is within the slit, False otherwise
+        :param ra: angular coordinate of photon/ray, float or numpy array
+        :param dec: angular coordinate of photon/ray, float or numpy array
+        :return: bool, True if photon/ray is within the aperture, False otherwise, and index of the segment (0, or -1
+         outside of the aperture for arrays)
         """
-        return frame_select(ra, dec, self._width_outer, self._width_inner, self._center_ra, self._center_dec, self._angle), 0
+        bool_select = frame_select(ra, dec, self._width_outer, self._width_inner, self._center_ra, self._center_dec,
+                                   self._angle)
+        return bool_select, _single_segment_index(bool_select)
 
     @property
     def num_segments(self):
@@ -107,30 +119,36 @@ class Frame(object):
         """
         return 1
 
+    @property
+    def max_radius(self):
+        """
+        maximal distance of the aperture to the origin of the coordinates
+
+        :return: float
+        """
+        return np.sqrt(self._center_ra ** 2 + self._center_dec ** 2) + self._width_outer / np.sqrt(2)
+
 
 @export
 def frame_select(ra, dec, width_outer, width_inner, center_ra=0, center_dec=0, angle=0):
     """
 
-    :param ra: angular coordinate of photon/ray
-    :param dec: angular coordinate of photon/ray
+    :param ra: angular coordinate of photon/ray, float or numpy array
+    :param dec: angular coordinate of photon/ray, float or numpy array
     :param width_outer: width of box to the outer parts
     :param width_inner: width of inner removed box
     :param center_ra: center of slit
     :param center_dec: center of slit
     :param angle: orientation angle of slit, angle=0 corresponds length in RA direction
-    :return: bool, True if photon/ray is within the box with a hole, False otherwise
+    :return: bool, True if photon/ray is within the box with a hole, False otherwise (bool array for array input)
     """
     ra_ = ra - center_ra
     dec_ = dec - center_dec
     x = np.cos(angle) * ra_ + np.sin(angle) * dec_
     y = - np.sin(angle) * ra_ + np.cos(angle) * dec_
-    if abs(x) < width_outer / 2. and abs(y) < width_outer / 2.:
-        if abs(x) < width_inner / 2. and abs(y) < width_inner / 2.:
-            return False
-        else:
-            return True
-    return False
+    bool_select = (np.abs(x) < width_outer / 2.) & (np.abs(y) < width_outer / 2.) & \
+        ((np.abs(x) >= width_inner / 2.) | (np.abs(y) >= width_inner / 2.))
+    return _bool_output(bool_select)
 
 
 @export
@@ -153,11 +171,13 @@ class Shell(object):
     def aperture_select(self, ra, dec):
         """
 
-        :param ra: angular coordinate of photon/ray
-        :param dec: angular coordinate of photon/ray
-        :return: bool, True if photon/ray is within the slit, False otherwise
+        :param ra: angular coordinate of photon/ray, float or numpy array
+        :param dec: angular coordinate of photon/ray, float or numpy array
+        :return: bool, True if photon/ray is within the aperture, False otherwise, and index of the segment (0, or -1
+         outside of the aperture for arrays)
         """
-        return shell_select(ra, dec, self._r_in, self._r_out, self._center_ra, self._center_dec), 0
+        bool_select = shell_select(ra, dec, self._r_in, self._r_out, self._center_ra, self._center_dec)
+        return bool_select, _single_segment_index(bool_select)
 
     @property
     def num_segments(self):
@@ -168,26 +188,33 @@ class Shell(object):
         """
         return 1
 
+    @property
+    def max_radius(self):
+        """
+        maximal distance of the aperture to the origin of the coordinates
+
+        :return: float
+        """
+        return np.sqrt(self._center_ra ** 2 + self._center_dec ** 2) + self._r_out
+
 
 @export
 def shell_select(ra, dec, r_in, r_out, center_ra=0, center_dec=0):
     """
 
-    :param ra: angular coordinate of photon/ray
-    :param dec: angular coordinate of photon/ray
+    :param ra: angular coordinate of photon/ray, float or numpy array
+    :param dec: angular coordinate of photon/ray, float or numpy array
     :param r_in: innermost radius to be selected
     :param r_out: outermost radius to be selected
     :param center_ra: center of the sphere
     :param center_dec: center of the sphere
-    :return: boolean, True if within the radial range, False otherwise
+    :return: boolean, True if within the radial range, False otherwise (bool array for array input)
     """
     x = ra - center_ra
     y = dec - center_dec
     r = np.sqrt(x ** 2 + y ** 2)
-    if (r >= r_in) and (r < r_out):
-        return True
-    else:
-        return False
+    bool_select = (r >= r_in) & (r < r_out)
+    return _bool_output(bool_select)
 
 
 @export
@@ -209,9 +236,9 @@ class IFUShells(object):
     def aperture_select(self, ra, dec):
         """
 
-        :param ra: angular coordinate of photon/ray
-        :param dec: angular coordinate of photon/ray
-        :return: bool, True if photon/ray is within the slit, False otherwise, index of shell
+        :param ra: angular coordinate of photon/ray, float or numpy array
+        :param dec: angular coordinate of photon/ray, float or numpy array
+        :return: bool, True if photon/ray is within the slit, False otherwise, index of shell (see shell_ifu_select())
         """
         return shell_ifu_select(ra, dec, self._r_bins, self._center_ra, self._center_dec)
 
@@ -223,23 +250,60 @@ class IFUShells(object):
         """
         return len(self._r_bins) - 1
 
+    @property
+    def max_radius(self):
+        """
+        maximal distance of the aperture to the origin of the coordinates
+
+        :return: float
+        """
+        return np.sqrt(self._center_ra ** 2 + self._center_dec ** 2) + np.max(self._r_bins)
+
 
 @export
 def shell_ifu_select(ra, dec, r_bin, center_ra=0, center_dec=0):
     """
 
-    :param ra: angular coordinate of photon/ray
-    :param dec: angular coordinate of photon/ray
+    :param ra: angular coordinate of photon/ray, float or numpy array
+    :param dec: angular coordinate of photon/ray, float or numpy array
     :param r_bin: array of radial bins to average the dispersion spectra in ascending order.
      It starts with the inner-most edge to the outermost edge.
     :param center_ra: center of the sphere
     :param center_dec: center of the sphere
-    :return: boolean, True if within the radial range, False otherwise
+    :return: boolean, True if within the radial range, False otherwise, and index of the shell (None outside). For
+     array input, bool array and integer array of the indexes (-1 outside)
     """
     x = ra - center_ra
     y = dec - center_dec
     r = np.sqrt(x ** 2 + y ** 2)
-    for i in range(0, len(r_bin) - 1):
-        if (r >= r_bin[i]) and (r < r_bin[i+1]):
-            return True, i
-    return False, None
+    # index i of the shell with r_bin[i] <= r < r_bin[i+1]
+    index = np.searchsorted(r_bin, r, side='right') - 1
+    bool_select = (index >= 0) & (index < len(r_bin) - 1)
+    if np.ndim(bool_select) == 0:
+        if bool_select:
+            return True, int(index)
+        return False, None
+    return bool_select, np.where(bool_select, index, -1)
+
+
+def _bool_output(bool_select):
+    """
+
+    :param bool_select: bool or bool array
+    :return: python bool for a single photon/ray, bool array otherwise
+    """
+    if np.ndim(bool_select) == 0:
+        return bool(bool_select)
+    return bool_select
+
+
+def _single_segment_index(bool_select):
+    """
+    index of the segment of apertures with a single segment
+
+    :param bool_select: bool or bool array of the selection
+    :return: 0 for a single photon/ray, integer array with 0 inside and -1 outside of the aperture otherwise
+    """
+    if np.ndim(bool_select) == 0:
+        return 0
+    return np.where(bool_select, 0, -1)
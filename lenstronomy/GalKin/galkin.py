@@ -1,5 +1,6 @@
 from lenstronomy.GalKin.observation import GalkinObservation
 from lenstronomy.GalKin.galkin_model import GalkinModel
+from lenstronomy.GalKin.aperture_grid import ApertureGrid
 
 import numpy as np
 
@@ -48,7 +49,7 @@ class Galkin(GalkinModel, GalkinObservation):
 
     """
     def __init__(self, kwargs_model, kwargs_aperture, kwargs_psf, kwargs_cosmo, kwargs_numerics=None,
-                 analytic_kinematics=False):
+                 analytic_kinematics=False, aperture_grid=None):
         """
 
         :param kwargs_model: keyword arguments describing the model components
@@ -58,10 +59,15 @@ class Galkin(GalkinModel, GalkinObservation):
          involved
         :param kwargs_numerics: numerics keyword arguments
         :param analytic_kinematics: bool, if True uses the analytic kinematic model
+        :param aperture_grid: ApertureGrid instance of the same aperture and PSF (optional, e.g. shared between
+         instances), used by dispersion_grid() and dispersion_map_grid() for the settings it was created with
         """
         GalkinModel.__init__(self, kwargs_model, kwargs_cosmo, kwargs_numerics=kwargs_numerics,
                              analytic_kinematics=analytic_kinematics)
         GalkinObservation.__init__(self, kwargs_aperture=kwargs_aperture, kwargs_psf=kwargs_psf)
+        if aperture_grid is not None:
+            self._aperture_grid_instance = aperture_grid
+            self._aperture_grid_settings = aperture_grid.settings
 
     def dispersion(self, kwargs_mass, kwargs_light, kwargs_anisotropy, sampling_number=1000):
         """
@@ -109,18 +115,91 @@ class Galkin(GalkinModel, GalkinObservation):
         for i in range(0, num_kin_sampling):
             r, R, x, y = self.numerics.draw_light(kwargs_light)
             sigma2_IR, IR = self.numerics.sigma_s2(r, R, kwargs_mass, kwargs_light, kwargs_anisotropy)
-            for k in range(0, num_psf_sampling):
-                x_, y_ = self.displace_psf(x, y)
-                bool_ap, ifu_index = self.aperture_select(x_, y_)
-                if bool_ap is True:
-                    sigma2_IR_sum[ifu_index] += sigma2_IR
-                    count_draws[ifu_index] += IR
+            x_, y_ = self.displace_psf(np.full(num_psf_sampling, x), np.full(num_psf_sampling, y))
+            bool_ap, ifu_index = self.aperture_select(x_, y_)
+            num_in_segment = np.bincount(ifu_index[bool_ap], minlength=num_segments)
+            sigma2_IR_sum += sigma2_IR * num_in_segment
+            count_draws += IR * num_in_segment
 
         sigma_s2_average = sigma2_IR_sum / count_draws
         # apply unit conversion from arc seconds and deflections to physical velocity dispersion in (km/s)
         self.numerics.delete_cache()
         return np.sqrt(sigma_s2_average) / 1000.  # in units of km/s
 
+    def dispersion_grid(self, kwargs_mass, kwargs_light, kwargs_anisotropy, delta_pix=None, supersampling_factor=5):
+        """
+        computes the averaged LOS velocity dispersion in the whole aperture (convolved) with a deterministic integral on
+        a pixel grid (see ApertureGrid class) instead of the spectral rendering of dispersion()
+
+        :param kwargs_mass: mass model parameters (following lenstronomy lens model conventions)
+        :param kwargs_light: deflector light parameters (following lenstronomy light model conventions)
+        :param kwargs_anisotropy: anisotropy parameters, may vary according to anisotropy type chosen.
+            We refer to the Anisotropy() class for details on the parameters.
+        :param delta_pix: pixel size of the grid of the PSF convolution (in arc seconds), if None, a tenth of the FWHM
+         (see dispersion_map_grid() for the accuracy)
+        :param supersampling_factor: int, super-sampling factor of the pixels
+        :return: integrated LOS velocity dispersion in units [km/s]
+        """
+        I_R_sigma2_sum, I_R_sum = self._aperture_grid_sums(kwargs_mass, kwargs_light, kwargs_anisotropy, delta_pix,
+                                                           supersampling_factor)
+        sigma_s2_average = np.sum(I_R_sigma2_sum) / np.sum(I_R_sum)
+        return np.sqrt(sigma_s2_average) / 1000.  # in units of km/s
+
+    def dispersion_map_grid(self, kwargs_mass, kwargs_light, kwargs_anisotropy, delta_pix=None,
+                            supersampling_factor=5):
+        """
+        computes the velocity dispersion in each segment of the aperture with a deterministic integral on a pixel grid
+        (see ApertureGrid class) instead of the spectral rendering of dispersion_map(). The result is a smooth function
+        of the parameters.
+
+        The accuracy is set by the pixel size relative to the FWHM and to the width of the segments. For Gaussian and
+        Moffat seeing and segments of 0.3 - 1 FWHM width, the relative errors are up to 2e-3 with delta_pix = FWHM / 5,
+        4e-4 with FWHM / 10 (default) and 7e-5 with FWHM / 20, with a super-sampling factor of 5 (the largest errors
+        are in the central segment).
+
+        :param kwargs_mass: keyword arguments of the mass model
+        :param kwargs_light: keyword argument of the light model
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :param delta_pix: pixel size of the grid of the PSF convolution (in arc seconds), if None, a tenth of the FWHM
+        :param supersampling_factor: int, super-sampling factor of the pixels
+        :return: ordered array of velocity dispersions [km/s] for each segment
+        """
+        I_R_sigma2_sum, I_R_sum = self._aperture_grid_sums(kwargs_mass, kwargs_light, kwargs_anisotropy, delta_pix,
+                                                           supersampling_factor)
+        sigma_s2_average = I_R_sigma2_sum / I_R_sum
+        return np.sqrt(sigma_s2_average) / 1000.  # in units of km/s
+
+    def _aperture_grid_sums(self, kwargs_mass, kwargs_light, kwargs_anisotropy, delta_pix, supersampling_factor):
+        """
+        seeing convolved I(R) * sigma_s^2(R) and I(R) summed over each segment of the aperture on the pixel grid
+
+        :param kwargs_mass: keyword arguments of the mass model
+        :param kwargs_light: keyword argument of the light model
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :param delta_pix: pixel size of the grid of the PSF convolution (in arc seconds)
+        :param supersampling_factor: int, super-sampling factor of the pixels
+        :return: sums of I(R) * sigma_s^2(R) and of I(R) for each segment
+        """
+        aperture_grid = self._aperture_grid(delta_pix, supersampling_factor)
+        I_R_sigma2, I_R = self.numerics.I_R_sigma2_and_IR(aperture_grid.radius, kwargs_mass, kwargs_light,
+                                                           kwargs_anisotropy)
+        self.numerics.delete_cache()
+        return aperture_grid.aperture_sum(I_R_sigma2), aperture_grid.aperture_sum(I_R)
+
+    def _aperture_grid(self, delta_pix, supersampling_factor):
+        """
+        grid of the aperture and PSF, computed at the first call for a given pixel size and super-sampling factor
+
+        :param delta_pix: pixel size of the grid
+        :param supersampling_factor: int, super-sampling factor of the pixels
+        :return: ApertureGrid instance
+        """
+        if getattr(self, '_aperture_grid_settings', None) != (delta_pix, supersampling_factor):
+            self._aperture_grid_instance = ApertureGrid(self, delta_pix=delta_pix,
+                                                        supersampling_factor=supersampling_factor)
+            self._aperture_grid_settings = (delta_pix, supersampling_factor)
+        return self._aperture_grid_instance
+
     def _draw_one_sigma2(self, kwargs_mass, kwargs_light, kwargs_anisotropy):
         """
 
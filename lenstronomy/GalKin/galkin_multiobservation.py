@@ -1,5 +1,6 @@
 from lenstronomy.GalKin.observation import GalkinObservation
 from lenstronomy.GalKin.galkin_model import GalkinModel
+from lenstronomy.GalKin.aperture_grid import ApertureGrid
 
 import numpy as np
 
@@ -15,7 +16,7 @@ class GalkinMultiObservation(GalkinModel):
     Does not work with IFU observations (yet)
     """
     def __init__(self, kwargs_model, kwargs_aperture_list, kwargs_psf_list, kwargs_cosmo, kwargs_numerics=None,
-                 analytic_kinematics=False):
+                 analytic_kinematics=False, aperture_grid_list=None):
         """
 
         :param kwargs_model: keyword arguments describing the model components
@@ -26,6 +27,8 @@ class GalkinMultiObservation(GalkinModel):
          involved
         :param kwargs_numerics: numerics keyword arguments - see GalkinModel
         :param analytic_kinematics: bool, if True uses the analytic kinematic model
+        :param aperture_grid_list: list of ApertureGrid instances of the observations created with the same settings
+         (optional, e.g. shared between instances), used by dispersion_map_grid() for these settings
         """
         GalkinModel.__init__(self, kwargs_model, kwargs_cosmo, kwargs_numerics=kwargs_numerics,
                              analytic_kinematics=analytic_kinematics)
@@ -34,6 +37,9 @@ class GalkinMultiObservation(GalkinModel):
         for i in range(self._num_observations):
             self._observation_list.append(GalkinObservation(kwargs_aperture=kwargs_aperture_list[i],
                                                             kwargs_psf=kwargs_psf_list[i]))
+        if aperture_grid_list is not None:
+            self._aperture_grid_list = aperture_grid_list
+            self._aperture_grid_settings = aperture_grid_list[0].settings
 
     def dispersion_map(self, kwargs_mass, kwargs_light, kwargs_anisotropy, num_kin_sampling=1000, num_psf_sampling=100):
         """
@@ -59,14 +65,43 @@ class GalkinMultiObservation(GalkinModel):
             r, R, x, y = self.numerics.draw_light(kwargs_light)
             sigma2_IR, IR = self.numerics.sigma_s2(r, R, kwargs_mass, kwargs_light, kwargs_anisotropy)
             for obs_index, observation in enumerate(self._observation_list):
-                for k in range(0, num_psf_sampling):
-                    x_, y_ = observation.displace_psf(x, y)
-                    bool_ap, _ = observation.aperture_select(x_, y_)
-                    if bool_ap is True:
-                        sigma2_R_sum[obs_index] += sigma2_IR
-                        count_draws[obs_index] += IR
+                x_, y_ = observation.displace_psf(np.full(num_psf_sampling, x), np.full(num_psf_sampling, y))
+                bool_ap, _ = observation.aperture_select(x_, y_)
+                num_in_aperture = np.count_nonzero(bool_ap)
+                sigma2_R_sum[obs_index] += sigma2_IR * num_in_aperture
+                count_draws[obs_index] += IR * num_in_aperture
 
         sigma_s2_average = sigma2_R_sum / count_draws
         # apply unit conversion from arc seconds and deflections to physical velocity dispersion in (km/s)
         self.numerics.delete_cache()
         return np.sqrt(sigma_s2_average) / 1000.  # in units of km/s
+
+    def dispersion_map_grid(self, kwargs_mass, kwargs_light, kwargs_anisotropy, delta_pix=None,
+                            supersampling_factor=5):
+        """
+        computes the velocity dispersion of each observation with a deterministic integral on a pixel grid (see
+        ApertureGrid class) instead of the spectral rendering of dispersion_map(). The kinematics are computed once
+        for all observations.
+
+        :param kwargs_mass: keyword arguments of the mass model
+        :param kwargs_light: keyword argument of the light model
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :param delta_pix: pixel size of the grids of the PSF convolution (in arc seconds), if None, a tenth of the FWHM
+         of each observation (see Galkin.dispersion_map_grid() for the accuracy)
+        :param supersampling_factor: int, super-sampling factor of the pixels
+        :return: ordered array of velocity dispersions [km/s] for each observation
+        """
+        if getattr(self, '_aperture_grid_settings', None) != (delta_pix, supersampling_factor):
+            self._aperture_grid_list = [ApertureGrid(observation, delta_pix=delta_pix,
+                                                     supersampling_factor=supersampling_factor)
+                                        for observation in self._observation_list]
+            self._aperture_grid_settings = (delta_pix, supersampling_factor)
+        sigma_s2_average = np.zeros(self._num_observations)
+        for obs_index, aperture_grid in enumerate(self._aperture_grid_list):
+            I_R_sigma2, I_R = self.numerics.I_R_sigma2_and_IR(aperture_grid.radius, kwargs_mass, kwargs_light,
+                                                               kwargs_anisotropy)
+            # the observations have a single segment
+            sigma_s2_average[obs_index] = aperture_grid.aperture_sum(I_R_sigma2)[0] / \
+                aperture_grid.aperture_sum(I_R)[0]
+        self.numerics.delete_cache()
+        return np.sqrt(sigma_s2_average) / 1000.  # in units of km/s
@@ -88,6 +88,18 @@ class NumericKinematics(Anisotropy):
         # I_R = self.lightProfile.light_2d(R, kwargs_light)
         return I_R_sigma2 / I_R, 1
 
+    def I_R_sigma2_and_IR(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
+        """
+        return I(R)*sigma^2 equation A15 in Mamon & Lokas 2005 and the projected light I(R), interpolated in log(R)
+
+        :param R: projected radius (in arc seconds), float or numpy array
+        :param kwargs_mass: mass profile keyword arguments
+        :param kwargs_light: light model keyword arguments
+        :param kwargs_anisotropy: stellar anisotropy keyword arguments
+        :return: I(R)*sigma^2, I(R)
+        """
+        return self._I_R_sigma2_interp(R, kwargs_mass, kwargs_light, kwargs_anisotropy)
+
     def sigma_s2_r(self, r, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
         """
         returns unweighted los velocity dispersion for a specified 3d radius r at projected radius R
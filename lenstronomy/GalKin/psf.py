@@ -1,4 +1,7 @@
+import numpy as np
 from lenstronomy.GalKin import velocity_util as util
+from lenstronomy.Util import kernel_util
+import lenstronomy.Util.util as lenstronomy_util
 
 from lenstronomy.Util.package_util import exporter
 export, __all__ = exporter()
@@ -25,12 +28,30 @@ class PSF(object):
     def displace_psf(self, x, y):
         """
 
-        :param x: x-coordinate of light ray
-        :param y: y-coordinate of light ray
-        :return: x', y' displaced by the two dimensional PSF distribution function
+        :param x: x-coordinate of light ray, float or numpy array
+        :param y: y-coordinate of light ray, float or numpy array
+        :return: x', y' displaced by the two dimensional PSF distribution function (independently for each ray)
         """
         return self._psf.displace_psf(x, y)
 
+    def convolution_kernel(self, delta_pix, num_pix):
+        """
+        normalized pixelated kernel of the PSF
+
+        :param delta_pix: pixel size of the kernel
+        :param num_pix: number of pixels per axis of the kernel (odd number)
+        :return: 2d array of the kernel
+        """
+        return self._psf.convolution_kernel(delta_pix, num_pix)
+
+    @property
+    def fwhm(self):
+        """
+
+        :return: full width at half maximum of the PSF
+        """
+        return self._psf.fwhm
+
 
 @export
 class PSFGaussian(object):
@@ -47,12 +68,30 @@ class PSFGaussian(object):
     def displace_psf(self, x, y):
         """
 
-        :param x: x-coordinate of light ray
-        :param y: y-coordinate of light ray
-        :return: x', y' displaced by the two dimensional PSF distribution function
+        :param x: x-coordinate of light ray, float or numpy array
+        :param y: y-coordinate of light ray, float or numpy array
+        :return: x', y' displaced by the two dimensional PSF distribution function (independently for each ray)
         """
         return util.displace_PSF_gaussian(x, y, self._fwhm)
 
+    def convolution_kernel(self, delta_pix, num_pix):
+        """
+        normalized pixelated kernel of the PSF
+
+        :param delta_pix: pixel size of the kernel
+        :param num_pix: number of pixels per axis of the kernel (odd number)
+        :return: 2d array of the kernel
+        """
+        return kernel_util.kernel_gaussian(num_pix, delta_pix, self._fwhm)
+
+    @property
+    def fwhm(self):
+        """
+
+        :return: full width at half maximum of the PSF
+        """
+        return self._fwhm
+
 
 @export
 class PSFMoffat(object):
@@ -72,8 +111,30 @@ class PSFMoffat(object):
     def displace_psf(self, x, y):
         """
 
-        :param x: x-coordinate of light ray
-        :param y: y-coordinate of light ray
-        :return: x', y' displaced by the two dimensional PSF distribution function
+        :param x: x-coordinate of light ray, float or numpy array
+        :param y: y-coordinate of light ray, float or numpy array
+        :return: x', y' displaced by the two dimensional PSF distribution function (independently for each ray)
         """
         return util.displace_PSF_moffat(x, y, self._fwhm, self._moffat_beta)
+
+    def convolution_kernel(self, delta_pix, num_pix):
+        """
+        normalized pixelated kernel of the PSF
+
+        :param delta_pix: pixel size of the kernel
+        :param num_pix: number of pixels per axis of the kernel (odd number)
+        :return: 2d array of the kernel
+        """
+        x_grid, y_grid = lenstronomy_util.make_grid(num_pix, delta_pix)
+        alpha = util.moffat_fwhm_alpha(self._fwhm, self._moffat_beta)
+        kernel = util.moffat_r(np.sqrt(x_grid ** 2 + y_grid ** 2), alpha, self._moffat_beta)
+        kernel /= np.sum(kernel)
+        return lenstronomy_util.array2image(kernel)
+
+    @property
+    def fwhm(self):
+        """
+
+        :return: full width at half maximum of the PSF
+        """
+        return self._fwhm
@@ -20,15 +20,16 @@ def hyp_2F1(a, b, c, z):
 def displace_PSF_gaussian(x, y, FWHM):
     """
 
-    :param x: x-coord (arc sec)
-    :param y: y-coord (arc sec)
+    :param x: x-coord (arc sec), float or numpy array
+    :param y: y-coord (arc sec), float or numpy array
     :param FWHM: psf size (arc sec)
     :return: x', y' random displaced according to psf
     """
     sigma = FWHM / (2 * np.sqrt(2 * np.log(2)))
     sigma_one_direction = sigma
-    x_ = x + np.random.normal() * sigma_one_direction
-    y_ = y + np.random.normal() * sigma_one_direction
+    size = np.shape(x) if np.ndim(x) > 0 else None
+    x_ = x + np.random.normal(size=size) * sigma_one_direction
+    y_ = y + np.random.normal(size=size) * sigma_one_direction
     return x_, y_
 
 
@@ -58,15 +59,16 @@ def moffat_fwhm_alpha(FWHM, beta):
 
 
 @export
-def draw_moffat_r(FWHM, beta):
+def draw_moffat_r(FWHM, beta, size=None):
     """
 
     :param FWHM: full width at half maximum
     :param beta: Moffat beta parameter
+    :param size: None for a single draw, or shape of the array of draws
     :return: draw from radial Moffat distribution
     """
     alpha = moffat_fwhm_alpha(FWHM, beta)
-    y = draw_cdf_Y(beta)
+    y = draw_cdf_Y(beta, size=size)
     # equation B3 in Berge et al. paper
     X = alpha * np.sqrt((y - 1))
     return X
@@ -76,26 +78,29 @@ def draw_moffat_r(FWHM, beta):
 def displace_PSF_moffat(x, y, FWHM, beta):
     """
 
-    :param x: x-coordinate of light ray
-    :param y: y-coordinate of light ray
+    :param x: x-coordinate of light ray, float or numpy array
+    :param y: y-coordinate of light ray, float or numpy array
     :param FWHM: full width at half maximum
     :param beta: Moffat beta parameter
     :return: displaced ray by PSF
     """
-    X = draw_moffat_r(FWHM, beta)
+    size = np.shape(x) if np.ndim(x) > 0 else None
+    X = draw_moffat_r(FWHM, beta, size=size)
     dx, dy = draw_xy(X)
     return x + dx, y + dy
 
 
 @export
-def draw_cdf_Y(beta):
+def draw_cdf_Y(beta, size=None):
     """
     Draw c.d.f for Moffat function according to Berge et al. Ufig paper, equation B2
     cdf(Y) = 1-Y**(1-beta)
 
+    :param beta: Moffat beta parameter
+    :param size: None for a single draw, or shape of the array of draws
     :return:
     """
-    x = np.random.uniform(0, 1)
+    x = np.random.uniform(0, 1, size=size)
     return (1-x) ** (1./(1-beta))
 
 
@@ -124,10 +129,11 @@ def project2d_random(r):
 def draw_xy(R):
     """
 
-    :param R: projected radius
+    :param R: projected radius, float or numpy array
     :return:
     """
-    phi = np.random.uniform(0, 2 * np.pi)
+    size = np.shape(R) if np.ndim(R) > 0 else None
+    phi = np.random.uniform(0, 2 * np.pi, size=size)
     x = R * np.cos(phi)
     y = R * np.sin(phi)
     return x, y
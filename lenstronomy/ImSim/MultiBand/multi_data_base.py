@@ -1,3 +1,6 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 __all__ = ['MultiDataBase']
 
 
@@ -6,11 +9,14 @@ class MultiDataBase(object):
     Base class with definitions that are shared among all variations of modelling multiple data sets
     """
 
-    def __init__(self, image_model_list, compute_bool=None):
+    def __init__(self, image_model_list, compute_bool=None, num_band_threads=1):
         """
 
         :param image_model_list: list of ImageModel instances (supporting linear inversions)
         :param compute_bool: list of booleans for each imaging band indicating whether to model it or not.
+        :param num_band_threads: int, number of threads evaluating the imaging bands in parallel (default 1, i.e.
+         serial evaluation). The FFT convolutions and the linear algebra release the GIL such that the bands can be
+         evaluated concurrently within a single process (e.g. a single walker of a MPI or multiprocessing pool).
         """
         self._num_bands = len(image_model_list)
         if compute_bool is None:
@@ -19,11 +25,62 @@ class MultiDataBase(object):
             if not len(compute_bool) == self._num_bands:
                 raise ValueError('compute_bool statement has not the same range as number of bands available!')
         self._compute_bool = compute_bool
+        if num_band_threads < 1:
+            raise ValueError('num_band_threads needs to be a positive integer, got %s.' % num_band_threads)
+        self._num_band_threads = int(num_band_threads)
+        self._thread_pool, self._thread_pool_pid = None, None
         self._imageModel_list = image_model_list
         self._num_response_list = []
         for imageModel in image_model_list:
             self._num_response_list.append(imageModel.num_data_evaluate)
 
+    def __getstate__(self):
+        # the thread pool can not be pickled and is re-created in the process it is used
+        state = self.__dict__.copy()
+        state['_thread_pool'], state['_thread_pool_pid'] = None, None
+        return state
+
+    def _evaluate_bands(self, func, kwargs_linear=None):
+        """
+        evaluates func(i, *kwargs_linear) for all the bands i to be computed.
+        With num_band_threads > 1, the bands are evaluated in a thread pool. As the evaluation of a band over-writes
+        the linear parameters in the keyword arguments, each band then operates on copies of kwargs_linear and the
+        changes are written back in the order of the bands, such that the result does not depend on the scheduling of
+        the threads and is identical to the serial evaluation.
+
+        :param func: definition with arguments (band index, *kwargs_linear)
+        :param kwargs_linear: list of keyword argument lists (or None) that are updated by the evaluation of a band
+        :return: list of the returns of func for each band (None for bands not computed), ordered as the bands
+        """
+        if kwargs_linear is None:
+            kwargs_linear = []
+        band_list = [i for i in range(self._num_bands) if self._compute_bool[i] is True]
+        result_list = [None] * self._num_bands
+        if self._num_band_threads == 1 or len(band_list) < 2:
+            for i in band_list:
+                result_list[i] = func(i, *kwargs_linear)
+            return result_list
+        thread_pool = self._get_thread_pool()
+        kwargs_init = [_copy_kwargs_list(kwargs) for kwargs in kwargs_linear]
+        kwargs_band_list = [[_copy_kwargs_list(kwargs) for kwargs in kwargs_linear] for _ in band_list]
+        futures = [thread_pool.submit(func, i, *kwargs_band) for i, kwargs_band in zip(band_list, kwargs_band_list)]
+        for i, future in zip(band_list, futures):
+            result_list[i] = future.result()
+        for kwargs_band in kwargs_band_list:
+            for kwargs, kwargs_0, kwargs_i in zip(kwargs_linear, kwargs_init, kwargs_band):
+                _merge_kwargs_list(kwargs, kwargs_0, kwargs_i)
+        return result_list
+
+    def _get_thread_pool(self):
+        """
+
+        :return: ThreadPoolExecutor with num_band_threads workers of the current process
+        """
+        if self._thread_pool is None or self._thread_pool_pid != os.getpid():
+            self._thread_pool = ThreadPoolExecutor(max_workers=self._num_band_threads)
+            self._thread_pool_pid = os.getpid()
+        return self._thread_pool
+
     @property
     def num_bands(self):
         return self._num_bands
@@ -46,6 +103,16 @@ class MultiDataBase(object):
         for imageModel in self._imageModel_list:
             imageModel.reset_point_source_cache(cache=cache)
 
+    def set_profiler(self, profiler):
+        """
+        sets the profiler measuring the stages of the image computation of all bands (see StageProfiler)
+
+        :param profiler: StageProfiler instance
+        :return: None
+        """
+        for imageModel in self._imageModel_list:
+            imageModel.set_profiler(profiler)
+
     @property
     def num_data_evaluate(self):
         num = 0
@@ -83,3 +150,32 @@ class MultiDataBase(object):
                                                                                 error_map=error_map_list[index]))
                 index += 1
         return residual_list
+
+
+def _copy_kwargs_list(kwargs_list):
+    """
+    shallow copy of the individual keyword arguments of a list
+
+    :param kwargs_list: list of keyword arguments or None
+    :return: list of copied keyword arguments or None
+    """
+    if kwargs_list is None:
+        return None
+    return [dict(kwargs) for kwargs in kwargs_list]
+
+
+def _merge_kwargs_list(kwargs_list, kwargs_list_init, kwargs_list_update):
+    """
+    writes the entries changed in kwargs_list_update compared to kwargs_list_init into kwargs_list
+
+    :param kwargs_list: list of keyword arguments to be updated (or None)
+    :param kwargs_list_init: copy of the initial state of kwargs_list
+    :param kwargs_list_update: updated copy of kwargs_list_init
+    :return: None
+    """
+    if kwargs_list is None:
+        return
+    for kwargs, kwargs_init, kwargs_update in zip(kwargs_list, kwargs_list_init, kwargs_list_update):
+        for key, value in kwargs_update.items():
+            if key not in kwargs_init or value is not kwargs_init[key]:
+                kwargs[key] = value
@@ -24,7 +24,7 @@ class MultiLinear(MultiDataBase):
     """
 
     def __init__(self, multi_band_list, kwargs_model, likelihood_mask_list=None, compute_bool=None,
-                 kwargs_pixelbased=None, linear_solver=True):
+                 kwargs_pixelbased=None, linear_solver=True, kwargs_matrix_free=None, num_band_threads=1):
         """
 
         :param multi_band_list: list of imaging band configurations [[kwargs_data, kwargs_psf, kwargs_numerics],[...], ...]
@@ -33,6 +33,8 @@ class MultiLinear(MultiDataBase):
         :param compute_bool: (optional), bool list to indicate which band to be included in the modeling
         :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
          that they get overwritten by the linear solver solution.
+        :param kwargs_matrix_free: keyword arguments of the matrix-free linear solver (see ImageLinearFit)
+        :param num_band_threads: int, number of threads evaluating the bands in parallel (see MultiDataBase)
         """
         self.type = 'multi-linear'
         imageModel_list = []
@@ -41,9 +43,10 @@ class MultiLinear(MultiDataBase):
         for band_index in range(len(multi_band_list)):
             imageModel = SingleBandMultiModel(multi_band_list, kwargs_model, likelihood_mask_list=likelihood_mask_list,
                                               band_index=band_index, kwargs_pixelbased=kwargs_pixelbased,
-                                              linear_solver=linear_solver)
+                                              linear_solver=linear_solver, kwargs_matrix_free=kwargs_matrix_free)
             imageModel_list.append(imageModel)
-        super(MultiLinear, self).__init__(imageModel_list, compute_bool=compute_bool)
+        super(MultiLinear, self).__init__(imageModel_list, compute_bool=compute_bool,
+                                          num_band_threads=num_band_threads)
 
     def image_linear_solve(self, kwargs_lens=None, kwargs_source=None, kwargs_lens_light=None, kwargs_ps=None,
                            kwargs_extinction=None, kwargs_special=None, inv_bool=False):
@@ -59,18 +62,16 @@ class MultiLinear(MultiDataBase):
         :param inv_bool: if True, invert the full linear solver Matrix Ax = y for the purpose of the covariance matrix.
         :return: 1d array of surface brightness pixels of the optimal solution of the linear parameters to match the data
         """
+        def _solve(i, kwargs_source_, kwargs_lens_light_, kwargs_ps_):
+            return self._imageModel_list[i].image_linear_solve(kwargs_lens, kwargs_source_, kwargs_lens_light_,
+                                                               kwargs_ps_, kwargs_extinction, kwargs_special,
+                                                               inv_bool=inv_bool)
+        result_list = self._evaluate_bands(_solve, kwargs_linear=[kwargs_source, kwargs_lens_light, kwargs_ps])
         wls_list, error_map_list, cov_param_list, param_list = [], [], [], []
-        for i in range(self._num_bands):
-            if self._compute_bool[i] is True:
-                wls_model, error_map, cov_param, param = self._imageModel_list[i].image_linear_solve(kwargs_lens,
-                                                                                                     kwargs_source,
-                                                                                                     kwargs_lens_light,
-                                                                                                     kwargs_ps,
-                                                                                                     kwargs_extinction,
-                                                                                                     kwargs_special,
-                                                                                                     inv_bool=inv_bool)
-            else:
-                wls_model, error_map, cov_param, param = None, None, None, None
+        for result in result_list:
+            if result is None:
+                result = None, None, None, None
+            wls_model, error_map, cov_param, param = result
             wls_list.append(wls_model)
             error_map_list.append(error_map)
             cov_param_list.append(cov_param)
@@ -93,15 +94,19 @@ class MultiLinear(MultiDataBase):
         :return: log likelihood (natural logarithm) (sum of the log likelihoods of the individual images)
         """
         # generate image
-        logL = 0
         if linear_prior is None:
             linear_prior = [None for i in range(self._num_bands)]
+
+        def _likelihood(i, kwargs_source_, kwargs_lens_light_, kwargs_ps_):
+            return self._imageModel_list[i].likelihood_data_given_model(kwargs_lens, kwargs_source_,
+                                                                        kwargs_lens_light_, kwargs_ps_,
+                                                                        kwargs_extinction, kwargs_special,
+                                                                        source_marg=source_marg,
+                                                                        linear_prior=linear_prior[i],
+                                                                        check_positive_flux=check_positive_flux)
+        logL_list = self._evaluate_bands(_likelihood, kwargs_linear=[kwargs_source, kwargs_lens_light, kwargs_ps])
+        logL = 0
         for i in range(self._num_bands):
             if self._compute_bool[i] is True:
-                logL += self._imageModel_list[i].likelihood_data_given_model(kwargs_lens, kwargs_source,
-                                                                             kwargs_lens_light, kwargs_ps,
-                                                                             kwargs_extinction, kwargs_special,
-                                                                             source_marg=source_marg,
-                                                                             linear_prior=linear_prior[i],
-                                                                             check_positive_flux=check_positive_flux)
+                logL += logL_list[i]
         return logL
@@ -26,7 +26,7 @@ class SingleBandMultiModel(ImageLinearFit):
     """
 
     def __init__(self, multi_band_list, kwargs_model, likelihood_mask_list=None, band_index=0, kwargs_pixelbased=None,
-                 linear_solver=True):
+                 linear_solver=True, kwargs_matrix_free=None):
         """
 
         :param multi_band_list: list of imaging band configurations [[kwargs_data, kwargs_psf, kwargs_numerics],[...], ...]
@@ -37,6 +37,7 @@ class SingleBandMultiModel(ImageLinearFit):
          (see SLITronomy documentation)
         :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
          that they get overwritten by the linear solver solution.
+        :param kwargs_matrix_free: keyword arguments of the matrix-free linear solver (see ImageLinearFit)
         """
         self.type = 'single-band-multi-model'
         if likelihood_mask_list is None:
@@ -47,6 +48,7 @@ class SingleBandMultiModel(ImageLinearFit):
         kwargs_numerics = multi_band_list[band_index][2]
         data_i = ImageData(**kwargs_data)
         psf_i = PSF(**kwargs_psf)
+        image_numerics_class = class_creator.create_image_numerics(data_i, psf_i, kwargs_psf, kwargs_numerics)
 
         index_lens_model_list = kwargs_model.get('index_lens_model_list', [None for i in range(len(multi_band_list))])
         self._index_lens_model = index_lens_model_list[band_index]
@@ -64,7 +66,9 @@ class SingleBandMultiModel(ImageLinearFit):
         super(SingleBandMultiModel, self).__init__(data_i, psf_i, lens_model_class, source_model_class,
                                                    lens_light_model_class, point_source_class, extinction_class,
                                                    kwargs_numerics=kwargs_numerics, likelihood_mask=likelihood_mask_list[band_index],
-                                                   kwargs_pixelbased=kwargs_pixelbased)
+                                                   kwargs_pixelbased=kwargs_pixelbased,
+                                                   kwargs_matrix_free=kwargs_matrix_free,
+                                                   image_numerics_class=image_numerics_class)
 
     def image_linear_solve(self, kwargs_lens=None, kwargs_source=None, kwargs_lens_light=None, kwargs_ps=None,
                            kwargs_extinction=None, kwargs_special=None, inv_bool=False):
@@ -1,4 +1,4 @@
-from scipy import fftpack, ndimage, signal
+from scipy import fftpack, ndimage
 import numpy as np
 import threading
 import lenstronomy.Util.kernel_util as kernel_util
@@ -59,17 +59,27 @@ class PixelKernelConvolution(object):
         """
         return PixelKernelConvolution(self._kernel.T, convolution_type=self._type)
 
+    def copy_flip(self):
+        """
+
+        :return: copy of the class with kernel rotated by 180 degrees (adjoint of the convolution operation)
+        """
+        return PixelKernelConvolution(self._kernel[::-1, ::-1], convolution_type=self._type)
+
     def convolution2d(self, image):
         """
 
         :param image: 2d array (image) to be convolved
         :return: fft convolution
         """
+        # scipy.signal is slow to import and not needed by the default 'fft_static' convolution
         if self._type == 'fft':
+            from scipy import signal
             image_conv = signal.fftconvolve(image, self._kernel, mode='same')
         elif self._type == 'fft_static':
             image_conv = self._static_fft(image, mode='same')
         elif self._type == 'grid':
+            from scipy import signal
             image_conv = signal.convolve2d(image, self._kernel, mode='same')
         else:
             raise ValueError('convolution_type %s not supported!' % self._type)
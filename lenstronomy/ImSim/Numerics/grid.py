@@ -234,6 +234,20 @@ class RegularGrid(Coordinates1D):
             image_low_res = image
         return image_low_res, image_high_res
 
+    def flux_array_adjoint(self, image_low_res):
+        """
+        adjoint (transpose) of the linear mapping of flux_array2image_low_high() to the low resolution image
+
+        :param image_low_res: 2d array of the regular pixel grid
+        :return: 1d array corresponding to the coordinates_evaluate order
+        """
+        if self._supersampling_factor > 1:
+            image = np.repeat(np.repeat(image_low_res, self._supersampling_factor, axis=0),
+                              self._supersampling_factor, axis=1) / self._supersampling_factor ** 2
+        else:
+            image = image_low_res
+        return util.image2array(image)[self._compute_indexes]
+
     @staticmethod
     def _subgrid_index(idex_mask, subgrid_res, nx, ny):
         """
@@ -122,6 +122,63 @@ class Numerics(PointSourceRendering):
             image_conv = self._conv.re_size_convolve(image_low_res, image_high_res_partial)
         return image_conv * self._pixel_width ** 2
 
+    def re_size_convolve_adjoint(self, image, unconvolved=False):
+        """
+        adjoint (transpose) of the linear operation of re_size_convolve(), used for matrix-free linear inversions.
+        Only supported for the settings accepted by check_adjoint().
+
+        :param image: 2d array on the regular pixel grid
+        :param unconvolved: boolean, if True, does not apply the (adjoint) convolution
+        :return: 1d array, corresponding to coordinates_evaluate
+        """
+        self.check_adjoint()
+        if unconvolved is False:
+            image = self.convolve_adjoint(image)
+        return self._grid.flux_array_adjoint(image) * self._pixel_width ** 2
+
+    def convolve(self, image):
+        """
+        PSF convolution of an image on the regular pixel grid, such that
+        re_size_convolve(flux_array) = convolve(re_size_convolve(flux_array, unconvolved=True)).
+        Only supported for the settings accepted by check_adjoint().
+
+        :param image: 2d array on the regular pixel grid
+        :return: convolved 2d array
+        """
+        self.check_adjoint()
+        if self._psf_type == 'NONE':
+            return image
+        return self._conv.convolution2d(image)
+
+    def convolve_adjoint(self, image):
+        """
+        adjoint (transpose) of convolve()
+
+        :param image: 2d array on the regular pixel grid
+        :return: 2d array
+        """
+        self.check_adjoint()
+        if self._psf_type == 'NONE':
+            return image
+        if not hasattr(self, '_conv_adjoint'):
+            self._conv_adjoint = self._conv.copy_flip()
+        return self._conv_adjoint.convolution2d(image)
+
+    def check_adjoint(self):
+        """
+        checks that the numerical settings support the adjoint operations used by the matrix-free linear inversion:
+        compute_mode='regular' without supersampling_convolution and psf_type 'PIXEL' or 'NONE'
+
+        :return: None
+        :raises: ValueError if the settings are not supported
+        """
+        if not isinstance(self._grid, RegularGrid) or self._high_res_return is True:
+            raise ValueError('adjoint of re_size_convolve() is only supported in compute_mode="regular" without '
+                             'supersampling_convolution.')
+        if self._psf_type != 'NONE' and not isinstance(self._conv, PixelKernelConvolution):
+            raise ValueError('adjoint of re_size_convolve() is only supported for psf_type "PIXEL" or "NONE", got %s.'
+                             % self._psf_type)
+
     @property
     def grid_supersampling_factor(self):
         """
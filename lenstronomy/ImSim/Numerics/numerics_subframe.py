@@ -68,6 +68,43 @@ class NumericsSubFrame(PointSourceRendering):
         image_sub_frame = self._numerics_subframe.re_size_convolve(flux_array, unconvolved=unconvolved)
         return self._complete_frame(image_sub_frame)
 
+    def re_size_convolve_adjoint(self, image, unconvolved=False):
+        """
+        adjoint (transpose) of the linear operation of re_size_convolve()
+
+        :param image: 2d array of the full image
+        :param unconvolved: boolean, if True, does not apply the (adjoint) convolution
+        :return: 1d array, corresponding to coordinates_evaluate
+        """
+        return self._numerics_subframe.re_size_convolve_adjoint(self._cut_frame(image), unconvolved=unconvolved)
+
+    def convolve(self, image):
+        """
+        PSF convolution of an image of the full frame, such that
+        re_size_convolve(flux_array) = convolve(re_size_convolve(flux_array, unconvolved=True))
+
+        :param image: 2d array of the full image
+        :return: convolved 2d array of the full image (zero outside of the sub-frame)
+        """
+        return self._complete_frame(self._numerics_subframe.convolve(self._cut_frame(image)))
+
+    def convolve_adjoint(self, image):
+        """
+        adjoint (transpose) of convolve()
+
+        :param image: 2d array of the full image
+        :return: 2d array of the full image (zero outside of the sub-frame)
+        """
+        return self._complete_frame(self._numerics_subframe.convolve_adjoint(self._cut_frame(image)))
+
+    def check_adjoint(self):
+        """
+        checks that the numerical settings support the adjoint operations (see Numerics.check_adjoint())
+
+        :return: None
+        """
+        self._numerics_subframe.check_adjoint()
+
     @property
     def grid_supersampling_factor(self):
         """
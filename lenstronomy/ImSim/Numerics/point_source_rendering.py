@@ -1,6 +1,7 @@
 from lenstronomy.Util import image_util
 from lenstronomy.Util import kernel_util
 import numpy as np
+from scipy import ndimage
 
 __all__ = ['PointSourceRendering']
 
@@ -46,6 +47,58 @@ class PointSourceRendering(object):
         grid2d = image_util.re_size(subgrid2d, factor=subgrid)
         return grid2d*subgrid**2
 
+    def point_source_rendering_sparse(self, ra_pos, dec_pos, amp):
+        """
+        renders the point source(s) only on their PSF footprint and returns the non-zero pixels in sparse form.
+        The result is identical to point_source_rendering() with the pixel values stored outside of the returned
+        indexes being zero.
+
+        :param ra_pos: list of RA positions of point source(s)
+        :param dec_pos: list of DEC positions of point source(s)
+        :param amp: list of amplitudes of point source(s)
+        :return: 1d array of (unique and sorted) indexes of the flattened image (as in util.image2array()),
+         1d array of pixel values at those indexes
+        """
+        subgrid = self._supersampling_factor
+        x_pos, y_pos = self._pixel_grid.map_coord2pix(ra_pos, dec_pos)
+        if len(x_pos) > len(amp):
+            raise ValueError('there are %s images appearing but only %s amplitudes provided!' % (len(x_pos), len(amp)))
+        x_pos_subgrid = np.atleast_1d(x_pos) * subgrid + (subgrid - 1) / 2.
+        y_pos_subgrid = np.atleast_1d(y_pos) * subgrid + (subgrid - 1) / 2.
+        kernel = self._kernel_supersampled
+        k_y, k_x = np.shape(kernel)
+        k_l2_x, k_l2_y = int((k_x - 1) / 2), int((k_y - 1) / 2)
+        index_list, value_list = [], []
+        for i in range(len(x_pos_subgrid)):
+            x_int = int(round(x_pos_subgrid[i]))
+            y_int = int(round(y_pos_subgrid[i]))
+            # the sub-pixel shift is performed in the same way as in image_util.add_layer2image()
+            kernel_shifted = ndimage.shift(amp[i] * kernel, shift=[-(y_int - y_pos_subgrid[i]),
+                                                                   -(x_int - x_pos_subgrid[i])], order=1)
+            # stamp on the super-sampled grid aligned with the (regular) pixels covering the full kernel
+            x_min, x_max = (x_int - k_l2_x) // subgrid, (x_int + k_l2_x) // subgrid
+            y_min, y_max = (y_int - k_l2_y) // subgrid, (y_int + k_l2_y) // subgrid
+            stamp = np.zeros(((y_max - y_min + 1) * subgrid, (x_max - x_min + 1) * subgrid))
+            y_0, x_0 = y_int - k_l2_y - y_min * subgrid, x_int - k_l2_x - x_min * subgrid
+            stamp[y_0:y_0 + k_y, x_0:x_0 + k_x] = kernel_shifted
+            stamp = image_util.re_size(stamp, factor=subgrid)
+            # cut the stamp to the image frame
+            rows = np.arange(y_min, y_max + 1)
+            cols = np.arange(x_min, x_max + 1)
+            bool_rows = (rows >= 0) & (rows < self._nx)
+            bool_cols = (cols >= 0) & (cols < self._ny)
+            if not np.any(bool_rows) or not np.any(bool_cols):
+                continue
+            stamp = stamp[bool_rows][:, bool_cols]
+            index = rows[bool_rows][:, np.newaxis] * self._ny + cols[bool_cols][np.newaxis, :]
+            index_list.append(index.flatten())
+            value_list.append(stamp.flatten())
+        if len(index_list) == 0:
+            return np.zeros(0, dtype=int), np.zeros(0)
+        index, inverse = np.unique(np.concatenate(index_list), return_inverse=True)
+        values = np.bincount(inverse, weights=np.concatenate(value_list), minlength=len(index))
+        return index, values * subgrid**2
+
     @property
     def _kernel_supersampled(self):
         if not hasattr(self, '_kernel_supersampled_instance'):
@@ -8,7 +8,7 @@ export, __all__ = exporter()
 
 
 @export
-def get_param_WLS(A, C_D_inv, d, inv_bool=True):
+def get_param_WLS(A, C_D_inv, d, inv_bool=True, sparse_index_list=None):
     """
     returns the parameter values given
 
@@ -16,19 +16,20 @@ def get_param_WLS(A, C_D_inv, d, inv_bool=True):
     :param C_D_inv: inverse covariance matrix of the data, Nd x Nd, diagonal form
     :param d: data array, 1-d Nd
     :param inv_bool: boolean, whether returning also the inverse matrix or just solve the linear system
+    :param sparse_index_list: None or list of length Ns. Each entry is either None (dense response) or a 1-d array of
+     the data indexes where the response of the parameter is non-zero (e.g. the footprint of a point source).
+     The normal matrix entries of sparse responses are only computed on their footprints.
     :return: 1-d array of parameter values
     """
-    M = A.T.dot(np.multiply(C_D_inv, A.T).T)
+    M, R = normal_equations(A, C_D_inv, d, sparse_index_list=sparse_index_list)
     if inv_bool:
         if np.linalg.cond(M) < 5/sys.float_info.epsilon:
             M_inv = _stable_inv(M)
         else:
             M_inv = np.zeros_like(M)
-        R = A.T.dot(np.multiply(C_D_inv, d))
         B = M_inv.dot(R)
     else:
         if np.linalg.cond(M) < 5/sys.float_info.epsilon:
-            R = A.T.dot(np.multiply(C_D_inv, d))
             B = _solve_stable(M, R)
             # try:
             #    B = np.linalg.solve(M, R).T
@@ -41,6 +42,42 @@ def get_param_WLS(A, C_D_inv, d, inv_bool=True):
     return B, M_inv, image
 
 
+@export
+def normal_equations(A, C_D_inv, d, sparse_index_list=None):
+    """
+    computes the normal matrix M = A^T C_D^-1 A and the projected data vector R = A^T C_D^-1 d of the weighted least
+    squares problem
+
+    :param A: response matrix Nd x Ns (Nd = # data points, Ns = # parameters)
+    :param C_D_inv: inverse covariance matrix of the data, Nd x Nd, diagonal form
+    :param d: data array, 1-d Nd
+    :param sparse_index_list: None or list of length Ns. Each entry is either None (dense response) or a 1-d array of
+     the data indexes where the response of the parameter is non-zero.
+    :return: M (Ns x Ns), R (Ns)
+    """
+    if sparse_index_list is None:
+        M = A.T.dot(np.multiply(C_D_inv, A.T).T)
+        R = A.T.dot(np.multiply(C_D_inv, d))
+        return M, R
+    num_param = len(sparse_index_list)
+    sparse_bool = np.array([index is not None for index in sparse_index_list], dtype=bool)
+    dense_bool = ~sparse_bool
+    M = np.zeros((num_param, num_param))
+    R = np.zeros(num_param)
+    if np.any(dense_bool):
+        A_dense = A[:, dense_bool]
+        M[np.ix_(dense_bool, dense_bool)] = A_dense.T.dot(np.multiply(C_D_inv, A_dense.T).T)
+        R[dense_bool] = A_dense.T.dot(np.multiply(C_D_inv, d))
+    for i in np.where(sparse_bool)[0]:
+        index = sparse_index_list[i]
+        weights = A[index, i] * C_D_inv[index]
+        M_i = weights.dot(A[index, :])
+        M[i, :] = M_i
+        M[:, i] = M_i
+        R[i] = weights.dot(d[index])
+    return M, R
+
+
 @export
 def marginalisation_const(M_inv):
     """
@@ -78,6 +115,106 @@ def marginalization_new(M_inv, d_prior=None):
     return log_det / 2 + m/2. * np.log(np.pi/2.) - m * np.log(d_prior)
 
 
+@export
+def get_param_cg(apply_M, R, M_diag=None, x0=None, tol=1e-8, max_iter=None):
+    """
+    solves the normal equations M x = R with a (Jacobi) preconditioned conjugate gradient method, requiring only
+    matrix-vector products with M
+
+    :param apply_M: function computing M.dot(v) for a 1-d array v (M symmetric positive definite, Ns x Ns)
+    :param R: 1-d array of length Ns, right-hand side of the normal equations
+    :param M_diag: 1-d array of length Ns, (approximate) diagonal of M used as preconditioner (or None)
+    :param x0: 1-d array of length Ns, initial guess of the solution (or None, starting at zero)
+    :param tol: relative tolerance of the residual norm |R - M x| / |R| to stop the iteration
+    :param max_iter: maximum number of iterations (default is Ns)
+    :return: 1-d array of parameter values, number of iterations performed
+    """
+    num = len(R)
+    if max_iter is None:
+        max_iter = num
+    if M_diag is None:
+        precond = np.ones(num)
+    else:
+        precond = np.zeros(num)
+        precond[M_diag > 0] = 1. / M_diag[M_diag > 0]
+    if x0 is None:
+        x = np.zeros(num)
+        r = np.array(R, dtype=float)
+    else:
+        x = np.array(x0, dtype=float)
+        r = R - apply_M(x)
+    norm_R = np.linalg.norm(R)
+    if norm_R == 0:
+        return np.zeros(num), 0
+    z = precond * r
+    p = z.copy()
+    rz = r.dot(z)
+    i = 0
+    for i in range(1, max_iter + 1):
+        Mp = apply_M(p)
+        pMp = p.dot(Mp)
+        if pMp <= 0:
+            break
+        alpha = rz / pMp
+        x += alpha * p
+        r -= alpha * Mp
+        if np.linalg.norm(r) < tol * norm_R:
+            break
+        z = precond * r
+        rz_new = r.dot(z)
+        p = z + rz_new / rz * p
+        rz = rz_new
+    return x, i
+
+
+@export
+def log_det_lanczos(apply_M, num, num_probes=20, num_steps=30, seed=42, min_eigenvalue=None):
+    """
+    stochastic Lanczos quadrature estimate of log det(M) of a symmetric positive definite matrix M (Ubaru et al. 2017),
+    requiring only matrix-vector products with M.
+    The Rademacher probe vectors are drawn with a fixed seed such that the estimate is a deterministic (smooth)
+    function of M.
+
+    :param apply_M: function computing M.dot(v) for a 1-d array v (M symmetric positive definite, Ns x Ns)
+    :param num: int, dimension Ns of M
+    :param num_probes: number of random probe vectors
+    :param num_steps: number of Lanczos iterations per probe vector
+    :param seed: seed of the random number generator of the probe vectors
+    :param min_eigenvalue: float or None, if set, the eigenvalues of M are raised to at least this value (the
+     equivalent of the limitation of the eigenvalues of the covariance matrix in marginalization_new())
+    :return: estimate of log det(M)
+    """
+    random = np.random.RandomState(seed)
+    num_steps = min(num_steps, num)
+    log_det = 0
+    for _ in range(num_probes):
+        v = random.choice([-1., 1.], size=num) / np.sqrt(num)
+        alpha, beta = np.zeros(num_steps), np.zeros(num_steps - 1)
+        v_prev = np.zeros(num)
+        b = 0
+        k = num_steps
+        for j in range(num_steps):
+            w = apply_M(v)
+            alpha[j] = w.dot(v)
+            w = w - alpha[j] * v - b * v_prev
+            if j == num_steps - 1:
+                break
+            b = np.linalg.norm(w)
+            if b < 1e-12:
+                k = j + 1
+                break
+            beta[j] = b
+            v_prev, v = v, w / b
+        T = np.diag(alpha[:k]) + np.diag(beta[:k - 1], 1) + np.diag(beta[:k - 1], -1)
+        theta, U = np.linalg.eigh(T)
+        if np.any(theta <= 0):
+            return np.nan
+        if min_eigenvalue is not None:
+            theta = np.maximum(theta, min_eigenvalue)
+        log_det += np.sum(U[0, :] ** 2 * np.log(theta))
+    return log_det * num / num_probes
+
+
 def _stable_inv(m):
     """
     stable linear inversion
@@ -1,5 +1,4 @@
 import numpy as np
-from lenstronomy.Cosmo.background import Background
 
 __all__ = ['Image2SourceMapping']
 
@@ -43,6 +42,7 @@ class Image2SourceMapping(object):
             if self._deflection_scaling_list is not None:
                 raise ValueError('deflection scaling for different source planes not possible in combination of '
                                  'multi-lens plane modeling. You have to specify the redshifts of the sources instead.')
+            from lenstronomy.Cosmo.background import Background
             self._bkg_cosmo = Background(lensModel.cosmo)
             if self._source_redshift_list is None:
                 self._multi_source_plane = False
@@ -2,6 +2,7 @@ from lenstronomy.ImSim.image_model import ImageModel
 import lenstronomy.ImSim.de_lens as de_lens
 from lenstronomy.Util import util
 from lenstronomy.ImSim.Numerics.convolution import PixelKernelConvolution
+from lenstronomy.ImSim.linear_response_operator import LinearResponseOperator
 import numpy as np
 
 __all__ = ['ImageLinearFit']
@@ -18,7 +19,8 @@ class ImageLinearFit(ImageModel):
     def __init__(self, data_class, psf_class=None, lens_model_class=None, source_model_class=None,
                  lens_light_model_class=None, point_source_class=None, extinction_class=None, 
                  kwargs_numerics=None, likelihood_mask=None,
-                 psf_error_map_bool_list=None, kwargs_pixelbased=None):
+                 psf_error_map_bool_list=None, kwargs_pixelbased=None, kwargs_matrix_free=None,
+                 image_numerics_class=None):
         """
 
         :param data_class: ImageData() instance
@@ -34,16 +36,30 @@ class ImageLinearFit(ImageModel):
          Indicates whether PSF error map is used for the point source model stated as the index.
         :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver
          (see SLITronomy documentation) being applied to the point sources.
+        :param kwargs_matrix_free: keyword arguments of the matrix-free linear solver (or None for the dense linear
+         response matrix). The linear inversion is solved with preconditioned conjugate gradients and the
+         marginalization over the linear parameters uses a stochastic Lanczos estimate of the log determinant.
+         Options are 'tolerance' (relative residual, default 1e-8), 'max_iter' (default: number of linear parameters),
+         'regularization' (float or array, diagonal of the Gaussian prior precision on the linear parameters,
+         default 0), 'num_probes' (default 20), 'num_lanczos_steps' (default 30) and 'seed' (default 42).
+         Without regularization, the marginalization term has the same normalization as the dense linear solver
+         (including linear_prior). Requires compute_mode='regular' without supersampling_convolution and psf_type
+         'PIXEL' or 'NONE', a ValueError is raised otherwise.
+        :param image_numerics_class: (optional) NumericsSubFrame() instance of the pixel grid of data_class, psf_class
+         and kwargs_numerics (see ImageModel)
         """
         if likelihood_mask is None:
             likelihood_mask = np.ones_like(data_class.data)
         self.likelihood_mask = np.array(likelihood_mask, dtype=bool)
         self._mask1d = util.image2array(self.likelihood_mask)
+        # index of each image pixel in the masked 1d data vector (-1 for pixels masked out)
+        self._index_masked1d = np.where(self._mask1d, np.cumsum(self._mask1d) - 1, -1)
         super(ImageLinearFit, self).__init__(data_class, psf_class=psf_class, lens_model_class=lens_model_class,
                                              source_model_class=source_model_class,
                                              lens_light_model_class=lens_light_model_class,
                                              point_source_class=point_source_class, extinction_class=extinction_class, 
-                                             kwargs_numerics=kwargs_numerics, kwargs_pixelbased=kwargs_pixelbased)
+                                             kwargs_numerics=kwargs_numerics, kwargs_pixelbased=kwargs_pixelbased,
+                                             image_numerics_class=image_numerics_class)
         if psf_error_map_bool_list is None:
             psf_error_map_bool_list = [True] * len(self.PointSource.point_source_type_list)
         self._psf_error_map_bool_list = psf_error_map_bool_list
@@ -51,6 +67,18 @@ class ImageLinearFit(ImageModel):
             # update the pixel-based solver with the likelihood mask
             self.PixelSolver.set_likelihood_mask(self.likelihood_mask)
 
+        if kwargs_matrix_free is not None:
+            if self._pixelbased_bool is True or self.Data.likelihood_method() != 'diagonal':
+                raise ValueError('matrix-free linear solver is only supported for the "diagonal" likelihood method '
+                                 'without pixel-based solver.')
+            if np.any(np.asarray(kwargs_matrix_free.get('regularization', 0)) < 0):
+                raise ValueError('the regularization of the matrix-free linear solver needs to be non-negative, got %s.'
+                                 % kwargs_matrix_free.get('regularization'))
+            self.ImageNumerics.check_adjoint()
+        self._kwargs_matrix_free = kwargs_matrix_free
+        self._freeze_extended_response = False
+        self._extended_response_cache = None
+
         # prepare to use fft convolution for the natwt linear solver 
         if self.Data.likelihood_method() == 'interferometry_natwt':
             self._convolution = PixelKernelConvolution(kernel = self.PSF.kernel_point_source)
@@ -93,11 +121,20 @@ class ImageLinearFit(ImageModel):
             model, model_error, cov_param, param = self.image_pixelbased_solve(kwargs_lens, kwargs_source, 
                                                                                kwargs_lens_light, kwargs_ps, 
                                                                                kwargs_extinction, kwargs_special)
+        elif self._kwargs_matrix_free is not None:
+            model, model_error, cov_param, param = self._image_linear_solve_matrix_free(kwargs_lens, kwargs_source,
+                                                                                        kwargs_lens_light, kwargs_ps,
+                                                                                        kwargs_extinction,
+                                                                                        kwargs_special,
+                                                                                        inv_bool=inv_bool)
         elif self.Data.likelihood_method() == 'diagonal':
-            A = self._linear_response_matrix(kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps, kwargs_extinction, kwargs_special)
+            A, sparse_index_list = self._linear_response_matrix_sparse(kwargs_lens, kwargs_source, kwargs_lens_light,
+                                                                       kwargs_ps, kwargs_extinction, kwargs_special)
             C_D_response, model_error = self._error_response(kwargs_lens, kwargs_ps, kwargs_special=kwargs_special)
             d = self.data_response
-            param, cov_param, wls_model = de_lens.get_param_WLS(A.T, 1 / C_D_response, d, inv_bool=inv_bool)
+            with self._profiler.stage('get_param_WLS'):
+                param, cov_param, wls_model = de_lens.get_param_WLS(A.T, 1 / C_D_response, d, inv_bool=inv_bool,
+                                                                    sparse_index_list=sparse_index_list)
             model = self.array_masked2image(wls_model)
             _, _, _, _ = self.update_linear_kwargs(param, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps)
         elif self.Data.likelihood_method() == 'interferometry_natwt':
@@ -107,6 +144,75 @@ class ImageLinearFit(ImageModel):
             raise ValueError("likelihood_method %s not supported!" % self.Data.likelihood_method())
         return model, model_error, cov_param, param
 
+    def _image_linear_solve_matrix_free(self, kwargs_lens=None, kwargs_source=None, kwargs_lens_light=None,
+                                        kwargs_ps=None, kwargs_extinction=None, kwargs_special=None, inv_bool=False):
+        """
+        linear inversion with the matrix-free representation of the response (see LinearResponseOperator), solved
+        with preconditioned conjugate gradients. The covariance matrix of the linear parameters is not computed.
+
+        :param kwargs_lens: list of keyword arguments corresponding to the superposition of different lens profiles
+        :param kwargs_source: list of keyword arguments corresponding to the superposition of different source light profiles
+        :param kwargs_lens_light: list of keyword arguments corresponding to different lens light surface brightness profiles
+        :param kwargs_ps: keyword arguments corresponding to "other" parameters, such as external shear and point source image positions
+        :param inv_bool: has no impact, the covariance matrix is not computed by the matrix-free linear solver
+        :return: 2d array of surface brightness pixels of the optimal solution, error map, None, linear parameters
+        """
+        model, model_error, param, _ = self._matrix_free_solve(kwargs_lens, kwargs_source, kwargs_lens_light,
+                                                               kwargs_ps, kwargs_extinction, kwargs_special,
+                                                               marginalization=False)
+        return model, model_error, None, param
+
+    def _matrix_free_solve(self, kwargs_lens=None, kwargs_source=None, kwargs_lens_light=None, kwargs_ps=None,
+                           kwargs_extinction=None, kwargs_special=None, marginalization=False, linear_prior=None):
+        """
+        linear inversion with the matrix-free representation of the response (see LinearResponseOperator), solved
+        with preconditioned conjugate gradients, and the marginalization term over the linear parameters computed with
+        a stochastic Lanczos estimate of the log determinant of the normal matrix.
+
+        :param kwargs_lens: list of keyword arguments corresponding to the superposition of different lens profiles
+        :param kwargs_source: list of keyword arguments corresponding to the superposition of different source light profiles
+        :param kwargs_lens_light: list of keyword arguments corresponding to different lens light surface brightness profiles
+        :param kwargs_ps: keyword arguments corresponding to "other" parameters, such as external shear and point source image positions
+        :param marginalization: bool, if True, computes the marginalization term over the linear parameters
+        :param linear_prior: linear prior width in eigenvalues, with the same normalization as
+         de_lens.marginalization_new() of the dense linear solver (not combined with a 'regularization')
+        :return: 2d array of surface brightness pixels of the optimal solution, error map, linear parameters,
+         marginalization term of the log likelihood (None if marginalization=False)
+        """
+        operator = self._linear_response_operator(kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps,
+                                                  kwargs_extinction, kwargs_special)
+        C_D_response, model_error = self._error_response(kwargs_lens, kwargs_ps, kwargs_special=kwargs_special)
+        weights = 1. / C_D_response
+        d = self.data_response
+        kwargs = self._kwargs_matrix_free
+        regularization = kwargs.get('regularization', 0)
+        apply_M = lambda x: operator.normal_dot(x, weights, regularization=regularization)
+        M_diag = operator.normal_diagonal(weights) + regularization
+        param, _ = de_lens.get_param_cg(apply_M, operator.adjoint(weights * d), M_diag=M_diag,
+                                        tol=kwargs.get('tolerance', 1e-8), max_iter=kwargs.get('max_iter', None))
+        model = self.array_masked2image(operator.forward(param))
+        marg_const = None
+        if marginalization is True:
+            min_eigenvalue = None if linear_prior is None else linear_prior ** -2
+            log_det = de_lens.log_det_lanczos(apply_M, operator.num_param, num_probes=kwargs.get('num_probes', 20),
+                                              num_steps=kwargs.get('num_lanczos_steps', 30),
+                                              seed=kwargs.get('seed', 42), min_eigenvalue=min_eigenvalue)
+            if np.isnan(log_det):
+                marg_const = -10**15
+            else:
+                # same normalization as de_lens.marginalization_new() of the covariance matrix M^-1
+                marg_const = - log_det / 2.
+                if linear_prior is not None:
+                    m = operator.num_param
+                    marg_const += m / 2. * np.log(np.pi / 2.) - m * np.log(linear_prior)
+                if np.any(regularization):
+                    regularization = regularization * np.ones(operator.num_param)
+                    # parameters without regularization (flat prior) do not contribute to the prior normalization
+                    positive = regularization > 0
+                    marg_const += (np.sum(np.log(regularization[positive])) - param.dot(regularization * param)) / 2.
+        _, _, _, _ = self.update_linear_kwargs(param, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps)
+        return model, model_error, param, marg_const
+
     def image_pixelbased_solve(self, kwargs_lens=None, kwargs_source=None, kwargs_lens_light=None, 
                                kwargs_ps=None, kwargs_extinction=None, kwargs_special=None, 
                                init_lens_light_model=None):
@@ -148,6 +254,53 @@ class ImageLinearFit(ImageModel):
                                          kwargs_special)
         return A
 
+    def linear_response_operator(self, kwargs_lens=None, kwargs_source=None, kwargs_lens_light=None, kwargs_ps=None,
+                                 kwargs_extinction=None, kwargs_special=None):
+        """
+        computes the matrix-free representation of the linear response matrix
+
+        :param kwargs_lens: lens model keyword argument list
+        :param kwargs_source: extended source model keyword argument list
+        :param kwargs_lens_light: lens light model keyword argument list
+        :param kwargs_ps: point source model keyword argument list
+        :param kwargs_extinction: extinction model keyword argument list
+        :param kwargs_special: special keyword argument list
+        :return: LinearResponseOperator instance
+        """
+        return self._linear_response_operator(kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps,
+                                              kwargs_extinction, kwargs_special)
+
+    def _linear_response_operator(self, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps,
+                                  kwargs_extinction=None, kwargs_special=None):
+        """
+        computes the matrix-free representation of the linear response matrix with the same components and ordering
+        as _linear_response_matrix()
+
+        :param kwargs_lens: list of keyword arguments corresponding to the superposition of different lens profiles
+        :param kwargs_source: list of keyword arguments corresponding to the superposition of different source light profiles
+        :param kwargs_lens_light: list of keyword arguments corresponding to different lens light surface brightness profiles
+        :param kwargs_ps: keyword arguments corresponding to "other" parameters, such as external shear and point source image positions
+        :return: LinearResponseOperator instance
+        """
+        extended_response, _, _ = self._extended_response(kwargs_lens, kwargs_source, kwargs_lens_light,
+                                                          kwargs_extinction, kwargs_special)
+        # the responses are re-sized to the pixel grid before the convolution, such that only the pixel resolution is
+        # stored in the operator
+        basis_response = [util.image2array(self.ImageNumerics.re_size_convolve(response, unconvolved=True))
+                          for response in extended_response]
+        ra_pos, dec_pos, amp, n_points = self.point_source_linear_response_set(kwargs_ps, kwargs_lens, kwargs_special,
+                                                                               with_amp=False)
+        ps_index_list, ps_value_list = [], []
+        for i in range(0, n_points):
+            with self._profiler.stage('point_source_rendering'):
+                index, values = self.ImageNumerics.point_source_rendering_sparse(ra_pos[i], dec_pos[i], amp[i])
+            index_masked = self._index_masked1d[index]
+            mask = index_masked >= 0
+            ps_index_list.append(index_masked[mask])
+            ps_value_list.append(values[mask])
+        return LinearResponseOperator(basis_response, ps_index_list, ps_value_list, self.ImageNumerics,
+                                      self._mask1d, self.Data.num_pixel_axes, flux_scaling=self._flux_scaling)
+
     @property
     def data_response(self):
         """
@@ -222,11 +375,20 @@ class ImageLinearFit(ImageModel):
         :return: log likelihood (natural logarithm)
         """
         # generate image
+        marg_const_matrix_free = None
         if linear_solver is False:
             im_sim = self.image(kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps, kwargs_extinction,
                                 kwargs_special)
             cov_matrix = None
             model_error = self._error_map_model(kwargs_lens, kwargs_ps=kwargs_ps, kwargs_special=kwargs_special)
+        elif self._kwargs_matrix_free is not None and self._pixelbased_bool is False:
+            if source_marg and linear_prior is not None and np.any(self._kwargs_matrix_free.get('regularization', 0)):
+                raise ValueError('linear_prior can not be combined with the "regularization" option of '
+                                 'kwargs_matrix_free.')
+            im_sim, model_error, param, marg_const_matrix_free = self._matrix_free_solve(
+                kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps, kwargs_extinction, kwargs_special,
+                marginalization=source_marg, linear_prior=linear_prior)
+            cov_matrix = None
         else:
             im_sim, model_error, cov_matrix, param = self._image_linear_solve(kwargs_lens, kwargs_source,
                                                                               kwargs_lens_light, kwargs_ps,
@@ -236,7 +398,9 @@ class ImageLinearFit(ImageModel):
         logL = self.Data.log_likelihood(im_sim, self.likelihood_mask, model_error)
 
         if self._pixelbased_bool is False:
-            if cov_matrix is not None and source_marg:
+            if marg_const_matrix_free is not None:
+                logL += marg_const_matrix_free
+            elif cov_matrix is not None and source_marg:
                 marg_const = de_lens.marginalization_new(cov_matrix, d_prior=linear_prior)
                 logL += marg_const
         if check_positive_flux is True:
@@ -282,40 +446,43 @@ class ImageLinearFit(ImageModel):
         :param unconvolved: bool, if True, computes components without convolution kernel (will not work for point sources)
         :return: response matrix (m x n)
         """
-        x_grid, y_grid = self.ImageNumerics.coordinates_evaluate
-        source_light_response, n_source = self.source_mapping.image_flux_split(x_grid, y_grid, kwargs_lens,
-                                                                               kwargs_source)
-        extinction = self._extinction.extinction(x_grid, y_grid, kwargs_extinction=kwargs_extinction,
-                                                 kwargs_special=kwargs_special)
-        lens_light_response, n_lens_light = self.LensLightModel.functions_split(x_grid, y_grid, kwargs_lens_light)
+        A, _ = self._linear_response_matrix_sparse(kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps,
+                                                   kwargs_extinction=kwargs_extinction, kwargs_special=kwargs_special,
+                                                   unconvolved=unconvolved)
+        return A
 
-        ra_pos, dec_pos, amp, n_points = self.point_source_linear_response_set(kwargs_ps, kwargs_lens, kwargs_special, with_amp=False)
+    def _linear_response_matrix_sparse(self, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps,
+                                       kwargs_extinction=None, kwargs_special=None, unconvolved=False):
+        """
+        computes the linear response matrix (m x n) as _linear_response_matrix() together with the support of the
+        sparse responses. The point sources are only rendered on their PSF footprint and directly written into the
+        response matrix.
+
+        :param kwargs_lens: list of keyword arguments corresponding to the superposition of different lens profiles
+        :param kwargs_source: list of keyword arguments corresponding to the superposition of different source light profiles
+        :param kwargs_lens_light: list of keyword arguments corresponding to different lens light surface brightness profiles
+        :param kwargs_ps: keyword arguments corresponding to "other" parameters, such as external shear and point source image positions
+        :param unconvolved: bool, if True, computes components without convolution kernel (will not work for point sources)
+        :return: response matrix (m x n), list of length m with either None (dense response) or the 1d array of
+         indexes of the masked data vector where the response is non-zero
+        """
+        extended_response, n_source, n_lens_light = self._extended_response(kwargs_lens, kwargs_source,
+                                                                            kwargs_lens_light, kwargs_extinction,
+                                                                            kwargs_special)
+
+        with self._profiler.stage('point_source_linear_response_set'):
+            ra_pos, dec_pos, amp, n_points = self.point_source_linear_response_set(kwargs_ps, kwargs_lens,
+                                                                                   kwargs_special, with_amp=False)
         num_param = n_points + n_lens_light + n_source
 
         num_response = self.num_data_evaluate
         A = np.zeros((num_param, num_response))
+        sparse_index_list = [None] * num_param
         n = 0
-        # response of lensed source profile
-        for i in range(0, n_source):
-            image = source_light_response[i]
-            
-            # multiply with primary beam before convolution
-            if self._pb is not None:
-                image *= self._pb_1d
-            
-            image *= extinction
-            image = self.ImageNumerics.re_size_convolve(image, unconvolved=unconvolved)
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
-            n += 1
-        # response of deflector light profile (or any other un-lensed extended components)
-        for i in range(0, n_lens_light):
-            image = lens_light_response[i]
-            
-            # multiply with primary beam before convolution
-            if self._pb is not None:
-                image *= self._pb_1d
-                
-            image = self.ImageNumerics.re_size_convolve(image, unconvolved=unconvolved)
+        # response of lensed source profile and deflector light profile (or any other un-lensed extended components)
+        for image in extended_response:
+            with self._profiler.stage('re_size_convolve'):
+                image = self.ImageNumerics.re_size_convolve(image, unconvolved=unconvolved)
             A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
             n += 1
         # response of point sources
@@ -324,11 +491,70 @@ class ImageLinearFit(ImageModel):
             # raise warnings when primary beam is attempted to be applied for point sources
             if self._pb is not None:
                 raise Warning("Antenna primary beam does not apply to point sources!")
-            
-            image = self.ImageNumerics.point_source_rendering(ra_pos[i], dec_pos[i], amp[i])
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
+
+            with self._profiler.stage('point_source_rendering'):
+                index, values = self.ImageNumerics.point_source_rendering_sparse(ra_pos[i], dec_pos[i], amp[i])
+            index_masked = self._index_masked1d[index]
+            mask = index_masked >= 0
+            index_masked = index_masked[mask]
+            A[n, index_masked] = np.nan_to_num(values[mask], copy=False)
+            sparse_index_list[n] = index_masked
             n += 1
-        return A * self._flux_scaling
+        return A * self._flux_scaling, sparse_index_list
+
+    def _extended_response(self, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_extinction=None,
+                           kwargs_special=None):
+        """
+        un-convolved responses of the linear components of the lensed source (including the extinction) and of the
+        deflector light on the coordinates evaluated by the Numerics class, multiplied by the primary beam (if present).
+        If freeze_extended_response() is set, the responses are computed once and then re-used.
+
+        :param kwargs_lens: list of keyword arguments corresponding to the superposition of different lens profiles
+        :param kwargs_source: list of keyword arguments corresponding to the superposition of different source light profiles
+        :param kwargs_lens_light: list of keyword arguments corresponding to different lens light surface brightness profiles
+        :param kwargs_extinction: list of keyword arguments of extinction model
+        :param kwargs_special: list of special keyword arguments
+        :return: list of 1d arrays of the responses, number of source and lens light responses
+        """
+        if self._freeze_extended_response is True and self._extended_response_cache is not None:
+            return self._extended_response_cache
+        x_grid, y_grid = self.ImageNumerics.coordinates_evaluate
+        with self._profiler.stage('image_flux_split'):
+            source_light_response, n_source = self.source_mapping.image_flux_split(x_grid, y_grid, kwargs_lens,
+                                                                                   kwargs_source)
+        extinction = self._extinction.extinction(x_grid, y_grid, kwargs_extinction=kwargs_extinction,
+                                                 kwargs_special=kwargs_special)
+        with self._profiler.stage('functions_split'):
+            lens_light_response, n_lens_light = self.LensLightModel.functions_split(x_grid, y_grid,
+                                                                                    kwargs_lens_light)
+        extended_response = []
+        for i in range(0, n_source):
+            image = source_light_response[i]
+            # multiply with primary beam before convolution
+            if self._pb is not None:
+                image *= self._pb_1d
+            extended_response.append(image * extinction)
+        for i in range(0, n_lens_light):
+            image = lens_light_response[i]
+            if self._pb is not None:
+                image *= self._pb_1d
+            extended_response.append(image)
+        if self._freeze_extended_response is True:
+            self._extended_response_cache = extended_response, n_source, n_lens_light
+        return extended_response, n_source, n_lens_light
+
+    def freeze_extended_response(self, freeze=True):
+        """
+        keeps the un-convolved responses of the extended linear components (lensed source and deflector light) fixed
+        after their next evaluation, such that only the convolution and the point sources are re-computed.
+        This is only valid as long as the non-linear parameters of the lens, source, lens light and extinction models
+        do not change, e.g. when iterating the PSF with fixed model parameters (see PsfFitting).
+
+        :param freeze: bool, if False, deletes the cached responses and computes them at every evaluation
+        :return: None
+        """
+        self._freeze_extended_response = freeze
+        self._extended_response_cache = None
 
     def update_linear_kwargs(self, param, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps):
         """
@@ -7,6 +7,7 @@ from lenstronomy.LightModel.light_model import LightModel
 from lenstronomy.PointSource.point_source import PointSource
 from lenstronomy.ImSim.differential_extinction import DifferentialExtinction
 from lenstronomy.Util import util
+from lenstronomy.Util.profiler import StageProfiler
 
 import numpy as np
 
@@ -19,7 +20,7 @@ class ImageModel(object):
     """
     def __init__(self, data_class, psf_class, lens_model_class=None, source_model_class=None,
                  lens_light_model_class=None, point_source_class=None, extinction_class=None, kwargs_numerics=None,
-                 kwargs_pixelbased=None):
+                 kwargs_pixelbased=None, image_numerics_class=None):
         """
         :param data_class: instance of ImageData() or PixelGrid() class
         :param psf_class: instance of PSF() class
@@ -29,6 +30,9 @@ class ImageModel(object):
         :param point_source_class: instance of PointSource() class describing the point sources
         :param kwargs_numerics: keyword arguments with various numeric description (see ImageNumerics class for options)
         :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver (see SLITronomy documentation)
+        :param image_numerics_class: (optional) NumericsSubFrame() instance of the pixel grid of data_class, psf_class
+         and kwargs_numerics, e.g. shared between instances (see class_creator.create_image_numerics()). If None, it is
+         created.
         """
         self.type = 'single-band'
         self.num_bands = 1
@@ -41,7 +45,9 @@ class ImageModel(object):
         self.PSF.set_pixel_size(self.Data.pixel_width)
         if kwargs_numerics is None:
             kwargs_numerics = {}
-        self.ImageNumerics = NumericsSubFrame(pixel_grid=self.Data, psf=self.PSF, **kwargs_numerics)
+        if image_numerics_class is None:
+            image_numerics_class = NumericsSubFrame(pixel_grid=self.Data, psf=self.PSF, **kwargs_numerics)
+        self.ImageNumerics = image_numerics_class
         if lens_model_class is None:
             lens_model_class = LensModel(lens_model_list=[])
         self.LensModel = lens_model_class
@@ -85,6 +91,16 @@ class ImageModel(object):
             self._pb_1d = util.image2array(self._pb)
         else:
             self._pb_1d = None
+        self._profiler = StageProfiler(enabled=False)
+
+    def set_profiler(self, profiler):
+        """
+        sets the profiler measuring the stages of the image computation (see StageProfiler)
+
+        :param profiler: StageProfiler instance
+        :return: None
+        """
+        self._profiler = profiler
 
     def reset_point_source_cache(self, cache=True):
         """
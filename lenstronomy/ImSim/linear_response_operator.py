@@ -0,0 +1,178 @@
+import numpy as np
+from scipy import sparse
+from lenstronomy.Util import util
+
+__all__ = ['LinearResponseOperator']
+
+
+class LinearResponseOperator(object):
+    """
+    matrix-free representation of the linear response of the imaging model.
+    Instead of convolving every basis component and storing the dense response matrix (n_param x n_data),
+    the response is represented as the product of operators:
+
+    - the (sparse) basis responses re-sized to the pixel grid before the convolution (the lensed and un-lensed extended
+      components),
+    - the PSF convolution (FFT) and its adjoint as provided by the Numerics class,
+    - the gather of the pixels within the likelihood mask,
+
+    plus the sparse footprints of the point sources in the masked data vector.
+    Applying the operator or its adjoint costs a single (adjoint) convolution, independent of the number of linear
+    parameters. The basis responses are stored at the resolution of the pixels (not of the super-sampled evaluation
+    grid), as sparse columns if most of their pixels are zero. Responses that cover most of the image (e.g. shapelets)
+    still need n_data values each, so the memory is that of the unconvolved response matrix. The lens mapping is the
+    evaluation of the basis on the ray-traced coordinates; lenstronomy has no pixelated source basis that a sparse
+    interpolation operator would represent.
+    """
+    def __init__(self, basis_response, ps_index_list, ps_value_list, image_numerics, mask1d, num_pixel_axes,
+                 flux_scaling=1, sparse_threshold=0.3):
+        """
+
+        :param basis_response: list of 1d arrays, responses of the extended linear components with amp=1 re-sized to
+         the pixel grid before the convolution (re_size_convolve(unconvolved=True) of the Numerics class)
+        :param ps_index_list: list of 1d integer arrays, indexes of the masked data vector of the point source
+         footprints
+        :param ps_value_list: list of 1d arrays, values of the point source footprints with amp=1
+        :param image_numerics: Numerics or NumericsSubFrame instance, supporting convolve() and convolve_adjoint()
+        :param mask1d: 1d boolean array, likelihood mask of the image pixels
+        :param num_pixel_axes: number of pixels per axis, nx, ny
+        :param flux_scaling: float, scaling of the flux
+        :param sparse_threshold: float, a basis response is stored as a sparse column when its fraction of non-zero
+         entries is below this threshold, and as a 1d array otherwise
+        :raises: ValueError if the numerical settings do not support the adjoint convolution
+        """
+        image_numerics.check_adjoint()
+        self._image_numerics = image_numerics
+        self._mask1d = mask1d
+        self._nx, self._ny = num_pixel_axes
+        self._flux_scaling = flux_scaling
+        self._num_extended = len(basis_response)
+        self._num_ps = len(ps_index_list)
+        self._num_data = int(np.sum(mask1d))
+        # the basis responses are kept per component (no dense matrix of all the components is built): the sparse
+        # responses as columns of a sparse matrix, the other ones as a list of 1d arrays with their indexes
+        self._dense_index, self._dense_basis = [], []
+        rows, cols, values = [], [], []
+        for i, response in enumerate(basis_response):
+            response = np.nan_to_num(np.asarray(response, dtype=float))
+            nonzero = np.flatnonzero(response)
+            if len(nonzero) < sparse_threshold * len(response):
+                rows.append(nonzero)
+                cols.append(np.ones(len(nonzero), dtype=int) * i)
+                values.append(response[nonzero])
+            else:
+                self._dense_index.append(i)
+                self._dense_basis.append(response)
+        if self._num_extended > 0:
+            if len(rows) > 0:
+                rows, cols, values = np.concatenate(rows), np.concatenate(cols), np.concatenate(values)
+            self._sparse_basis = sparse.csc_matrix((values, (rows, cols)), shape=(self._nx * self._ny,
+                                                                                  self._num_extended))
+        if self._num_ps > 0:
+            rows = np.concatenate(ps_index_list).astype(int)
+            cols = np.concatenate([np.ones(len(index), dtype=int) * i for i, index in enumerate(ps_index_list)])
+            values = np.nan_to_num(np.concatenate(ps_value_list))
+            self._ps_response = sparse.csr_matrix((values, (rows, cols)), shape=(self._num_data, self._num_ps))
+
+    @property
+    def num_param(self):
+        """
+
+        :return: number of linear parameters
+        """
+        return self._num_extended + self._num_ps
+
+    def forward(self, param):
+        """
+        model response of a set of linear coefficients (A^T x in the convention of the dense response matrix A)
+
+        :param param: 1d array of the linear coefficients
+        :return: 1d array of the masked data vector
+        """
+        array = np.zeros(self._num_data)
+        if self._num_extended > 0:
+            image = util.array2image(self._basis_dot(param[:self._num_extended]), self._nx, self._ny)
+            array += util.image2array(self._image_numerics.convolve(image))[self._mask1d]
+        if self._num_ps > 0:
+            array += self._ps_response.dot(param[self._num_extended:])
+        return array * self._flux_scaling
+
+    def adjoint(self, array):
+        """
+        adjoint of the forward() operation (A y in the convention of the dense response matrix A)
+
+        :param array: 1d array of the masked data vector
+        :return: 1d array of length of the linear coefficients
+        """
+        array = array * self._flux_scaling
+        param = np.zeros(self.num_param)
+        if self._num_extended > 0:
+            image = self._image_numerics.convolve_adjoint(self._array_masked2image(array))
+            param[:self._num_extended] = self._basis_transpose_dot(util.image2array(image))
+        if self._num_ps > 0:
+            param[self._num_extended:] = self._ps_response.T.dot(array)
+        return param
+
+    def normal_dot(self, param, weights, regularization=0):
+        """
+        product of the (regularized) normal matrix with a vector, (A W A^T + Lambda) x
+
+        :param param: 1d array of the linear coefficients
+        :param weights: 1d array of the inverse variances of the masked data vector
+        :param regularization: float or 1d array, diagonal of the regularization matrix Lambda
+        :return: 1d array of length of the linear coefficients
+        """
+        return self.adjoint(weights * self.forward(param)) + regularization * param
+
+    def normal_diagonal(self, weights):
+        """
+        approximate diagonal of the normal matrix A W A^T, to be used as a preconditioner.
+        The point source entries are exact, the extended components neglect the PSF convolution.
+
+        :param weights: 1d array of the inverse variances of the masked data vector
+        :return: 1d array of length of the linear coefficients
+        """
+        diag = np.zeros(self.num_param)
+        if self._num_extended > 0:
+            weights_pixel = util.image2array(self._array_masked2image(weights))
+            diag_extended = self._sparse_basis.multiply(self._sparse_basis).T.dot(weights_pixel)
+            for i, response in zip(self._dense_index, self._dense_basis):
+                diag_extended[i] = np.dot(response * weights_pixel, response)
+            diag[:self._num_extended] = diag_extended
+        if self._num_ps > 0:
+            diag[self._num_extended:] = self._ps_response.multiply(self._ps_response).T.dot(weights)
+        return diag * self._flux_scaling ** 2
+
+    def _basis_dot(self, param):
+        """
+        un-convolved image of a set of coefficients of the extended components
+
+        :param param: 1d array of the coefficients of the extended components
+        :return: 1d array of the image pixels
+        """
+        flux = self._sparse_basis.dot(param)
+        for i, response in zip(self._dense_index, self._dense_basis):
+            flux += param[i] * response
+        return flux
+
+    def _basis_transpose_dot(self, flux):
+        """
+        adjoint of _basis_dot()
+
+        :param flux: 1d array of the image pixels
+        :return: 1d array of the coefficients of the extended components
+        """
+        param = self._sparse_basis.T.dot(flux)
+        for i, response in zip(self._dense_index, self._dense_basis):
+            param[i] = response.dot(flux)
+        return param
+
+    def _array_masked2image(self, array):
+        """
+
+        :param array: 1d array of values not masked out
+        :return: 2d array of full image
+        """
+        grid1d = np.zeros(self._nx * self._ny)
+        grid1d[self._mask1d] = array
+        return util.array2image(grid1d, self._nx, self._ny)
@@ -1,7 +1,6 @@
 __author__ = 'dgilman', 'sibirrer'
 
 import numpy as np
-from scipy.integrate import quad
 from lenstronomy.LensModel.Profiles.nfw import NFW
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 
@@ -17,6 +16,10 @@ class CNFW(LensProfileBase):
     """
     model_name = 'CNFW'
     _s = 0.001  # numerical limit for minimal radius
+    # table of the dimensionless potential (see _potential_table())
+    _x_max_table = 1e8
+    _num_table_per_decade = 20
+    _num_nodes = 8
     param_names = ['Rs', 'alpha_Rs', 'r_core', 'center_x', 'center_y']
     lower_limit_default = {'Rs': 0, 'alpha_Rs': 0, 'r_core': 0, 'center_x': -100, 'center_y': -100}
     upper_limit_default = {'Rs': 100, 'alpha_Rs': 10, 'r_core': 100, 'center_x': 100, 'center_y': 100}
@@ -45,27 +48,60 @@ class CNFW(LensProfileBase):
         r = np.sqrt(x_ ** 2 + y_ ** 2)
         r = np.maximum(r, self._s)
         rho0 = self._alpha2rho0(alpha_Rs=alpha_Rs, Rs=Rs, r_core=r_core)
-        if isinstance(r, int) or isinstance(r, float):
-            return self._num_integral_potential(r, Rs, rho0, r_core)
-        else:
-            #TODO: currently the numerical integral is done one by one. More efficient is sorting the radial list and
-            # then perform one numerical integral reading out to the radial points
-            f_ = []
-            for i in range(len(r)):
-                f_.append(self._num_integral_potential(r[i], Rs, rho0, r_core))
-            return np.array(f_)
+        return 4 * rho0 * Rs ** 3 * self._potential_dimensionless(r / Rs, r_core / Rs)
 
-    def _num_integral_potential(self, r, Rs, rho0, r_core):
+    def _potential_dimensionless(self, X, b):
         """
+        dimensionless potential int_0^X G(x, b) / x dx, such that the potential is 4 * rho0 * Rs^3 times this integral.
+        The integral is read out of a table of the cumulative integral on a logarithmic grid in x (see
+        _potential_table()), completed by a Gauss-Legendre quadrature from the nearest grid point below X.
+        As in alpha_r(), the integrand is kept constant below x = _s. Within the table (X < 10^8), the relative error
+        of the quadrature is below 1e-10, such that the precision is set by the one of _G() (which degrades for b
+        close to 1 and for x << 1).
 
-        :param r:
-        :param r_core:
-        :return:
+        :param X: R/Rs
+        :param b: r_core/Rs
+        :return: dimensionless potential with the shape of X
+        """
+        log_x, potential_table = self._potential_table(b)
+        log_X = np.log(np.maximum(X, self._s))
+        k = np.clip(np.searchsorted(log_x, log_X) - 1, 0, len(log_x) - 1)
+        potential = potential_table[k] + self._integral_log(log_x[k], log_X, b)
+        return np.where(X < self._s, X / self._s * potential_table[0], potential)
+
+    def _potential_table(self, b):
+        """
+        table of the dimensionless potential int_0^x G(x', b) / x' dx' on a logarithmic grid in x from _s to
+        _x_max_table. The table is built for the last value of b requested and is re-used as long as b does not change.
+
+        :param b: r_core/Rs
+        :return: log(x) of the grid, dimensionless potential at the grid points
+        """
+        if getattr(self, '_table_b', None) != b:
+            num = int(np.log10(self._x_max_table / self._s) * self._num_table_per_decade) + 1
+            log_x = np.linspace(np.log(self._s), np.log(self._x_max_table), num)
+            # constant integrand G(_s, b) / _s below _s
+            potential_0 = self._G(np.array([self._s]), b)[0]
+            potential_table = potential_0 + np.append(0, np.cumsum(self._integral_log(log_x[:-1], log_x[1:], b)))
+            self._table_b = b
+            self._table = (log_x, potential_table)
+        return self._table
+
+    def _integral_log(self, log_x_1, log_x_2, b):
+        """
+        integral int_{x_1}^{x_2} G(x, b) / x dx = int G(x, b) dlog(x) with a Gauss-Legendre quadrature in log(x)
+
+        :param log_x_1: log of the lower bounds
+        :param log_x_2: log of the upper bounds
+        :param b: r_core/Rs
+        :return: integrals with the shape of the bounds
         """
-        def _integrand(x):
-            return self.alpha_r(x, Rs, rho0, r_core)
-        f_ = quad(_integrand, 0, r)[0]
-        return f_
+        log_x_1, log_x_2 = np.broadcast_arrays(log_x_1, log_x_2)
+        shape = log_x_1.shape
+        log_x_1, delta = log_x_1.ravel(), (log_x_2 - log_x_1).ravel()
+        nodes, weights = np.polynomial.legendre.leggauss(self._num_nodes)
+        g_x = self._G(np.exp(log_x_1 + (nodes[:, None] + 1) / 2. * delta), b)
+        return (np.sum(weights[:, None] * g_x, axis=0) / 2. * delta).reshape(shape)
 
     def derivatives(self, x, y, Rs, alpha_Rs, r_core, center_x=0, center_y=0):
 
@@ -1,7 +1,7 @@
 __author__ = 'sibirrer'
 
 import numpy as np
-from scipy.integrate import quad
+from scipy import special
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 from lenstronomy.Util import derivative_util as calc_util
 
@@ -41,26 +41,9 @@ class CoredDensity2(LensProfileBase):
         x_ = x - center_x
         y_ = y - center_y
         r = np.sqrt(x_ ** 2 + y_ ** 2)
-        r = np.maximum(r, self._s)
-        if isinstance(r, int) or isinstance(r, float):
-            return self._num_integral_potential(r, sigma0, r_core)
-        else:
-            f_ = []
-            for i in range(len(r)):
-                f_.append(self._num_integral_potential(r[i], sigma0, r_core))
-            return np.array(f_)
-
-    def _num_integral_potential(self, r, sigma0, r_core):
-        """
-
-        :param r:
-        :param r_core:
-        :return:
-        """
-        def _integrand(x):
-            return self.alpha_r(x, sigma0=sigma0, r_core=r_core)
-        f_ = quad(_integrand, 0, r)[0]
-        return f_
+        # int_0^r alpha(r') dr' = sigma0 * r_core^2 / 2 * int_0^u ln(1 + t) / t dt = - sigma0 * r_core^2 / 2 * Li_2(-u)
+        # with u = r^2 / r_core^2 and the dilogarithm Li_2(-u) = spence(1 + u)
+        return - sigma0 * r_core ** 2 / 2. * special.spence(1 + r ** 2 / r_core ** 2)
 
     def derivatives(self, x, y, sigma0, r_core, center_x=0, center_y=0):
         """
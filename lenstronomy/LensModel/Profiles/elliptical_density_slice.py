@@ -1,11 +1,10 @@
 __author__ = "lynevdv"
 
 import numpy as np
-import cmath as c
 from lenstronomy.Util import param_util
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 
-__all__ = ['ElliSLICE']
+__all__ = ['ElliSLICE', 'ElliSLICEStack']
 
 
 class ElliSLICE (LensProfileBase):
@@ -53,22 +52,12 @@ class ElliSLICE (LensProfileBase):
         :param center_y: float, center on the y axis
 
         """
-        kwargs_slice = {'center_x': center_x, 'center_y': center_y, 'a': a, 'b': b, 'psi': psi, 'sigma_0': sigma_0}
-        x_ = x - center_x
-        y_ = y - center_y
-        x_rot = x_*np.cos(psi) + y_*np.sin(psi)
-        y_rot = -x_*np.sin(psi) + y_*np.cos(psi)
-        try:
-            len(x_)
-        except:
-            if (x_rot ** 2 / a ** 2) + (y_rot ** 2 / b ** 2) <= 1:
-                return self.pot_in(x_, y_, kwargs_slice)
-            else:
-                return self.pot_ext(x_, y_, kwargs_slice)
-        else:
-            f = np.array([self.pot_in(x_[i], y_[i], kwargs_slice) if (x_rot[i] ** 2 / a ** 2) + (y_rot[i] ** 2 / b ** 2) <= 1
-                          else self.pot_ext(x_[i], y_[i], kwargs_slice) for i in range(len(x_))])
-            return f
+        x_, y_, kwargs_slice, inside = self._split(x, y, a, b, psi, sigma_0, center_x, center_y)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f = np.where(inside, self.pot_in(x_, y_, kwargs_slice), self.pot_ext(x_, y_, kwargs_slice))
+        if np.ndim(f) == 0:
+            return float(f)
+        return f
 
     def derivatives(self, x, y, a, b, psi, sigma_0, center_x=0., center_y=0.):
         """
@@ -82,22 +71,15 @@ class ElliSLICE (LensProfileBase):
         :param center_y: float, center on the y axis
 
         """
-        kwargs_slice = {'center_x': center_x, 'center_y': center_y, 'a': a, 'b': b, 'psi': psi, 'sigma_0': sigma_0}
-        x_ = x - center_x
-        y_ = y - center_y
-        x_rot = x_ * np.cos(psi) + y_ * np.sin(psi)
-        y_rot = -x_ * np.sin(psi) + y_ * np.cos(psi)
-        try:
-            len(x_)
-        except:
-            if (x_rot ** 2 / a ** 2) + (y_rot ** 2 / b ** 2) <= 1:
-                return self.alpha_in(x_, y_, kwargs_slice)
-            else:
-                return self.alpha_ext(x_, y_, kwargs_slice)
-        else:
-            defl = np.array([self.alpha_in(x_[i], y_[i], kwargs_slice) if (x_rot[i] ** 2 / a ** 2) + (y_rot[i] ** 2 / b ** 2) <= 1
-                             else self.alpha_ext(x_[i], y_[i], kwargs_slice) for i in range(len(x_))])
-            return defl[:, 0], defl[:, 1]
+        x_, y_, kwargs_slice, inside = self._split(x, y, a, b, psi, sigma_0, center_x, center_y)
+        alpha_x_in, alpha_y_in = self.alpha_in(x_, y_, kwargs_slice)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            alpha_x_ext, alpha_y_ext = self.alpha_ext(x_, y_, kwargs_slice)
+        f_x = np.where(inside, alpha_x_in, alpha_x_ext)
+        f_y = np.where(inside, alpha_y_in, alpha_y_ext)
+        if np.ndim(f_x) == 0:
+            return float(f_x), float(f_y)
+        return f_x, f_y
 
     def hessian(self, x, y, a, b, psi, sigma_0, center_x=0., center_y=0.):
         """
@@ -111,32 +93,101 @@ class ElliSLICE (LensProfileBase):
         :param center_y: float, center on the y axis
 
         """
+        x_, y_, kwargs_slice, inside = self._split(x, y, a, b, psi, sigma_0, center_x, center_y)
+        hessian_in = self.hessian_in(x_, y_, kwargs_slice)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            hessian_ext = self.hessian_ext(x_, y_, kwargs_slice)
+        f_xx, f_xy, f_yx, f_yy = [np.where(inside, f_in, f_ext) for f_in, f_ext in zip(hessian_in, hessian_ext)]
+        if np.ndim(f_xx) == 0:
+            return float(f_xx), float(f_xy), float(f_yx), float(f_yy)
+        return f_xx, f_xy, f_yx, f_yy
+
+    @staticmethod
+    def _split(x, y, a, b, psi, sigma_0, center_x, center_y):
+        """
+        coordinates relative to the center and flags of the coordinates inside the slice. The slice parameters may be
+        arrays broadcastable against the coordinates.
 
-        diff = 0.000000001
-        alpha_ra, alpha_dec = self.derivatives(x, y, a, b, psi, sigma_0, center_x, center_y)
-        alpha_ra_dx, alpha_dec_dx = self.derivatives(x + diff, y, a, b, psi, sigma_0, center_x, center_y)
-        alpha_ra_dy, alpha_dec_dy = self.derivatives(x, y + diff, a, b, psi, sigma_0, center_x, center_y)
+        :return: x and y relative to the center, dictionary with the slice definition (a,b,psi,sigma_0), boolean array
+         of the coordinates inside the slice
+        """
+        x_ = np.subtract(x, center_x, dtype=float)
+        y_ = np.subtract(y, center_y, dtype=float)
+        x_rot = x_ * np.cos(psi) + y_ * np.sin(psi)
+        y_rot = -x_ * np.sin(psi) + y_ * np.cos(psi)
+        inside = (x_rot ** 2 / a ** 2) + (y_rot ** 2 / b ** 2) <= 1
+        kwargs_slice = {'a': a, 'b': b, 'psi': psi, 'sigma_0': sigma_0}
+        return x_, y_, kwargs_slice, inside
 
-        f_xx = (alpha_ra_dx - alpha_ra) / diff
-        f_xy = (alpha_ra_dy - alpha_ra) / diff
-        f_yx = (alpha_dec_dx - alpha_dec) / diff
-        f_yy = (alpha_dec_dy - alpha_dec) / diff
-        return f_xx, f_xy, f_yx, f_yy
+    @staticmethod
+    def _select(value, shape, mask):
+        """
+
+        :param value: float or array broadcastable to shape
+        :param shape: shape of the coordinates
+        :param mask: boolean array of the given shape, or None
+        :return: value (if mask is None) or the entries of the broadcast value selected by the mask
+        """
+        if mask is None:
+            return value
+        return np.broadcast_to(value, shape)[mask]
+
+    @staticmethod
+    def _complex(x, y):
+        """
+        complex number x + iy, keeping the sign of zero of the real and imaginary parts
+
+        :param x: real part
+        :param y: imaginary part
+        :return: complex number or array of complex numbers
+        """
+        x, y = np.broadcast_arrays(x, y)
+        z = np.empty(x.shape, dtype=complex)
+        z.real = x
+        z.imag = y
+        return z
 
     @staticmethod
     def sign(z):
         """
         sign function
 
-        :param z: complex
+        :param z: complex (or array of complex numbers)
 
         """
-        x = z.real
-        y = z.imag
-        if x > 0 or (x == 0 and y >= 0):
-            return 1
-        else:
-            return -1
+        x = np.real(z)
+        y = np.imag(z)
+        sign = np.where((x > 0) | ((x == 0) & (y >= 0)), 1, -1)
+        if np.ndim(sign) == 0:
+            return int(sign)
+        return sign
+
+    def _median_near_axis(self, func, x, y, psi):
+        """
+        evaluates a complex function of the position and, when (x,y) is on one of the ellipse axis, replaces it by the
+        median of the function at three points: (x,y), and a delta away from (x,y) perpendicularly to the axis on both
+        sides. When the argument of the square roots of the exterior solutions has an imaginary part == 0, having 0.
+        or -0. may return different answers; the median avoids any singularity for points along the axis.
+
+        :param func: function of (z, mask) with z the complex positions and mask None (all the positions) or a boolean
+         array selecting the positions
+        :param x: x coordinates relative to the center
+        :param y: y coordinates relative to the center
+        :param psi: orientation of the slice (float or array broadcastable against x and y)
+        :return: value of the function (with the median at the positions close to the axes)
+        """
+        value = func(self._complex(x, y), None)
+        r, phi = param_util.cart2polar(x, y)
+        near_axis = (np.abs(np.sin(phi - psi)) <= 10 ** -10) | (np.abs(np.sin(phi - psi - np.pi / 2.)) <= 10 ** -10)
+        if np.any(near_axis):
+            eps = 10 ** -10
+            value = np.array(np.broadcast_to(value, near_axis.shape))
+            r, phi = np.broadcast_to(r, near_axis.shape)[near_axis], np.broadcast_to(phi, near_axis.shape)[near_axis]
+            value_minus = func(self._complex(r * np.cos(phi - eps), r * np.sin(phi - eps)), near_axis)
+            value_plus = func(self._complex(r * np.cos(phi + eps), r * np.sin(phi + eps)), near_axis)
+            value_list = np.array([value_minus, value_plus, value[near_axis]])
+            value[near_axis] = np.median(value_list.real, axis=0) + 1j * np.median(value_list.imag, axis=0)
+        return value
 
     def alpha_in(self, x, y, kwargs_slice):
         """
@@ -145,12 +196,12 @@ class ElliSLICE (LensProfileBase):
         :param kwargs_slice: dict, dictionary with  the slice definition (a,b,psi,sigma_0)
 
         """
-        z = complex(x, y)
+        z = self._complex(x, y)
         zb = z.conjugate()
         psi = kwargs_slice['psi']
         e = (kwargs_slice['a'] - kwargs_slice['b']) / (kwargs_slice['a'] + kwargs_slice['b'])
         sig_0 = kwargs_slice['sigma_0']
-        e2ipsi = c.exp(2j * psi)
+        e2ipsi = np.exp(2j * psi)
         I_in = (z - e * zb * e2ipsi) * sig_0
         return I_in.real, I_in.imag
 
@@ -161,53 +212,67 @@ class ElliSLICE (LensProfileBase):
         :param kwargs_slice: dict, dictionary with  the slice definition (a,b,psi,sigma_0)
 
         """
-        z = complex(x, y)
-        r, phi = param_util.cart2polar(x, y)
-        zb = z.conjugate()
         psi = kwargs_slice['psi']
         a = kwargs_slice['a']
         b = kwargs_slice['b']
+        sig_0 = kwargs_slice['sigma_0']
+        shape = np.broadcast(x, y, psi, a, b, sig_0).shape
         f2 = a ** 2 - b ** 2
+        e2ipsi = np.exp(2j * psi)
+        eipsi = np.exp(1j * psi)
+        prefactor = 2 * a * b / f2 * sig_0
+
+        def _alpha(z, mask):
+            zb = z.conjugate()
+            _e2ipsi, _eipsi = self._select(e2ipsi, shape, mask), self._select(eipsi, shape, mask)
+            return self._select(prefactor, shape, mask) * (zb * _e2ipsi - _eipsi * self.sign(zb * _eipsi) * np.sqrt(
+                zb ** 2 * _e2ipsi - self._select(f2, shape, mask)))
+        I_out = self._median_near_axis(_alpha, x, y, psi)
+        return I_out.real, I_out.imag
+
+    @staticmethod
+    def hessian_in(x, y, kwargs_slice):
+        """
+        second derivatives of the lensing potential for (x,y) inside the elliptical slice (constant)
+
+        :param kwargs_slice: dict, dictionary with  the slice definition (a,b,psi,sigma_0)
+        :return: f_xx, f_xy, f_yx, f_yy
+        """
+        psi = kwargs_slice['psi']
+        e = (kwargs_slice['a'] - kwargs_slice['b']) / (kwargs_slice['a'] + kwargs_slice['b'])
         sig_0 = kwargs_slice['sigma_0']
-        median_op = False
-        # when (x,y) is on one of the ellipse axis, there might be an issue when calculating the square root of
-        # zb ** 2 * e2ipsi - f2. When the argument has an imaginary part ==0, having 0. or -0. may return different
-        # answers. Therefore, for points (x,y) close to one axis, we take 3 points (one is x,y ; another one is a delta
-        # away from this position, perpendicularly to the axis ; another one is at -delta perpendicularly away from
-        # x,y). We calculate the function for each point and take the median. This avoids any singularity for points
-        # along the axis but it slows down the function.
-        if np.abs(np.sin(phi - psi)) <= 10 ** -10 \
-                or np.abs(np.sin(phi - psi - np.pi / 2.)) <= 10 ** -10:  # very close to one of the ellipse axis
-            median_op = True
-        e2ipsi = c.exp(2j * psi)
-        eipsi = c.exp(1j * psi)
-        if median_op is True:
-            eps = 10 ** -10
-            z_minus_eps = complex(r * np.cos(phi - eps), r * np.sin(phi - eps))
-            zb_minus_eps = z_minus_eps.conjugate()
-            z_plus_eps = complex(r * np.cos(phi + eps), r * np.sin(phi + eps))
-            zb_plus_eps = z_plus_eps.conjugate()
-            I_out_minus = 2 * a * b / f2 * (zb_minus_eps * e2ipsi - eipsi * self.sign(zb_minus_eps * eipsi)
-                                            * c.sqrt(zb_minus_eps ** 2 * e2ipsi - f2)) * sig_0
-            I_out_plus = 2 * a * b / f2 * (zb_plus_eps * e2ipsi - eipsi * self.sign(zb_plus_eps * eipsi)
-                                           * c.sqrt(zb_plus_eps ** 2 * e2ipsi - f2)) * sig_0
-            I_out_mid = 2 * a * b / f2 * (zb * e2ipsi - eipsi * self.sign(zb * eipsi)
-                                          * c.sqrt(zb ** 2 * e2ipsi - f2)) * sig_0
-            I_out_real = np.median([I_out_minus.real, I_out_plus.real, I_out_mid.real])
-            I_out_imag = np.median([I_out_minus.imag, I_out_plus.imag, I_out_mid.imag])
-        else:
-            I_out = 2 * a * b / f2 * (
-                        zb * e2ipsi - eipsi * self.sign(zb * eipsi) * c.sqrt(zb ** 2 * e2ipsi - f2)) * sig_0
-            I_out_real = I_out.real
-            I_out_imag = I_out.imag
-
-        # buf = zb ** 2 * e2ipsi - f2  ##problem with 0. and -0. giving different answers
-        # if buf.real == 0:
-        #     buf = complex(0, buf.imag)
-        # if buf.imag == 0:
-        #     buf = complex(buf.real, 0)
-
-        return I_out_real, I_out_imag
+        # derivative of alpha_in with respect to x, the derivative with respect to y is i * (1 + e e^{2i psi})
+        f_xx = sig_0 * (1 - e * np.cos(2 * psi))
+        f_xy = -sig_0 * e * np.sin(2 * psi)
+        f_yy = sig_0 * (1 + e * np.cos(2 * psi))
+        return f_xx, f_xy, f_xy, f_yy
+
+    def hessian_ext(self, x, y, kwargs_slice):
+        """
+        second derivatives of the lensing potential for (x,y) outside the elliptical slice
+
+        :param kwargs_slice: dict, dictionary with  the slice definition (a,b,psi,sigma_0)
+        :return: f_xx, f_xy, f_yx, f_yy
+        """
+        psi = kwargs_slice['psi']
+        a = kwargs_slice['a']
+        b = kwargs_slice['b']
+        sig_0 = kwargs_slice['sigma_0']
+        shape = np.broadcast(x, y, psi, a, b, sig_0).shape
+        f2 = a ** 2 - b ** 2
+        e2ipsi = np.exp(2j * psi)
+        eipsi = np.exp(1j * psi)
+        prefactor = 2 * a * b / f2 * sig_0
+
+        def _d_alpha(z, mask):
+            # alpha_ext is a function of the complex conjugate zb only, this is its derivative with respect to zb
+            zb = z.conjugate()
+            _e2ipsi, _eipsi = self._select(e2ipsi, shape, mask), self._select(eipsi, shape, mask)
+            return self._select(prefactor, shape, mask) * _e2ipsi * (1 - _eipsi * self.sign(zb * _eipsi) * zb / np.sqrt(
+                zb ** 2 * _e2ipsi - self._select(f2, shape, mask)))
+        d_alpha = self._median_near_axis(_d_alpha, x, y, psi)
+        f_xx, f_xy = d_alpha.real, d_alpha.imag
+        return f_xx, f_xy, f_xy, -f_xx
 
     @staticmethod
     def pot_in(x, y, kwargs_slice):
@@ -235,48 +300,114 @@ class ElliSLICE (LensProfileBase):
         :param kwargs_slice: dict, dictionary with  the slice definition (a,b,psi,sigma_0)
 
         """
-        z = complex(x, y)
-        # zb = z.conjugate()
         psi = kwargs_slice['psi']
         a = kwargs_slice['a']
         b = kwargs_slice['b']
         sig_0 = kwargs_slice['sigma_0']
-        r, phi = param_util.cart2polar(x, y)
-        median_op = False
-        # when (x,y) is on one of the ellipse axis, there might be an issue when calculating the square root of
-        # z ** 2 * em2ipsi - f2. When the argument has an imaginary part ==0, having 0. or -0. may return different
-        # answers. Therefore, for points (x,y) close to one axis, we take 3 points (one is x,y ; another one is a delta
-        # away from this position, perpendicularly to the axis ; another one is at -delta perpendicularly away from
-        # x,y). We calculate the function for each point and take the median. This avoids any singularity for points
-        # along the axis but it slows down the function.
-        if np.abs(np.sin(phi - psi)) <= 10 ** -10 \
-                or np.abs(np.sin(phi - psi - np.pi / 2.)) <= 10 ** -10:  # very close to one of the ellipse axis
-            median_op = True
+        shape = np.broadcast(x, y, psi, a, b, sig_0).shape
         e = (a - b) / (a + b)
         f2 = a ** 2 - b ** 2
-        emipsi = c.exp(-1j * psi)
-        em2ipsi = c.exp(-2j * psi)
-        if median_op is True:
-            eps = 10 ** -10
-            z_minus_eps = complex(r * np.cos(phi - eps), r * np.sin(phi - eps))
-            z_plus_eps = complex(r * np.cos(phi + eps), r * np.sin(phi + eps))
-
-            pot_ext_minus = (1 - e ** 2) / (4 * e) * (f2 * c.log(
-                (self.sign(z_minus_eps * emipsi) * z_minus_eps * emipsi + c.sqrt(z_minus_eps ** 2 * em2ipsi - f2)) / 2.)
-                                                      - self.sign(z_minus_eps * emipsi) * z_minus_eps * emipsi * c.sqrt(
-                        z_minus_eps ** 2 * em2ipsi - f2) + z_minus_eps ** 2 * em2ipsi) * sig_0
-            pot_ext_plus = (1 - e ** 2) / (4 * e) * (f2 * c.log(
-                (self.sign(z_plus_eps * emipsi) * z_plus_eps * emipsi + c.sqrt(z_plus_eps ** 2 * em2ipsi - f2)) / 2.)
-                                                     - self.sign(z_plus_eps * emipsi) * z_plus_eps * emipsi * c.sqrt(
-                        z_plus_eps ** 2 * em2ipsi - f2) + z_plus_eps ** 2 * em2ipsi) * sig_0
-            pot_ext_mid = (1 - e ** 2) / (4 * e) * (
-                        f2 * c.log((self.sign(z * emipsi) * z * emipsi + c.sqrt(z ** 2 * em2ipsi - f2)) / 2.)
-                        - self.sign(z * emipsi) * z * emipsi * c.sqrt(z ** 2 * em2ipsi - f2) + z ** 2 * em2ipsi) * sig_0
-            pot_ext = np.median([pot_ext_minus.real, pot_ext_plus.real, pot_ext_mid.real])
-        else:
-            pot_ext = ((1 - e ** 2) / (4 * e) * (
-                        f2 * c.log((self.sign(z * emipsi) * z * emipsi + c.sqrt(z ** 2 * em2ipsi - f2)) / 2.)
-                        - self.sign(z * emipsi) * z * emipsi *
-                        c.sqrt(z ** 2 * em2ipsi - f2) + z ** 2 * em2ipsi) * sig_0).real
-        return pot_ext
+        emipsi = np.exp(-1j * psi)
+        em2ipsi = np.exp(-2j * psi)
+        prefactor = (1 - e ** 2) / (4 * e) * sig_0
+
+        def _pot(z, mask):
+            _em2ipsi, _f2 = self._select(em2ipsi, shape, mask), self._select(f2, shape, mask)
+            z_rot = z * self._select(emipsi, shape, mask)
+            sign_z = self.sign(z_rot)
+            sqrt_z = np.sqrt(z ** 2 * _em2ipsi - _f2)
+            return self._select(prefactor, shape, mask) * (_f2 * np.log((sign_z * z_rot + sqrt_z) / 2.)
+                                                           - sign_z * z_rot * sqrt_z + z ** 2 * _em2ipsi)
+        return self._median_near_axis(_pot, x, y, psi).real
+
+
+class ElliSLICEStack(LensProfileBase):
+    """
+    Stack of elliptical slices of constant density (see :class:`ElliSLICE`), evaluated at once by broadcasting the
+    slices against the coordinates. Stacks of (typically hundreds of) concentric or nested slices can be used to
+    approximate arbitrary mass distributions.
+
+    The parameters are arrays with one entry per slice (or floats shared by all the slices).
+    When fitted (see LensParam), the axes 'a' and 'b' must be held fixed, the densities 'sigma_0' are sampled with one
+    parameter per slice and 'psi', 'center_x' and 'center_y' (if not fixed) with one parameter shared by all slices.
+    """
+    param_names = ['a', 'b', 'psi', 'sigma_0', 'center_x', 'center_y']
+    lower_limit_default = {'a': 0., 'b': 0., 'psi': -90./180.*np.pi, 'sigma_0': 0., 'center_x': -100.,
+                           'center_y': -100.}
+    upper_limit_default = {'a': 100., 'b': 100., 'psi': 90. / 180. * np.pi, 'sigma_0': 100., 'center_x': 100.,
+                           'center_y': 100.}
+
+    def __init__(self):
+        self._slice = ElliSLICE()
+        super(ElliSLICEStack, self).__init__()
+
+    def _sum_slices(self, func, x, y, a, b, psi, sigma_0, center_x, center_y):
+        """
+        sums a function of ElliSLICE over the slices, with the coordinates processed in chunks to limit the memory of
+        the (slices, coordinates) arrays
+
+        :param func: ElliSLICE.function or ElliSLICE.derivatives
+        :return: sum over the slices (tuple of the sums for the derivatives)
+        """
+        x_, y_ = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        shape = x_.shape
+        x_, y_ = x_.ravel(), y_.ravel()
+        # slices along the first axis, broadcast against the coordinates along the second axis
+        a, b, psi, sigma_0, center_x, center_y = [np.reshape(v, (-1, 1)) for v in (a, b, psi, sigma_0, center_x,
+                                                                                  center_y)]
+        result = None
+        chunk = max(1, 2 ** 18 // max(len(a), len(b), len(psi), len(sigma_0)))
+        for start in range(0, len(x_), chunk):
+            values = func(x_[start:start + chunk], y_[start:start + chunk], a, b, psi, sigma_0, center_x, center_y)
+            values = np.sum(values, axis=-2)
+            if result is None:
+                result = np.zeros(values.shape[:-1] + (len(x_),))
+            result[..., start:start + chunk] = values
+        result = result.reshape(result.shape[:-1] + shape)
+        if result.ndim == 0:
+            return float(result)
+        return result
+
+    def function(self, x, y, a, b, psi, sigma_0, center_x=0., center_y=0.):
+        """
+        lensing potential of the stack
+
+        :param a: array, semi-major axes, must be positive
+        :param b: array, semi-minor axes, must be positive
+        :param psi: array, orientations in radian
+        :param sigma_0: array, surface mass densities, must be positive
+        :param center_x: array, centers on the x axis
+        :param center_y: array, centers on the y axis
+
+        """
+        return self._sum_slices(self._slice.function, x, y, a, b, psi, sigma_0, center_x, center_y)
+
+    def derivatives(self, x, y, a, b, psi, sigma_0, center_x=0., center_y=0.):
+        """
+        lensing deflection angle of the stack
 
+        :param a: array, semi-major axes, must be positive
+        :param b: array, semi-minor axes, must be positive
+        :param psi: array, orientations in radian
+        :param sigma_0: array, surface mass densities, must be positive
+        :param center_x: array, centers on the x axis
+        :param center_y: array, centers on the y axis
+
+        """
+        f_x, f_y = self._sum_slices(self._slice.derivatives, x, y, a, b, psi, sigma_0, center_x, center_y)
+        return f_x, f_y
+
+    def hessian(self, x, y, a, b, psi, sigma_0, center_x=0., center_y=0.):
+        """
+        lensing second derivatives of the stack
+
+        :param a: array, semi-major axes, must be positive
+        :param b: array, semi-minor axes, must be positive
+        :param psi: array, orientations in radian
+        :param sigma_0: array, surface mass densities, must be positive
+        :param center_x: array, centers on the x axis
+        :param center_y: array, centers on the y axis
+
+        """
+        f_xx, f_xy, f_yx, f_yy = self._sum_slices(self._slice.hessian, x, y, a, b, psi, sigma_0, center_x, center_y)
+        return f_xx, f_xy, f_yx, f_yy
@@ -115,6 +115,24 @@ class EPL(LensProfileBase):
         if hasattr(self, '_q_static'):
             del self._q_static
 
+    def _rotated_frame(self, x, y, e1, e2, center_x, center_y, phi_G):
+        """
+        shifts and rotates the coordinates into the frame of the major axis. The frame is shared with other profiles of
+        the same center and eccentricities within a param_util.transform_cache() block.
+
+        :param x: x-coordinate in image plane
+        :param y: y-coordinate in image plane
+        :param e1: eccentricity component
+        :param e2: eccentricity component
+        :param center_x: profile center
+        :param center_y: profile center
+        :param phi_G: orientation angle of the major axis (as returned by param_conv())
+        :return: coordinates along the major and the minor axis
+        """
+        if self._static is True:
+            return util.rotate(x - center_x, y - center_y, phi_G)
+        return param_util.rotated_frame(x, y, e1, e2, center_x, center_y)
+
     def function(self, x, y, theta_E, gamma, e1, e2, center_x=0, center_y=0):
         """
 
@@ -129,11 +147,8 @@ class EPL(LensProfileBase):
         :return: lensing potential
         """
         b, t, q, phi_G = self.param_conv(theta_E, gamma, e1, e2)
-        # shift
-        x_ = x - center_x
-        y_ = y - center_y
-        # rotate
-        x__, y__ = util.rotate(x_, y_, phi_G)
+        # shift and rotate
+        x__, y__ = self._rotated_frame(x, y, e1, e2, center_x, center_y, phi_G)
         # evaluate
         f_ = self.epl_major_axis.function(x__, y__, b, t, q)
         # rotate back
@@ -153,11 +168,8 @@ class EPL(LensProfileBase):
         :return: alpha_x, alpha_y
         """
         b, t, q, phi_G = self.param_conv(theta_E, gamma, e1, e2)
-        # shift
-        x_ = x - center_x
-        y_ = y - center_y
-        # rotate
-        x__, y__ = util.rotate(x_, y_, phi_G)
+        # shift and rotate
+        x__, y__ = self._rotated_frame(x, y, e1, e2, center_x, center_y, phi_G)
         # evaluate
         f__x, f__y = self.epl_major_axis.derivatives(x__, y__, b, t, q)
         # rotate back
@@ -179,11 +191,8 @@ class EPL(LensProfileBase):
         """
 
         b, t, q, phi_G = self.param_conv(theta_E, gamma, e1, e2)
-        # shift
-        x_ = x - center_x
-        y_ = y - center_y
-        # rotate
-        x__, y__ = util.rotate(x_, y_, phi_G)
+        # shift and rotate
+        x__, y__ = self._rotated_frame(x, y, e1, e2, center_x, center_y, phi_G)
         # evaluate
         f__xx, f__xy, f__yx, f__yy = self.epl_major_axis.hessian(x__, y__, b, t, q)
         # rotate back
@@ -32,17 +32,20 @@ class GaussianEllipseKappaSet(LensProfileBase):
     upper_limit_default = {'amp': 100, 'sigma': 100, 'e1': 0.5, 'e2': 0.5,
                            'center_x': 100, 'center_y': 100}
 
-    def __init__(self, use_scipy_wofz=True, min_ellipticity=1e-5):
+    def __init__(self, use_scipy_wofz=True, min_ellipticity=1e-5, use_numba_wofz=True):
         """
 
         :param use_scipy_wofz: To initiate ``class GaussianEllipseKappa``. If ``True``, Gaussian lensing will use ``scipy.special.wofz`` function. Set ``False`` for lower precision, but faster speed.
         :type use_scipy_wofz: ``bool``
         :param min_ellipticity: To be passed to ``class GaussianEllipseKappa``. Minimum ellipticity for Gaussian elliptical lensing calculation. For lower ellipticity than min_ellipticity the equations for the spherical case will be used.
         :type min_ellipticity: ``float``
+        :param use_numba_wofz: To be passed to ``class GaussianEllipseKappa``. If ``True`` (together with ``use_scipy_wofz``) and numba is enabled, the Faddeeva function is evaluated with the compiled kernel of the same precision.
+        :type use_numba_wofz: ``bool``
         """
         self.gaussian_ellipse_kappa = GaussianEllipseKappa(
                                             use_scipy_wofz=use_scipy_wofz,
-                                            min_ellipticity=min_ellipticity)
+                                            min_ellipticity=min_ellipticity,
+                                            use_numba_wofz=use_numba_wofz)
         super(GaussianEllipseKappaSet, self).__init__()
 
     def function(self, x, y, amp, sigma, e1, e2, center_x=0, center_y=0):
@@ -69,16 +72,7 @@ class GaussianEllipseKappaSet(LensProfileBase):
         :return: Potential for elliptical Gaussian convergence
         :rtype: ``float``, or ``numpy.array`` with ``shape = x.shape``
         """
-        function = np.zeros_like(x, dtype=float)
-
-        for i in range(len(amp)):
-            function += self.gaussian_ellipse_kappa.function(x, y,
-                                                             amp[i],
-                                                             sigma[i], e1,
-                                                             e2,
-                                                             center_x,
-                                                             center_y)
-        return function
+        return self.gaussian_ellipse_kappa.function_set(x, y, amp, sigma, e1, e2, center_x, center_y)
 
     def derivatives(self, x, y, amp, sigma, e1, e2, center_x=0, center_y=0):
         """
@@ -105,16 +99,7 @@ class GaussianEllipseKappaSet(LensProfileBase):
         :return: Deflection angle :math:`\\partial f/\\partial x`, :math:`\\partial f/\\partial y` for elliptical Gaussian convergence
         :rtype: tuple ``(float, float)`` or ``(numpy.array, numpy.array)`` with each ``numpy`` array's shape equal to ``x.shape``
         """
-        f_x = np.zeros_like(x, dtype=float)
-        f_y = np.zeros_like(x, dtype=float)
-
-        for i in range(len(amp)):
-            f_x_i, f_y_i = self.gaussian_ellipse_kappa.derivatives(x, y, amp=amp[i], sigma=sigma[i], e1=e1, e2=e2,
-                                                                   center_x=center_x, center_y=center_y)
-            f_x += f_x_i
-            f_y += f_y_i
-
-        return f_x, f_y
+        return self.gaussian_ellipse_kappa.derivatives_set(x, y, amp, sigma, e1, e2, center_x, center_y)
 
     def hessian(self, x, y, amp, sigma, e1, e2, center_x=0, center_y=0):
         """
@@ -144,18 +129,7 @@ class GaussianEllipseKappaSet(LensProfileBase):
         :rtype: tuple ``(float, float, float)`` , or ``(numpy.array, numpy.array, numpy.array)``
          with each ``numpy`` array's shape equal to ``x.shape``
         """
-        f_xx = np.zeros_like(x, dtype=float)
-        f_yy = np.zeros_like(x, dtype=float)
-        f_xy = np.zeros_like(x, dtype=float)
-
-        for i in range(len(amp)):
-            f_xx_i, f_xy_i, _, f_yy_i = self.gaussian_ellipse_kappa.hessian(x, y, amp=amp[i], sigma=sigma[i], e1=e1,
-                                                                            e2=e2, center_x=center_x, center_y=center_y)
-            f_xx += f_xx_i
-            f_yy += f_yy_i
-            f_xy += f_xy_i
-
-        return f_xx, f_xy, f_xy, f_yy
+        return self.gaussian_ellipse_kappa.hessian_set(x, y, amp, sigma, e1, e2, center_x, center_y)
 
     def density_2d(self, x, y, amp, sigma, e1, e2, center_x=0, center_y=0):
         """
@@ -182,13 +156,7 @@ class GaussianEllipseKappaSet(LensProfileBase):
         :return: Density :math:`\\kappa` for elliptical Gaussian convergence
         :rtype: ``float``, or ``numpy.array`` with shape equal to ``x.shape``
         """
-        density_2d = np.zeros_like(x, dtype=float)
-
-        for i in range(len(amp)):
-            density_2d += self.gaussian_ellipse_kappa.density_2d(x, y, amp=amp[i], sigma=sigma[i], e1=e1, e2=e2,
-                                                                 center_x=center_x, center_y=center_y)
-
-        return density_2d
+        return self.gaussian_ellipse_kappa.density_2d_set(x, y, amp, sigma, e1, e2, center_x, center_y)
 
 
 @export
@@ -198,7 +166,8 @@ class GaussDecompositionAbstract(metaclass=abc.ABCMeta):
     an elliptical convergence through Shajib (2019)'s Gauss decomposition.
     """
     def __init__(self, n_sigma=15, sigma_start_mult=0.02, sigma_end_mult=15.,
-                 precision=10, use_scipy_wofz=True, min_ellipticity=1e-5):
+                 precision=10, use_scipy_wofz=True, min_ellipticity=1e-5,
+                 use_numba_wofz=True):
         """
         Set up settings for the Gaussian decomposition. For more details about
         the decomposition parameters, see Shajib (2019).
@@ -215,10 +184,13 @@ class GaussDecompositionAbstract(metaclass=abc.ABCMeta):
         :type use_scipy_wofz: ``bool``
         :param min_ellipticity: To be passed to ``class GaussianEllipseKappa``. Minimum ellipticity for Gaussian elliptical lensing calculation. For lower ellipticity than min_ellipticity the equations for the spherical case will be used.
         :type min_ellipticity: ``float``
+        :param use_numba_wofz: To be passed to ``class GaussianEllipseKappa``. If ``True`` (together with ``use_scipy_wofz``) and numba is enabled, the Faddeeva function is evaluated with the compiled kernel of the same precision.
+        :type use_numba_wofz: ``bool``
         """
         self.gaussian_set = GaussianEllipseKappaSet(
                                             use_scipy_wofz=use_scipy_wofz,
-                                            min_ellipticity=min_ellipticity)
+                                            min_ellipticity=min_ellipticity,
+                                            use_numba_wofz=use_numba_wofz)
 
         self.n_sigma = n_sigma
         self.sigma_start_mult = sigma_start_mult
@@ -486,7 +458,8 @@ class NFWEllipseGaussDec(GaussDecompositionAbstract):
                            'center_x': 100, 'center_y': 100}
 
     def __init__(self, n_sigma=15, sigma_start_mult=0.005, sigma_end_mult=50.,
-                 precision=10, use_scipy_wofz=True, min_ellipticity=1e-5):
+                 precision=10, use_scipy_wofz=True, min_ellipticity=1e-5,
+                 use_numba_wofz=True):
         """
         Set up settings for the Gaussian decomposition. For more details about
         the decomposition parameters, see Shajib (2019).
@@ -503,13 +476,16 @@ class NFWEllipseGaussDec(GaussDecompositionAbstract):
         :type use_scipy_wofz: ``bool``
         :param min_ellipticity: To be passed to ``class GaussianEllipseKappa``. Minimum ellipticity for Gaussian elliptical lensing calculation. For lower ellipticity than min_ellipticity the equations for the spherical case will be used.
         :type min_ellipticity: ``float``
+        :param use_numba_wofz: To be passed to ``class GaussianEllipseKappa``. If ``True`` (together with ``use_scipy_wofz``) and numba is enabled, the Faddeeva function is evaluated with the compiled kernel of the same precision.
+        :type use_numba_wofz: ``bool``
         """
         super(NFWEllipseGaussDec, self).__init__(n_sigma=n_sigma,
                                                  sigma_start_mult=sigma_start_mult,
                                                  sigma_end_mult=sigma_end_mult,
                                                  precision=precision,
                                                  use_scipy_wofz=use_scipy_wofz,
-                                                 min_ellipticity=min_ellipticity)
+                                                 min_ellipticity=min_ellipticity,
+                                                 use_numba_wofz=use_numba_wofz)
 
     def get_kappa_1d(self, y, **kwargs):
         r"""
@@ -613,7 +589,7 @@ class CTNFWGaussDec(GaussDecompositionAbstract3D):
                            'rho_s': 1000, 'center_x': 100, 'center_y': 100}
 
     def __init__(self, n_sigma=15, sigma_start_mult=0.01, sigma_end_mult=20.,
-                 precision=10, use_scipy_wofz=True):
+                 precision=10, use_scipy_wofz=True, use_numba_wofz=True):
         """
         Set up settings for the Gaussian decomposition. For more details about
         the decomposition parameters, see Shajib (2019).
@@ -628,10 +604,12 @@ class CTNFWGaussDec(GaussDecompositionAbstract3D):
         :type precision: ``int``
         :param use_scipy_wofz: To be passed to ``class GaussianEllipseKappa``. If ``True``, Gaussian lensing will use ``scipy.special.wofz`` function. Set ``False`` for lower precision, but faster speed.
         :type use_scipy_wofz: ``bool``
+        :param use_numba_wofz: To be passed to ``class GaussianEllipseKappa``. If ``True`` (together with ``use_scipy_wofz``) and numba is enabled, the Faddeeva function is evaluated with the compiled kernel of the same precision.
+        :type use_numba_wofz: ``bool``
         """
         super(CTNFWGaussDec, self).__init__(n_sigma=n_sigma, sigma_start_mult=sigma_start_mult,
                                             sigma_end_mult=sigma_end_mult, precision=precision,
-                                            use_scipy_wofz=use_scipy_wofz)
+                                            use_scipy_wofz=use_scipy_wofz, use_numba_wofz=use_numba_wofz)
 
     def get_kappa_1d(self, y, **kwargs):
         r"""
@@ -9,11 +9,12 @@ __author__ = 'ajshajib'
 
 import numpy as np
 from scipy.special import wofz
-from scipy.integrate import quad
 from copy import deepcopy
 from lenstronomy.LensModel.Profiles.gaussian_kappa import GaussianKappa
 import lenstronomy.Util.param_util as param_util
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
+from lenstronomy.LensModel.Util.faddeeva_util import _wofz_upper
+from lenstronomy.Util.numba_util import jit, prange, numba_enabled
 
 __all__ = ['GaussianEllipseKappa']
 
@@ -31,23 +32,35 @@ class GaussianEllipseKappa(LensProfileBase):
     upper_limit_default = {'amp': 100, 'sigma': 100, 'e1': 0.5, 'e2': 0.5,
                            'center_x': 100, 'center_y': 100}
 
-    def __init__(self, use_scipy_wofz=True, min_ellipticity=1e-5):
+    def __init__(self, use_scipy_wofz=True, min_ellipticity=1e-5, num_nodes=24, use_numba_wofz=True):
         """
         Setup which method to use the Faddeeva function and the
         ellipticity limit for spherical approximation.
 
-        :param use_scipy_wofz: If ``True``, use ``scipy.special.wofz``.
+        :param use_scipy_wofz: If ``True``, use ``scipy.special.wofz`` (or the compiled kernel of the same precision,
+         see ``use_numba_wofz``). If ``False``, use the approximation of Zaghloul (2017).
         :type use_scipy_wofz: ``bool``
         :param min_ellipticity: Minimum allowed ellipticity. For ``q > 1 - min_ellipticity``, values for spherical case will be returned.
         :type min_ellipticity: ``float``
+        :param num_nodes: Number of Gauss-Legendre nodes of each of the two parts of the line integral of the potential.
+        :type num_nodes: ``int``
+        :param use_numba_wofz: If ``True`` (together with ``use_scipy_wofz``) and numba is enabled, the
+         :math:`\\varsigma(z; q)` function is evaluated in a single compiled loop with the Faddeeva kernel of
+         ``lenstronomy.LensModel.Util.faddeeva_util`` (relative difference to ``scipy.special.wofz`` below 3e-14).
+        :type use_numba_wofz: ``bool``
         """
         if use_scipy_wofz:
             self.w_f = wofz
         else:
             self.w_f = self.w_f_approx
+        self._use_numba = use_scipy_wofz and use_numba_wofz and numba_enabled
 
         self.min_ellipticity = min_ellipticity
         self.spherical = GaussianKappa()
+        # Gauss-Legendre nodes on [0, 1] of the line integral of the potential
+        nodes, weights = np.polynomial.legendre.leggauss(num_nodes)
+        self._nodes = (nodes + 1) / 2.
+        self._weights = weights / 2.
         super(GaussianEllipseKappa, self).__init__()
 
     def function(self, x, y, amp, sigma, e1, e2, center_x=0, center_y=0):
@@ -94,44 +107,243 @@ class GaussianEllipseKappa(LensProfileBase):
         x_ = cos_phi * x_shift + sin_phi * y_shift
         y_ = -sin_phi * x_shift + cos_phi * y_shift
 
-        _b = 1. / 2. / sigma_ ** 2
-        _p = np.sqrt(_b * q ** 2 / (1. - q ** 2))
+        return self._potential_rotated(x_, y_, amp_, sigma_, q)
 
-        if isinstance(x_, int) or isinstance(x_, float):
-            return self._num_integral(x_, y_, amp_, sigma_, _p, q)
-        else:
-            f_ = []
-            for i in range(len(x_)):
-                f_.append(self._num_integral(x_[i], y_[i], amp_, sigma_, _p, q))
-            return np.array(f_)
+    def function_set(self, x, y, amp, sigma, e1, e2, center_x=0, center_y=0):
+        """
+        Compute the sum of the potentials of a set of concentric elliptical Gaussian convergence profiles with the same
+        ellipticity. The rotation and the integration nodes are shared by all the components.
 
-    def _num_integral(self, x_, y_, amp_, sigma_, _p, q):
+        :param x: x coordinate
+        :type x: ``float`` or ``numpy.array``
+        :param y: y coordinate
+        :type y: ``float`` or ``numpy.array``
+        :param amp: Amplitudes of the Gaussians, convention: :math:`A/(2 \\pi\\sigma^2) \\exp(-(x^2+y^2/q^2)/2\\sigma^2)`
+        :type amp: ``numpy.array`` with ``dtype=float``
+        :param sigma: Standard deviations of the Gaussians
+        :type sigma: ``numpy.array`` with ``dtype=float``
+        :param e1: Ellipticity parameter 1
+        :type e1: ``float``
+        :param e2: Ellipticity parameter 2
+        :type e2: ``float``
+        :param center_x: x coordinate of centroid
+        :type center_x: ``float``
+        :param center_y: y coordianate of centroid
+        :type center_y: ``float``
+        :return: Potential for the set of elliptical Gaussian convergence profiles
+        :rtype: ``float``, or ``numpy.array`` with shape equal to ``x.shape``
         """
+        phi_g, q = param_util.ellipticity2phi_q(e1, e2)
+        if q > 1 - self.min_ellipticity:
+            return self.spherical.function_set(x, y, amp, sigma, center_x, center_y)
+        amp_, sigma_ = self._convert_set(amp, sigma, q)
+        x_, y_, _, _ = self._rotate(x, y, phi_g, center_x, center_y)
+        return self._potential_rotated(x_, y_, amp_, sigma_, q)
 
-        :param x_:
-        :param y_:
-        :param _p:
-        :param q:
-        :return:
+    def derivatives_set(self, x, y, amp, sigma, e1, e2, center_x=0, center_y=0):
         """
-        def pot_real_line_integrand(_x):
-            sig_func_re, sig_func_im = self.sigma_function(_p * _x, 0, q)
+        Compute the sum of the deflection angles of a set of concentric elliptical Gaussian convergence profiles with
+        the same ellipticity. The components are evaluated with broadcasting on a (components, coordinates) layout,
+        sharing the rotation of the coordinates.
 
-            alpha_x_ = amp_*sigma_ * self.sgn(_x) * np.sqrt(2*np.pi / (
-                    1. - q ** 2)) * sig_func_re
+        :param x: x coordinate
+        :type x: ``float`` or ``numpy.array``
+        :param y: y coordinate
+        :type y: ``float`` or ``numpy.array``
+        :param amp: Amplitudes of the Gaussians, convention: :math:`A/(2 \\pi\\sigma^2) \\exp(-(x^2+y^2/q^2)/2\\sigma^2)`
+        :type amp: ``numpy.array`` with ``dtype=float``
+        :param sigma: Standard deviations of the Gaussians
+        :type sigma: ``numpy.array`` with ``dtype=float``
+        :param e1: Ellipticity parameter 1
+        :type e1: ``float``
+        :param e2: Ellipticity parameter 2
+        :type e2: ``float``
+        :param center_x: x coordinate of centroid
+        :type center_x: ``float``
+        :param center_y: y coordianate of centroid
+        :type center_y: ``float``
+        :return: Deflection angle :math:`\\partial f/\\partial x`, :math:`\\partial f/\\partial y` for the set of
+         elliptical Gaussian convergence profiles
+        :rtype: tuple ``(float, float)`` or ``(numpy.array, numpy.array)`` with each ``numpy.array``'s shape equal
+         to ``x.shape``.
+        """
+        phi_g, q = param_util.ellipticity2phi_q(e1, e2)
+        if q > 1 - self.min_ellipticity:
+            return self.spherical.derivatives_set(x, y, amp, sigma, center_x, center_y)
+        amp_, sigma_ = self._convert_set(amp, sigma, q)
+        x_, y_, cos_phi, sin_phi = self._rotate(x, y, phi_g, center_x, center_y)
+        alpha_x_, alpha_y_ = self.spherical.sum_components(
+            lambda _x, _y, _amp, _sigma: self._alpha_rotated(_x, _y, _amp, _sigma, q), x_, y_, amp_, sigma_)
 
-            return alpha_x_
+        # rotate back to the original frame
+        f_x = alpha_x_ * cos_phi - alpha_y_ * sin_phi
+        f_y = alpha_x_ * sin_phi + alpha_y_ * cos_phi
+        return f_x, f_y
 
-        def pot_imag_line_integrand(_y):
-            sig_func_re, sig_func_im = self.sigma_function(_p * x_, _p * _y, q)
+    def hessian_set(self, x, y, amp, sigma, e1, e2, center_x=0, center_y=0):
+        """
+        Compute the sum of the Hessian matrices of a set of concentric elliptical Gaussian convergence profiles with
+        the same ellipticity. The components are evaluated with broadcasting on a (components, coordinates) layout,
+        sharing the rotation of the coordinates.
 
-            alpha_y_ = -amp_*sigma_ * self.sgn(x_ + 1j*_y) * np.sqrt(2*np.pi / (1. - q ** 2)) * sig_func_im
+        :param x: x coordinate
+        :type x: ``float`` or ``numpy.array``
+        :param y: y coordinate
+        :type y: ``float`` or ``numpy.array``
+        :param amp: Amplitudes of the Gaussians, convention: :math:`A/(2 \\pi\\sigma^2) \\exp(-(x^2+y^2/q^2)/2\\sigma^2)`
+        :type amp: ``numpy.array`` with ``dtype=float``
+        :param sigma: Standard deviations of the Gaussians
+        :type sigma: ``numpy.array`` with ``dtype=float``
+        :param e1: Ellipticity parameter 1
+        :type e1: ``float``
+        :param e2: Ellipticity parameter 2
+        :type e2: ``float``
+        :param center_x: x coordinate of centroid
+        :type center_x: ``float``
+        :param center_y: y coordianate of centroid
+        :type center_y: ``float``
+        :return: Hessian :math:`\\partial^2f/\\partial x^2`, :math:`\\partial^2/\\partial x\\partial y`,
+         :math:`\\partial^2/\\partial y\\partial x`, :math:`\\partial^2 f/\\partial y^2` for the set of elliptical
+         Gaussian convergence profiles.
+        :rtype: tuple ``(float, float, float, float)`` , or ``(numpy.array, numpy.array, numpy.array, numpy.array)``
+         with each ``numpy.array``'s shape equal to ``x.shape``.
+        """
+        phi_g, q = param_util.ellipticity2phi_q(e1, e2)
+        if q > 1 - self.min_ellipticity:
+            return self.spherical.hessian_set(x, y, amp, sigma, center_x, center_y)
+        amp_, sigma_ = self._convert_set(amp, sigma, q)
+        x_, y_, cos_phi, sin_phi = self._rotate(x, y, phi_g, center_x, center_y)
+        f_xx_, f_xy_, f_yy_ = self.spherical.sum_components(
+            lambda _x, _y, _amp, _sigma: self._hessian_rotated(_x, _y, _amp, _sigma, q), x_, y_, amp_, sigma_)
+        return self._rotate_hessian(f_xx_, f_xy_, f_yy_, cos_phi, sin_phi)
+
+    def density_2d_set(self, x, y, amp, sigma, e1, e2, center_x=0, center_y=0):
+        """
+        Compute the sum of the densities of a set of concentric elliptical Gaussian convergence profiles with the same
+        ellipticity.
 
-            return alpha_y_
+        :param x: x coordinate
+        :type x: ``float`` or ``numpy.array``
+        :param y: y coordinate
+        :type y: ``float`` or ``numpy.array``
+        :param amp: Amplitudes of the Gaussians, convention: :math:`A/(2 \\pi\\sigma^2) \\exp(-(x^2+y^2/q^2)/2\\sigma^2)`
+        :type amp: ``numpy.array`` with ``dtype=float``
+        :param sigma: Standard deviations of the Gaussians
+        :type sigma: ``numpy.array`` with ``dtype=float``
+        :param e1: Ellipticity parameter 1
+        :type e1: ``float``
+        :param e2: Ellipticity parameter 2
+        :type e2: ``float``
+        :param center_x: x coordinate of centroid
+        :type center_x: ``float``
+        :param center_y: y coordianate of centroid
+        :type center_y: ``float``
+        :return: Density :math:`\\kappa` for the set of elliptical Gaussian convergence profiles
+        :rtype: ``float``, or ``numpy.array`` with shape equal to ``x.shape``
+        """
+        phi_g, q = param_util.ellipticity2phi_q(e1, e2)
+        # the expression in the frame of the major axis is also valid for the spherical case
+        amp_, sigma_ = self._convert_set(amp, sigma, q)
+        x_, y_, _, _ = self._rotate(x, y, phi_g, center_x, center_y)
+        return self.spherical.sum_components(
+            lambda _x, _y, _amp, _sigma: _amp * np.exp(-(q**2 * _x**2 + _y**2) / 2 / _sigma**2), x_, y_, amp_, sigma_)
 
-        pot_on_real_line = quad(pot_real_line_integrand, 0, x_)[0]
-        pot_on_imag_parallel = quad(pot_imag_line_integrand, 0, y_)[0]
-        return pot_on_real_line + pot_on_imag_parallel
+    @staticmethod
+    def _convert_set(amp, sigma, q):
+        """
+        converts the amplitudes and standard deviations of a set of Gaussians into the convention of Shajib (2019)
+
+        :param amp: amplitudes
+        :param sigma: standard deviations
+        :param q: axis ratio
+        :return: amp_, sigma_ arrays
+        """
+        amp = np.asarray(amp, dtype=float)
+        sigma = np.asarray(sigma, dtype=float)
+        return amp / (2 * np.pi * sigma**2), sigma * np.sqrt(q)
+
+    @staticmethod
+    def _rotate(x, y, phi_g, center_x, center_y):
+        """
+        coordinates in the frame of the major axis
+
+        :param x: x coordinate
+        :param y: y coordinate
+        :param phi_g: position angle
+        :param center_x: x coordinate of centroid
+        :param center_y: y coordianate of centroid
+        :return: x_, y_, cos(phi_g), sin(phi_g)
+        """
+        x_shift = x - center_x
+        y_shift = y - center_y
+        cos_phi = np.cos(phi_g)
+        sin_phi = np.sin(phi_g)
+        x_ = cos_phi * x_shift + sin_phi * y_shift
+        y_ = -sin_phi * x_shift + cos_phi * y_shift
+        return x_, y_, cos_phi, sin_phi
+
+    def _potential_rotated(self, x_, y_, amp_, sigma_, q):
+        """
+        potential in the frame of the major axis as line integral of the deflection along the ray from the center,
+        evaluated with a fixed-order Gauss-Legendre quadrature for all the coordinates at once.
+
+        The ray is split at the radius 5 sigma_/q: the inner part is integrated linearly in the radius, the outer part
+        linearly in the logarithm of the radius, in which the deflection times the radius is smooth.
+
+        :param x_: x coordinate in the frame of the major axis
+        :param y_: y coordinate in the frame of the major axis
+        :param amp_: amplitude (or array of amplitudes) in the convention of Shajib (2019)
+        :param sigma_: standard deviation (or array of standard deviations) in the convention of Shajib (2019)
+        :param q: axis ratio
+        :return: potential (summed over the components), with the shape of x_
+        """
+        x_, y_ = np.broadcast_arrays(np.asarray(x_, dtype=float), np.asarray(y_, dtype=float))
+        shape = x_.shape
+        x_, y_ = x_.ravel(), y_.ravel()
+        amp_ = np.atleast_1d(amp_)[:, None]
+        sigma_ = np.atleast_1d(sigma_)[:, None]
+        num_components = len(sigma_)
+        nodes = self._nodes[:, None, None]
+        weights = self._weights[:, None, None]
+        potential = np.zeros(len(x_))
+        # coordinates are processed in chunks to limit the memory of the (nodes, components, coordinates) arrays
+        chunk = max(1, 2 ** 18 // (len(self._nodes) * num_components))
+        for start in range(0, len(x_), chunk):
+            x_i, y_i = x_[start:start + chunk], y_[start:start + chunk]
+            r = np.sqrt(x_i ** 2 + y_i ** 2)
+            s_split = np.minimum(1, 5 * sigma_ / q / np.maximum(r, 1e-300))
+            log_s_split = np.log(s_split)
+            # inner part of the ray s in [0, s_split], outer part s in [s_split, 1] with ds = s d(log s)
+            s_inner = nodes * s_split
+            s_outer = np.exp(nodes * log_s_split)
+            for s_, weight in [(s_inner, weights * s_split), (s_outer, - weights * log_s_split * s_outer)]:
+                alpha_x_, alpha_y_ = self._alpha_rotated(s_ * x_i, s_ * y_i, amp_, sigma_, q)
+                potential[start:start + chunk] += np.sum(weight * (alpha_x_ * x_i + alpha_y_ * y_i), axis=(0, 1))
+        potential = potential.reshape(shape)
+        if shape == ():
+            return float(potential)
+        return potential
+
+    def _alpha_rotated(self, x_, y_, amp_, sigma_, q):
+        """
+        deflection angles in the frame of the major axis, eqn. (4.15) of Shajib (2019)
+
+        :param x_: x coordinate in the frame of the major axis
+        :param y_: y coordinate in the frame of the major axis
+        :param amp_: amplitude in the convention of Shajib (2019)
+        :param sigma_: standard deviation in the convention of Shajib (2019)
+        :param q: axis ratio
+        :return: alpha_x, alpha_y in the frame of the major axis
+        """
+        _p = q / sigma_ / np.sqrt(2 * (1. - q**2))
+
+        sig_func_re, sig_func_im = self.sigma_function(_p * x_, _p * y_, q)
+
+        alpha_x_ = amp_ * sigma_ * self.sgn(x_ + 1j*y_) * np.sqrt(2*np.pi/(
+                1.-q**2)) * sig_func_re
+        alpha_y_ = - amp_ * sigma_ * self.sgn(x_ + 1j*y_) * np.sqrt(
+            2 * np.pi / (1. - q ** 2)) * sig_func_im
+        return alpha_x_, alpha_y_
 
     def derivatives(self, x, y, amp, sigma, e1, e2, center_x=0, center_y=0):
         """
@@ -181,14 +393,7 @@ class GaussianEllipseKappa(LensProfileBase):
         x_ = cos_phi * x_shift + sin_phi * y_shift
         y_ = -sin_phi * x_shift + cos_phi * y_shift
 
-        _p = q / sigma_ / np.sqrt(2 * (1. - q**2))
-
-        sig_func_re, sig_func_im = self.sigma_function(_p * x_, _p * y_, q)
-
-        alpha_x_ = amp_ * sigma_ * self.sgn(x_ + 1j*y_) * np.sqrt(2*np.pi/(
-                1.-q**2)) * sig_func_re
-        alpha_y_ = - amp_ * sigma_ * self.sgn(x_ + 1j*y_) * np.sqrt(
-            2 * np.pi / (1. - q ** 2)) * sig_func_im
+        alpha_x_, alpha_y_ = self._alpha_rotated(x_, y_, amp_, sigma_, q)
 
         # rotate back to the original frame
         f_x = alpha_x_ * cos_phi - alpha_y_ * sin_phi
@@ -243,6 +448,20 @@ class GaussianEllipseKappa(LensProfileBase):
         x_ = cos_phi * x_shift + sin_phi * y_shift
         y_ = -sin_phi * x_shift + cos_phi * y_shift
 
+        f_xx_, f_xy_, f_yy_ = self._hessian_rotated(x_, y_, amp_, sigma_, q)
+        return self._rotate_hessian(f_xx_, f_xy_, f_yy_, cos_phi, sin_phi)
+
+    def _hessian_rotated(self, x_, y_, amp_, sigma_, q):
+        """
+        Hessian in the frame of the major axis, eqns. (4.19)-(4.21) of Shajib (2019)
+
+        :param x_: x coordinate in the frame of the major axis
+        :param y_: y coordinate in the frame of the major axis
+        :param amp_: amplitude in the convention of Shajib (2019)
+        :param sigma_: standard deviation in the convention of Shajib (2019)
+        :param q: axis ratio
+        :return: f_xx, f_xy, f_yy in the frame of the major axis
+        """
         _p = q / sigma_ / np.sqrt(2 * (1. - q**2))
         sig_func_re, sig_func_im = self.sigma_function(_p * x_, _p * y_, q)
 
@@ -256,8 +475,15 @@ class GaussianEllipseKappa(LensProfileBase):
         f_xx_ = kappa + shear.real
         f_yy_ = kappa - shear.real
         f_xy_ = shear.imag
+        return f_xx_, f_xy_, f_yy_
 
-        # rotate back to the original frame
+    @staticmethod
+    def _rotate_hessian(f_xx_, f_xy_, f_yy_, cos_phi, sin_phi):
+        """
+        rotates the Hessian from the frame of the major axis back to the original frame
+
+        :return: f_xx, f_xy, f_yx, f_yy in the original frame
+        """
         f_xx = f_xx_ * cos_phi**2 + f_yy_ * sin_phi**2 - 2 * sin_phi * cos_phi * f_xy_
         f_yy = f_xx_ * sin_phi**2 + f_yy_ * cos_phi**2 + 2 * sin_phi * cos_phi * f_xy_
         f_xy = sin_phi * cos_phi * (f_xx_ - f_yy_) + (cos_phi**2 - sin_phi**2) * f_xy_
@@ -325,6 +551,12 @@ class GaussianEllipseKappa(LensProfileBase):
         :return: real and imaginary part of :math:`\varsigma(z; q)` function
         :rtype: tuple ``(type(x), type(x))``
         """
+        if self._use_numba:
+            x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+            sigma_func_real, sigma_func_imag = _sigma_function_numba(x.ravel(), y.ravel(), float(q))
+            if x.ndim == 0:
+                return sigma_func_real[0], sigma_func_imag[0]
+            return sigma_func_real.reshape(x.shape), sigma_func_imag.reshape(x.shape)
         y_sign = np.sign(y)
         y_ = deepcopy(y) * y_sign
         z = x + 1j * y_
@@ -416,3 +648,27 @@ class GaussianEllipseKappa(LensProfileBase):
 
             wz[reg6] = f1 / f2
         return wz
+
+
+@jit()
+def _sigma_function_numba(x, y, q):
+    """
+    compiled :math:`\\varsigma(z; q)` function of eqn. (4.12) of Shajib (2019), see
+    GaussianEllipseKappa.sigma_function()
+
+    :param x: 1d array of the real part of z
+    :param y: 1d array of the imaginary part of z
+    :param q: axis ratio
+    :return: real and imaginary part of the function
+    """
+    sigma_func_real = np.empty(len(x))
+    sigma_func_imag = np.empty(len(x))
+    for i in prange(len(x)):
+        y_sign = np.sign(y[i])
+        y_ = y[i] * y_sign
+        w = _wofz_upper(complex(x[i], y_))
+        wq = _wofz_upper(complex(q * x[i], y_ / q))
+        exp_factor = np.exp(-x[i] * x[i] * (1 - q * q) - y_ * y_ * (1 / q / q - 1))
+        sigma_func_real[i] = w.imag - exp_factor * wq.imag
+        sigma_func_imag[i] = (- w.real + exp_factor * wq.real) * y_sign
+    return sigma_func_real, sigma_func_imag
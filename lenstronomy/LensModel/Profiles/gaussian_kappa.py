@@ -3,7 +3,6 @@ __author__ = 'sibirrer'
 
 import numpy as np
 import scipy.special
-import scipy.integrate as integrate
 from lenstronomy.LensModel.Profiles.gaussian_potential import Gaussian
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 
@@ -32,13 +31,7 @@ class GaussianKappa(LensProfileBase):
         r = np.sqrt(x_**2 + y_**2)
         sigma_x, sigma_y = sigma, sigma
         c = 1. / (2 * sigma_x * sigma_y)
-        if isinstance(x_, int) or isinstance(x_, float):
-            num_int = self._num_integral(r, c)
-        else:
-            num_int = []
-            for i in range(len(x_)):
-                num_int.append(self._num_integral(r[i], c))
-            num_int = np.array(num_int)
+        num_int = self._num_integral(r, c)
         amp_density = self._amp2d_to_3d(amp, sigma_x, sigma_y)
         amp2d = amp_density / (np.sqrt(np.pi) * np.sqrt(sigma_x * sigma_y * 2))
         amp2d *= 2 * 1. / (2 * c)
@@ -47,13 +40,28 @@ class GaussianKappa(LensProfileBase):
     @staticmethod
     def _num_integral(r, c):
         """
-        numerical integral (1-e^{-c*x^2})/x dx [0..r]
+        integral (1-e^{-c*x^2})/x dx [0..r] = Ein(c r^2) / 2, with the entire exponential integral
+        Ein(z) = E_1(z) + ln(z) + gamma (evaluated with its power series for z < 1 to avoid the cancellation of E_1 and
+        ln for small z)
+
         :param r: radius
         :param c: 1/2sigma^2
-        :return:
+        :return: integral, with the shape of r
         """
-        out = integrate.quad(lambda x: (1-np.exp(-c*x**2))/x, 0, r)
-        return out[0]
+        z = np.asarray(c * r ** 2, dtype=float)
+        ein = np.zeros_like(z)
+        small = z < 1
+        z_small = z[small]
+        # power series sum_k (-1)^(k+1) z^k / (k k!) in Horner form, truncation error < 1e-18 for z < 1
+        series = np.zeros_like(z_small)
+        for k in range(18, 0, -1):
+            series = z_small * ((-1) ** (k + 1) / (k * scipy.special.factorial(k)) + series)
+        ein[small] = series
+        z_large = z[~small]
+        ein[~small] = scipy.special.exp1(z_large) + np.log(z_large) + np.euler_gamma
+        if ein.ndim == 0:
+            return float(ein) / 2.
+        return ein / 2.
 
     def derivatives(self, x, y, amp, sigma, center_x=0, center_y=0):
         """
@@ -90,6 +98,101 @@ class GaussianKappa(LensProfileBase):
         f_xy = -(d_alpha_dr/r + alpha/r**2) * x_*y_/r
         return f_xx, f_xy, f_xy, f_yy
 
+    @staticmethod
+    def sum_components(func, x, y, amp, sigma, chunk_size=2**14):
+        """
+        evaluates a function of a set of Gaussian components with broadcasting on a (components, coordinates) layout
+        and sums over the components. The coordinates are processed in chunks to limit the memory of the intermediate
+        arrays.
+
+        :param func: function of (x, y, amp, sigma) with x, y 1d arrays of coordinates and amp, sigma arrays of shape
+         (num_components, 1), returning an array or a tuple of arrays of shape (num_components, len(x))
+        :param x: x coordinate(s)
+        :param y: y coordinate(s)
+        :param amp: amplitudes of the components
+        :param sigma: standard deviations of the components
+        :param chunk_size: maximal number of (component, coordinate) pairs evaluated at once
+        :return: sum over the components with the shape of x (tuple of them if func returns a tuple)
+        """
+        x_, y_ = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        shape = x_.shape
+        x_, y_ = x_.ravel(), y_.ravel()
+        amp = np.reshape(np.asarray(amp, dtype=float), (-1, 1))
+        sigma = np.reshape(np.asarray(sigma, dtype=float), (-1, 1))
+        chunk = max(1, chunk_size // len(amp))
+        result, is_tuple = None, False
+        for start in range(0, max(len(x_), 1), chunk):
+            values = func(x_[start:start + chunk], y_[start:start + chunk], amp, sigma)
+            is_tuple = isinstance(values, tuple)
+            values = np.array(values) if is_tuple else np.array([values])
+            values = np.sum(values, axis=1)
+            if result is None:
+                result = np.zeros((len(values), len(x_)))
+            result[:, start:start + chunk] = values
+        result = result.reshape((len(result),) + shape)
+        if shape == ():
+            result = [float(value) for value in result]
+        if is_tuple:
+            return tuple(result)
+        return result[0]
+
+    def function_set(self, x, y, amp, sigma, center_x=0, center_y=0):
+        """
+        sum of the potentials of a set of concentric Gaussian convergence profiles
+
+        :param x: x coordinate(s)
+        :param y: y coordinate(s)
+        :param amp: array of amplitudes
+        :param sigma: array of standard deviations
+        :param center_x: x coordinate of the center
+        :param center_y: y coordinate of the center
+        :return: potential
+        """
+        return self.sum_components(lambda x_, y_, amp_, sigma_: self.function(x_, y_, amp_, sigma_, center_x,
+                                                                             center_y), x, y, amp, sigma)
+
+    def derivatives_set(self, x, y, amp, sigma, center_x=0, center_y=0):
+        """
+        sum of the deflection angles of a set of concentric Gaussian convergence profiles
+
+        :param x: x coordinate(s)
+        :param y: y coordinate(s)
+        :param amp: array of amplitudes
+        :param sigma: array of standard deviations
+        :param center_x: x coordinate of the center
+        :param center_y: y coordinate of the center
+        :return: df/dx, df/dy
+        """
+        x_ = x - center_x
+        y_ = y - center_y
+        R = np.maximum(np.sqrt(x_**2 + y_**2), self.ds)
+        # the radial deflections are summed over the components before the projection on the axes
+        alpha = self.sum_components(lambda r, _, amp_, sigma_: self.alpha_abs(r, amp_, sigma_), R, R, amp, sigma)
+        return alpha / R * x_, alpha / R * y_
+
+    def hessian_set(self, x, y, amp, sigma, center_x=0, center_y=0):
+        """
+        sum of the Hessian matrices of a set of concentric Gaussian convergence profiles
+
+        :param x: x coordinate(s)
+        :param y: y coordinate(s)
+        :param amp: array of amplitudes
+        :param sigma: array of standard deviations
+        :param center_x: x coordinate of the center
+        :param center_y: y coordinate of the center
+        :return: d^2f/dx^2, d^2/dxdy, d^2/dydx, d^f/dy^2
+        """
+        x_ = x - center_x
+        y_ = y - center_y
+        r = np.maximum(np.sqrt(x_**2 + y_**2), self.ds)
+        d_alpha_dr, alpha = self.sum_components(lambda r_, _, amp_, sigma_: (
+            -self.d_alpha_dr(r_, amp_, sigma_, sigma_), self.alpha_abs(r_, amp_, sigma_)), r, r, amp, sigma)
+
+        f_xx = -(d_alpha_dr/r + alpha/r**2) * x_**2/r + alpha/r
+        f_yy = -(d_alpha_dr/r + alpha/r**2) * y_**2/r + alpha/r
+        f_xy = -(d_alpha_dr/r + alpha/r**2) * x_*y_/r
+        return f_xx, f_xy, f_xy, f_yy
+
     def density(self, r, amp, sigma):
         """
 
@@ -116,6 +219,21 @@ class GaussianKappa(LensProfileBase):
         amp2d = self._amp3d_to_2d(amp, sigma_x, sigma_y)
         return self.gaussian.function(x, y, amp2d, sigma_x, sigma_y, center_x, center_y)
 
+    def density_2d_set(self, x, y, amp, sigma, center_x=0, center_y=0):
+        """
+        sum of the convergences of a set of concentric Gaussian convergence profiles
+
+        :param x: x coordinate(s)
+        :param y: y coordinate(s)
+        :param amp: array of amplitudes
+        :param sigma: array of standard deviations
+        :param center_x: x coordinate of the center
+        :param center_y: y coordinate of the center
+        :return: convergence
+        """
+        return self.sum_components(lambda x_, y_, amp_, sigma_: self.density_2d(x_, y_, amp_, sigma_, center_x,
+                                                                               center_y), x, y, amp, sigma)
+
     def mass_2d(self, R, amp, sigma):
         """
 
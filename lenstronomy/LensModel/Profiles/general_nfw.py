@@ -5,6 +5,7 @@ import numpy as np
 from scipy.special import hyp2f1
 from scipy.special import beta
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
+from lenstronomy.LensModel.Profiles.radial_table import radial_table
 
 __all__ = ['GNFW']
 
@@ -28,6 +29,17 @@ class GNFW(LensProfileBase):
     lower_limit_default = {'Rs': 0, 'alpha_Rs': 0, 'center_x': -100, 'center_y': -100, 'gamma_inner': 0.1, 'gamma_outer': 1.0}
     upper_limit_default = {'Rs': 100, 'alpha_Rs': 10, 'center_x': 100, 'center_y': 100, 'gamma_inner': 2.9, 'gamma_outer': 10.0}
 
+    def __init__(self, use_table=False):
+        """
+
+        :param use_table: bool, if True, the hypergeometric functions f() and g() are interpolated from tables in R/Rs
+         (see radial_table module), built once per process for each pair of slopes (gamma_inner, gamma_outer).
+         Only meant for fixed slopes: with free slopes every new value builds a new table. Set it with
+         kwargs_model['kwargs_interp'] = {'use_table': True}.
+        """
+        self._use_table = use_table
+        super(GNFW, self).__init__()
+
     def derivatives(self, x, y, Rs, alpha_Rs, gamma_inner, gamma_outer, center_x=0, center_y=0):
         """
         returns df/dx and df/dy of the function which are the deflection angles
@@ -124,7 +136,7 @@ class GNFW(LensProfileBase):
         y_ = y - center_y
         R = np.sqrt(x_ ** 2 + y_ ** 2)
         x = R / Rs
-        Fx = self._f(x, gamma_inner, gamma_outer)
+        Fx = self.f_(x, gamma_inner, gamma_outer)
         return 2 * rho0 * Rs * Fx
 
     @staticmethod
@@ -175,7 +187,7 @@ class GNFW(LensProfileBase):
         """
         R = np.maximum(R, 0.00000001)
         x = R / Rs
-        gx = self._g(x, gamma_inner, gamma_outer)
+        gx = self.g_(x, gamma_inner, gamma_outer)
         m_2d = 4 * rho0 * Rs * R ** 2 * gx / x ** 2 * np.pi
         return m_2d
 
@@ -195,7 +207,7 @@ class GNFW(LensProfileBase):
         """
         R = np.maximum(R, 0.00000001)
         x = R / Rs
-        gx = self._g(x, gamma_inner, gamma_outer)
+        gx = self.g_(x, gamma_inner, gamma_outer)
         a = 4 * rho0 * Rs * R * gx / x ** 2 / R
         return a * ax_x, a * ax_y
 
@@ -215,11 +227,37 @@ class GNFW(LensProfileBase):
         """
         R = np.maximum(R, 0.00000001)
         x = R / Rs
-        gx = self._g(x, gamma_inner, gamma_outer)
-        Fx = self._f(x, gamma_inner, gamma_outer)
+        gx = self.g_(x, gamma_inner, gamma_outer)
+        Fx = self.f_(x, gamma_inner, gamma_outer)
         a = 2 * rho0 * Rs * (2 * gx / x ** 2 - Fx)  # /x #2*rho0*Rs*(2*gx/x**2 - Fx)*axis/x
         return a * (ax_y ** 2 - ax_x ** 2) / R ** 2, -a * 2 * (ax_x * ax_y) / R ** 2
 
+    def f_(self, X, g, n):
+        """
+        solution of the projection integral, interpolated if use_table=True (see _f())
+
+        :param X: R/Rs
+        :param g: logarithmic profile slope interior to Rs
+        :param n: logarithmic profile slope exterior to Rs
+        :return: solution to the projection integral
+        """
+        if self._use_table:
+            return radial_table('GNFW_f', self._f, params=(g, n))(X)
+        return self._f(X, g, n)
+
+    def g_(self, X, g, n):
+        """
+        solution of the integral over the projected mass, interpolated if use_table=True (see _g())
+
+        :param X: R/Rs
+        :param g: logarithmic profile slope interior to Rs
+        :param n: logarithmic profile slope exterior to Rs
+        :return: solution of the integral over projected mass
+        """
+        if self._use_table:
+            return radial_table('GNFW_g', self._g, params=(g, n))(X)
+        return self._g(X, g, n)
+
     @staticmethod
     def _f(X, g, n):
         """
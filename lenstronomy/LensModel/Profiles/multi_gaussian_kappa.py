@@ -29,11 +29,7 @@ class MultiGaussianKappa(LensProfileBase):
         :param center_y:
         :return:
         """
-        f_ = np.zeros_like(x, dtype=float)
-        for i in range(len(amp)):
-            f_ += self.gaussian_kappa.function(x, y, amp=scale_factor*amp[i], sigma=sigma[i],
-                                               center_x=center_x, center_y=center_y)
-        return f_
+        return self.gaussian_kappa.function_set(x, y, scale_factor * np.asarray(amp), sigma, center_x, center_y)
 
     def derivatives(self, x, y, amp, sigma, center_x=0, center_y=0, scale_factor=1):
         """
@@ -46,13 +42,7 @@ class MultiGaussianKappa(LensProfileBase):
         :param center_y:
         :return:
         """
-        f_x, f_y = np.zeros_like(x, dtype=float), np.zeros_like(x, dtype=float)
-        for i in range(len(amp)):
-            f_x_i, f_y_i = self.gaussian_kappa.derivatives(x, y, amp=scale_factor*amp[i], sigma=sigma[i],
-                                                           center_x=center_x, center_y=center_y)
-            f_x += f_x_i
-            f_y += f_y_i
-        return f_x, f_y
+        return self.gaussian_kappa.derivatives_set(x, y, scale_factor * np.asarray(amp), sigma, center_x, center_y)
 
     def hessian(self, x, y, amp, sigma, center_x=0, center_y=0, scale_factor=1):
         """
@@ -65,15 +55,7 @@ class MultiGaussianKappa(LensProfileBase):
         :param center_y:
         :return:
         """
-        f_xx, f_yy, f_xy = np.zeros_like(x, dtype=float), np.zeros_like(x, dtype=float), np.zeros_like(x, dtype=float)
-        for i in range(len(amp)):
-            f_xx_i, f_xy_i, _, f_yy_i = self.gaussian_kappa.hessian(x, y, amp=scale_factor*amp[i],
-                                                                 sigma=sigma[i], center_x=center_x,
-                                                                 center_y=center_y)
-            f_xx += f_xx_i
-            f_yy += f_yy_i
-            f_xy += f_xy_i
-        return f_xx, f_xy, f_xy, f_yy
+        return self.gaussian_kappa.hessian_set(x, y, scale_factor * np.asarray(amp), sigma, center_x, center_y)
 
     def density(self, r, amp, sigma, scale_factor=1):
         """
@@ -97,10 +79,7 @@ class MultiGaussianKappa(LensProfileBase):
         :param sigma_y:
         :return:
         """
-        d_3d = np.zeros_like(x, dtype=float)
-        for i in range(len(amp)):
-            d_3d += self.gaussian_kappa.density_2d(x, y, scale_factor*amp[i], sigma[i], center_x, center_y)
-        return d_3d
+        return self.gaussian_kappa.density_2d_set(x, y, scale_factor * np.asarray(amp), sigma, center_x, center_y)
 
     def mass_3d_lens(self, R, amp, sigma, scale_factor=1):
         """
@@ -0,0 +1,223 @@
+"""
+tables of dimensionless radial functions f(x) of the lens profiles (e.g. the projected mass or the potential in units of
+the scale radius), shared between the instances of the profiles of a process.
+
+A function is tabulated on a grid uniform in log(x) between x_min and x_max and evaluated with a cubic (4-point
+Lagrange) interpolation in log(x), of log(f) if f > 0 on the whole grid and of f otherwise. The resolution is doubled
+until the interpolation at the mid-points of the grid agrees with the function within
+rtol * |f| + atol, or until the error does not decrease any more (when it is set by the numerical precision of the
+function). Values outside [x_min, x_max] are evaluated with the function itself.
+
+Profiles opt in with a use_table argument and request their tables with radial_table(), which caches the tables per
+process and, if a directory is set with set_table_dir(), on disk.
+
+Example:
+
+>>> from lenstronomy.LensModel.Profiles.radial_table import radial_table
+>>> from lenstronomy.LensModel.Profiles.nfw import NFW
+>>> table = radial_table('NFW_g', NFW._g)
+>>> g_x = table(np.array([0.1, 1., 10.]))
+"""
+
+import os
+import hashlib
+import warnings
+import numpy as np
+from lenstronomy.Util.interpolation_util import cubic_interpolation
+
+__all__ = ['RadialTable', 'radial_table', 'set_table_dir', 'clear_tables']
+
+# directory of the tables stored on disk (None: tables are only kept in memory)
+_table_dir = None
+# tables of the process, indexed by name, parameters and accuracy settings
+_tables = {}
+_max_num_tables = 64
+
+
+def set_table_dir(directory):
+    """
+    sets the directory in which the tables are stored and from which they are read by radial_table()
+
+    :param directory: path of the directory, or None to keep the tables in memory only
+    :return: None
+    """
+    global _table_dir
+    _table_dir = os.path.expanduser(directory) if directory is not None else None
+
+
+def clear_tables():
+    """
+    removes the tables of the process from memory (tables stored on disk are kept)
+
+    :return: None
+    """
+    _tables.clear()
+
+
+def radial_table(name, func, params=(), x_min=1e-4, x_max=1e4, rtol=1e-8, atol=0):
+    """
+    table of func(x, *params), built once per process for a given name, set of parameters and accuracy
+
+    :param name: unique name of the function (e.g. 'NFW_g'), used as key of the table and as file name on disk
+    :param func: definition func(x, *params) of a 1d array x
+    :param params: tuple of the additional (scalar) arguments of func
+    :param x_min: minimal x of the table
+    :param x_max: maximal x of the table
+    :param rtol: relative tolerance of the interpolation
+    :param atol: absolute tolerance of the interpolation
+    :return: RadialTable instance
+    """
+    params = tuple(float(p) for p in params)
+    key = (name, params, x_min, x_max, rtol, atol)
+    if key not in _tables:
+        filename = None
+        if _table_dir is not None:
+            key_hash = hashlib.md5(repr(key).encode()).hexdigest()[:16]
+            filename = os.path.join(_table_dir, '%s_%s.npz' % (name, key_hash))
+        if len(_tables) >= _max_num_tables:
+            # removes the oldest table
+            del _tables[next(iter(_tables))]
+        _tables[key] = RadialTable(func, params=params, x_min=x_min, x_max=x_max, rtol=rtol, atol=atol,
+                                   filename=filename)
+    return _tables[key]
+
+
+class RadialTable(object):
+    """
+    table of a dimensionless radial function f(x) with accuracy-controlled resolution in log(x)
+    """
+    def __init__(self, func, params=(), x_min=1e-4, x_max=1e4, rtol=1e-8, atol=0, num_start=65, max_num=2**16 + 1,
+                 filename=None):
+        """
+
+        :param func: definition func(x, *params) of a 1d array x
+        :param params: tuple of the additional arguments of func
+        :param x_min: minimal x of the table
+        :param x_max: maximal x of the table
+        :param rtol: relative tolerance of the interpolation
+        :param atol: absolute tolerance of the interpolation
+        :param num_start: number of grid points of the first iteration of the resolution
+        :param max_num: maximal number of grid points (a warning is raised if the tolerance is not reached)
+        :param filename: path of the .npz file storing the table. If the file exists, the table is read from it,
+         otherwise it is written after the table is built. If None, the table is kept in memory only.
+        """
+        if not 0 < x_min < x_max:
+            raise ValueError('the range of the table needs 0 < x_min < x_max, got x_min=%s and x_max=%s.'
+                             % (x_min, x_max))
+        self._func = func
+        self._params = tuple(params)
+        self._x_min, self._x_max = x_min, x_max
+        if filename is not None and os.path.exists(filename):
+            with np.load(filename) as f:
+                log_x, values = f['log_x'], f['values']
+        else:
+            log_x, values = self._build(rtol, atol, num_start, max_num)
+            if filename is not None:
+                self._save(filename, log_x, values)
+        self._set_table(log_x, values)
+
+    @property
+    def num(self):
+        """
+
+        :return: number of grid points of the table
+        """
+        return len(self._log_x)
+
+    def __call__(self, x):
+        """
+        interpolated function
+
+        :param x: float or numpy array of dimensionless radii
+        :return: f(x) with the shape of x
+        """
+        x_ = np.asarray(x, dtype=float)
+        x_flat = x_.ravel()
+        inside = (x_flat >= self._x_min) & (x_flat <= self._x_max)
+        values = np.empty(len(x_flat))
+        values[inside] = self._interpolate(np.log(x_flat[inside]), self._log_x, self._values, self._log_values)
+        if not np.all(inside):
+            values[~inside] = self._func(x_flat[~inside], *self._params)
+        if x_.ndim == 0:
+            return float(values[0])
+        return values.reshape(x_.shape)
+
+    def _build(self, rtol, atol, num_start, max_num):
+        """
+        doubles the resolution of the table until the interpolation at the mid-points meets the tolerance
+
+        :return: log(x) of the grid, f(x) on the grid
+        """
+        log_x = np.linspace(np.log(self._x_min), np.log(self._x_max), num_start)
+        values = self._func(np.exp(log_x), *self._params)
+        error_previous = np.inf
+        while True:
+            log_x_mid = (log_x[:-1] + log_x[1:]) / 2.
+            values_mid = self._func(np.exp(log_x_mid), *self._params)
+            log_values = bool(np.all(values > 0) and np.all(values_mid > 0))
+            interp_mid = self._interpolate(log_x_mid, log_x, np.log(values) if log_values else values, log_values)
+            tolerance = rtol * np.maximum(np.abs(values_mid), np.maximum(np.abs(values[:-1]), np.abs(values[1:])))
+            # maximal error in units of the tolerance
+            error = np.max(np.abs(interp_mid - values_mid) / (tolerance + atol))
+            # grid with the mid-points
+            log_x_new = np.empty(2 * len(log_x) - 1)
+            log_x_new[0::2], log_x_new[1::2] = log_x, log_x_mid
+            values_new = np.empty(2 * len(log_x) - 1)
+            values_new[0::2], values_new[1::2] = values, values_mid
+            log_x, values = log_x_new, values_new
+            if error <= 1:
+                return log_x, values
+            if error > error_previous / 2.:
+                # the error does not decrease with the resolution (as 1/num^4) any more, it is set by the numerical
+                # precision of the function itself
+                return log_x, values
+            if 2 * len(log_x) - 1 > max_num:
+                warnings.warn('table of %s did not reach the tolerance rtol=%s, atol=%s with %s grid points.'
+                              % (getattr(self._func, '__qualname__', self._func), rtol, atol, len(log_x)), Warning)
+                return log_x, values
+            error_previous = error
+
+    def _set_table(self, log_x, values):
+        """
+        sets the grid and the interpolated values (in log if all values are positive)
+
+        :param log_x: log(x) of the grid
+        :param values: f(x) on the grid
+        :return: None
+        """
+        self._log_x = log_x
+        self._log_values = bool(np.all(values > 0))
+        self._values = np.log(values) if self._log_values else values
+
+    @staticmethod
+    def _save(filename, log_x, values):
+        """
+        writes the table to a .npz file (through a temporary file such that concurrent processes do not read partially
+        written tables)
+
+        :param filename: path of the file
+        :param log_x: log(x) of the grid
+        :param values: f(x) on the grid
+        :return: None
+        """
+        directory = os.path.dirname(filename)
+        if directory != '':
+            os.makedirs(directory, exist_ok=True)
+        filename_tmp = '%s.%s.tmp' % (filename, os.getpid())
+        with open(filename_tmp, 'wb') as f:
+            np.savez(f, log_x=log_x, values=values)
+        os.replace(filename_tmp, filename)
+
+    @staticmethod
+    def _interpolate(log_x_eval, log_x, values, log_values):
+        """
+        cubic 4-point Lagrange interpolation on a uniform grid
+
+        :param log_x_eval: 1d array of log(x) at which the function is interpolated (within the grid)
+        :param log_x: uniform grid in log(x) (at least 4 points)
+        :param values: values (or log of the values) on the grid
+        :param log_values: bool, if True, values are the log of the function
+        :return: interpolated function
+        """
+        return cubic_interpolation(log_x_eval, log_x[0], log_x[1] - log_x[0], values, log_values=log_values)
+
@@ -14,7 +14,9 @@ class SersicEllipseKappa(LensProfileBase):
     this class contains the function and the derivatives of an elliptical sersic profile
     with the ellipticity introduced in the convergence (not the potential).
 
-    This requires the use of numerical integrals (Keeton 2004)
+    This requires the use of numerical integrals (Keeton 2004). The integrals are evaluated for all the coordinates at
+    once with a fixed-order Gauss-Legendre quadrature in the variable t = u^(1/(2 n_sersic)), in which the exponent of
+    the Sersic profile is smooth, over the range of t in which the profile is not negligible (see _integrals()).
     """
     param_names = ['k_eff', 'R_sersic', 'n_sersic', 'e1', 'e2', 'center_x', 'center_y']
     lower_limit_default = {'k_eff': 0, 'R_sersic': 0, 'n_sersic': 0.5, 'e1': -0.5, 'e2': -0.5, 'center_x': -100,
@@ -22,9 +24,16 @@ class SersicEllipseKappa(LensProfileBase):
     upper_limit_default = {'k_eff': 10, 'R_sersic': 100, 'n_sersic': 8, 'e1': 0.5, 'e2': 0.5, 'center_x': 100,
                            'center_y': 100}
 
-    def __init__(self):
+    def __init__(self, num_nodes=64):
+        """
 
+        :param num_nodes: number of Gauss-Legendre nodes of the integrals (the relative accuracy of the deflection
+         angles is better than 1e-5 for 64 nodes and 0.5 < n_sersic < 8)
+        """
         self._sersic = Sersic()
+        nodes, weights = np.polynomial.legendre.leggauss(num_nodes)
+        self._nodes = (nodes[:, None] + 1) / 2.
+        self._weights = weights[:, None] / 2.
         super(SersicEllipseKappa, self).__init__()
 
     def function(self, x, y, n_sersic, R_sersic, k_eff, e1, e2, center_x=0, center_y=0):
@@ -60,63 +69,116 @@ class SersicEllipseKappa(LensProfileBase):
         #
         # return 0.5 * q * integral
 
-    def derivatives(self, x, y, n_sersic, R_sersic, k_eff, e1, e2, center_x=0, center_y = 0):
-
+    def derivatives(self, x, y, n_sersic, R_sersic, k_eff, e1, e2, center_x=0, center_y=0):
+        """
+        deflection angles
+
+        :param x: x-coordinate
+        :param y: y-coordinate
+        :param n_sersic: Sersic index
+        :param R_sersic: half-light radius
+        :param k_eff: convergence at the half-light radius
+        :param e1: eccentricity component
+        :param e2: eccentricity component
+        :param center_x: profile center
+        :param center_y: profile center
+        :return: alpha_x, alpha_y
+        """
         phi_G, gam = param_util.shear_cartesian2polar(e1, e2)
         q = max(1-gam, 0.00001)
 
-        x, y = self._coord_rotate(x, y, phi_G, center_x, center_y)
-
-        if isinstance(x, float) and isinstance(y, float):
-
-            alpha_x, alpha_y = self._compute_derivative_atcoord(x, y, n_sersic, R_sersic, k_eff,
-                                        phi_G, q, center_x=center_x, center_y = center_y)
-
-        else:
-
-            assert isinstance(x, np.ndarray) or isinstance(x, list)
-            assert isinstance(y, np.ndarray) or isinstance(y, list)
-            x = np.array(x)
-            y = np.array(y)
-            shape0 = x.shape
-            assert shape0 == y.shape
-
-            alpha_x, alpha_y = np.empty_like(x).ravel(), np.empty_like(y).ravel()
-
-            if isinstance(phi_G, float) or isinstance(phi_G, int):
-                phiG = np.ones_like(alpha_x) * float(phi_G)
-                q = np.ones_like(alpha_x) * float(q)
-
-            for i, (x_i, y_i, phi_i, q_i) in \
-                    enumerate(zip(x.ravel(), y.ravel(), phiG.ravel(), q.ravel())):
-
-                fxi, fyi = self._compute_derivative_atcoord(x_i, y_i, n_sersic, R_sersic, k_eff,
-                                   phi_i, q_i, center_x=center_x, center_y = center_y)
-
-                alpha_x[i], alpha_y[i] = fxi, fyi
-
-            alpha_x = alpha_x.reshape(shape0)
-            alpha_y = alpha_y.reshape(shape0)
-
-        alpha_x, alpha_y = self._coord_rotate(alpha_x, alpha_y, -phi_G, 0, 0)
-
+        x_, y_ = self._coord_rotate(x, y, phi_G, center_x, center_y)
+        j_0, j_1 = self._integrals(x_, y_, n_sersic, R_sersic, k_eff, q)
+        alpha_x, alpha_y = self._coord_rotate(x_ * q * j_0, y_ * q * j_1, -phi_G, 0, 0)
         return alpha_x, alpha_y
 
-    def hessian(self, x, y, n_sersic, R_sersic, k_eff, e1, e2, center_x=0, center_y = 0):
+    def hessian(self, x, y, n_sersic, R_sersic, k_eff, e1, e2, center_x=0, center_y=0):
         """
-        returns Hessian matrix of function d^2f/dx^2, d^2/dxdy, d^2/dydx, d^f/dy^2
+        returns Hessian matrix of function d^2f/dx^2, d^2/dxdy, d^2/dydx, d^f/dy^2 (Keeton 2001 eqn 2.9)
+
+        :param x: x-coordinate
+        :param y: y-coordinate
+        :param n_sersic: Sersic index
+        :param R_sersic: half-light radius
+        :param k_eff: convergence at the half-light radius
+        :param e1: eccentricity component
+        :param e2: eccentricity component
+        :param center_x: profile center
+        :param center_y: profile center
+        :return: f_xx, f_xy, f_yx, f_yy
         """
-        alpha_ra, alpha_dec = self.derivatives(x, y, n_sersic, R_sersic, k_eff, e1, e2, center_x, center_y)
-        diff = 0.000001
-        alpha_ra_dx, alpha_dec_dx = self.derivatives(x + diff, y, n_sersic, R_sersic, k_eff, e1, e2, center_x, center_y)
-        alpha_ra_dy, alpha_dec_dy = self.derivatives(x, y + diff, n_sersic, R_sersic, k_eff, e1, e2, center_x, center_y)
+        phi_G, gam = param_util.shear_cartesian2polar(e1, e2)
+        q = max(1-gam, 0.00001)
 
-        f_xx = (alpha_ra_dx - alpha_ra)/diff
-        f_xy = (alpha_ra_dy - alpha_ra)/diff
-        f_yx = (alpha_dec_dx - alpha_dec)/diff
-        f_yy = (alpha_dec_dy - alpha_dec)/diff
+        x_, y_ = self._coord_rotate(x, y, phi_G, center_x, center_y)
+        j_0, j_1, k_0, k_1, k_2 = self._integrals(x_, y_, n_sersic, R_sersic, k_eff, q, hessian=True)
+        f_xx_ = 2 * q * x_ ** 2 * k_0 + q * j_0
+        f_yy_ = 2 * q * y_ ** 2 * k_2 + q * j_1
+        f_xy_ = 2 * q * x_ * y_ * k_1
 
-        return f_xx, f_xy, f_yx, f_yy
+        # rotate back into the frame of the coordinates
+        cos_phi = np.cos(phi_G)
+        sin_phi = np.sin(phi_G)
+        f_xx = cos_phi ** 2 * f_xx_ - 2 * cos_phi * sin_phi * f_xy_ + sin_phi ** 2 * f_yy_
+        f_yy = sin_phi ** 2 * f_xx_ + 2 * cos_phi * sin_phi * f_xy_ + cos_phi ** 2 * f_yy_
+        f_xy = cos_phi * sin_phi * (f_xx_ - f_yy_) + (cos_phi ** 2 - sin_phi ** 2) * f_xy_
+        return f_xx, f_xy, f_xy, f_yy
+
+    def _integrals(self, x, y, n_sersic, R_sersic, k_eff, q, hessian=False):
+        """
+        integrals J_0, J_1 (and K_0, K_1, K_2) of Keeton 2001 (eqn 2.8 and 2.9) in the frame of the major axis,
+        evaluated for all the coordinates at once.
+
+        With u = t^(2 n_sersic) the elliptical radius is xi = t^n_sersic * sqrt(x^2 + y^2/(1-(1-q^2)u)) and the
+        exponent of the Sersic profile is smooth in t. The integrals are truncated at the value of t beyond which the
+        convergence is below exp(-50) of the central convergence for all u, such that the quadrature resolves the
+        profile also far outside R_sersic.
+
+        :param x: x-coordinate along the major axis
+        :param y: y-coordinate along the minor axis
+        :param n_sersic: Sersic index
+        :param R_sersic: half-light radius
+        :param k_eff: convergence at the half-light radius
+        :param q: axis ratio
+        :param hessian: bool, if True, also returns the integrals of the second derivatives
+        :return: J_0, J_1 (, K_0, K_1, K_2) with the shape of x
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        shape = x.shape
+        x, y = x.ravel(), y.ravel()
+        b_n = self._sersic.b_n(n_sersic)
+        xi_max = R_sersic * (50. / b_n) ** n_sersic
+        num_out = 5 if hessian is True else 2
+        out = np.zeros((num_out, len(x)))
+        # coordinates are processed in chunks to limit the memory of the (num_nodes, num_coordinates) arrays
+        chunk = max(1, 2 ** 18 // len(self._nodes))
+        for start in range(0, len(x), chunk):
+            x_, y_ = x[start:start + chunk], y[start:start + chunk]
+            r2 = x_ ** 2 + y_ ** 2
+            # xi >= t^n_sersic * r such that the convergence is negligible for t > t_max
+            t_max = np.minimum(1, (xi_max ** 2 / np.maximum(r2, 1e-300)) ** (1. / (2 * n_sersic)))
+            t = self._nodes * t_max
+            u = t ** (2 * n_sersic)
+            fac = 1 - (1 - q ** 2) * u
+            # xi^2 / u
+            s2 = x_ ** 2 + y_ ** 2 / fac
+            xi_n = (u * s2 / R_sersic ** 2) ** (1. / (2 * n_sersic))
+            kappa = k_eff * np.exp(-b_n * (xi_n - 1))
+            # du/dt and the quadrature weights
+            weight = self._weights * t_max * 2 * n_sersic * t ** (2 * n_sersic - 1)
+            integrand_0 = weight * fac ** -0.5
+            out[0, start:start + chunk] = np.sum(integrand_0 * kappa, axis=0)
+            out[1, start:start + chunk] = np.sum(integrand_0 / fac * kappa, axis=0)
+            if hessian is True:
+                # u * d kappa / d xi^2
+                kappa_prime = - kappa * b_n * xi_n / (2 * n_sersic * np.maximum(s2, 1e-300))
+                out[2, start:start + chunk] = np.sum(integrand_0 * kappa_prime, axis=0)
+                out[3, start:start + chunk] = np.sum(integrand_0 / fac * kappa_prime, axis=0)
+                out[4, start:start + chunk] = np.sum(integrand_0 / fac ** 2 * kappa_prime, axis=0)
+        out = out.reshape((num_out,) + shape)
+        if shape == ():
+            return tuple(float(out_i) for out_i in out)
+        return tuple(out)
 
     def projected_mass(self, x, y, q, n_sersic, R_sersic, k_eff, u = 1, power = 1):
 
@@ -64,12 +64,7 @@ class SersicUtil(object):
 
         if self._sersic_major_axis:
             phi_G, q = param_util.ellipticity2phi_q(e1, e2)
-            x_shift = x - center_x
-            y_shift = y - center_y
-            cos_phi = np.cos(phi_G)
-            sin_phi = np.sin(phi_G)
-            xt1 = cos_phi*x_shift+sin_phi*y_shift
-            xt2 = -sin_phi*x_shift+cos_phi*y_shift
+            xt1, xt2 = param_util.rotated_frame(x, y, e1, e2, center_x, center_y)
             xt2difq2 = xt2/(q*q)
             r = np.sqrt(xt1*xt1+xt2*xt2difq2)
         else:
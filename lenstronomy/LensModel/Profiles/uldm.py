@@ -4,6 +4,7 @@ __author__ = 'lucateo'
 import numpy as np
 from scipy.special import gamma, hyp2f1
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
+from lenstronomy.LensModel.Profiles.radial_table import radial_table
 
 __all__ = ['Uldm']
 
@@ -38,6 +39,17 @@ class Uldm(LensProfileBase):
     lower_limit_default = {'kappa_0': 0, 'theta_c': 0, 'slope': 3.5, 'center_x': -100, 'center_y': -100}
     upper_limit_default = {'kappa_0': 1., 'theta_c': 100, 'slope': 10, 'center_x': 100, 'center_y': 100}
 
+    def __init__(self, use_table=False):
+        """
+
+        :param use_table: bool, if True, the hypergeometric function of the lensing potential is interpolated from a
+         table in the dimensionless radius (see radial_table module), built once per process for each slope.
+         Only meant for a fixed slope: with a free slope every new value builds a new table. Set it with
+         kwargs_model['kwargs_interp'] = {'use_table': True}.
+        """
+        self._use_table = use_table
+        super(Uldm, self).__init__()
+
     @staticmethod
     def rhotilde(kappa_0, theta_c, slope=8):
         """
@@ -70,6 +82,9 @@ class Uldm(LensProfileBase):
         r = np.sqrt(x_** 2 + y_** 2)
         r = np.maximum(r, self._s)
         a_factor_sqrt = np.sqrt( (0.5)**(-1./slope) -1)
+        if self._use_table:
+            table = radial_table('ULDM_potential', self._potential_integral, params=(slope,))
+            return kappa_0 / 2. * (theta_c / a_factor_sqrt) ** 2 * table(a_factor_sqrt * r / theta_c)
         if np.isscalar(r) == True:
             hypgeom = float(kappa_0 /2 * r**2 * 
                 hyp3f2(1, 1, slope - 0.5, 2, 2, -(a_factor_sqrt * r /theta_c )**2))
@@ -201,6 +216,19 @@ class Uldm(LensProfileBase):
         R = np.sqrt(x_**2 + y_**2)
         return self.kappa_r(R, kappa_0, theta_c, slope)
 
+    @staticmethod
+    def _potential_integral(x, slope=8):
+        """
+        dimensionless lensing potential x^2 * 3F2(1, 1, slope - 1/2; 2, 2; -x^2), such that the potential is
+        kappa_0 / 2 * (theta_c / sqrt(a))^2 times this function of x = sqrt(a) * r / theta_c
+
+        :param x: numpy array of dimensionless radii
+        :param slope: exponent entering the profile
+        :return: dimensionless potential
+        """
+        from mpmath import hyp3f2
+        return np.array([x_i ** 2 * hyp3f2(1, 1, slope - 0.5, 2, 2, -x_i ** 2) for x_i in x], dtype=float)
+
     def _mass_integral(self, x, slope=8):
         """
         Returns the analytic result of the integral appearing in mass expression
@@ -0,0 +1,255 @@
+import numpy as np
+
+__all__ = ['refine_zero_cells', 'marching_squares', 'link_segments', 'zero_contours']
+
+
+class _NodeCache(object):
+    """
+    values of a function on the nodes of a regular grid, evaluated once per node when first requested
+    """
+    def __init__(self, func, x_0, y_0, scale, num_nodes):
+        """
+
+        :param func: function f(x, y) of arrays of coordinates returning an array of values
+        :param x_0: x-coordinate of the node (0, 0)
+        :param y_0: y-coordinate of the node (0, 0)
+        :param scale: spacing of the nodes
+        :param num_nodes: number of nodes per axis
+        """
+        self._func = func
+        self._x_0, self._y_0 = x_0, y_0
+        self._scale = scale
+        self._num_nodes = num_nodes
+        self._keys = np.zeros(0, dtype=np.int64)
+        self._values = np.zeros(0)
+
+    def coordinates(self, i, j):
+        """
+
+        :param i: integer x-index of the nodes
+        :param j: integer y-index of the nodes
+        :return: x- and y-coordinates of the nodes
+        """
+        return self._x_0 + i * self._scale, self._y_0 + j * self._scale
+
+    def values(self, i, j):
+        """
+
+        :param i: integer x-index of the nodes
+        :param j: integer y-index of the nodes
+        :return: function values at the nodes
+        """
+        keys = np.asarray(i, dtype=np.int64) * self._num_nodes + np.asarray(j, dtype=np.int64)
+        keys_new = np.setdiff1d(keys, self._keys)
+        if len(keys_new) > 0:
+            x, y = self.coordinates(keys_new // self._num_nodes, keys_new % self._num_nodes)
+            values_new = np.asarray(self._func(x, y), dtype=float)
+            keys_all = np.concatenate([self._keys, keys_new])
+            sort = np.argsort(keys_all)
+            self._keys = keys_all[sort]
+            self._values = np.concatenate([self._values, values_new])[sort]
+        return self._values[np.searchsorted(self._keys, keys)]
+
+
+def refine_zero_cells(node_cache, num_cells, num_levels):
+    """
+    quad-tree refinement of the cells of a regular grid in which a function changes sign.
+    Starting from a coarse grid, the cells with a sign change among their corners and their direct neighbours are split
+    into four at each level, such that the function is only evaluated in the vicinity of its zero contours.
+    All active cells of a level are processed at once.
+
+    :param node_cache: _NodeCache instance of the function on the nodes of the finest grid
+    :param num_cells: number of cells per axis of the coarse grid
+    :param num_levels: number of refinement levels, each level halves the cell size
+    :return: x- and y-index of the lower left node of the cells at the finest level with a sign change,
+     and the function values at the corners (0, 0), (1, 0), (1, 1), (0, 1) of these cells
+    """
+    factor = 2 ** num_levels
+    i_cell, j_cell = np.meshgrid(np.arange(num_cells) * factor, np.arange(num_cells) * factor, indexing='ij')
+    i_cell, j_cell = i_cell.ravel(), j_cell.ravel()
+    i_max = num_cells * factor
+    for level in range(num_levels + 1):
+        size = 2 ** (num_levels - level)
+        v00 = node_cache.values(i_cell, j_cell)
+        v10 = node_cache.values(i_cell + size, j_cell)
+        v11 = node_cache.values(i_cell + size, j_cell + size)
+        v01 = node_cache.values(i_cell, j_cell + size)
+        sign = v00 > 0
+        change = (sign != (v10 > 0)) | (sign != (v11 > 0)) | (sign != (v01 > 0))
+        if level == num_levels:
+            return i_cell[change], j_cell[change], v00[change], v10[change], v11[change], v01[change]
+        # add the direct neighbours to catch contours passing between the corners of a cell
+        i_select, j_select = i_cell[change], j_cell[change]
+        i_list, j_list = [], []
+        for di in [-1, 0, 1]:
+            for dj in [-1, 0, 1]:
+                i_list.append(i_select + di * size)
+                j_list.append(j_select + dj * size)
+        i_select, j_select = np.concatenate(i_list), np.concatenate(j_list)
+        inside = (i_select >= 0) & (i_select < i_max) & (j_select >= 0) & (j_select < i_max)
+        keys = np.unique(i_select[inside] * (i_max + 1) + j_select[inside])
+        i_select, j_select = keys // (i_max + 1), keys % (i_max + 1)
+        # split the selected cells into four
+        half = size // 2
+        i_cell = np.concatenate([i_select, i_select + half, i_select + half, i_select])
+        j_cell = np.concatenate([j_select, j_select, j_select + half, j_select + half])
+
+
+def marching_squares(i_cell, j_cell, v00, v10, v11, v01, num_nodes):
+    """
+    line segments of the zero contour within the cells of a regular grid.
+    The end points of the segments are on the cell edges (linear interpolation of the function values) and are
+    labeled by a key of the edge, which is shared by the neighbouring cell.
+    Saddle cells (four crossings) are disambiguated with the mean of the corner values.
+
+    :param i_cell: x-index of the lower left node of the cells
+    :param j_cell: y-index of the lower left node of the cells
+    :param v00: function values at the corners (0, 0)
+    :param v10: function values at the corners (1, 0)
+    :param v11: function values at the corners (1, 1)
+    :param v01: function values at the corners (0, 1)
+    :param num_nodes: number of nodes per axis of the grid
+    :return: edge keys of the start and end points of the segments, dictionary of the edge keys and the position
+     (in units of the node indexes) of the crossing
+    """
+    # edges in order bottom, right, top, left, with start node (i, j), end node and direction (0: x, 1: y)
+    edges = [(i_cell, j_cell, v00, v10, 0), (i_cell + 1, j_cell, v10, v11, 1),
+             (i_cell, j_cell + 1, v01, v11, 0), (i_cell, j_cell, v00, v01, 1)]
+    crossing = np.zeros((len(i_cell), 4), dtype=bool)
+    keys = np.zeros((len(i_cell), 4), dtype=np.int64)
+    points = {}
+    for k, (i, j, v_a, v_b, direction) in enumerate(edges):
+        crossing[:, k] = (v_a > 0) != (v_b > 0)
+        keys[:, k] = 2 * (i * num_nodes + j) + direction
+        c = crossing[:, k]
+        t = v_a[c] / (v_a[c] - v_b[c])
+        x = i[c] + t * (direction == 0)
+        y = j[c] + t * (direction == 1)
+        points.update(zip(keys[c, k].tolist(), zip(x.tolist(), y.tolist())))
+
+    num_crossing = np.sum(crossing, axis=1)
+    # cells with two crossings: one segment between the two crossed edges
+    single = num_crossing == 2
+    index = np.argsort(~crossing[single], axis=1, kind='stable')[:, :2]
+    keys_single = np.take_along_axis(keys[single], index, axis=1)
+    # saddle cells: two segments, separating the corners of opposite sign to the center
+    saddle = num_crossing == 4
+    keys_saddle = keys[saddle]
+    center = (v00[saddle] + v10[saddle] + v11[saddle] + v01[saddle]) / 4.
+    connect_00 = (center > 0) == (v00[saddle] > 0)
+    # if the center has the sign of corner (0, 0), the contours enclose the corners (1, 0) and (0, 1)
+    pairs_1 = np.where(connect_00[:, None], keys_saddle[:, [0, 1]], keys_saddle[:, [3, 0]])
+    pairs_2 = np.where(connect_00[:, None], keys_saddle[:, [2, 3]], keys_saddle[:, [1, 2]])
+    segments = np.concatenate([keys_single, pairs_1, pairs_2], axis=0)
+    return segments[:, 0], segments[:, 1], points
+
+
+def link_segments(key_start, key_end):
+    """
+    connects line segments sharing end points into curves
+
+    :param key_start: keys of the start points of the segments
+    :param key_end: keys of the end points of the segments
+    :return: list of lists of keys of the connected curves. Closed curves repeat the first key at the end.
+    """
+    key_start, key_end = list(key_start), list(key_end)
+    neighbours = {}
+    for n, (a, b) in enumerate(zip(key_start, key_end)):
+        neighbours.setdefault(a, []).append(n)
+        neighbours.setdefault(b, []).append(n)
+    visited = np.zeros(len(key_start), dtype=bool)
+    curves = []
+    for n in range(len(key_start)):
+        if visited[n]:
+            continue
+        visited[n] = True
+        curve = [key_start[n], key_end[n]]
+        # extend the curve from its end, and then (if not closed) from its start
+        for _ in range(2):
+            while True:
+                key = curve[-1]
+                next_segments = [m for m in neighbours[key] if not visited[m]]
+                if len(next_segments) == 0:
+                    break
+                m = next_segments[0]
+                visited[m] = True
+                curve.append(key_end[m] if key_start[m] == key else key_start[m])
+            if curve[0] == curve[-1]:
+                break
+            curve.reverse()
+        curves.append(curve)
+    return curves
+
+
+def zero_contours(func, x_min, y_min, start_scale, num_cells, num_levels, func_gradient=None, num_newton=0):
+    """
+    zero contours of a function in a square window, computed with an adaptive marching squares algorithm.
+    The function is evaluated on a coarse grid, only the cells (and their neighbours) with a sign change are refined
+    and the contours are extracted from the cells at the finest level.
+
+    Contours entirely contained within a cell of the coarse grid without a sign change at its corners are not found.
+
+    :param func: function f(x, y) of arrays of coordinates returning an array of values
+    :param x_min: x-coordinate of the lower left corner of the window
+    :param y_min: y-coordinate of the lower left corner of the window
+    :param start_scale: cell size of the coarse grid
+    :param num_cells: number of cells per axis of the coarse grid
+    :param num_levels: number of refinement levels, the cell size at the finest level is start_scale / 2**num_levels
+    :param func_gradient: function returning the gradient (df/dx, df/dy) at (x, y) for the Newton polishing. If None,
+     finite differences are used.
+    :param num_newton: number of Newton iterations moving the contour points onto the zero contour
+    :return: list of x-coordinates and list of y-coordinates of the connected contours, sorted by their number of
+     points (longest first)
+    """
+    scale = start_scale / 2 ** num_levels
+    num_nodes = num_cells * 2 ** num_levels + 1
+    node_cache = _NodeCache(func, x_min, y_min, scale, num_nodes)
+    i_cell, j_cell, v00, v10, v11, v01 = refine_zero_cells(node_cache, num_cells, num_levels)
+    key_start, key_end, points = marching_squares(i_cell, j_cell, v00, v10, v11, v01, num_nodes)
+    curves = link_segments(key_start.tolist(), key_end.tolist())
+    curves.sort(key=len, reverse=True)
+    x_list, y_list = [], []
+    for curve in curves:
+        index = np.array([points[key] for key in curve])
+        x, y = node_cache.coordinates(index[:, 0], index[:, 1])
+        x_list.append(x)
+        y_list.append(y)
+    if num_newton > 0 and len(x_list) > 0:
+        num_points = [len(x) for x in x_list]
+        x, y = np.concatenate(x_list), np.concatenate(y_list)
+        x, y = _newton_polish(func, x, y, func_gradient, num_newton, scale)
+        split = np.cumsum(num_points)[:-1]
+        x_list, y_list = np.split(x, split), np.split(y, split)
+    return x_list, y_list
+
+
+def _newton_polish(func, x, y, func_gradient, num_newton, scale):
+    """
+    moves points along the gradient of a function onto its zero contour.
+    The steps are limited to the cell size to stay on the contour the points have been found on.
+
+    :param func: function f(x, y)
+    :param x: x-coordinates
+    :param y: y-coordinates
+    :param func_gradient: function returning the gradient (df/dx, df/dy) at (x, y), or None for finite differences
+    :param num_newton: number of Newton iterations
+    :param scale: cell size
+    :return: x- and y-coordinates
+    """
+    x, y = np.array(x, dtype=float), np.array(y, dtype=float)
+    for _ in range(num_newton):
+        f = func(x, y)
+        if func_gradient is None:
+            diff = scale * 1e-3
+            f_x = (func(x + diff, y) - func(x - diff, y)) / (2 * diff)
+            f_y = (func(x, y + diff) - func(x, y - diff)) / (2 * diff)
+        else:
+            f_x, f_y = func_gradient(x, y)
+        norm = f_x ** 2 + f_y ** 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step_x, step_y = - f * f_x / norm, - f * f_y / norm
+        step = np.hypot(step_x, step_y)
+        valid = np.isfinite(step) & (step < scale)
+        x[valid] += step_x[valid]
+        y[valid] += step_y[valid]
+    return x, y
@@ -0,0 +1,118 @@
+"""
+compiled Faddeeva function :math:`w(z) = \\exp(-z^2) \\mathrm{erfc}(-\\mathrm{i}z)`.
+
+The kernel evaluates the rational approximation of Weideman (1994, SIAM J. Numer. Anal. 31, 1497) with 40 terms
+in the upper half-plane for :math:`|z| < 10`, the Laplace continued fraction with 8 terms for :math:`|z| \\geq 10`, and
+the reflection :math:`w(z) = 2\\exp(-z^2) - w(-z)` in the lower half-plane. Compared to
+``scipy.special.wofz`` (Faddeeva package), the relative error :math:`|w - w_\\mathrm{scipy}|/|w_\\mathrm{scipy}|` is
+below 3e-14 in the upper half-plane (tested on a logarithmic grid with :math:`10^{-6} \\leq |\\mathrm{Re}(z)| \\leq
+10^8` and :math:`10^{-8} \\leq \\mathrm{Im}(z) \\leq 10^8`, including the real axis, and on random points with
+:math:`|\\mathrm{Re}(z)|, \\mathrm{Im}(z) \\leq 12`; the largest errors occur close to the real axis at
+:math:`6.5 < |\\mathrm{Re}(z)| < 8`). In the lower half-plane, the error grows with :math:`|\\exp(-z^2)|` as for
+any evaluation through the reflection formula.
+
+The loop over the values is parallelized when numba compiles with parallel=True (see conf_default.yaml).
+"""
+
+import numpy as np
+from lenstronomy.Util.numba_util import jit, prange
+
+__all__ = ['wofz', 'wofz_array']
+
+_NUM_TERMS = 40
+# beyond this modulus, the continued fraction with the given number of terms is used
+_CONTINUED_FRACTION_RADIUS = 10.
+_CONTINUED_FRACTION_TERMS = 8
+
+
+def _weideman_coefficients(num_terms):
+    """
+    coefficients of the rational approximation of the Faddeeva function of Weideman (1994)
+
+    :param num_terms: number of terms of the expansion
+    :return: coefficients (in the order of decreasing powers), scale parameter L
+    """
+    m = 2 * num_terms
+    k = np.arange(-m + 1, m)
+    scale = np.sqrt(num_terms / np.sqrt(2))
+    t = scale * np.tan(k * np.pi / m / 2)
+    f = np.append(0, np.exp(-t ** 2) * (scale ** 2 + t ** 2))
+    a = np.real(np.fft.fft(np.fft.fftshift(f))) / (2 * m)
+    return np.ascontiguousarray(np.flipud(a[1:num_terms + 1])), scale
+
+
+_COEFFICIENTS, _SCALE = _weideman_coefficients(_NUM_TERMS)
+_INV_SQRT_PI = 1. / np.sqrt(np.pi)
+
+
+@jit()
+def _wofz_upper(z):
+    """
+    Faddeeva function in the upper half-plane (Im(z) >= 0)
+
+    :param z: complex number
+    :return: w(z)
+    """
+    x, y = z.real, z.imag
+    if x * x + y * y >= _CONTINUED_FRACTION_RADIUS ** 2:
+        # Laplace continued fraction w(z) = i/sqrt(pi) / (z - 1/2 / (z - 1 / (z - 3/2 / ...))), with the complex
+        # divisions written out in real arithmetic
+        a, b = 0., 0.
+        for k in range(_CONTINUED_FRACTION_TERMS, 0, -1):
+            d_re, d_im = x - a, y - b
+            f = k / 2. / (d_re * d_re + d_im * d_im)
+            a, b = f * d_re, -f * d_im
+        d_re, d_im = x - a, y - b
+        f = _INV_SQRT_PI / (d_re * d_re + d_im * d_im)
+        return complex(f * d_im, f * d_re)
+    # 1 / (L - iz)
+    d_re, d_im = _SCALE + y, -x
+    f = 1. / (d_re * d_re + d_im * d_im)
+    inv_denominator = complex(f * d_re, -f * d_im)
+    ratio = complex(_SCALE - y, x) * inv_denominator
+    p = 0j
+    for a in _COEFFICIENTS:
+        p = p * ratio + a
+    return (2 * p * inv_denominator + _INV_SQRT_PI) * inv_denominator
+
+
+@jit()
+def _wofz_single(z):
+    """
+    Faddeeva function
+
+    :param z: complex number
+    :return: w(z)
+    """
+    if z.imag >= 0:
+        return _wofz_upper(z)
+    return 2 * np.exp(-z * z) - _wofz_upper(-z)
+
+
+@jit()
+def wofz_array(z):
+    """
+    Faddeeva function of a 1d array
+
+    :param z: 1d array of complex numbers
+    :return: w(z), 1d array of complex numbers
+    """
+    w = np.empty(len(z), dtype=np.complex128)
+    for i in prange(len(z)):
+        w[i] = _wofz_single(z[i])
+    return w
+
+
+def wofz(z):
+    """
+    Faddeeva function :math:`w(z) = \\exp(-z^2) \\mathrm{erfc}(-\\mathrm{i}z)`, compiled replacement of
+    ``scipy.special.wofz``
+
+    :param z: complex number or array of complex numbers
+    :return: w(z) with the shape of z
+    """
+    z_ = np.asarray(z, dtype=np.complex128)
+    w = wofz_array(z_.ravel()).reshape(z_.shape)
+    if z_.ndim == 0:
+        return complex(w)
+    return w
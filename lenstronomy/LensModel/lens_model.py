@@ -1,8 +1,6 @@
 __author__ = 'sibirrer'
 from lenstronomy.LensModel.single_plane import SinglePlane
 from lenstronomy.LensModel.LineOfSight.single_plane_los import SinglePlaneLOS
-from lenstronomy.LensModel.MultiPlane.multi_plane import MultiPlane
-from lenstronomy.Cosmo.lens_cosmo import LensCosmo
 from lenstronomy.Util import constants as const
 
 __all__ = ['LensModel']
@@ -32,7 +30,8 @@ class LensModel(object):
         :param numerical_alpha_class: an instance of a custom class for use in NumericalAlpha() lens model
          (see documentation in Profiles/numerical_alpha)
         :param kwargs_interp: interpolation keyword arguments specifying the numerics.
-         See description in the Interpolate() class. Only applicable for 'INTERPOL' and 'INTERPOL_SCALED' models.
+         See description in the Interpolate() class. Only applicable for 'INTERPOL' and 'INTERPOL_SCALED' models,
+         except for the key 'use_table' which sets the radial tables of the 'GNFW' and 'ULDM' models (fixed slopes only).
         :param observed_convention_index: a list of indices, corresponding to the lens_model_list element with same
          index, where the 'center_x' and 'center_y' kwargs correspond to observed (lensed) positions, not physical
          positions. The code will compute the physical locations when performing computations
@@ -51,10 +50,8 @@ class LensModel(object):
         self._z_source_convention = z_source_convention
         self.redshift_list = lens_redshift_list
 
-        if cosmo is None:
-            from astropy.cosmology import default_cosmology
-            cosmo = default_cosmology.get()
-        self.cosmo = cosmo
+        # the default cosmology (and astropy.cosmology) is only loaded when needed
+        self._cosmo = cosmo
 
         # Are there line-of-sight corrections?
         permitted_los_models = ['LOS', 'LOS_MINIMAL']
@@ -75,7 +72,8 @@ class LensModel(object):
                 raise ValueError('z_source needs to be set for multi-plane lens modelling.')
             if los_effects is True:
                 raise ValueError('LOS effects and multi-plane lensing are incompatible.')
-            self.lens_model = MultiPlane(z_source, lens_model_list, lens_redshift_list, cosmo=cosmo,
+            from lenstronomy.LensModel.MultiPlane.multi_plane import MultiPlane
+            self.lens_model = MultiPlane(z_source, lens_model_list, lens_redshift_list, cosmo=self.cosmo,
                                          numerical_alpha_class=numerical_alpha_class,
                                          observed_convention_index=observed_convention_index,
                                          z_source_convention=z_source_convention, cosmo_interp=cosmo_interp,
@@ -97,7 +95,28 @@ class LensModel(object):
                     kwargs_interp=kwargs_interp)
 
         if z_lens is not None and z_source is not None:
-            self._lensCosmo = LensCosmo(z_lens, z_source, cosmo=cosmo)
+            from lenstronomy.Cosmo.lens_cosmo import LensCosmo
+            self._lensCosmo = LensCosmo(z_lens, z_source, cosmo=self.cosmo)
+
+    @property
+    def cosmo(self):
+        """
+
+        :return: instance of the astropy cosmology class (the default cosmology if not specified)
+        """
+        if self._cosmo is None:
+            from astropy.cosmology import default_cosmology
+            self._cosmo = default_cosmology.get()
+        return self._cosmo
+
+    @cosmo.setter
+    def cosmo(self, cosmo):
+        """
+
+        :param cosmo: instance of the astropy cosmology class
+        :return: None
+        """
+        self._cosmo = cosmo
 
     def ray_shooting(self, x, y, kwargs, k=None):
         """
@@ -1,6 +1,8 @@
 import numpy as np
 import lenstronomy.Util.util as util
-from lenstronomy.Util.magnification_finite_util import setup_mag_finite
+from lenstronomy.LensModel.Util import critical_curve_util
+from lenstronomy.Util.magnification_finite_util import setup_mag_finite, auto_raytracing_grid_size, \
+    auto_raytracing_grid_resolution
 
 __all__ = ['LensModelExtensions']
 
@@ -87,78 +89,173 @@ class LensModelExtensions(object):
         :return: an array of image magnifications
         """
 
-        grid_x_0, grid_y_0, source_model, kwargs_source, grid_resolution, grid_radius_arcsec = setup_mag_finite(cosmo,
-                                                                                                                self._lensModel,
-                                                                                                                grid_radius_arcsec,
-                                                                                                                grid_resolution,
-                                                                                                                source_fwhm_parsec,
-                                                                                                                source_light_model,
-                                                                                                                z_source,
-                                                                                                                source_x,
-                                                                                                                source_y,
-                                                                                                                dx, dy,
-                                                                                                                amp_scale,
-                                                                                                                size_scale)
-        grid_x_0, grid_y_0 = grid_x_0.ravel(), grid_y_0.ravel()
-
-        minimum_magnification = 1e-5
-
-        magnifications = []
-
-        for xi, yi in zip(x_image, y_image):
-
-            if axis_ratio == 1:
-                grid_r = np.hypot(grid_x_0, grid_y_0)
-            else:
-                w1, w2, v11, v12, v21, v22 = self.hessian_eigenvectors(xi, yi, kwargs_lens)
-                _v = [np.array([v11, v12]), np.array([v21, v22])]
-                _w = [abs(w1), abs(w2)]
-                if use_largest_eigenvalue:
-                    idx = int(np.argmax(_w))
-                else:
-                    idx = int(np.argmin(_w))
-                v = _v[idx]
-
-                rotation_angle = np.arctan(v[1] / v[0]) - np.pi / 2
-                grid_x, grid_y = util.rotate(grid_x_0, grid_y_0, rotation_angle)
+        magnifications = self.magnification_finite_adaptive_batch(x_image, y_image, source_x, source_y, kwargs_lens,
+                                                                  source_fwhm_parsec, z_source, cosmo=cosmo,
+                                                                  grid_resolution=grid_resolution,
+                                                                  grid_radius_arcsec=grid_radius_arcsec,
+                                                                  axis_ratio=axis_ratio, tol=tol, step_size=step_size,
+                                                                  use_largest_eigenvalue=use_largest_eigenvalue,
+                                                                  source_light_model=source_light_model, dx=dx, dy=dy,
+                                                                  size_scale=size_scale, amp_scale=amp_scale,
+                                                                  fixed_aperture_size=fixed_aperture_size)
+        return magnifications[0]
+
+    def magnification_finite_adaptive_batch(self, x_image, y_image, source_x, source_y, kwargs_lens,
+                                            source_fwhm_parsec, z_source, cosmo=None, grid_resolution=None,
+                                            grid_radius_arcsec=None, axis_ratio=0.5, tol=0.001, step_size=0.05,
+                                            use_largest_eigenvalue=True, source_light_model='SINGLE_GAUSSIAN',
+                                            dx=None, dy=None, size_scale=None, amp_scale=None,
+                                            fixed_aperture_size=False):
+        """
+        Batched version of magnification_finite_adaptive() computing the magnifications of all images for one or
+        several source sizes from a single ray-tracing pass.
 
-                if axis_ratio == 0:
-                    sort = np.argsort(_w)
-                    q = _w[sort[0]] / _w[sort[1]]
-                    grid_r = np.hypot(grid_x, grid_y / q).ravel()
-                else:
-                    grid_r = np.hypot(grid_x, grid_y / axis_ratio).ravel()
+        The elliptical apertures of all images grow in lockstep and the rays of each new annulus are traced in a single
+        call to the lens model. The rays of an annulus are traced only once; the surface brightness of each source size
+        is evaluated at the traced coordinates and added to its running flux. An image stops growing once the
+        magnifications of all source sizes converged, the magnification of a source size is the one of the step at
+        which it converged (as in magnification_finite_adaptive()).
 
-            flux_array = np.zeros_like(grid_x_0)
-            step = step_size * grid_radius_arcsec
+        All source sizes share the same ray-tracing grid. If not specified, the grid radius is estimated from the
+        largest and the grid resolution from the smallest source size, such that the number of grid points grows with
+        the range of the source sizes.
 
-            r_min = 0
-            if fixed_aperture_size:
-                r_max = grid_radius_arcsec
-            else:
-                r_max = step
-            magnification_current = 0.
+        :param x_image: a list or array of x coordinates [units arcsec]
+        :param y_image: a list or array of y coordinates [units arcsec]
+        :param source_x: float, source position
+        :param source_y: float, source position
+        :param kwargs_lens: keyword arguments for the lens model
+        :param source_fwhm_parsec: float or list of floats, the size(s) of the background source [units parsec]
+        :param z_source: the source redshift
+        :param cosmo: (optional) an instance of astropy.cosmology; if not specified, a default cosmology will be used
+        :param grid_resolution: the grid resolution in units arcsec/pixel; if not specified, an appropriate value will
+         be estimated from the smallest source size
+        :param grid_radius_arcsec: (optional) the size of the ray tracing region in arcsec; if not specified, an
+         appropriate value will be estimated from the largest source size
+        :param axis_ratio: the axis ratio of the ellipse used for ray tracing (see magnification_finite_adaptive())
+        :param tol: tolerance for convergence in the magnification
+        :param step_size: sets the increment for the successively larger ray tracing windows
+        :param use_largest_eigenvalue: bool; if True, then the major axis of the ray tracing ellipse region
+         will be aligned with the eigenvector corresponding to the largest eigenvalue of the hessian matrix
+        :param source_light_model: the model for background source light; currently implemented are 'SINGLE_GAUSSIAN'
+         and 'DOUBLE_GAUSSIAN'.
+        :param dx: used with source model 'DOUBLE_GAUSSIAN', the offset of the second source light profile from the
+         first [arcsec]
+        :param dy: used with source model 'DOUBLE_GAUSSIAN', the offset of the second source light profile from the
+         first [arcsec]
+        :param size_scale: used with source model 'DOUBLE_GAUSSIAN', the size of the second source light profile
+         relative to the first
+        :param amp_scale: used with source model 'DOUBLE_GAUSSIAN', the peak brightness of the second source light
+         profile relative to the first
+        :param fixed_aperture_size: bool, if True the flux is computed inside a fixed aperture size with radius
+         grid_radius_arcsec
+        :return: 2d array of image magnifications of shape (number of source sizes, number of images)
+        """
+        source_fwhm_list = np.atleast_1d(source_fwhm_parsec)
+        if grid_radius_arcsec is None:
+            grid_radius_arcsec = auto_raytracing_grid_size(np.max(source_fwhm_list))
+        if grid_resolution is None:
+            grid_resolution = auto_raytracing_grid_resolution(np.min(source_fwhm_list))
+        source_list = []
+        for source_fwhm in source_fwhm_list:
+            grid_x_0, grid_y_0, source_model, kwargs_source, _, _ = setup_mag_finite(cosmo, self._lensModel,
+                                                                                     grid_radius_arcsec,
+                                                                                     grid_resolution, source_fwhm,
+                                                                                     source_light_model, z_source,
+                                                                                     source_x, source_y, dx, dy,
+                                                                                     amp_scale, size_scale)
+            source_list.append([source_model, kwargs_source])
+        grid_x_0, grid_y_0 = grid_x_0.ravel(), grid_y_0.ravel()
+        x_image, y_image = np.atleast_1d(x_image), np.atleast_1d(y_image)
+        num_sizes, num_images = len(source_fwhm_list), len(x_image)
 
-            while True:
+        minimum_magnification = 1e-5
 
-                flux_array = self._magnification_adaptive_iteration(flux_array, xi, yi, grid_x_0, grid_y_0, grid_r,
-                                                                    r_min, r_max, self._lensModel, kwargs_lens,
-                                                                    source_model, kwargs_source)
-                new_magnification = np.sum(flux_array) * grid_resolution ** 2
+        # the grid points of each image sorted by their elliptical radius, such that an annulus is a slice
+        order_list, r_sorted_list = [], []
+        for xi, yi in zip(x_image, y_image):
+            grid_r = self._aperture_radius(xi, yi, kwargs_lens, grid_x_0, grid_y_0, axis_ratio,
+                                           use_largest_eigenvalue)
+            order = np.argsort(grid_r, kind='stable')
+            order_list.append(order)
+            r_sorted_list.append(grid_r[order])
+
+        flux = np.zeros((num_sizes, num_images))
+        magnifications = np.zeros((num_sizes, num_images))
+        magnification_current = np.zeros((num_sizes, num_images))
+        active = np.ones((num_sizes, num_images), dtype=bool)
+        step = step_size * grid_radius_arcsec
+
+        r_min = 0
+        if fixed_aperture_size:
+            r_max = grid_radius_arcsec
+        else:
+            r_max = step
+
+        while True:
+            image_index = np.where(np.any(active, axis=0))[0]
+            index_list = []
+            for i in image_index:
+                i_min, i_max = np.searchsorted(r_sorted_list[i], [r_min, r_max])
+                index_list.append(order_list[i][i_min:i_max])
+            num_rays = [len(index) for index in index_list]
+            if np.sum(num_rays) > 0:
+                x_coords = np.concatenate([grid_x_0[index] + x_image[i] for i, index in zip(image_index, index_list)])
+                y_coords = np.concatenate([grid_y_0[index] + y_image[i] for i, index in zip(image_index, index_list)])
+                beta_x, beta_y = self._lensModel.ray_shooting(x_coords, y_coords, kwargs_lens)
+                split = np.cumsum(num_rays)[:-1]
+                for k, (source_model, kwargs_source) in enumerate(source_list):
+                    flux_in_pixels = source_model.surface_brightness(beta_x, beta_y, kwargs_source)
+                    flux[k, image_index] += [np.sum(f) for f in np.split(flux_in_pixels, split)]
+
+            new_magnification = flux * grid_resolution ** 2
+            magnifications[active] = new_magnification[active]
+            if r_max >= grid_radius_arcsec:
+                break
+            with np.errstate(divide='ignore', invalid='ignore'):
                 diff = abs(new_magnification - magnification_current) / new_magnification
+            active &= ~np.logical_and(diff < tol, new_magnification > minimum_magnification)
+            if not np.any(active):
+                break
+            r_min += step
+            r_max += step
+            magnification_current = new_magnification
+        return magnifications
+
+    def _aperture_radius(self, x_image, y_image, kwargs_lens, grid_x, grid_y, axis_ratio, use_largest_eigenvalue):
+        """
+        elliptical radius of the ray-tracing grid around an image, with the ellipse oriented along the eigenvectors of
+        the hessian matrix at the image position (see magnification_finite_adaptive())
 
-                if r_max >= grid_radius_arcsec:
-                    break
-                elif diff < tol and new_magnification > minimum_magnification:
-                    break
-                else:
-                    r_min += step
-                    r_max += step
-                    magnification_current = new_magnification
+        :param x_image: image x coordinate
+        :param y_image: image y coordinate
+        :param kwargs_lens: keyword arguments for the lens model
+        :param grid_x: an array of x coordinates relative to the image
+        :param grid_y: an array of y coordinates relative to the image
+        :param axis_ratio: the axis ratio of the ellipse; if 0, estimated from the eigenvalues of the hessian matrix
+        :param use_largest_eigenvalue: bool; if True, then the major axis of the ellipse will be aligned with the
+         eigenvector corresponding to the largest eigenvalue of the hessian matrix
+        :return: array of elliptical radii of the grid coordinates
+        """
+        if axis_ratio == 1:
+            return np.hypot(grid_x, grid_y)
+        w1, w2, v11, v12, v21, v22 = self.hessian_eigenvectors(x_image, y_image, kwargs_lens)
+        _v = [np.array([v11, v12]), np.array([v21, v22])]
+        _w = [abs(w1), abs(w2)]
+        if use_largest_eigenvalue:
+            idx = int(np.argmax(_w))
+        else:
+            idx = int(np.argmin(_w))
+        v = _v[idx]
 
-            magnifications.append(new_magnification)
+        rotation_angle = np.arctan(v[1] / v[0]) - np.pi / 2
+        grid_x, grid_y = util.rotate(grid_x, grid_y, rotation_angle)
 
-        return np.array(magnifications)
+        if axis_ratio == 0:
+            sort = np.argsort(_w)
+            q = _w[sort[0]] / _w[sort[1]]
+            return np.hypot(grid_x, grid_y / q).ravel()
+        return np.hypot(grid_x, grid_y / axis_ratio).ravel()
 
     @staticmethod
     def _magnification_adaptive_iteration(flux_array, x_image, y_image, grid_x, grid_y, grid_r, r_min, r_max,
@@ -307,20 +404,24 @@ class LensModelExtensions(object):
                 dec_crit_list += dec_crit  # list addition
         return np.array(ra_crit_list), np.array(dec_crit_list)
 
-    def caustic_area(self, kwargs_lens, kwargs_caustic_num, index_vertices=0):
+    def caustic_area(self, kwargs_lens, kwargs_caustic_num, index_vertices=0, adaptive=False):
         """
         computes the area inside a connected caustic curve
 
         :param kwargs_lens: lens model keyword argument list
         :param kwargs_caustic_num: keyword arguments for the numerical calculation of the caustics, as input of
-         self.critical_curve_caustics()
+         self.critical_curve_caustics() (or self.critical_curve_caustics_adaptive() if adaptive=True)
         :param index_vertices: integer, index of connected vortex from the output of self.critical_curve_caustics()
          of disconnected curves.
+        :param adaptive: bool, if True, uses the adaptive critical curve finder critical_curve_caustics_adaptive()
         :return: area within the caustic curve selected
         """
-
-        ra_crit_list, dec_crit_list, ra_caustic_list, dec_caustic_list = self.critical_curve_caustics(kwargs_lens,
-                                                                                                      **kwargs_caustic_num)
+        if adaptive is True:
+            critical_curve_caustics = self.critical_curve_caustics_adaptive
+        else:
+            critical_curve_caustics = self.critical_curve_caustics
+        ra_crit_list, dec_crit_list, ra_caustic_list, dec_caustic_list = critical_curve_caustics(kwargs_lens,
+                                                                                                 **kwargs_caustic_num)
 
         # select specific vortex
         ra_caustic_inner = ra_caustic_list[index_vertices]
@@ -411,6 +512,47 @@ class LensModelExtensions(object):
             dec_caustic_list.append(dec_caustics)
         return ra_crit_list, dec_crit_list, ra_caustic_list, dec_caustic_list
 
+    def critical_curve_caustics_adaptive(self, kwargs_lens, compute_window=5, grid_scale=0.01, start_scale=0.1,
+                                         center_x=0, center_y=0, num_newton=0):
+        """
+        critical curves and caustics with an adaptive marching squares algorithm.
+        The determinant of the lensing Jacobian is evaluated on a coarse grid of cell size start_scale and only the
+        cells in which it changes sign (and their neighbours) are refined until the cell size is below grid_scale.
+        The number of lens model evaluations hence scales with the length of the critical curves instead of the area
+        of the window as in critical_curve_caustics().
+
+        Critical curves smaller than start_scale might be missed.
+
+        :param kwargs_lens: lens model kwargs
+        :param compute_window: window size in arcsec where the critical curve is computed
+        :param grid_scale: maximal cell size at the finest level of the refinement
+        :param start_scale: cell size of the coarse grid
+        :param center_x: float, center of the window to compute critical curves and caustics
+        :param center_y: float, center of the window to compute critical curves and caustics
+        :param num_newton: int, number of Newton iterations moving the critical curve points onto the curve where the
+         determinant of the lensing Jacobian vanishes
+        :return: lists of ra and dec arrays corresponding to different disconnected critical curves and their caustic
+         counterparts, longest curve first (closed curves repeat their first point at the end)
+        """
+        num_cells = int(np.ceil(compute_window / start_scale))
+        num_levels = max(int(np.ceil(np.log2(start_scale / grid_scale))), 0)
+        x_min = center_x - num_cells * start_scale / 2.
+        y_min = center_y - num_cells * start_scale / 2.
+
+        def _det_jacobian(x, y):
+            f_xx, f_xy, f_yx, f_yy = self._lensModel.hessian(x, y, kwargs_lens)
+            return (1 - f_xx) * (1 - f_yy) - f_xy * f_yx
+
+        ra_crit_list, dec_crit_list = critical_curve_util.zero_contours(_det_jacobian, x_min, y_min, start_scale,
+                                                                        num_cells, num_levels, num_newton=num_newton)
+        ra_caustic_list = []
+        dec_caustic_list = []
+        for ra_points, dec_points in zip(ra_crit_list, dec_crit_list):
+            ra_caustics, dec_caustics = self._lensModel.ray_shooting(ra_points, dec_points, kwargs_lens)
+            ra_caustic_list.append(ra_caustics)
+            dec_caustic_list.append(dec_caustics)
+        return ra_crit_list, dec_crit_list, ra_caustic_list, dec_caustic_list
+
     def hessian_eigenvectors(self, x, y, kwargs_lens, diff=None):
         """
         computes magnification eigenvectors at position (x, y)
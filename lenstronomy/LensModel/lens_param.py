@@ -100,6 +100,12 @@ class LensParam(object):
                         i += num_param
                     elif model in ['MULTI_GAUSSIAN_KAPPA', 'MULTI_GAUSSIAN_KAPPA_ELLIPSE'] and name == 'sigma':
                         raise ValueError("%s must have fixed 'sigma' list!" % model)
+                    elif model == 'ElliSLICE_STACK' and name == 'sigma_0':
+                        num_param = self._num_slices(kwargs_fixed)
+                        kwargs['sigma_0'] = np.array(args[i:i + num_param])
+                        i += num_param
+                    elif model == 'ElliSLICE_STACK' and name in ['a', 'b']:
+                        raise ValueError("%s must have fixed 'a' and 'b' lists!" % model)
                     elif model in ['INTERPOL', 'INTERPOL_SCALED'] and name in ['f_', 'f_xx', 'f_xy', 'f_yy']:
                         pass
                     else:
@@ -142,6 +148,11 @@ class LensParam(object):
                         args += list(amp)
                     elif model in ['MULTI_GAUSSIAN_KAPPA', 'MULTI_GAUSSIAN_KAPPA_ELLIPSE'] and name == 'sigma':
                         raise ValueError("%s must have fixed 'sigma' list!" % model)
+                    elif model == 'ElliSLICE_STACK' and name == 'sigma_0':
+                        # a single value (e.g. the default bounds) applies to all the slices
+                        args += list(np.broadcast_to(kwargs['sigma_0'], (self._num_slices(kwargs_fixed),)))
+                    elif model == 'ElliSLICE_STACK' and name in ['a', 'b']:
+                        raise ValueError("%s must have fixed 'a' and 'b' lists!" % model)
                     elif model in ['INTERPOL', 'INTERPOL_SCALED'] and name in ['f_', 'f_xx', 'f_xy', 'f_yy']:
                         pass
                     # elif self._solver_type == 'PROFILE_SHEAR' and k == 1:
@@ -187,9 +198,27 @@ class LensParam(object):
                             list.append(str(name + '_' + type + str(k)))
                     elif model in ['MULTI_GAUSSIAN_KAPPA', 'MULTI_GAUSSIAN_KAPPA_ELLIPSE'] and name == 'sigma':
                         raise ValueError("'sigma' must be a fixed keyword argument for MULTI_GAUSSIAN")
+                    elif model == 'ElliSLICE_STACK' and name == 'sigma_0':
+                        num_param = self._num_slices(kwargs_fixed)
+                        num += num_param
+                        for i in range(num_param):
+                            list.append(str(name + '_' + type + str(k)))
+                    elif model == 'ElliSLICE_STACK' and name in ['a', 'b']:
+                        raise ValueError("'a' and 'b' must be fixed keyword arguments for ElliSLICE_STACK")
                     elif model in ['INTERPOL', 'INTERPOL_SCALED'] and name in ['f_', 'f_xx', 'f_xy', 'f_yy']:
                         pass
                     else:
                         num += 1
                         list.append(str(name + '_' + type + str(k)))
         return num, list
+
+    @staticmethod
+    def _num_slices(kwargs_fixed):
+        """
+
+        :param kwargs_fixed: fixed keyword arguments of an 'ElliSLICE_STACK' lens model
+        :return: number of slices of the stack, as given by the fixed semi-major and semi-minor axes
+        """
+        if 'a' not in kwargs_fixed or 'b' not in kwargs_fixed:
+            raise ValueError("ElliSLICE_STACK must have fixed 'a' and 'b' lists!")
+        return np.broadcast(kwargs_fixed['a'], kwargs_fixed['b']).size
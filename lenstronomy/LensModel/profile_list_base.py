@@ -16,7 +16,7 @@ _SUPPORTED_MODELS = ['SHIFT', 'NIE_POTENTIAL', 'CONST_MAG', 'SHEAR', 'SHEAR_GAMM
                      'DIPOLE', 'CURVED_ARC_CONST', 'CURVED_ARC_SPP', 'CURVED_ARC_SIS_MST', 'CURVED_ARC_SPT',
                      'CURVED_ARC_TAN_DIFF', 'ARC_PERT', 'coreBURKERT',
                      'CORED_DENSITY', 'CORED_DENSITY_2', 'CORED_DENSITY_MST', 'CORED_DENSITY_2_MST', 'CORED_DENSITY_EXP',
-                     'CORED_DENSITY_EXP_MST', 'NumericalAlpha', 'MULTIPOLE', 'HESSIAN', 'ElliSLICE', 'ULDM','CORED_DENSITY_ULDM_MST',
+                     'CORED_DENSITY_EXP_MST', 'NumericalAlpha', 'MULTIPOLE', 'HESSIAN', 'ElliSLICE', 'ElliSLICE_STACK', 'ULDM','CORED_DENSITY_ULDM_MST',
                      'LOS', 'LOS_MINIMAL',
                      'GNFW','CSE']
 
@@ -77,10 +77,16 @@ class ProfileListBase(object):
         :param z_lens: lens redshift  # currently only used in NFW_MC model as this is redshift dependent
         :param z_source: source redshift  # currently only used in NFW_MC model as this is redshift dependent
         :param kwargs_interp: interpolation keyword arguments specifying the numerics.
-         See description in the Interpolate() class. Only applicable for 'INTERPOL' and 'INTERPOL_SCALED' models.
+         See description in the Interpolate() class. Only applicable for 'INTERPOL' and 'INTERPOL_SCALED' models,
+         except for the key 'use_table' (bool) which is passed to the 'GNFW' and 'ULDM' models (see radial_table
+         module). The tables are built per slope, so use_table=True only pays off when the slopes are kept fixed.
         :return: class instance of the lens model type
         """
 
+        if kwargs_interp is None:
+            kwargs_interp = {}
+        use_table = kwargs_interp.get('use_table', False)
+        kwargs_interp = {key: value for key, value in kwargs_interp.items() if key != 'use_table'}
         if lens_type == 'SHIFT':
             from lenstronomy.LensModel.Profiles.constant_shift import Shift
             return Shift()
@@ -306,12 +312,15 @@ class ProfileListBase(object):
         elif lens_type == 'ElliSLICE':
             from lenstronomy.LensModel.Profiles.elliptical_density_slice import ElliSLICE
             return ElliSLICE()
+        elif lens_type == 'ElliSLICE_STACK':
+            from lenstronomy.LensModel.Profiles.elliptical_density_slice import ElliSLICEStack
+            return ElliSLICEStack()
         elif lens_type == 'ULDM':
             from lenstronomy.LensModel.Profiles.uldm import Uldm
-            return Uldm()
+            return Uldm(use_table=use_table)
         elif lens_type == 'GNFW':
             from lenstronomy.LensModel.Profiles.general_nfw import GNFW
-            return GNFW()
+            return GNFW(use_table=use_table)
         elif lens_type == 'CORED_DENSITY_ULDM_MST':
             from lenstronomy.LensModel.Profiles.cored_density_mst import CoredDensityMST
             return CoredDensityMST(profile_type='CORED_DENSITY_ULDM')
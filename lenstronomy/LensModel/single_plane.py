@@ -1,6 +1,7 @@
 __author__ = 'sibirrer'
 
 import numpy as np
+from lenstronomy.Util.param_util import transform_cache
 from lenstronomy.LensModel.profile_list_base import ProfileListBase
 
 __all__ = ['SinglePlane']
@@ -63,9 +64,10 @@ class SinglePlane(ProfileListBase):
             return self.func_list[k].function(x, y, **kwargs[k])
         bool_list = self._bool_list(k)
         potential = np.zeros_like(x)
-        for i, func in enumerate(self.func_list):
-            if bool_list[i] is True:
-                potential += func.function(x, y, **kwargs[i])
+        with transform_cache(kwargs):
+            for i, func in enumerate(self.func_list):
+                if bool_list[i] is True:
+                    potential += func.function(x, y, **kwargs[i])
         return potential
 
     def alpha(self, x, y, kwargs, k=None):
@@ -88,11 +90,12 @@ class SinglePlane(ProfileListBase):
             return self.func_list[k].derivatives(x, y, **kwargs[k])
         bool_list = self._bool_list(k)
         f_x, f_y = np.zeros_like(x), np.zeros_like(x)
-        for i, func in enumerate(self.func_list):
-            if bool_list[i] is True:
-                f_x_i, f_y_i = func.derivatives(x, y, **kwargs[i])
-                f_x += f_x_i
-                f_y += f_y_i
+        with transform_cache(kwargs):
+            for i, func in enumerate(self.func_list):
+                if bool_list[i] is True:
+                    f_x_i, f_y_i = func.derivatives(x, y, **kwargs[i])
+                    f_x += f_x_i
+                    f_y += f_y_i
 
         return f_x, f_y
 
@@ -115,13 +118,14 @@ class SinglePlane(ProfileListBase):
 
         bool_list = self._bool_list(k)
         f_xx, f_xy, f_yx, f_yy = np.zeros_like(x), np.zeros_like(x), np.zeros_like(x), np.zeros_like(x)
-        for i, func in enumerate(self.func_list):
-            if bool_list[i] is True:
-                f_xx_i, f_xy_i, f_yx_i, f_yy_i = func.hessian(x, y, **kwargs[i])
-                f_xx += f_xx_i
-                f_xy += f_xy_i
-                f_yx += f_yx_i
-                f_yy += f_yy_i
+        with transform_cache(kwargs):
+            for i, func in enumerate(self.func_list):
+                if bool_list[i] is True:
+                    f_xx_i, f_xy_i, f_yx_i, f_yy_i = func.hessian(x, y, **kwargs[i])
+                    f_xx += f_xx_i
+                    f_xy += f_xy_i
+                    f_yx += f_yx_i
+                    f_yy += f_yy_i
         return f_xx, f_xy, f_yx, f_yy
 
     def mass_3d(self, r, kwargs, bool_list=None):
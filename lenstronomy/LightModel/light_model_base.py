@@ -4,6 +4,7 @@ __author__ = 'sibirrer'
 
 import numpy as np
 from lenstronomy.Util.util import convert_bool_list
+from lenstronomy.Util.param_util import transform_cache
 from lenstronomy.Conf import config_loader
 convention_conf = config_loader.conventions_conf()
 sersic_major_axis_conf = convention_conf.get('sersic_major_axis', False)
@@ -127,10 +128,11 @@ class LightModelBase(object):
         y = np.array(y, dtype=float)
         flux = np.zeros_like(x)
         bool_list = self._bool_list(k=k)
-        for i, func in enumerate(self.func_list):
-            if bool_list[i] is True:
-                out = np.array(func.function(x, y, **kwargs_list_standard[i]), dtype=float)
-                flux += out
+        with transform_cache(kwargs_list_standard):
+            for i, func in enumerate(self.func_list):
+                if bool_list[i] is True:
+                    out = np.array(func.function(x, y, **kwargs_list_standard[i]), dtype=float)
+                    flux += out
         return flux
 
     def light_3d(self, r, kwargs_list, k=None):
@@ -4,6 +4,7 @@ __author__ = 'sibirrer'
 
 import numpy as np
 from lenstronomy.LightModel.light_model_base import LightModelBase
+from lenstronomy.Util.param_util import transform_cache
 
 __all__ = ['LinearBasis']
 
@@ -59,39 +60,40 @@ class LinearBasis(LightModelBase):
         response = []
         n = 0
         bool_list = self._bool_list(k=k)
-        for i, model in enumerate(self.profile_type_list):
-            if bool_list[i] is True:
-                if model in ['SERSIC', 'SERSIC_ELLIPSE', 'CORE_SERSIC', 'HERNQUIST', 'HERNQUIST_ELLIPSE', 'PJAFFE',
-                             'PJAFFE_ELLIPSE', 'GAUSSIAN', 'GAUSSIAN_ELLIPSE', 'POWER_LAW', 'NIE', 'CHAMELEON',
-                             'DOUBLE_CHAMELEON', 'TRIPLE_CHAMELEON', 'UNIFORM', 'INTERPOL', 'ELLIPSOID']:
-                    kwargs_new = kwargs_list[i].copy()
-                    new = {'amp': 1}
-                    kwargs_new.update(new)
-                    response += [self.func_list[i].function(x, y, **kwargs_new)]
-                    n += 1
-                elif model in ['MULTI_GAUSSIAN', 'MULTI_GAUSSIAN_ELLIPSE']:
-                    num = len(kwargs_list[i]['amp'])
-                    new = {'amp': np.ones(num)}
-                    kwargs_new = kwargs_list[i].copy()
-                    kwargs_new.update(new)
-                    response += self.func_list[i].function_split(x, y, **kwargs_new)
-                    n += num
-                elif model in ['SHAPELETS', 'SHAPELETS_POLAR', 'SHAPELETS_POLAR_EXP']:
-                    kwargs = kwargs_list[i]
-                    n_max = kwargs['n_max']
-                    if model in ['SHAPELETS_POLAR_EXP']:
-                        num_param = int((n_max+1)**2)
+        with transform_cache(kwargs_list):
+            for i, model in enumerate(self.profile_type_list):
+                if bool_list[i] is True:
+                    if model in ['SERSIC', 'SERSIC_ELLIPSE', 'CORE_SERSIC', 'HERNQUIST', 'HERNQUIST_ELLIPSE', 'PJAFFE',
+                                 'PJAFFE_ELLIPSE', 'GAUSSIAN', 'GAUSSIAN_ELLIPSE', 'POWER_LAW', 'NIE', 'CHAMELEON',
+                                 'DOUBLE_CHAMELEON', 'TRIPLE_CHAMELEON', 'UNIFORM', 'INTERPOL', 'ELLIPSOID']:
+                        kwargs_new = kwargs_list[i].copy()
+                        new = {'amp': 1}
+                        kwargs_new.update(new)
+                        response += [self.func_list[i].function(x, y, **kwargs_new)]
+                        n += 1
+                    elif model in ['MULTI_GAUSSIAN', 'MULTI_GAUSSIAN_ELLIPSE']:
+                        num = len(kwargs_list[i]['amp'])
+                        new = {'amp': np.ones(num)}
+                        kwargs_new = kwargs_list[i].copy()
+                        kwargs_new.update(new)
+                        response += self.func_list[i].function_split(x, y, **kwargs_new)
+                        n += num
+                    elif model in ['SHAPELETS', 'SHAPELETS_POLAR', 'SHAPELETS_POLAR_EXP']:
+                        kwargs = kwargs_list[i]
+                        n_max = kwargs['n_max']
+                        if model in ['SHAPELETS_POLAR_EXP']:
+                            num_param = int((n_max+1)**2)
+                        else:
+                            num_param = int((n_max + 1) * (n_max + 2) / 2)
+                        new = {'amp': np.ones(num_param)}
+                        kwargs_new = kwargs_list[i].copy()
+                        kwargs_new.update(new)
+                        response += self.func_list[i].function_split(x, y, **kwargs_new)
+                        n += num_param
+                    elif model in ['SLIT_STARLETS', 'SLIT_STARLETS_GEN2']:
+                        raise ValueError("'{}' model does not support function split".format(model))
                     else:
-                        num_param = int((n_max + 1) * (n_max + 2) / 2)
-                    new = {'amp': np.ones(num_param)}
-                    kwargs_new = kwargs_list[i].copy()
-                    kwargs_new.update(new)
-                    response += self.func_list[i].function_split(x, y, **kwargs_new)
-                    n += num_param
-                elif model in ['SLIT_STARLETS', 'SLIT_STARLETS_GEN2']:
-                    raise ValueError("'{}' model does not support function split".format(model))
-                else:
-                    raise ValueError('model type %s not valid!' % model)
+                        raise ValueError('model type %s not valid!' % model)
         return response, n
 
     def num_param_linear(self, kwargs_list, list_return=False):
@@ -11,7 +11,7 @@ class ImageLikelihood(object):
 
     def __init__(self, multi_band_list, multi_band_type, kwargs_model, bands_compute=None,
                  image_likelihood_mask_list=None, source_marg=False, linear_prior=None, check_positive_flux=False,
-                 kwargs_pixelbased=None, linear_solver=True):
+                 kwargs_pixelbased=None, linear_solver=True, kwargs_matrix_free=None, num_band_threads=1):
         """
 
         :param bands_compute: list of bools with same length as data objects, indicates which "band" to include in the
@@ -28,11 +28,16 @@ class ImageLikelihood(object):
          (see SLITronomy documentation)
         :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
          that they get overwritten by the linear solver solution.
+        :param kwargs_matrix_free: keyword arguments of the matrix-free linear solver (see ImageLinearFit)
+        :param num_band_threads: int, number of threads evaluating the imaging bands in parallel in 'multi-linear'
+         mode (see MultiDataBase)
         """
         self.imSim = class_creator.create_im_sim(multi_band_list, multi_band_type, kwargs_model,
                                                  bands_compute=bands_compute,
                                                  image_likelihood_mask_list=image_likelihood_mask_list,
-                                                 kwargs_pixelbased=kwargs_pixelbased, linear_solver=linear_solver)
+                                                 kwargs_pixelbased=kwargs_pixelbased, linear_solver=linear_solver,
+                                                 kwargs_matrix_free=kwargs_matrix_free,
+                                                 num_band_threads=num_band_threads)
         self._model_type = self.imSim.type
         self._source_marg = source_marg
         self._linear_prior = linear_prior
@@ -82,3 +87,11 @@ class ImageLikelihood(object):
         :return: None
         """
         self.imSim.reset_point_source_cache(cache=cache)
+
+    def set_profiler(self, profiler):
+        """
+
+        :param profiler: StageProfiler instance measuring the stages of the image computation
+        :return: None
+        """
+        self.imSim.set_profiler(profiler)
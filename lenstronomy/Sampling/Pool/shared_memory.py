@@ -0,0 +1,273 @@
+"""
+data products shared between the processes of a multiprocessing or MPI pool.
+
+Instead of pickling the LikelihoodModule (including the images, noise maps, PSF kernels and all the pre-computed
+caches) to every worker of a pool, the numpy arrays of the data products are written once into memory-mapped files
+(on the tmpfs /dev/shm where available) and the workers attach to them without copying. The likelihood itself is
+reconstructed in each worker process from its (lightweight) keyword arguments and is then cached in the process.
+
+With MPI, only the master process writes the files. The worker processes attach (read-only) to the files of the
+master when they receive the likelihood with their first task, i.e. the directory needs to be on a file system
+accessible by all the ranks (see SharedDataStore). The worker processes of a multiprocessing pool exit when the pool is
+closed; the MPI worker ranks release the likelihood of a previous step when they receive the one of the next step.
+"""
+
+import os
+import uuid
+import shutil
+import tempfile
+import numpy as np
+
+from lenstronomy.Sampling.likelihood import LikelihoodModule
+from lenstronomy.Sampling.parameters import Param
+
+__all__ = ['SharedDataStore', 'SharedArray', 'SharedLikelihoodModule', 'attach']
+
+# per-process caches of the attached arrays, the re-constructed likelihoods and parameter classes
+_array_cache = {}
+_likelihood_cache = {}
+_param_cache = {}
+
+
+class SharedArray(object):
+    """
+    lightweight (picklable) handle of a numpy array stored in a memory-mapped file
+    """
+    def __init__(self, filename, shape, dtype):
+        """
+
+        :param filename: path to the .npy file storing the array
+        :param shape: shape of the array
+        :param dtype: data type of the array
+        """
+        self.filename = filename
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+
+    def attach(self):
+        """
+        maps the array read-only into the memory of the current process, such that the data is shared between the
+        processes
+
+        :return: numpy array (not writeable)
+        """
+        if self.filename not in _array_cache:
+            array = np.load(self.filename, mmap_mode='r')
+            _array_cache[self.filename] = np.asarray(array)
+        return _array_cache[self.filename]
+
+
+def attach(obj):
+    """
+    recursively replaces the SharedArray handles in (nested) dictionaries, lists and tuples by the arrays
+
+    :param obj: object as returned by SharedDataStore.share()
+    :return: object with the same structure with numpy arrays in place of the SharedArray handles
+    """
+    if isinstance(obj, SharedArray):
+        return obj.attach()
+    if isinstance(obj, dict):
+        return {key: attach(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [attach(value) for value in obj]
+    if isinstance(obj, tuple):
+        return tuple(attach(value) for value in obj)
+    return obj
+
+
+class SharedDataStore(object):
+    """
+    directory of memory-mapped files holding the shared numpy arrays.
+    The directory needs to be accessible by all the processes of the pool. By default, the shared memory file system
+    /dev/shm is used (if present), for MPI pools across several nodes a directory on a shared file system needs to be
+    provided.
+    """
+    def __init__(self, directory=None, min_size=1000):
+        """
+
+        :param directory: path to the directory in which the temporary files are created.
+         If None, uses /dev/shm if existing or the default temporary directory otherwise.
+        :param min_size: int, minimal number of elements of an array to be shared. Smaller arrays are pickled.
+        """
+        if directory is None and os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+            directory = '/dev/shm'
+        self._directory = tempfile.mkdtemp(prefix='lenstronomy_', dir=directory)
+        self._min_size = min_size
+        self._num_files = 0
+
+    @property
+    def directory(self):
+        """
+
+        :return: path of the directory holding the memory-mapped files
+        """
+        return self._directory
+
+    def share(self, obj):
+        """
+        recursively replaces the numpy arrays in (nested) dictionaries, lists and tuples by SharedArray handles
+
+        :param obj: object to be shared, e.g. kwargs_data_joint
+        :return: object with the same structure with SharedArray handles in place of the numpy arrays
+        """
+        if isinstance(obj, np.ndarray) and obj.dtype != object and obj.size >= self._min_size:
+            return self.share_array(obj)
+        if isinstance(obj, dict):
+            return {key: self.share(value) for key, value in obj.items()}
+        if isinstance(obj, list):
+            return [self.share(value) for value in obj]
+        if isinstance(obj, tuple):
+            return tuple(self.share(value) for value in obj)
+        return obj
+
+    def share_array(self, array):
+        """
+        writes a numpy array into a memory-mapped file
+
+        :param array: numpy array
+        :return: SharedArray instance
+        """
+        if self._directory is None:
+            raise ValueError('SharedDataStore has been closed and can not share further arrays.')
+        filename = os.path.join(self._directory, 'array_%s.npy' % self._num_files)
+        self._num_files += 1
+        np.save(filename, np.ascontiguousarray(array), allow_pickle=False)
+        return SharedArray(filename, array.shape, array.dtype)
+
+    def close(self):
+        """
+        removes the memory-mapped files. Arrays already attached remain valid in the attached processes.
+
+        :return: None
+        """
+        if self._directory is not None:
+            for filename in list(_array_cache.keys()):
+                if filename.startswith(self._directory):
+                    del _array_cache[filename]
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _release_process(keep=None):
+    """
+    removes the re-constructed likelihoods and parameter classes of the current process from the caches
+
+    :param keep: token of a SharedLikelihoodModule whose entries are kept (optional)
+    :return: None
+    """
+    for cache in [_likelihood_cache, _param_cache]:
+        for token in list(cache.keys()):
+            if token != keep:
+                del cache[token]
+
+
+class SharedLikelihoodModule(object):
+    """
+    picklable stand-in of the LikelihoodModule for pools.
+    Only the keyword arguments (with the data arrays replaced by SharedArray handles) are transferred to the workers,
+    the LikelihoodModule is re-constructed once per process at its first call.
+    """
+    def __init__(self, kwargs_data_joint, kwargs_model, kwargs_param, kwargs_likelihood, data_store):
+        """
+
+        :param kwargs_data_joint: keyword argument specifying the data according to LikelihoodModule
+        :param kwargs_model: keyword arguments to describe all model components used in
+         class_creator.create_class_instances()
+        :param kwargs_param: keyword arguments to create the Param() class
+        :param kwargs_likelihood: keyword arguments of the LikelihoodModule (excluding kwargs_data_joint, kwargs_model
+         and param_class)
+        :param data_store: SharedDataStore instance, or None on the worker ranks of an MPI pool. Without data store,
+         nothing is written and the instance only provides the parameter handling (param, param_limits) needed before
+         the worker enters the pool; the likelihood is then evaluated by the instance received from the master.
+        """
+        if data_store is None:
+            self._kwargs_data_joint, self._kwargs_model, self._kwargs_likelihood = None, None, None
+            self._kwargs_param = kwargs_param
+        else:
+            self._kwargs_data_joint = data_store.share(kwargs_data_joint)
+            self._kwargs_model = data_store.share(kwargs_model)
+            self._kwargs_param = data_store.share(kwargs_param)
+            self._kwargs_likelihood = data_store.share(kwargs_likelihood)
+        self._token = uuid.uuid4().hex
+
+    @property
+    def likelihood_module(self):
+        """
+
+        :return: LikelihoodModule instance of the current process
+        """
+        if self._token not in _likelihood_cache:
+            if self._kwargs_data_joint is None:
+                raise ValueError('SharedLikelihoodModule without data store can not evaluate the likelihood.')
+            # a process evaluates one likelihood at a time: the likelihoods of previous fitting steps are released
+            # (the worker ranks of an MPI pool are kept alive between the steps and never see release())
+            _release_process(keep=self._token)
+            _likelihood_cache[self._token] = LikelihoodModule(attach(self._kwargs_data_joint),
+                                                              attach(self._kwargs_model), self.param,
+                                                              **attach(self._kwargs_likelihood))
+        return _likelihood_cache[self._token]
+
+    @property
+    def param(self):
+        """
+        Param() instance of the current process (without constructing the LikelihoodModule)
+
+        :return: Param() instance
+        """
+        if self._token not in _param_cache:
+            _param_cache[self._token] = Param(**attach(self._kwargs_param))
+        return _param_cache[self._token]
+
+    @property
+    def param_limits(self):
+        """
+
+        :return: lower and upper limits of the parameters
+        """
+        return self.param.param_limits()
+
+    def release(self):
+        """
+        removes the LikelihoodModule of the current process from the cache
+
+        :return: None
+        """
+        _likelihood_cache.pop(self._token, None)
+        _param_cache.pop(self._token, None)
+
+    def __getattr__(self, name):
+        # delegate everything else (param, param_limits, effective_num_data_points, ...) to the LikelihoodModule
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.likelihood_module, name)
+
+    def __call__(self, a):
+        return self.likelihood_module.logL(a)
+
+    def logL(self, args, verbose=False):
+        """
+        routine to compute X2 given variable parameters for a MCMC/PSO chain (see LikelihoodModule.logL())
+
+        :param args: ordered parameter values that are being sampled
+        :param verbose: if True, makes print statements about individual likelihood components
+        :return: log likelihood of the data given the model (natural logarithm)
+        """
+        return self.likelihood_module.logL(args, verbose=verbose)
+
+    def likelihood(self, a):
+        return self.likelihood_module.logL(a)
+
+    def negativelogL(self, a):
+        """
+        for minimizer function, the negative value of the logl value is requested
+
+        :param a: array of parameters
+        :return: -logL
+        """
+        return -self.likelihood_module.logL(a)
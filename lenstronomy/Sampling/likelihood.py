@@ -6,6 +6,7 @@ from lenstronomy.Sampling.Likelihoods.position_likelihood import PositionLikelih
 from lenstronomy.Sampling.Likelihoods.flux_ratio_likelihood import FluxRatioLikelihood
 from lenstronomy.Sampling.Likelihoods.prior_likelihood import PriorLikelihood
 import lenstronomy.Util.class_creator as class_creator
+from lenstronomy.Util.profiler import StageProfiler
 import numpy as np
 
 __all__ = ['LikelihoodModule']
@@ -34,7 +35,8 @@ class LikelihoodModule(object):
                  prior_source_kde=None, prior_lens_light_kde=None, prior_ps_kde=None, prior_special_kde=None,
                  prior_extinction_kde=None, prior_lens_lognormal=None, prior_source_lognormal=None,
                  prior_extinction_lognormal=None, prior_lens_light_lognormal=None, prior_ps_lognormal=None,
-                 prior_special_lognormal=None, custom_logL_addition=None, kwargs_pixelbased=None):
+                 prior_special_lognormal=None, custom_logL_addition=None, kwargs_pixelbased=None,
+                 kwargs_matrix_free=None, num_band_threads=1, profiler=None):
         """
         initializing class
 
@@ -75,6 +77,11 @@ class LikelihoodModule(object):
          kwargs_ps, kwargs_special, kwargs_extinction) and returns a logL (punishing) value.
         :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver
          (see SLITronomy documentation)
+        :param kwargs_matrix_free: keyword arguments of the matrix-free linear solver (see ImageLinearFit)
+        :param num_band_threads: int, number of threads evaluating the imaging bands in parallel in 'multi-linear'
+         mode (see MultiDataBase). Can be combined with the process-level pools of the samplers.
+        :param profiler: StageProfiler instance measuring the wall time and number of calls of the stages of the
+         likelihood evaluation (None for no profiling)
         """
         multi_band_list, multi_band_type, time_delays_measured, time_delays_uncertainties, flux_ratios, flux_ratio_errors, ra_image_list, dec_image_list = self._unpack_data(**kwargs_data_joint)
         if len(multi_band_list) == 0:
@@ -99,13 +106,17 @@ class LikelihoodModule(object):
         self._kwargs_flux_compute = kwargs_flux_compute
         self._check_bounds = check_bounds
         self._custom_logL_addition = custom_logL_addition
+        if profiler is None:
+            profiler = StageProfiler(enabled=False)
+        self._profiler = profiler
         self._kwargs_time_delay = {'time_delays_measured': time_delays_measured,
                                    'time_delays_uncertainties': time_delays_uncertainties}
         self.kwargs_imaging = {'multi_band_list': multi_band_list, 'multi_band_type': multi_band_type,
                                 'bands_compute': bands_compute,
                                 'image_likelihood_mask_list': image_likelihood_mask_list, 'source_marg': source_marg,
                                 'linear_prior': linear_prior, 'check_positive_flux': check_positive_flux,
-                                'kwargs_pixelbased': kwargs_pixelbased, 'linear_solver': linear_solver}
+                                'kwargs_pixelbased': kwargs_pixelbased, 'linear_solver': linear_solver,
+                                'kwargs_matrix_free': kwargs_matrix_free, 'num_band_threads': num_band_threads}
         self._kwargs_position = {'astrometric_likelihood': astrometric_likelihood,
                                  'image_position_likelihood': image_position_likelihood,
                                  'source_position_likelihood': source_position_likelihood,
@@ -133,6 +144,7 @@ class LikelihoodModule(object):
         :return: updated model instances of this class
         """
 
+        self._redshift_state_current = self.param.model_redshifts(kwargs_model)
         # TODO: in case lens model or point source models are only applied on partial images, then this current class
         # has ambiguities when it comes to time-delay likelihood and flux ratio likelihood
         lens_model_class, _, _, point_source_class, _ = class_creator.create_class_instances(all_models=True,
@@ -146,6 +158,7 @@ class LikelihoodModule(object):
 
         if self._image_likelihood is True:
             self.image_likelihood = ImageLikelihood(kwargs_model=kwargs_model, **kwargs_imaging)
+            self.image_likelihood.set_profiler(self._profiler)
         self._position_likelihood = PositionLikelihood(point_source_class, **kwargs_position)
         if self._flux_ratio_likelihood is True:
             self.flux_ratio_likelihood = FluxRatioLikelihood(lens_model_class, **kwargs_flux)
@@ -164,8 +177,22 @@ class LikelihoodModule(object):
         :type verbose: boolean
         :returns: log likelihood of the data given the model (natural logarithm)
         """
+        with self._profiler.stage('logL'):
+            logL = self._logL(args, verbose=verbose)
+        self._profiler.step()
+        return logL
+
+    def _logL(self, args, verbose=False):
+        """
+        see logL()
+
+        :param args: ordered parameter values that are being sampled
+        :param verbose: if True, makes print statements about individual likelihood components
+        :returns: log likelihood of the data given the model (natural logarithm)
+        """
         # extract parameters
-        kwargs_return = self.param.args2kwargs(args)
+        with self._profiler.stage('args2kwargs'):
+            kwargs_return = self.param.args2kwargs(args)
         if self._check_bounds is True:
             penalty, bound_hit = self.check_bounds(args, self._lower_limit, self._upper_limit, verbose=verbose)
             if bound_hit is True:
@@ -198,12 +225,14 @@ class LikelihoodModule(object):
         logL = 0
 
         if self._image_likelihood is True:
-            logL_image = self.image_likelihood.logL(**kwargs_return)
+            with self._profiler.stage('ImageLikelihood.logL'):
+                logL_image = self.image_likelihood.logL(**kwargs_return)
             logL += logL_image
             if verbose is True:
                 print('image logL = %s' % logL_image)
         if self._time_delay_likelihood is True:
-            logL_time_delay = self.time_delay_likelihood.logL(kwargs_lens, kwargs_ps, kwargs_special)
+            with self._profiler.stage('TimeDelayLikelihood.logL'):
+                logL_time_delay = self.time_delay_likelihood.logL(kwargs_lens, kwargs_ps, kwargs_special)
             logL += logL_time_delay
             if verbose is True:
                 print('time-delay logL = %s' % logL_time_delay)
@@ -215,8 +244,10 @@ class LikelihoodModule(object):
             logL += logL_flux_ratios
             if verbose is True:
                 print('flux ratio logL = %s' % logL_flux_ratios)
-        logL += self._position_likelihood.logL(kwargs_lens, kwargs_ps, kwargs_special, verbose=verbose)
-        logL_prior = self._prior_likelihood.logL(**kwargs_return)
+        with self._profiler.stage('PositionLikelihood.logL'):
+            logL += self._position_likelihood.logL(kwargs_lens, kwargs_ps, kwargs_special, verbose=verbose)
+        with self._profiler.stage('PriorLikelihood.logL'):
+            logL_prior = self._prior_likelihood.logL(**kwargs_return)
         logL += logL_prior
         if verbose is True:
             print('Prior likelihood = %s' % logL_prior)
@@ -266,6 +297,14 @@ class LikelihoodModule(object):
     def param_limits(self):
         return self._lower_limit, self._upper_limit
 
+    @property
+    def profiler(self):
+        """
+
+        :return: StageProfiler instance measuring the stages of the likelihood evaluation
+        """
+        return self._profiler
+
     def effective_num_data_points(self, **kwargs):
         """
         returns the effective number of data points considered in the X2 estimation to compute the reduced X2 value
@@ -326,7 +365,9 @@ class LikelihoodModule(object):
         :return: None, all class instances updated to recent modek
         """
         kwargs_model, update_bool = self.param.update_kwargs_model(kwargs_special)
-        if update_bool is True:
+        if update_bool is True and self.param.model_redshifts(kwargs_model) != self._redshift_state_current:
+            # the numerics of the imaging likelihood can be shared between the re-created instances with
+            # class_creator.set_cache()
             self._class_instances(kwargs_model=kwargs_model, kwargs_imaging=self.kwargs_imaging,
                                   kwargs_position=self._kwargs_position, kwargs_flux=self._kwargs_flux,
                                   kwargs_time_delay=self._kwargs_time_delay)
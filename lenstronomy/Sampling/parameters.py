@@ -212,6 +212,7 @@ class Param(object):
         self._num_z_sampling, self._lens_redshift_sampling_indexes, self._source_redshift_sampling_indexes = num_z_sampling, lens_redshift_sampling_indexes, source_redshift_sampling_indexes
 
         self._lens_model_class, self._source_model_class, _, _, _ = class_creator.create_class_instances(all_models=True, **kwargs_model)
+        self._redshift_state = self.model_redshifts(kwargs_model)
         self._image2SourceMapping = Image2SourceMapping(lensModel=self._lens_model_class,
                                                         sourceModel=self._source_model_class)
 
@@ -678,18 +679,37 @@ class Param(object):
         kwargs_model['source_redshift_list'] = source_redshift_list
         return kwargs_model, True
 
+    @staticmethod
+    def model_redshifts(kwargs_model):
+        """
+        redshifts of the model that are updated when sampling redshifts (see update_kwargs_model())
+
+        :param kwargs_model: keyword arguments to describe all model components
+        :return: tuple of the lens and source redshifts (tuples or None)
+        """
+        lens_redshift_list = kwargs_model.get('lens_redshift_list', None)
+        source_redshift_list = kwargs_model.get('source_redshift_list', None)
+        if lens_redshift_list is not None:
+            lens_redshift_list = tuple(lens_redshift_list)
+        if source_redshift_list is not None:
+            source_redshift_list = tuple(source_redshift_list)
+        return lens_redshift_list, source_redshift_list
+
     def _update_lens_model(self, kwargs_special):
         """
         updates lens model instance of this class (and all class instances related to it) when an update to the
-        modeled redshifts of the deflector and/or source planes are made
+        modeled redshifts of the deflector and/or source planes are made. The instances are only re-created when the
+        redshifts differ from the ones of the current instances (e.g. not when the same arguments are converted again).
 
         :param kwargs_special: keyword arguments from SpecialParam() class return of sampling arguments
         :return: None, internal calls instance updated
         """
         kwargs_model, update_bool = self.update_kwargs_model(kwargs_special)
         if update_bool is True:
-            # TODO: this class instances are effectively duplicated in the likelihood module and may cause a lot of overhead
-            # in the calculation as the instances are re-generated every step, and even so doing it twice!
+            redshift_state = self.model_redshifts(kwargs_model)
+            if redshift_state == self._redshift_state:
+                return
+            self._redshift_state = redshift_state
             self._lens_model_class, self._source_model_class, _, _, _ = class_creator.create_class_instances(
                 all_models=True, **kwargs_model)
             self._image2SourceMapping = Image2SourceMapping(lensModel=self._lens_model_class,
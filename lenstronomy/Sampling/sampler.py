@@ -116,6 +116,7 @@ class Sampler(object):
             time_end = time.time()
             print(time_end - time_start, 'time used for ', print_key)
             print('===================')
+        _close_pool(pool, self.chain.profiler)
         return result, [log_likelihood_list, pos_list, vel_list]
 
     def mcmc_emcee(self, n_walkers, n_run, n_burn, mean_start, sigma_start,
@@ -190,6 +191,7 @@ class Sampler(object):
             print('Sampling iterations (in current run):', n_run_eff)
             time_end = time.time()
             print(time_end - time_start, 'time taken for MCMC sampling')
+        _close_pool(pool, self.chain.profiler)
         return flat_samples, dist
 
     def mcmc_zeus(self, n_walkers, n_run, n_burn, mean_start, sigma_start,
@@ -307,5 +309,51 @@ class Sampler(object):
         flat_samples = sampler.get_chain(flat=True, thin=1, discard=n_burn)
 
         dist = sampler.get_log_prob(flat=True, thin=1, discard=n_burn)
-
+        _close_pool(pool, self.chain.profiler)
         return flat_samples, dist
+
+
+def _close_pool(pool, profiler=None):
+    """
+    writes the profile counters of the worker processes into the directory of the profiler (before they are aggregated
+    by StageProfiler.collect()) and closes a multiprocessing pool. MPI pools are kept open as their worker ranks exit
+    when the pool is closed.
+
+    :param pool: pool instance returned by choose_pool()
+    :param profiler: StageProfiler instance of the likelihood evaluated by the pool (optional)
+    :return: None
+    """
+    from lenstronomy.Sampling.Pool.multiprocessing import MultiPool
+    from schwimmbad.mpi import MPIPool
+    if profiler is not None and profiler.enabled is True:
+        if isinstance(pool, MultiPool):
+            # each worker process blocks at the barrier after its flush, such that every worker runs exactly one task
+            import multiprocess
+            manager = multiprocess.Manager()
+            try:
+                barrier = manager.Barrier(pool.size)
+                pool.map(_flush_profiler, [(profiler, barrier)] * pool.size, chunksize=1)
+            finally:
+                manager.shutdown()
+        elif isinstance(pool, MPIPool) and pool.is_master():
+            # the task is sent to each worker rank explicitly, following the protocol of MPIPool.wait()
+            for worker in pool.workers:
+                pool.comm.send((_flush_profiler, (profiler, None)), dest=worker, tag=0)
+            for worker in pool.workers:
+                pool.comm.recv(source=worker, tag=0)
+    if isinstance(pool, MultiPool):
+        pool.close()
+        pool.join()
+
+
+def _flush_profiler(args):
+    """
+    writes the counters of the current worker process into the directory of the profiler
+
+    :param args: tuple of the StageProfiler instance and a barrier shared by the workers (or None)
+    :return: None
+    """
+    profiler, barrier = args
+    profiler.flush()
+    if barrier is not None:
+        barrier.wait()
@@ -0,0 +1,242 @@
+from lenstronomy.SimulationAPI.sim_api import SimAPI
+
+import numpy as np
+
+__all__ = ['BatchSimAPI']
+
+_model_keys = ['kwargs_lens', 'kwargs_source', 'kwargs_lens_light', 'kwargs_ps']
+_magnitude_keys = ['kwargs_lens_light_mag', 'kwargs_source_mag', 'kwargs_ps_mag']
+
+# simulator of the worker processes of a pool
+_worker_simulator = None
+
+
+class BatchSimAPI(SimAPI):
+    """
+    simulation of large sets of lens systems sharing the same band configuration (pixel grid, PSF, noise properties,
+    numerics and model choices).
+    The ImageModel instance, including the numerics grid and the convolution, is set up once and re-used for all the
+    systems.
+
+    The parameters of the systems are given as columnar tables: a dictionary with the keys 'kwargs_lens',
+    'kwargs_source', 'kwargs_lens_light' and 'kwargs_ps' (and/or 'kwargs_lens_light_mag', 'kwargs_source_mag',
+    'kwargs_ps_mag' with 'magnitude' in place of the 'amp' parameters, see SimAPI.magnitude2amplitude()), each a list of
+    keyword arguments (one per model component) with arrays (or lists) of length num_systems as values.
+    Scalar values are used for all the systems. Parameters which are arrays for a single system (e.g. 'ra_image' of a
+    point source) are given as 2d arrays or lists with one entry per system.
+
+    Example:
+
+    >>> sim = BatchSimAPI(numpix=64, kwargs_single_band=kwargs_band, kwargs_model={'lens_model_list': ['SIE'],
+    >>>                   'source_light_model_list': ['SERSIC']})
+    >>> kwargs_table = {'kwargs_lens': [{'theta_E': np.random.uniform(0.8, 1.2, 1000), 'e1': 0, 'e2': 0,
+    >>>                                  'center_x': 0, 'center_y': 0}],
+    >>>                 'kwargs_source_mag': [{'magnitude': np.random.uniform(20, 22, 1000), 'R_sersic': 0.2,
+    >>>                                        'n_sersic': 1, 'center_x': 0, 'center_y': 0}]}
+    >>> sim.simulate_to_file(kwargs_table, 'images.npy', chunk_size=100, seed=42)
+    """
+    def __init__(self, numpix, kwargs_single_band, kwargs_model, kwargs_numerics=None):
+        """
+
+        :param numpix: number of pixels per axis
+        :param kwargs_single_band: keyword arguments specifying the class instance of DataAPI
+        :param kwargs_model: keyword arguments specifying the class instance of ModelAPI
+        :param kwargs_numerics: keyword arguments of the Numerics module
+        """
+        SimAPI.__init__(self, numpix, kwargs_single_band, kwargs_model)
+        self._image_model = self.image_model_class(kwargs_numerics=kwargs_numerics)
+
+    @staticmethod
+    def num_systems(kwargs_table):
+        """
+
+        :param kwargs_table: columnar table of the parameters of the systems
+        :return: number of systems in the table
+        """
+        num = None
+        for key, kwargs_list in kwargs_table.items():
+            if key not in _model_keys + _magnitude_keys:
+                raise ValueError('key %s in kwargs_table is not supported. Options are %s.'
+                                 % (key, _model_keys + _magnitude_keys))
+            for kwargs in kwargs_list:
+                for name, value in kwargs.items():
+                    if np.ndim(value) == 0:
+                        continue
+                    if num is None:
+                        num = len(value)
+                    elif len(value) != num:
+                        raise ValueError('parameter %s in %s has %s entries while other parameters have %s.'
+                                         % (name, key, len(value), num))
+        if num is None:
+            raise ValueError('kwargs_table needs at least one parameter with one entry per system.')
+        return num
+
+    @staticmethod
+    def kwargs_slice(kwargs_table, start, stop):
+        """
+
+        :param kwargs_table: columnar table of the parameters of the systems
+        :param start: index of the first system
+        :param stop: index after the last system
+        :return: columnar table of the systems start to stop
+        """
+        kwargs_table_slice = {}
+        for key, kwargs_list in kwargs_table.items():
+            kwargs_table_slice[key] = [{name: value if np.ndim(value) == 0 else value[start:stop]
+                                        for name, value in kwargs.items()} for kwargs in kwargs_list]
+        return kwargs_table_slice
+
+    def kwargs_system(self, kwargs_table, i):
+        """
+        keyword arguments of a single system, with the magnitudes converted into amplitudes
+
+        :param kwargs_table: columnar table of the parameters of the systems
+        :param i: index of the system
+        :return: keyword arguments of ImageModel.image() (kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps)
+        """
+        kwargs = {}
+        for key, kwargs_list in kwargs_table.items():
+            kwargs[key] = [{name: value if np.ndim(value) == 0 else value[i] for name, value in kwargs_component.items()}
+                           for kwargs_component in kwargs_list]
+        if any(key in kwargs for key in _magnitude_keys):
+            kwargs_lens_light, kwargs_source, kwargs_ps = self.magnitude2amplitude(
+                kwargs_lens_light_mag=kwargs.pop('kwargs_lens_light_mag', None),
+                kwargs_source_mag=kwargs.pop('kwargs_source_mag', None),
+                kwargs_ps_mag=kwargs.pop('kwargs_ps_mag', None))
+            for key, kwargs_list in zip(['kwargs_lens_light', 'kwargs_source', 'kwargs_ps'],
+                                        [kwargs_lens_light, kwargs_source, kwargs_ps]):
+                if kwargs_list is not None:
+                    if key in kwargs:
+                        raise ValueError('%s and %s_mag can not be both specified.' % (key, key))
+                    kwargs[key] = kwargs_list
+        return {key: kwargs.get(key, None) for key in _model_keys}
+
+    def simulate(self, kwargs_table, seed=None, chunk_index=0, add_noise=True):
+        """
+        simulates the images of all the systems of a table
+
+        :param kwargs_table: columnar table of the parameters of the systems
+        :param seed: int, seed of the noise realizations. If None, uses fresh entropy
+        :param chunk_index: int, index of the chunk in a larger simulation, combined with the seed to obtain independent
+         random numbers for each chunk
+        :param add_noise: bool, if True, adds noise realizations (see SingleBand.noise_for_model()) to the images
+        :return: images (with noise), noise-free images; both arrays of shape (num_systems, numpix, numpix)
+        """
+        num = self.num_systems(kwargs_table)
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(chunk_index,)))
+        seed_list = rng.integers(0, 2 ** 31 - 1, size=num)
+        models = np.zeros((num, self.numpix, self.numpix))
+        images = np.zeros((num, self.numpix, self.numpix))
+        for i in range(num):
+            models[i] = self._image_model.image(**self.kwargs_system(kwargs_table, i))
+            images[i] = models[i]
+            if add_noise is True:
+                images[i] += self.noise_for_model(models[i], seed=int(seed_list[i]))
+        return images, models
+
+    def simulate_chunks(self, kwargs_table, chunk_size=1000, seed=None, add_noise=True, num_processes=1):
+        """
+        generator of the simulated images in chunks of systems
+
+        :param kwargs_table: columnar table of the parameters of the systems
+        :param chunk_size: number of systems per chunk
+        :param seed: int, seed of the noise realizations. The random numbers of each chunk are derived from the seed and
+         the index of the chunk, such that the simulations are reproducible for a given seed and chunk_size,
+         independent of the number of processes.
+        :param add_noise: bool, if True, adds noise realizations to the images
+        :param num_processes: number of processes simulating the chunks in parallel
+        :return: generator of (index of the first system, images, noise-free images) in the order of the chunks
+        """
+        num = self.num_systems(kwargs_table)
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
+        task_list = [(self.kwargs_slice(kwargs_table, start, min(start + chunk_size, num)), seed, k, add_noise)
+                     for k, start in enumerate(range(0, num, chunk_size))]
+        if num_processes > 1:
+            from lenstronomy.Sampling.Pool.multiprocessing import MultiPool
+            pool = MultiPool(processes=num_processes, initializer=_init_worker, initargs=(self,))
+            try:
+                for k, (images, models) in enumerate(pool.imap(_simulate_worker, task_list)):
+                    yield k * chunk_size, images, models
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            for k, (kwargs_chunk, seed, chunk_index, add_noise) in enumerate(task_list):
+                images, models = self.simulate(kwargs_chunk, seed=seed, chunk_index=chunk_index, add_noise=add_noise)
+                yield k * chunk_size, images, models
+
+    def simulate_to_file(self, kwargs_table, filename, chunk_size=1000, seed=None, add_noise=True, num_processes=1,
+                         save_model=False):
+        """
+        simulates the images of all the systems and writes them chunk by chunk into a file, such that the images of
+        all the systems do not need to be held in memory.
+
+        :param kwargs_table: columnar table of the parameters of the systems
+        :param filename: path of the output file. Files ending with '.h5' or '.hdf5' are written with h5py (datasets
+         'image' and optionally 'model', the seed is stored as attribute), all other files as memory-mapped .npy file
+         (the noise-free images optionally in a second file with suffix '_model.npy').
+        :param chunk_size: number of systems per chunk
+        :param seed: int, seed of the noise realizations (see simulate_chunks()). If None, uses fresh entropy
+        :param add_noise: bool, if True, adds noise realizations to the images
+        :param num_processes: number of processes simulating the chunks in parallel
+        :param save_model: bool, if True, also stores the noise-free images
+        :return: seed of the noise realizations
+        """
+        num = self.num_systems(kwargs_table)
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
+        shape = (num, self.numpix, self.numpix)
+        if filename.endswith('.h5') or filename.endswith('.hdf5'):
+            try:
+                import h5py
+            except ImportError:
+                raise ImportError('h5py is required to write HDF5 files. You can get it with $pip install h5py.')
+            f = h5py.File(filename, 'w')
+            f.attrs['seed'] = str(seed)
+            store_image = f.create_dataset('image', shape=shape, dtype=float)
+            store_model = f.create_dataset('model', shape=shape, dtype=float) if save_model is True else None
+        else:
+            f = None
+            store_image = np.lib.format.open_memmap(filename, mode='w+', dtype=float, shape=shape)
+            store_model = None
+            if save_model is True:
+                filename_model = filename[:-4] if filename.endswith('.npy') else filename
+                store_model = np.lib.format.open_memmap(filename_model + '_model.npy', mode='w+', dtype=float,
+                                                        shape=shape)
+        try:
+            for start, images, models in self.simulate_chunks(kwargs_table, chunk_size=chunk_size, seed=seed,
+                                                              add_noise=add_noise, num_processes=num_processes):
+                store_image[start:start + len(images)] = images
+                if store_model is not None:
+                    store_model[start:start + len(models)] = models
+        finally:
+            if f is not None:
+                f.close()
+            else:
+                store_image.flush()
+                if store_model is not None:
+                    store_model.flush()
+        return seed
+
+
+def _init_worker(simulator):
+    """
+    sets the simulator of a worker process
+
+    :param simulator: BatchSimAPI instance
+    :return: None
+    """
+    global _worker_simulator
+    _worker_simulator = simulator
+
+
+def _simulate_worker(task):
+    """
+    simulates a chunk in a worker process
+
+    :param task: tuple of (kwargs_table, seed, chunk_index, add_noise)
+    :return: images, noise-free images
+    """
+    kwargs_table, seed, chunk_index, add_noise = task
+    return _worker_simulator.simulate(kwargs_table, seed=seed, chunk_index=chunk_index, add_noise=add_noise)
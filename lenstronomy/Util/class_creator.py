@@ -1,14 +1,129 @@
 from lenstronomy.Data.imaging_data import ImageData
 from lenstronomy.Data.psf import PSF
+from lenstronomy.Data.pixel_grid import PixelGrid
 from lenstronomy.LensModel.lens_model import LensModel
 from lenstronomy.LightModel.light_model import LightModel
 from lenstronomy.PointSource.point_source import PointSource
 from lenstronomy.ImSim.differential_extinction import DifferentialExtinction
 from lenstronomy.ImSim.image_linear_solve import ImageLinearFit
+from lenstronomy.ImSim.Numerics.numerics_subframe import NumericsSubFrame
+import hashlib
+import collections
+import numpy as np
 
 from lenstronomy.Util.package_util import exporter
 export, __all__ = exporter()
 
+# memoized numerics of the image models, see set_cache()
+_cache = collections.OrderedDict()
+_cache_settings = {'enabled': False, 'max_size': 128, 'hits': 0, 'misses': 0}
+
+
+@export
+def set_cache(enabled=True, max_size=128):
+    """
+    enables (or disables) the memoization of the numerics (coordinate grids, super-sampling and convolution kernels
+    and their Fourier transforms) of the image models created by create_image_model() and create_im_sim().
+    When enabled, image models of the same pixel grid, PSF and numerics settings share one NumericsSubFrame() instance,
+    e.g. when post-processing or plotting many chains of the same data set or when re-creating the imaging likelihood
+    with sampled redshifts. The numerics are not changed after their construction (update_psf() creates new ones), all
+    other class instances (data, PSF, lens, light and point source models) are created for every call.
+    Use clear_cache() to delete the memoized instances.
+
+    :param enabled: bool, whether the numerics are memoized
+    :param max_size: int, maximum number of memoized numerics (the least recently used ones are dropped first)
+    :return: None
+    """
+    _cache_settings['enabled'] = enabled
+    _cache_settings['max_size'] = max_size
+    if enabled is False:
+        clear_cache()
+    else:
+        _trim_cache()
+
+
+@export
+def clear_cache():
+    """
+    deletes all memoized numerics and resets the statistics of the cache
+
+    :return: None
+    """
+    _cache.clear()
+    _cache_settings['hits'] = 0
+    _cache_settings['misses'] = 0
+
+
+@export
+def cache_info():
+    """
+
+    :return: dictionary with the settings ('enabled', 'max_size') and the statistics ('hits', 'misses', 'size') of
+     the cache of numerics
+    """
+    info = dict(_cache_settings)
+    info['size'] = len(_cache)
+    return info
+
+
+def _trim_cache():
+    while len(_cache) > _cache_settings['max_size']:
+        _cache.popitem(last=False)
+
+
+def _canonical_key(obj):
+    """
+    hashable representation of (nested) settings. Numpy arrays are represented by their shape, type and a hash of
+    their content (only applied to the PSF kernels and the masks of the numerics, not to the data).
+
+    :param obj: argument
+    :return: hashable key
+    """
+    if isinstance(obj, dict):
+        return ('dict',) + tuple(sorted((key, _canonical_key(value)) for key, value in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return (type(obj).__name__,) + tuple(_canonical_key(value) for value in obj)
+    if isinstance(obj, np.ndarray):
+        return ('ndarray', obj.shape, obj.dtype.str, hashlib.sha1(np.ascontiguousarray(obj).tobytes()).hexdigest())
+    return obj
+
+
+@export
+def create_image_numerics(data_class, psf_class, kwargs_psf, kwargs_numerics):
+    """
+    NumericsSubFrame() instance of an image model, memoized by the pixel grid, the PSF and the numerics settings if
+    the cache is enabled (see set_cache()).
+
+    :param data_class: ImageData() instance, only its pixel grid enters the numerics
+    :param psf_class: PSF() instance constructed from kwargs_psf
+    :param kwargs_psf: PSF keyword arguments
+    :param kwargs_numerics: numerics keyword arguments for Numerics() class
+    :return: NumericsSubFrame() instance
+    """
+    if kwargs_numerics is None:
+        kwargs_numerics = {}
+    psf_class.set_pixel_size(data_class.pixel_width)
+    if _cache_settings['enabled'] is False:
+        return NumericsSubFrame(pixel_grid=data_class, psf=psf_class, **kwargs_numerics)
+    nx, ny = data_class.num_pixel_axes
+    transform_pix2angle = np.array(data_class.transform_pix2angle, dtype=float)
+    ra_at_xy_0, dec_at_xy_0 = data_class.radec_at_xy_0
+    key = (nx, ny, _canonical_key(transform_pix2angle), float(ra_at_xy_0), float(dec_at_xy_0),
+           _canonical_key(kwargs_psf), _canonical_key(kwargs_numerics))
+    if key in _cache:
+        _cache_settings['hits'] += 1
+        _cache.move_to_end(key)
+        return _cache[key]
+    _cache_settings['misses'] += 1
+    # the memoized numerics hold their own pixel grid and PSF instances, which are not exposed to the callers
+    pixel_grid = PixelGrid(nx, ny, transform_pix2angle, ra_at_xy_0, dec_at_xy_0)
+    psf_numerics = PSF(**kwargs_psf)
+    psf_numerics.set_pixel_size(pixel_grid.pixel_width)
+    image_numerics = NumericsSubFrame(pixel_grid=pixel_grid, psf=psf_numerics, **kwargs_numerics)
+    _cache[key] = image_numerics
+    _trim_cache()
+    return image_numerics
+
 
 @export
 def create_class_instances(lens_model_list=None, z_lens=None, z_source=None, z_source_convention=None,
@@ -33,7 +148,8 @@ def create_class_instances(lens_model_list=None, z_lens=None, z_source=None, z_s
     :param lens_redshift_list:
     :param multi_plane:
     :param kwargs_interp: interpolation keyword arguments specifying the numerics.
-     See description in the Interpolate() class. Only applicable for 'INTERPOL' and 'INTERPOL_SCALED' models.
+     See description in the Interpolate() class. Only applicable for 'INTERPOL' and 'INTERPOL_SCALED' models,
+     except for the key 'use_table' which sets the radial tables of the 'GNFW' and 'ULDM' models (fixed slopes only).
     :param observed_convention_index:
     :param source_light_model_list:
     :param lens_light_model_list:
@@ -169,15 +285,18 @@ def create_image_model(kwargs_data, kwargs_psf, kwargs_numerics, kwargs_model, i
     """
     data_class = ImageData(**kwargs_data)
     psf_class = PSF(**kwargs_psf)
+    image_numerics_class = create_image_numerics(data_class, psf_class, kwargs_psf, kwargs_numerics)
     lens_model_class, source_model_class, lens_light_model_class, point_source_class, extinction_class = create_class_instances(**kwargs_model)
     imageModel = ImageLinearFit(data_class, psf_class, lens_model_class, source_model_class, lens_light_model_class,
-                                point_source_class, extinction_class, kwargs_numerics, likelihood_mask=image_likelihood_mask)
+                                point_source_class, extinction_class, kwargs_numerics, likelihood_mask=image_likelihood_mask,
+                                image_numerics_class=image_numerics_class)
     return imageModel
 
 
 @export
 def create_im_sim(multi_band_list, multi_band_type, kwargs_model, bands_compute=None, image_likelihood_mask_list=None,
-                  band_index=0, kwargs_pixelbased=None, linear_solver=True):
+                  band_index=0, kwargs_pixelbased=None, linear_solver=True, kwargs_matrix_free=None,
+                  num_band_threads=1):
     """
 
 
@@ -194,16 +313,25 @@ def create_im_sim(multi_band_list, multi_band_type, kwargs_model, bands_compute=
     :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver (see SLITronomy documentation)
     :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
      that they get overwritten by the linear solver solution.
+    :param kwargs_matrix_free: keyword arguments of the matrix-free linear solver (see ImageLinearFit), only supported
+     in 'single-band' and 'multi-linear' mode
+    :param num_band_threads: int, number of threads evaluating the bands in parallel, only supported in
+     'multi-linear' mode (see MultiDataBase)
     :return: MultiBand class instance
     """
     if linear_solver is False and multi_band_type not in ['single-band', 'multi-linear']:
         raise ValueError('setting "linear_solver" to False is only supported in "single-band" mode '
                          'or if "multi-linear" model has only one band.')
+    if kwargs_matrix_free is not None and multi_band_type not in ['single-band', 'multi-linear']:
+        raise ValueError('matrix-free linear solver is only supported in "single-band" and "multi-linear" mode.')
+    if num_band_threads > 1 and multi_band_type != 'multi-linear':
+        raise ValueError('parallel evaluation of the bands is only supported in "multi-linear" mode.')
 
     if multi_band_type == 'multi-linear':
         from lenstronomy.ImSim.MultiBand.multi_linear import MultiLinear
         multiband = MultiLinear(multi_band_list, kwargs_model, compute_bool=bands_compute,
-                                likelihood_mask_list=image_likelihood_mask_list, linear_solver=linear_solver)
+                                likelihood_mask_list=image_likelihood_mask_list, linear_solver=linear_solver,
+                                kwargs_matrix_free=kwargs_matrix_free, num_band_threads=num_band_threads)
     elif multi_band_type == 'joint-linear':
         from lenstronomy.ImSim.MultiBand.joint_linear import JointLinear
         multiband = JointLinear(multi_band_list, kwargs_model, compute_bool=bands_compute,
@@ -212,7 +340,7 @@ def create_im_sim(multi_band_list, multi_band_type, kwargs_model, bands_compute=
         from lenstronomy.ImSim.MultiBand.single_band_multi_model import SingleBandMultiModel
         multiband = SingleBandMultiModel(multi_band_list, kwargs_model, likelihood_mask_list=image_likelihood_mask_list,
                                          band_index=band_index, kwargs_pixelbased=kwargs_pixelbased,
-                                         linear_solver=linear_solver)
+                                         linear_solver=linear_solver, kwargs_matrix_free=kwargs_matrix_free)
     else:
         raise ValueError("type %s is not supported!" % multi_band_type)
     return multiband
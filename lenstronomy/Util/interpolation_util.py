@@ -0,0 +1,57 @@
+"""
+interpolation routines of tabulated functions on uniform grids
+"""
+import numpy as np
+from lenstronomy.Util.numba_util import jit, numba_enabled
+
+from lenstronomy.Util.package_util import exporter
+export, __all__ = exporter()
+
+
+@export
+def cubic_interpolation(x_eval, x_0, step, values, log_values=False):
+    """
+    cubic 4-point Lagrange interpolation on a uniform grid (compiled if numba is enabled)
+
+    :param x_eval: 1d array of the coordinates at which the function is interpolated (within the grid)
+    :param x_0: first point of the grid
+    :param step: step of the grid
+    :param values: values (or log of the values) on the grid, at least 4 points along the first axis. Further axes
+     (e.g. the second axis of a 2d table) are interpolated simultaneously along the first axis.
+    :param log_values: bool, if True, values are the log of the function and the exponential is returned
+    :return: interpolated function, of shape (len(x_eval),) + values.shape[1:]
+    """
+    if numba_enabled and np.ndim(values) == 1:
+        return _interpolate_numba(x_eval, x_0, step, values, log_values)
+    u = (np.asarray(x_eval, dtype=float) - x_0) / step
+    k = np.clip(np.floor(u).astype(int) - 1, 0, len(values) - 4)
+    # position relative to the second point of the stencil, broadcast along the further axes of values
+    t = (u - k - 1).reshape(np.shape(u) + (1,) * (np.ndim(values) - 1))
+    f = (- t * (t - 1) * (t - 2) / 6. * values[k] + (t + 1) * (t - 1) * (t - 2) / 2. * values[k + 1]
+         - (t + 1) * t * (t - 2) / 2. * values[k + 2] + (t + 1) * t * (t - 1) / 6. * values[k + 3])
+    if log_values:
+        return np.exp(f)
+    return f
+
+
+@jit()
+def _interpolate_numba(x_eval, x_0, step, values, log_values):
+    """
+    compiled version of cubic_interpolation()
+
+    :param x_eval: 1d array of the coordinates at which the function is interpolated
+    :param x_0: first point of the grid
+    :param step: step of the grid
+    :param values: values (or log of the values) on the grid
+    :param log_values: bool, if True, values are the log of the function
+    :return: interpolated function
+    """
+    f = np.empty(len(x_eval))
+    for i in range(len(x_eval)):
+        u = (x_eval[i] - x_0) / step
+        k = min(max(int(np.floor(u)) - 1, 0), len(values) - 4)
+        t = u - k - 1
+        f_i = (- t * (t - 1) * (t - 2) / 6. * values[k] + (t + 1) * (t - 1) * (t - 2) / 2. * values[k + 1]
+               - (t + 1) * t * (t - 2) / 2. * values[k + 2] + (t + 1) * t * (t - 1) / 6. * values[k + 3])
+        f[i] = np.exp(f_i) if log_values else f_i
+    return f
@@ -48,6 +48,33 @@ def de_shift_kernel(kernel, shift_x, shift_y, iterations=20, fractional_step_siz
     return kernel_new[1:-1, 1:-1]
 
 
+@export
+def de_shift_kernel_fourier(kernel, shift_x, shift_y):
+    """
+    de-shifts a shifted kernel to the center of a pixel with a phase ramp in Fourier space (same convention as
+    de_shift_kernel()). The shift is exact for band-limited kernels (sampled at or above the Nyquist rate), for kernels
+    with significant power above the Nyquist frequency, the shift introduces ringing.
+
+    The kernel is padded with the mean of its corner pixels (as the background level) to avoid wrapping of the light
+    across the edges.
+
+    :param kernel: (shifted) kernel, e.g. a star in an image that is not centered in the pixel grid
+    :param shift_x: x-offset relative to the center of the pixel (sub-pixel shift)
+    :param shift_y: y-offset relative to the center of the pixel (sub-pixel shift)
+    :return: de-shifted kernel
+    """
+    kernel = np.array(kernel, dtype=float)
+    background = (kernel[0, 0] + kernel[0, -1] + kernel[-1, 0] + kernel[-1, -1]) / 4.
+    num_pad = int(np.ceil(max(abs(shift_x), abs(shift_y)))) + 1
+    kernel_pad = np.pad(kernel - background, num_pad)
+    ny, nx = np.shape(kernel_pad)
+    k_y = np.fft.fftfreq(ny)[:, np.newaxis]
+    k_x = np.fft.fftfreq(nx)[np.newaxis, :]
+    phase = np.exp(-2j * np.pi * (k_y * shift_y + k_x * shift_x))
+    kernel_shifted = np.real(np.fft.ifft2(np.fft.fft2(kernel_pad) * phase))
+    return kernel_shifted[num_pad:-num_pad, num_pad:-num_pad] + background
+
+
 @export
 def center_kernel(kernel, iterations=20):
     """
@@ -151,6 +178,45 @@ def subgrid_kernel(kernel, subgrid_res, odd=False, num_iter=100):
     return kernel_norm(kernel_subgrid - delta_kernel_sub)
 
 
+@export
+def subgrid_kernel_fourier(kernel, subgrid_res, odd=False):
+    """
+    creates a higher resolution kernel with subgrid resolution from the band-limited (Fourier) interpolation of the
+    original kernel (alternative to subgrid_kernel() without iterations).
+    The pixel response is de-convolved in Fourier space, such that the average of the subgrid pixels within an
+    original pixel reproduces the original kernel (exactly, if the output size is not reduced with odd=True).
+    Kernels with significant power above the Nyquist frequency show ringing (including negative values) in the
+    supersampled kernel.
+
+    :param kernel: initial kernel
+    :type kernel: 2d numpy array with square odd size
+    :param subgrid_res: subgrid resolution required
+    :type subgrid_res: integer
+    :param odd: forces odd axis size return (-1 in size if even)
+    :type odd: boolean
+    :return: kernel with higher resolution (larger)
+    :rtype: 2d numpy array with n x subgrid size (-1 if result is even and odd=True)
+    """
+    subgrid_res = int(subgrid_res)
+    if subgrid_res == 1:
+        return kernel
+    kernel = np.array(kernel, dtype=float)
+    matrix_list = []
+    for n in np.shape(kernel):
+        n_new = n * subgrid_res
+        if odd is True and n_new % 2 == 0:
+            n_new -= 1
+        # frequencies (cycles per pixel) and transfer function of the averaging over subgrid_res subgrid pixels
+        k = np.fft.fftfreq(n)
+        transfer = np.sinc(k) / np.sinc(k / subgrid_res)
+        # centers of the subgrid pixels in units of the original pixels, aligned at the center of the kernel
+        x_out = (n - 1) / 2. + (np.arange(n_new) - (n_new - 1) / 2.) / subgrid_res
+        matrix_list.append(np.exp(2j * np.pi * x_out[:, np.newaxis] * k[np.newaxis, :]) / (n * transfer))
+    matrix_y, matrix_x = matrix_list
+    kernel_subgrid = np.real(matrix_y.dot(np.fft.fft2(kernel)).dot(matrix_x.T))
+    return kernel_norm(kernel_subgrid)
+
+
 @export
 def kernel_pixelsize_change(kernel, deltaPix_in, deltaPix_out):
     """
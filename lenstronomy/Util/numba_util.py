@@ -1,5 +1,6 @@
 import numpy as np
 from lenstronomy.Conf import config_loader
+import os
 from os import environ
 
 """
@@ -18,15 +19,36 @@ parallel = numba_conf['parallel']
 numba_enabled = numba_conf['enable'] and not environ.get("NUMBA_DISABLE_JIT", False)
 fastmath = numba_conf['fastmath']
 error_model = numba_conf['error_model']
+cache_dir = numba_conf.get('cache_dir', None)
 
 if numba_enabled:
+    if cache_dir is not None and not environ.get("NUMBA_CACHE_DIR", False):
+        # needs to be set before numba is imported
+        environ["NUMBA_CACHE_DIR"] = os.path.expanduser(cache_dir)
     try:
         import numba
     except ImportError:
         numba_enabled = False
         numba = None
 
-__all__ = ['jit', 'generated_jit', 'nan_to_num', 'nan_to_num_arr', 'nan_to_num_single']
+# loop range of the kernels which is parallelized when numba compiles with parallel=True
+prange = numba.prange if numba_enabled else range
+
+__all__ = ['jit', 'generated_jit', 'prange', 'set_cache_dir', 'nan_to_num', 'nan_to_num_arr', 'nan_to_num_single']
+
+
+def set_cache_dir(directory):
+    """
+    sets the directory in which numba stores the compiled kernels (equivalent to setting NUMBA_CACHE_DIR).
+    Only applies to the kernels of the modules imported after this call.
+
+    :param directory: path of the cache directory
+    :return: None
+    """
+    directory = os.path.expanduser(directory)
+    environ["NUMBA_CACHE_DIR"] = directory
+    if numba_enabled:
+        numba.config.CACHE_DIR = directory
 
 
 def jit(nopython=nopython, cache=cache, parallel=parallel, fastmath=fastmath, error_model=error_model, inline='never'):
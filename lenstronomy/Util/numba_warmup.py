@@ -0,0 +1,183 @@
+"""
+ahead-of-time compilation ("warm-up") of the numba kernels of lenstronomy.
+
+The numba kernels are compiled at their first call in every process, which can take several seconds per process.
+Calling warmup() triggers the compilation of the registered kernels for their common signatures (float64 scalars and
+arrays) and, with numba caching enabled (see conf_default.yaml), stores them in the cache directory.
+Processes started afterwards (e.g. the workers of a pool or MPI ranks) load the compiled kernels from the cache.
+Setting a cache directory shared among the processes (config option 'cache_dir' or the NUMBA_CACHE_DIR environment
+variable) allows to compile the kernels once per environment.
+
+From the command line:
+
+    $ lenstronomy-warmup --cache-dir /path/to/shared/cache
+
+or equivalently
+
+    $ python -m lenstronomy.Util.numba_warmup --cache-dir /path/to/shared/cache
+
+The kernel modules are only imported within the warm-up definitions, such that the cache directory can be set before.
+"""
+
+import os
+import time
+import argparse
+import numpy as np
+
+__all__ = ['register', 'kernel_list', 'warmup', 'main']
+
+_warmup_registry = {}
+
+
+def register(name):
+    """
+    decorator to register a definition (without arguments) calling numba kernels with the common signatures
+
+    :param name: string, name of the kernel (group)
+    :return: decorator
+    """
+    def wrapper(func):
+        _warmup_registry[name] = func
+        return func
+    return wrapper
+
+
+def kernel_list():
+    """
+
+    :return: list of names of the registered kernels
+    """
+    return list(_warmup_registry.keys())
+
+
+def warmup(kernels=None, verbose=False):
+    """
+    compiles (or loads from the cache) the registered numba kernels
+
+    :param kernels: list of names of the kernels to be compiled (see kernel_list()). If None, compiles all
+    :param verbose: bool, if True, prints the time of the first call of each kernel in this process
+    :return: dictionary with the time (in seconds) of the first call of each kernel in this process
+    """
+    if kernels is None:
+        kernels = kernel_list()
+    for name in kernels:
+        if name not in _warmup_registry:
+            raise ValueError('numba kernel %s is not registered. Options are %s.' % (name, kernel_list()))
+    time_dict = {}
+    for name in kernels:
+        time_start = time.time()
+        _warmup_registry[name]()
+        time_dict[name] = time.time() - time_start
+        if verbose:
+            print('%s: %.3f s' % (name, time_dict[name]))
+    if verbose:
+        print('total: %.3f s' % np.sum(list(time_dict.values())))
+    return time_dict
+
+
+def main(args=None):
+    """
+    command line entry point of warmup()
+
+    :param args: list of command line arguments (if None, uses sys.argv)
+    :return: dictionary with the time (in seconds) of the first call of each kernel
+    """
+    parser = argparse.ArgumentParser(description='compiles the numba kernels of lenstronomy and stores them in '
+                                                 'the numba cache.')
+    parser.add_argument('--cache-dir', default=None, help='numba cache directory (default: NUMBA_CACHE_DIR, the '
+                                                          'lenstronomy configuration or the numba default)')
+    parser.add_argument('--kernels', nargs='+', default=None, help='names of the kernels to compile '
+                                                                   '(default: all)')
+    parser.add_argument('--list', action='store_true', help='lists the registered kernels and exits')
+    parser.add_argument('--quiet', action='store_true', help='does not print the timings')
+    args = parser.parse_args(args)
+    if args.list:
+        for name in kernel_list():
+            print(name)
+        return {}
+    if args.cache_dir is not None:
+        # before the kernel modules are imported, as numba sets the cache location when decorating a function
+        os.environ["NUMBA_CACHE_DIR"] = os.path.expanduser(args.cache_dir)
+    from lenstronomy.Util import numba_util
+    if args.cache_dir is not None:
+        numba_util.set_cache_dir(args.cache_dir)
+    if not args.quiet:
+        print('numba enabled: %s, cache: %s, cache directory: %s' % (numba_util.numba_enabled, numba_util.cache,
+                                                                    os.environ.get("NUMBA_CACHE_DIR", 'default')))
+    return warmup(kernels=args.kernels, verbose=not args.quiet)
+
+
+@register('Util.numba_util')
+def _warmup_numba_util():
+    from lenstronomy.Util import numba_util
+    numba_util.nan_to_num(np.ones(2))
+    numba_util.nan_to_num(1.)
+
+
+@register('Util.util')
+def _warmup_util():
+    from lenstronomy.Util import util
+    util.rotate(1., 1., 0.5)
+    util.rotate(np.ones(2), np.ones(2), 0.5)
+    util.rotate(np.ones((2, 2)), np.ones((2, 2)), 0.5)
+    x, y = util.make_grid(numPix=5, deltapix=1)
+    a = np.sqrt(x ** 2 + y ** 2)
+    util.local_minima_2d(a, x, y)
+    util.neighborSelect(a, x, y)
+
+
+@register('Util.param_util')
+def _warmup_param_util():
+    from lenstronomy.Util import param_util
+    e1, e2 = param_util.phi_q2_ellipticity(0.5, 0.8)
+    param_util.ellipticity2phi_q(e1, e2)
+    e1, e2 = param_util.phi_q2_ellipticity(np.ones(2) * 0.5, np.ones(2) * 0.8)
+    param_util.ellipticity2phi_q(e1, e2)
+
+
+@register('LensModel.Profiles.epl_numba')
+def _warmup_epl_numba():
+    from lenstronomy.LensModel.Profiles.epl_numba import EPL_numba
+    kwargs = {'theta_E': 1., 'gamma': 2.1, 'e1': 0.1, 'e2': -0.05, 'center_x': 0., 'center_y': 0.}
+    for x in [0.5, np.linspace(-1, 1, 4)]:
+        EPL_numba.function(x, x, **kwargs)
+        EPL_numba.derivatives(x, x, **kwargs)
+        EPL_numba.hessian(x, x, **kwargs)
+
+
+@register('LensModel.Util.faddeeva_util')
+def _warmup_faddeeva_util():
+    from lenstronomy.LensModel.Util.faddeeva_util import wofz
+    from lenstronomy.LensModel.Profiles.gaussian_ellipse_kappa import GaussianEllipseKappa
+    wofz(np.ones(2) * (1 + 1j))
+    GaussianEllipseKappa().sigma_function(np.ones(2), np.ones(2), 0.8)
+
+
+@register('Util.interpolation_util')
+def _warmup_interpolation_util():
+    from lenstronomy.Util.interpolation_util import cubic_interpolation
+    values = np.linspace(1., 2., 5)
+    for log_values in [False, True]:
+        cubic_interpolation(np.linspace(0., 4., 3), 0., 1., values, log_values=log_values)
+
+
+@register('LensModel.Solver.epl_shear_solver')
+def _warmup_epl_shear_solver():
+    from lenstronomy.LensModel.Solver.epl_shear_solver import solve_lenseq_pemd, caustics_epl_shear
+    kwargs_lens = [{'theta_E': 1., 'gamma': 2.1, 'e1': 0.1, 'e2': -0.05, 'center_x': 0., 'center_y': 0.},
+                   {'gamma1': 0.02, 'gamma2': 0.01}]
+    solve_lenseq_pemd((0.05, 0.02), kwargs_lens)
+    caustics_epl_shear(kwargs_lens, num_th=20)
+
+
+@register('ImSim.Numerics.numba_convolution')
+def _warmup_numba_convolution():
+    from lenstronomy.ImSim.Numerics.numba_convolution import NumbaConvolution
+    kernel = np.ones((3, 3)) / 9.
+    mask = np.ones((5, 5), dtype=bool)
+    conv = NumbaConvolution(kernel, conv_pixels=mask, compute_pixels=mask)
+    conv.convolve2d(np.ones((5, 5)))
+
+
+if __name__ == '__main__':
+    main()
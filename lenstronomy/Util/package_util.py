@@ -94,3 +94,27 @@ def short(_laconic=False):
     for key, value in to_add.items():
         setattr(lenstronomy, key, value)
     lenstronomy.__all__ = to_add.keys()
+
+
+@export
+def measure_import(statement='import lenstronomy', modules=None):
+    """
+    measures the wall time of a statement (e.g. an import) in a fresh python interpreter, excluding the start-up of
+    the interpreter itself
+
+    :param statement: string, python statement(s) to be executed
+    :param modules: list of module names (e.g. ['astropy.cosmology', 'matplotlib']) to check whether they have been
+     imported by the statement
+    :return: wall time in seconds, list of the modules (of the input list) that have been imported
+    """
+    import sys
+    import json
+    import subprocess
+    if modules is None:
+        modules = []
+    code = '\n'.join(['import sys, time, json', '_time_start = time.perf_counter()', statement,
+                      '_time = time.perf_counter() - _time_start',
+                      'print(json.dumps([_time, [m for m in %s if m in sys.modules]]))' % json.dumps(modules)])
+    output = subprocess.check_output([sys.executable, '-c', code], stderr=subprocess.DEVNULL)
+    time_import, modules_imported = json.loads(output.decode().strip().splitlines()[-1])
+    return time_import, modules_imported
@@ -1,4 +1,6 @@
 import numpy as np
+import threading
+from contextlib import contextmanager
 
 from lenstronomy.Util.numba_util import jit
 from lenstronomy.Util.package_util import exporter
@@ -103,29 +105,124 @@ def ellipticity2phi_q(e1, e2):
     return phi, q
 
 
+class _FrameCache(threading.local):
+    """
+    rotated coordinate frames of the active transform_cache() block (separate for each thread)
+    """
+    def __init__(self):
+        self.depth = 0
+        self.frames = {}
+        # parameters (e1, e2, center_x, center_y) of the frames to be stored, None for all frames
+        self.shared = None
+
+
+_frame_cache = _FrameCache()
+
+
+def _frame_params(e1, e2, center_x, center_y):
+    """
+
+    :return: tuple of floats (e1, e2, center_x, center_y) or None if any of the parameters is not a scalar
+    """
+    if np.ndim(e1) == 0 and np.ndim(e2) == 0 and np.ndim(center_x) == 0 and np.ndim(center_y) == 0:
+        return float(e1), float(e2), float(center_x), float(center_y)
+    return None
+
+
 @export
-def transform_e1e2_product_average(x, y, e1, e2, center_x, center_y):
+@contextmanager
+def transform_cache(kwargs_list=None):
     """
-    maps the coordinates x, y with eccentricities e1 e2 into a new elliptical coordinate system
-    such that R = sqrt(R_major * R_minor)
+    context in which the shifted and rotated coordinate frames computed by rotated_frame() (and thus by
+    transform_e1e2_product_average() and transform_e1e2_square_average()) are cached, such that profiles sharing the
+    center and eccentricities evaluate the transform once for the same coordinate arrays.
+    The cache is emptied when the outermost block is left. Blocks can be nested.
+
+    Example:
+
+    >>> with transform_cache(kwargs_list):
+    >>>     for func, kwargs in zip(func_list, kwargs_list):
+    >>>         flux += func.function(x, y, **kwargs)
+
+    :param kwargs_list: list of keyword arguments of the profiles evaluated in the block. If given, only the frames of
+     the centers and eccentricities shared by at least two profiles are stored (holding frames which are not re-used
+     only costs memory). If None, all the frames are stored.
+    :return: None
+    """
+    if _frame_cache.depth == 0:
+        if kwargs_list is None:
+            _frame_cache.shared = None
+        else:
+            count = {}
+            for kwargs in kwargs_list:
+                params = _frame_params(kwargs.get('e1', 0), kwargs.get('e2', 0), kwargs.get('center_x', 0),
+                                       kwargs.get('center_y', 0))
+                count[params] = count.get(params, 0) + 1
+            _frame_cache.shared = set(params for params, n in count.items() if n > 1 and params is not None)
+    _frame_cache.depth += 1
+    try:
+        yield
+    finally:
+        _frame_cache.depth -= 1
+        if _frame_cache.depth == 0:
+            _frame_cache.frames.clear()
+
+
+@export
+def rotated_frame(x, y, e1, e2, center_x, center_y):
+    """
+    shifts the coordinates x, y to the center and rotates them into the frame of the major axis defined by the
+    eccentricities e1, e2. Inside a transform_cache() block, the frames of the same coordinate arrays (by identity),
+    center and eccentricities are computed only once. The cached arrays are read-only.
 
     :param x: x-coordinate
     :param y: y-coordinate
     :param e1: eccentricity
     :param e2: eccentricity
-    :param center_x: center of distortion
-    :param center_y: center of distortion
-    :return: distorted coordinates x', y'
+    :param center_x: center of the frame
+    :param center_y: center of the frame
+    :return: coordinates along the major and the minor axis
     """
+    key = None
+    if _frame_cache.depth > 0 and _frame_cache.shared != set() and isinstance(x, np.ndarray) and \
+            isinstance(y, np.ndarray) and x.ndim > 0:
+        params = _frame_params(e1, e2, center_x, center_y)
+        if params is not None and (_frame_cache.shared is None or params in _frame_cache.shared):
+            key = (id(x), id(y)) + params
+            frame = _frame_cache.frames.get(key, None)
+            # the coordinate arrays are stored in the cache such that their id can not be re-used within the block
+            if frame is not None and frame[0] is x and frame[1] is y:
+                return frame[2], frame[3]
     phi_g, q = ellipticity2phi_q(e1, e2)
     x_shift = x - center_x
     y_shift = y - center_y
-
     cos_phi = np.cos(phi_g)
     sin_phi = np.sin(phi_g)
-
     xt1 = cos_phi * x_shift + sin_phi * y_shift
     xt2 = -sin_phi * x_shift + cos_phi * y_shift
+    if key is not None:
+        xt1.flags.writeable = False
+        xt2.flags.writeable = False
+        _frame_cache.frames[key] = (x, y, xt1, xt2)
+    return xt1, xt2
+
+
+@export
+def transform_e1e2_product_average(x, y, e1, e2, center_x, center_y):
+    """
+    maps the coordinates x, y with eccentricities e1 e2 into a new elliptical coordinate system
+    such that R = sqrt(R_major * R_minor)
+
+    :param x: x-coordinate
+    :param y: y-coordinate
+    :param e1: eccentricity
+    :param e2: eccentricity
+    :param center_x: center of distortion
+    :param center_y: center of distortion
+    :return: distorted coordinates x', y'
+    """
+    phi_g, q = ellipticity2phi_q(e1, e2)
+    xt1, xt2 = rotated_frame(x, y, e1, e2, center_x, center_y)
     return xt1 * np.sqrt(q), xt2 / np.sqrt(q)
 
 
@@ -144,13 +241,10 @@ def transform_e1e2_square_average(x, y, e1, e2, center_x, center_y):
     :return: distorted coordinates x', y'
     """
     phi_g, q = ellipticity2phi_q(e1, e2)
-    x_shift = x - center_x
-    y_shift = y - center_y
-    cos_phi = np.cos(phi_g)
-    sin_phi = np.sin(phi_g)
+    xt1, xt2 = rotated_frame(x, y, e1, e2, center_x, center_y)
     e = q2e(q)
-    x_ = (cos_phi * x_shift + sin_phi * y_shift) * np.sqrt(1 - e)
-    y_ = (-sin_phi * x_shift + cos_phi * y_shift) * np.sqrt(1 + e)
+    x_ = xt1 * np.sqrt(1 - e)
+    y_ = xt2 * np.sqrt(1 + e)
     return x_, y_
 
 
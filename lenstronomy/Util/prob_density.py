@@ -1,6 +1,5 @@
 __author__ = 'sibirrer'
 
-from scipy import stats
 import numpy as np
 
 from lenstronomy.Util.package_util import exporter
@@ -23,6 +22,7 @@ class SkewGaussian(object):
         :param a:
         :return:
         """
+        from scipy import stats
         t = (x-e) / w
         return 2. / w * stats.norm.pdf(t) * stats.norm.cdf(a*t)
 
@@ -110,6 +110,7 @@ class KDE1D(object):
 
         :param values: 1d numpy array of points representing a PDF
         """
+        from scipy import stats
         self._points = values
         self._kernel = stats.gaussian_kde(values)
 
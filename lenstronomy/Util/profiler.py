@@ -0,0 +1,267 @@
+"""
+light-weight instrumentation of the stages of the likelihood evaluation (wall time and number of calls).
+
+The profiler is opt-in: when disabled, the stages are a shared no-op context manager. To aggregate the counters of
+several processes (e.g. the workers of a multiprocessing or MPI pool), a directory accessible by all processes is
+provided. Each process then writes its counters into a file of this directory (see flush()) every flush_every calls of
+step() or flush_interval seconds, and when the process exits, and collect() sums the counters of all processes.
+"""
+
+import os
+import sys
+import json
+import time
+import glob
+import uuid
+import atexit
+import shutil
+import socket
+import threading
+
+__all__ = ['StageProfiler']
+
+# counters of the current process, keyed by (process id, profiler token). Copies of a profiler unpickled in the same
+# worker process (e.g. for every task of a pool) accumulate into the same counters, while the counters inherited by a
+# forked process are not counted twice.
+_counter_registry = {}
+_counter_lock = threading.Lock()
+# number of steps and time of the last flush of the current process, keyed as the counters
+_flush_registry = {}
+
+
+class _NullStage(object):
+    """
+    no-op context manager of a disabled profiler
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_null_stage = _NullStage()
+
+
+class _Stage(object):
+    """
+    context manager measuring the wall time of a stage
+    """
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._time_start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._profiler.add(self._name, time.perf_counter() - self._time_start)
+        return False
+
+
+class StageProfiler(object):
+    """
+    accumulates the wall time and the number of calls of named stages
+
+    Example:
+
+    >>> profiler = StageProfiler()
+    >>> with profiler.stage('re_size_convolve'):
+    >>>     ...
+    >>> print(profiler.report())
+    """
+    def __init__(self, enabled=True, directory=None, flush_every=1000, flush_interval=30.):
+        """
+
+        :param enabled: bool, if False, the stages are not measured
+        :param directory: path of a directory accessible by all processes to aggregate the counters of several
+         processes. If None, only the counters of the current process are considered.
+        :param flush_every: int, the counters of a process are written to the directory every flush_every calls of
+         step()
+        :param flush_interval: float, the counters of a process are written to the directory at the first call of
+         step() after flush_interval seconds since the last flush
+        """
+        self._enabled = enabled
+        self._directory = directory
+        if directory is not None and enabled is True:
+            os.makedirs(directory, exist_ok=True)
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval
+        self._token = uuid.uuid4().hex
+
+    @property
+    def enabled(self):
+        """
+
+        :return: bool, whether the stages are measured
+        """
+        return self._enabled
+
+    @property
+    def _counters(self):
+        """
+
+        :return: dictionary {stage: [wall time, number of calls]} of the current process
+        """
+        return _counter_registry.setdefault((os.getpid(), self._token), {})
+
+    def stage(self, name):
+        """
+        context manager measuring the wall time of a stage
+
+        :param name: string, name of the stage
+        :return: context manager
+        """
+        if self._enabled is False:
+            return _null_stage
+        return _Stage(self, name)
+
+    def add(self, name, time_elapsed, num_calls=1):
+        """
+        adds the wall time of calls to a stage
+
+        :param name: string, name of the stage
+        :param time_elapsed: wall time in seconds
+        :param num_calls: number of calls
+        :return: None
+        """
+        # stages may be measured concurrently by the band threads of MultiLinear
+        with _counter_lock:
+            counters = self._counters
+            if name not in counters:
+                counters[name] = [0., 0]
+            counters[name][0] += time_elapsed
+            counters[name][1] += num_calls
+
+    @property
+    def counters(self):
+        """
+
+        :return: dictionary {stage: {'time': wall time in seconds, 'calls': number of calls}} of this process
+        """
+        return {name: {'time': value[0], 'calls': value[1]} for name, value in self._counters.items()}
+
+    def step(self):
+        """
+        marks the end of a unit of work (e.g. a likelihood evaluation) and writes the counters of this process into
+        the shared directory every flush_every steps or flush_interval seconds. At the first step of a process, the
+        counters are registered to be written when the process exits.
+
+        :return: None
+        """
+        if self._enabled is False or self._directory is None:
+            return
+        key = (os.getpid(), self._token)
+        if key not in _flush_registry:
+            _flush_registry[key] = [0, time.time()]
+            self._register_exit_flush()
+        state = _flush_registry[key]
+        state[0] += 1
+        if state[0] >= self._flush_every or time.time() - state[1] >= self._flush_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        writes the counters of this process into the shared directory (if provided and existing).
+        The counters are cumulative, the file of a process is overwritten at each flush.
+
+        :return: None
+        """
+        _flush_registry[(os.getpid(), self._token)] = [0, time.time()]
+        if self._enabled is False or self._directory is None or len(self._counters) == 0:
+            return
+        if not os.path.isdir(self._directory):
+            # the directory has been removed by close()
+            return
+        filename = os.path.join(self._directory, 'profile_%s_%s_%s.json' % (self._token, socket.gethostname(),
+                                                                            os.getpid()))
+        filename_temp = filename + '.tmp'
+        with open(filename_temp, 'w') as f:
+            json.dump(self.counters, f)
+        os.replace(filename_temp, filename)
+
+    def _register_exit_flush(self):
+        """
+        registers flush() to be called when the current process exits, for the main process and MPI ranks (atexit)
+        and for the workers of multiprocessing pools, which exit without calling the atexit functions
+
+        :return: None
+        """
+        atexit.register(self.flush)
+        for module_name in ['multiprocessing.util', 'multiprocess.util']:
+            # only the library of the pool running this process is loaded
+            if module_name in sys.modules:
+                sys.modules[module_name].Finalize(None, self.flush, exitpriority=10)
+
+    def collect(self):
+        """
+        aggregates the counters of all processes
+
+        :return: dictionary {stage: {'time': wall time in seconds, 'calls': number of calls}}
+        """
+        if self._directory is None:
+            return self.counters
+        self.flush()
+        counters = {}
+        for filename in sorted(glob.glob(os.path.join(self._directory, 'profile_%s_*.json' % self._token))):
+            try:
+                with open(filename) as f:
+                    counters_process = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for name, value in counters_process.items():
+                if name not in counters:
+                    counters[name] = {'time': 0., 'calls': 0}
+                counters[name]['time'] += value['time']
+                counters[name]['calls'] += value['calls']
+        return counters
+
+    def reset(self):
+        """
+        deletes the counters (of all processes). Copies of the profiler pickled afterwards start with new counters.
+
+        :return: None
+        """
+        if self._directory is not None:
+            for filename in glob.glob(os.path.join(self._directory, 'profile_%s_*.json' % self._token)):
+                os.remove(filename)
+        self._clear()
+
+    def close(self):
+        """
+        removes the shared directory
+
+        :return: None
+        """
+        self._clear()
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+
+    def _clear(self):
+        """
+        removes the counters of the current process and renews the token
+
+        :return: None
+        """
+        _counter_registry.pop((os.getpid(), self._token), None)
+        _flush_registry.pop((os.getpid(), self._token), None)
+        self._token = uuid.uuid4().hex
+
+    @staticmethod
+    def report(counters, title=None):
+        """
+        formats the counters as a table sorted by the wall time
+
+        :param counters: dictionary {stage: {'time': wall time in seconds, 'calls': number of calls}}
+        :param title: string, printed as the header of the table
+        :return: string
+        """
+        lines = []
+        if title is not None:
+            lines.append(title)
+        lines.append('%-35s %12s %10s %14s' % ('stage', 'time [s]', 'calls', 'per call [ms]'))
+        for name, value in sorted(counters.items(), key=lambda item: -item[1]['time']):
+            lines.append('%-35s %12.3f %10d %14.3f' % (name, value['time'], value['calls'],
+                                                      value['time'] / max(value['calls'], 1) * 1000))
+        return '\n'.join(lines)
@@ -1,7 +1,6 @@
 __author__ = 'aymgal'
 
 import numpy as np
-from scipy import stats
 
 from lenstronomy.Util.package_util import exporter
 export, __all__ = exporter()
@@ -66,6 +65,7 @@ def cube2args_gaussian(cube, lowers, uppers, means, sigmas, num_dims, copy=False
     :param copy: If False, this function modifies 'cube' in-place. Default to False.
     :return: hypercube mapped to parameters space
     """
+    from scipy import stats
     if copy:
         cube_ = cube
         cube = np.zeros_like(cube_)
@@ -121,6 +121,7 @@ def sample_ball_truncated(mean, sigma, lower_limit, upper_limit, size):
     :param size: number of tuples to be sampled
     :return: realization of truncated normal distribution with shape (size, dim(parameters))
     """
+    from scipy import stats
     a, b = (lower_limit - mean) / sigma, (upper_limit - mean) / sigma
     draws = np.vstack([mean + sigma * stats.truncnorm.rvs(a, b, size=len(a)) for i in range(size)])
     return draws
@@ -5,10 +5,13 @@ from lenstronomy.ImSim.MultiBand.single_band_multi_model import SingleBandMultiM
 from lenstronomy.Workflow.multi_band_manager import MultiBandUpdateManager
 from lenstronomy.Sampling.likelihood import LikelihoodModule
 from lenstronomy.Sampling.sampler import Sampler
+from lenstronomy.Sampling.Pool.shared_memory import SharedDataStore, SharedLikelihoodModule
 from lenstronomy.Sampling.Samplers.multinest_sampler import MultiNestSampler
 from lenstronomy.Sampling.Samplers.polychord_sampler import DyPolyChordSampler
 from lenstronomy.Sampling.Samplers.dynesty_sampler import DynestySampler
+from lenstronomy.Util.profiler import StageProfiler
 import numpy as np
+import tempfile
 import lenstronomy.Util.analysis_util as analysis_util
 
 __all__ = ['FittingSequence']
@@ -22,7 +25,7 @@ class FittingSequence(object):
     FittingSequence
     """
     def __init__(self, kwargs_data_joint, kwargs_model, kwargs_constraints, kwargs_likelihood, kwargs_params, mpi=False,
-                 verbose=True):
+                 verbose=True, shared_data=False, shared_data_directory=None, profile=False, profile_directory=None):
         """
 
         :param kwargs_data_joint: keyword argument specifying the data according to LikelihoodModule
@@ -43,15 +46,41 @@ class FittingSequence(object):
         :param mpi: MPI option (bool), if True, will launch an MPI Pool job for the steps in the fitting sequence where
          possible
         :param verbose: bool, if True prints temporary results and indicators of the fitting process
+        :param shared_data: bool, if True, the data arrays are shared through memory-mapped files with the processes of
+         the pool in the PSO and MCMC steps (with MPI or threadCount > 1) and the likelihood is re-constructed in each
+         process instead of being pickled
+        :param shared_data_directory: directory of the memory-mapped files, needs to be accessible by all processes
+         (default is /dev/shm if available). With MPI, the files are only written by the master rank and the directory
+         needs to be on a file system shared by the nodes of the job; it has to be provided explicitly (the node-local
+         /dev/shm is not visible to ranks on other nodes). See SharedDataStore.
+        :param profile: bool, if True, measures the wall time and number of calls of the stages of the likelihood
+         evaluation (aggregated over the processes of the pools) and reports them at the end of each fitting step
+         (see StageProfiler and profile_list)
+        :param profile_directory: directory to aggregate the profiles of the processes, needs to be accessible by all
+         processes (default is a new temporary directory, which is removed at the end of fit_sequence()). With MPI,
+         the directory needs to be on a file system shared by the nodes of the job and has to be provided explicitly.
+         The counters of the processes of a pool are written when the pool is closed at the end of a fitting step.
         """
         self.kwargs_data_joint = kwargs_data_joint
         self.multi_band_list = kwargs_data_joint.get('multi_band_list', [])
         self.multi_band_type = kwargs_data_joint.get('multi_band_type', 'single-band')
         self._verbose = verbose
         self._mpi = mpi
+        if shared_data is True and mpi is True and shared_data_directory is None:
+            raise ValueError('shared_data with mpi=True requires a shared_data_directory on a file system accessible '
+                             'by all the nodes of the MPI job.')
+        if profile is True and mpi is True and profile_directory is None:
+            raise ValueError('profile with mpi=True requires a profile_directory on a file system accessible by all '
+                             'the nodes of the MPI job.')
+        self._shared_data = shared_data
+        self._shared_data_directory = shared_data_directory
         self._updateManager = MultiBandUpdateManager(kwargs_model, kwargs_constraints, kwargs_likelihood, kwargs_params,
                                                      num_bands=len(self.multi_band_list))
         self._mcmc_init_samples = None
+        self._profile = profile
+        self._profile_directory = profile_directory
+        self._profiler = None
+        self._profile_list = []
 
     def kwargs_fixed(self):
         """
@@ -68,6 +97,29 @@ class FittingSequence(object):
          kwargs being the arguments passed to this option
         :return: fitting results
         """
+        if self._profile is not True:
+            return self._fit_sequence(fitting_list)
+        temporary_directory = self._profile_directory is None
+        if temporary_directory:
+            self._profiler = StageProfiler(directory=tempfile.mkdtemp(prefix='lenstronomy_profile_'))
+        else:
+            self._profiler = StageProfiler(directory=self._profile_directory)
+        try:
+            return self._fit_sequence(fitting_list)
+        finally:
+            if temporary_directory:
+                self._profiler.close()
+            else:
+                self._profiler.reset()
+            self._profiler = None
+
+    def _fit_sequence(self, fitting_list):
+        """
+        see fit_sequence()
+
+        :param fitting_list: list of [['string', {kwargs}], ..]
+        :return: fitting results
+        """
         chain_list = []
         for i, fitting in enumerate(fitting_list):
             fitting_type = fitting[0]
@@ -133,8 +185,34 @@ class FittingSequence(object):
                 raise ValueError("fitting_sequence %s is not supported. Please use: 'PSO', 'SIMPLEX', 'MCMC', "
                                  "'psf_iteration', 'restart', 'update_settings', 'calibrate_images' or "
                                  "'align_images'" % fitting_type)
+            if self._profiler is not None:
+                self._report_profile(fitting_type)
         return chain_list
 
+    def _report_profile(self, fitting_type):
+        """
+        collects the profile of the stages of the likelihood evaluation of a fitting step and resets the counters
+
+        :param fitting_type: string, name of the fitting step
+        :return: None
+        """
+        counters = self._profiler.collect()
+        self._profiler.reset()
+        if len(counters) == 0:
+            return
+        self._profile_list.append([fitting_type, counters])
+        if self._verbose is True:
+            print(StageProfiler.report(counters, title='profile of %s:' % fitting_type))
+
+    @property
+    def profile_list(self):
+        """
+        profiles of the fitting steps with likelihood evaluations (only with profile=True)
+
+        :return: list of [fitting type, {stage: {'time': wall time in seconds, 'calls': number of calls}}]
+        """
+        return self._profile_list
+
     def best_fit(self, bijective=False):
         """
 
@@ -195,10 +273,52 @@ class FittingSequence(object):
         :return: Likelihood() class instance reflecting the current state of FittingSequence
         """
         kwargs_model = self._updateManager.kwargs_model
-        kwargs_likelihood = self._updateManager.kwargs_likelihood
+        kwargs_likelihood = self._kwargs_likelihood
         likelihoodModule = LikelihoodModule(self.kwargs_data_joint, kwargs_model, self.param_class, **kwargs_likelihood)
         return likelihoodModule
 
+    def _pool_likelihood(self, data_store):
+        """
+        likelihood to be distributed to the processes of a pool
+
+        :param data_store: SharedDataStore instance or None
+        :return: LikelihoodModule or SharedLikelihoodModule instance
+        """
+        if data_store is None:
+            if self._shared_data is True and self._mpi is True:
+                # MPI worker rank: the data is written by the master and the likelihood is received with the tasks
+                return SharedLikelihoodModule(None, None, self._updateManager.kwargs_param_class, None, None)
+            return self.likelihoodModule
+        return SharedLikelihoodModule(self.kwargs_data_joint, self._updateManager.kwargs_model,
+                                      self._updateManager.kwargs_param_class, self._kwargs_likelihood, data_store)
+
+    @property
+    def _kwargs_likelihood(self):
+        """
+
+        :return: keyword arguments of the LikelihoodModule, including the profiler if profiling is enabled
+        """
+        kwargs_likelihood = self._updateManager.kwargs_likelihood
+        if self._profiler is not None:
+            kwargs_likelihood = dict(kwargs_likelihood, profiler=self._profiler)
+        return kwargs_likelihood
+
+    def _shared_data_store(self, threadCount):
+        """
+
+        :param threadCount: number of CPU threads
+        :return: SharedDataStore instance if the data is shared with the processes of a pool, None otherwise (and on
+         the worker ranks of an MPI pool, which attach to the files written by the master)
+        """
+        if self._shared_data is True and self._mpi is True:
+            from mpi4py import MPI
+            if MPI.COMM_WORLD.Get_rank() != 0:
+                return None
+            return SharedDataStore(directory=self._shared_data_directory)
+        if self._shared_data is True and threadCount > 1:
+            return SharedDataStore(directory=self._shared_data_directory)
+        return None
+
     def simplex(self, n_iterations, method='Nelder-Mead'):
         """
         Downhill simplex optimization using the Nelder-Mead algorithm.
@@ -245,8 +365,8 @@ class FittingSequence(object):
         """
 
         param_class = self.param_class
-        # run PSO
-        mcmc_class = Sampler(likelihoodModule=self.likelihoodModule)
+        data_store = self._shared_data_store(threadCount)
+        mcmc_class = Sampler(likelihoodModule=self._pool_likelihood(data_store))
         kwargs_temp = self._updateManager.parameter_state
         mean_start = param_class.kwargs2args(**kwargs_temp)
         kwargs_sigma = self._updateManager.sigma_kwargs
@@ -268,22 +388,27 @@ class FittingSequence(object):
         else:
             initpos = None
 
-        if sampler_type == 'EMCEE':
-            samples, dist = mcmc_class.mcmc_emcee(n_walkers, n_run, n_burn, mean_start, sigma_start, mpi=self._mpi,
-                                                  threadCount=threadCount, progress=progress, initpos=initpos,
-                                                  backend_filename=backend_filename,
-                                                  start_from_backend=start_from_backend)
-            output = [sampler_type, samples, param_list, dist]
-
-        elif sampler_type == 'ZEUS':
-
-            samples, dist = mcmc_class.mcmc_zeus(n_walkers, n_run, n_burn, mean_start, sigma_start,
-                                                 mpi=self._mpi, threadCount=threadCount,
-                                                 progress=progress, initpos = initpos, backend_filename = backend_filename,
-                                                 **kwargs_zeus)
-            output = [sampler_type, samples, param_list, dist]
-        else:
-            raise ValueError('sampler_type %s not supported!' % sampler_type)
+        try:
+            if sampler_type == 'EMCEE':
+                samples, dist = mcmc_class.mcmc_emcee(n_walkers, n_run, n_burn, mean_start, sigma_start, mpi=self._mpi,
+                                                      threadCount=threadCount, progress=progress, initpos=initpos,
+                                                      backend_filename=backend_filename,
+                                                      start_from_backend=start_from_backend)
+                output = [sampler_type, samples, param_list, dist]
+
+            elif sampler_type == 'ZEUS':
+
+                samples, dist = mcmc_class.mcmc_zeus(n_walkers, n_run, n_burn, mean_start, sigma_start,
+                                                     mpi=self._mpi, threadCount=threadCount,
+                                                     progress=progress, initpos = initpos, backend_filename = backend_filename,
+                                                     **kwargs_zeus)
+                output = [sampler_type, samples, param_list, dist]
+            else:
+                raise ValueError('sampler_type %s not supported!' % sampler_type)
+        finally:
+            if data_store is not None:
+                mcmc_class.chain.release()
+                data_store.close()
         self._mcmc_init_samples = samples  # overwrites previous samples to continue from there in the next MCMC run
         return output
 
@@ -310,9 +435,15 @@ class FittingSequence(object):
         num_param, param_list = param_class.num_param()
 
         # run PSO
-        sampler = Sampler(likelihoodModule=self.likelihoodModule)
-        result, chain = sampler.pso(n_particles, n_iterations, lower_start, upper_start, init_pos=init_pos,
-                                    threadCount=threadCount, mpi=self._mpi, print_key=print_key)
+        data_store = self._shared_data_store(threadCount)
+        sampler = Sampler(likelihoodModule=self._pool_likelihood(data_store))
+        try:
+            result, chain = sampler.pso(n_particles, n_iterations, lower_start, upper_start, init_pos=init_pos,
+                                        threadCount=threadCount, mpi=self._mpi, print_key=print_key)
+        finally:
+            if data_store is not None:
+                sampler.chain.release()
+                data_store.close()
         kwargs_result = param_class.args2kwargs(result, bijective=True)
         return kwargs_result, chain, param_list
 
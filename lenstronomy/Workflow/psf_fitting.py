@@ -46,6 +46,9 @@ class PsfFitting(object):
     """
     def __init__(self, image_model_class):
         self._image_model_class = image_model_class
+        self._keep_workspace = False
+        self._star_workspace = None
+        self._model_cache = None
 
     def update_iterative(self, kwargs_psf, kwargs_params, num_iter=10, keep_psf_error_map=True, no_break=True,
                          verbose=True, **kwargs_psf_update):
@@ -63,6 +66,35 @@ class PsfFitting(object):
         :return: keyword argument of PSF constructor for PSF() class with updated PSF
         """
         self._image_model_class.PointSource.set_save_cache(True)
+        # the model parameters are fixed during the iterations, only the convolution with the PSF is re-computed and
+        # the per-star quantities (positions, masks, noise cutouts, shift operators) are kept in a workspace
+        self._image_model_class.freeze_extended_response(True)
+        self._keep_workspace = True
+        try:
+            return self._update_iterative(kwargs_psf, kwargs_params, num_iter=num_iter,
+                                          keep_psf_error_map=keep_psf_error_map, no_break=no_break, verbose=verbose,
+                                          **kwargs_psf_update)
+        finally:
+            self._image_model_class.freeze_extended_response(False)
+            self._keep_workspace = False
+            self._star_workspace = None
+            self._model_cache = None
+
+    def _update_iterative(self, kwargs_psf, kwargs_params, num_iter=10, keep_psf_error_map=True, no_break=True,
+                          verbose=True, **kwargs_psf_update):
+        """
+        see update_iterative()
+
+        :param kwargs_psf: keyword arguments to construct the PSF() class
+        :param kwargs_params: keyword arguments of the parameters of the model components (e.g. 'kwargs_lens' etc)
+        :param num_iter: number of iterations in the PSF fitting and image fitting process
+        :param keep_psf_error_map: boolean, if True keeps previous psf_error_map
+        :param no_break: boolean, if True, runs until the end regardless of the next step getting worse, and then
+         reads out the overall best fit
+        :param verbose: print statements informing about progress of iterative procedure
+        :param kwargs_psf_update: keyword arguments passed to update_psf()
+        :return: keyword argument of PSF constructor for PSF() class with updated PSF
+        """
         if 'kernel_point_source_init' not in kwargs_psf:
             kernel_point_source_init = copy.deepcopy(kwargs_psf['kernel_point_source'])
         else:
@@ -104,7 +136,7 @@ class PsfFitting(object):
 
     def update_psf(self, kwargs_psf, kwargs_params, stacking_method='median', psf_symmetry=1, psf_iter_factor=.2,
                    block_center_neighbour=0, error_map_radius=None, block_center_neighbour_error_map=None,
-                   new_procedure=True):
+                   new_procedure=True, shift_method='interpol'):
         """
 
         :param kwargs_psf: keyword arguments to construct the PSF() class
@@ -129,6 +161,8 @@ class PsfFitting(object):
          (unless blocked through other means)
         :param new_procedure: boolean, uses post lenstronomy 1.9.2 procedure which is more optimal for super-sampled
          PSF's
+        :param shift_method: 'interpol' or 'fourier'; sub-pixel shift of the star residuals in the new procedure with a
+         linear interpolation or with (pre-computed) Fourier phase ramps, see kernel_util.de_shift_kernel_fourier()
         :return: kwargs_psf_new, logL_after, error_map
         """
         if block_center_neighbour_error_map is None:
@@ -142,9 +176,12 @@ class PsfFitting(object):
                           'psf_error_map': kwargs_psf_copy.get('psf_error_map', None)}
         # if 'psf_error_map' in kwargs_psf_copy:
         #    kwargs_psf_new['psf_error_map'] = kwargs_psf_copy['psf_error_map'] / 10
-        self._image_model_class.update_psf(PSF(**kwargs_psf_new))
-
-        model, error_map_image, cov_param, param = self._image_model_class.image_linear_solve(**kwargs_params)
+        if self._model_cache is not None and self._same_psf(self._model_cache[0], kwargs_psf_new):
+            # the model with this PSF was already solved for at the end of the previous iteration
+            model = self._model_cache[1]
+        else:
+            self._image_model_class.update_psf(PSF(**kwargs_psf_new))
+            model, error_map_image, cov_param, param = self._image_model_class.image_linear_solve(**kwargs_params)
         kwargs_ps = kwargs_params.get('kwargs_ps', None)
         kwargs_lens = kwargs_params.get('kwargs_lens', None)
         ra_image, dec_image, point_amp = self._image_model_class.PointSource.point_source_list(kwargs_ps, kwargs_lens)
@@ -187,7 +224,8 @@ class PsfFitting(object):
             psf_kernel_list = self.psf_estimate_individual(ra_image, dec_image, point_amp, residuals,
                                                            cutout_size=kernel_size, kernel_guess=kernel_old_high_res,
                                                            supersampling_factor=point_source_supersampling_factor,
-                                                           block_center_neighbour=block_center_neighbour)
+                                                           block_center_neighbour=block_center_neighbour,
+                                                           shift_method=shift_method)
 
             kernel_new = self.combine_psf(psf_kernel_list, kernel_old_high_res, factor=psf_iter_factor,
                                           stacking_option=stacking_method, symmetry=psf_symmetry)
@@ -204,9 +242,51 @@ class PsfFitting(object):
         # if 'psf_error_map' in kwargs_psf_new:
         #    kwargs_psf_new['psf_error_map'] *= 10
         self._image_model_class.update_psf(PSF(**kwargs_psf_new))
-        logL_after = self._image_model_class.likelihood_data_given_model(**kwargs_params)
+        if self._keep_workspace is True and self._model_likelihood_consistent():
+            # the model is kept for the next iteration
+            model, error_map_image, cov_param, param = self._image_model_class.image_linear_solve(**kwargs_params)
+            logL_after = self._image_model_class.Data.log_likelihood(model, self._image_model_class.likelihood_mask,
+                                                                     error_map_image)
+            self._model_cache = kwargs_psf_new, model
+        else:
+            logL_after = self._image_model_class.likelihood_data_given_model(**kwargs_params)
         return kwargs_psf_new, logL_after, error_map
 
+    def _model_likelihood_consistent(self):
+        """
+        whether likelihood_data_given_model() (with its default arguments, as used for the likelihood before the
+        iterations) is the log likelihood of the model of image_linear_solve() with Data.log_likelihood(). This is the
+        case for the linear solver of ImageLinearFit and SingleBandMultiModel with a diagonal likelihood. Not covered
+        are models without linear solver, the interferometric likelihood (image_linear_solve() returns only the
+        convolved model) and classes overriding the likelihood.
+
+        :return: bool
+        """
+        from lenstronomy.ImSim.image_linear_solve import ImageLinearFit
+        from lenstronomy.ImSim.MultiBand.single_band_multi_model import SingleBandMultiModel
+        image_model = self._image_model_class
+        likelihood_method = type(image_model).likelihood_data_given_model
+        if likelihood_method not in [ImageLinearFit.likelihood_data_given_model,
+                                     SingleBandMultiModel.likelihood_data_given_model]:
+            return False
+        if type(image_model)._likelihood_data_given_model is not ImageLinearFit._likelihood_data_given_model:
+            return False
+        if getattr(image_model, '_linear_solver', True) is not True:
+            return False
+        return image_model.Data.likelihood_method() == 'diagonal'
+
+    @staticmethod
+    def _same_psf(kwargs_psf_1, kwargs_psf_2):
+        """
+
+        :param kwargs_psf_1: keyword arguments of a 'PIXEL' PSF as constructed in update_psf()
+        :param kwargs_psf_2: keyword arguments of a 'PIXEL' PSF as constructed in update_psf()
+        :return: bool, True if both describe the same PSF
+        """
+        return (kwargs_psf_1['point_source_supersampling_factor'] == kwargs_psf_2['point_source_supersampling_factor']
+                and np.array_equal(kwargs_psf_1['kernel_point_source'], kwargs_psf_2['kernel_point_source'])
+                and np.array_equal(kwargs_psf_1['psf_error_map'], kwargs_psf_2['psf_error_map']))
+
     def image_single_point_source(self, image_model_class, kwargs_params):
         """
         return model without including the point source contributions as a list (for each point source individually)
@@ -273,7 +353,7 @@ class PsfFitting(object):
         return kernel_list
 
     def psf_estimate_individual(self, ra_image, dec_image, point_amp, residuals, cutout_size, kernel_guess,
-                                supersampling_factor, block_center_neighbour):
+                                supersampling_factor, block_center_neighbour, shift_method='interpol'):
         """
 
         :param ra_image: list; position in angular units of the image
@@ -284,56 +364,58 @@ class PsfFitting(object):
         :param kernel_guess: initial guess of super-sampled PSF
         :param supersampling_factor: int, super-sampling factor
         :param block_center_neighbour:
+        :param shift_method: 'interpol' or 'fourier'; sub-pixel shift of the residuals with a linear interpolation or
+         with Fourier phase ramps
         :return: list of best-guess PSF's for each star based on the residual patterns
         """
-        mask = self._image_model_class.likelihood_mask
-        ra_grid, dec_grid = self._image_model_class.Data.pixel_coordinates
-        ra_grid = util.image2array(ra_grid)
-        dec_grid = util.image2array(dec_grid)
-        radius = block_center_neighbour
-        x_, y_ = self._image_model_class.Data.map_coord2pix(ra_image, dec_image)
-
-        kernel_list = []
-        for l in range(len(ra_image)):
-            mask_point_source = self.mask_point_source(ra_image, dec_image, ra_grid, dec_grid, radius, i=l)
-            mask_i = mask * mask_point_source
+        workspace = self._workspace(ra_image, dec_image)
+        # cutout residuals and apply mask
+        residual_cutouts = workspace.cutouts(residuals, cutout_size + 2)
+        residual_cutouts *= workspace.mask_cutouts(block_center_neighbour, cutout_size + 2)
+        # re-scale residuals with point source brightness
+        residual_cutouts /= np.array(point_amp, dtype=float)[:, np.newaxis, np.newaxis]
+        # enlarge residuals by super-sampling factor
+        residual_cutouts = residual_cutouts.repeat(supersampling_factor, axis=1).repeat(supersampling_factor, axis=2)
+
+        # inverse shift residuals
+        shift_x = (workspace.x_int - workspace.x) * supersampling_factor
+        shift_y = (workspace.y_int - workspace.y) * supersampling_factor
+        # for odd number super-sampling
+        if supersampling_factor % 2 == 1:
+            residuals_shifted = workspace.shift(residual_cutouts, shift_x, shift_y, method=shift_method)
+        else:
+            # for even number super-sampling half a super-sampled pixel offset needs to be performed
+            residuals_shifted = workspace.shift(residual_cutouts, shift_x - 0.5, shift_y - 0.5, method=shift_method)
+            # and the last column and row need to be removed
+            residuals_shifted = residuals_shifted[:, :-1, :-1]
+
+        # re-size shift residuals
+        psf_size = len(kernel_guess)
+        i_min = int((residuals_shifted.shape[1] - psf_size) / 2)
+        residuals_shifted = residuals_shifted[:, i_min:i_min + psf_size, i_min:i_min + psf_size]
+
+        # normalize residuals
+        correction = residuals_shifted - np.mean(residuals_shifted, axis=(1, 2), keepdims=True)
+        # correct old PSF with inverse shifted residuals
+        kernel_list = list(kernel_guess + correction)
+        return kernel_list
 
-            # cutout residuals
-            x_int = int(round(x_[l]))
-            y_int = int(round(y_[l]))
-            residual_cutout = kernel_util.cutout_source(x_int, y_int, residuals, cutout_size + 2, shift=False)
-            # cutout the mask
-            mask_cutout = kernel_util.cutout_source(x_int, y_int, mask_i, cutout_size + 2, shift=False)
-            # apply mask
-            residual_cutout_mask = residual_cutout * mask_cutout
-            # re-scale residuals with point source brightness
-            residual_cutout_mask /= point_amp[l]
-            # enlarge residuals by super-sampling factor
-            residual_cutout_mask = residual_cutout_mask.repeat(supersampling_factor, axis=0).repeat(supersampling_factor, axis=1)
-
-            # inverse shift residuals
-            shift_x = (x_int - x_[l]) * supersampling_factor
-            shift_y = (y_int - y_[l]) * supersampling_factor
-            # for odd number super-sampling
-            if supersampling_factor % 2 == 1:
-                residuals_shifted = ndimage.shift(residual_cutout_mask, shift=[shift_y, shift_x], order=1)
+    def _workspace(self, ra_image, dec_image):
+        """
+        per-star workspace of the PSF reconstruction. During update_iterative() it is kept and re-used as long as the
+        point source positions do not change.
 
-            else:
-                # for even number super-sampling half a super-sampled pixel offset needs to be performed
-                residuals_shifted = ndimage.shift(residual_cutout_mask, shift=[shift_y - 0.5, shift_x - 0.5], order=1)
-                # and the last column and row need to be removed
-                residuals_shifted = residuals_shifted[:-1, :-1]
-
-            # re-size shift residuals
-            psf_size = len(kernel_guess)
-            residuals_shifted = image_util.cut_edges(residuals_shifted, psf_size)
-
-            # normalize residuals
-            correction = residuals_shifted - np.mean(residuals_shifted)
-            # correct old PSF with inverse shifted residuals
-            kernel_new = kernel_guess + correction
-            kernel_list.append(kernel_new)
-        return kernel_list
+        :param ra_image: list; position in angular units of the image
+        :param dec_image: list; position in angular units of the image
+        :return: _StarWorkspace instance
+        """
+        workspace = self._star_workspace
+        if workspace is None or not workspace.matches(ra_image, dec_image):
+            workspace = _StarWorkspace(self._image_model_class.Data, self._image_model_class.likelihood_mask,
+                                       ra_image, dec_image)
+            if self._keep_workspace is True:
+                self._star_workspace = workspace
+        return workspace
 
     @staticmethod
     def point_like_source_cutouts(x_pos, y_pos, image_list, cutout_size):
@@ -456,22 +538,15 @@ class PsfFitting(object):
         :return: psf error map such that square of the uncertainty gets boosted by error_map * (psf * amp)**2
         """
         kernel_low = kernel_util.degrade_kernel(psf_kernel, supersampling_factor)
-        error_map_list = np.zeros((len(psf_kernel_list), len(kernel_low), len(kernel_low)))
-        x_pos, y_pos = self._image_model_class.Data.map_coord2pix(ra_image, dec_image)
+        kernel_low_list = np.array([kernel_util.degrade_kernel(psf_kernel_i, supersampling_factor)
+                                    for psf_kernel_i in psf_kernel_list])
+        workspace = self._workspace(ra_image, dec_image)
+        C_D_cutouts = workspace.noise_cutouts(len(kernel_low))
 
-        for i, psf_kernel_i in enumerate(psf_kernel_list):
-            kernel_low_i = kernel_util.degrade_kernel(psf_kernel_i, supersampling_factor)
-
-            x, y, amp_i = x_pos[i], y_pos[i], point_amp[i]
-            x_int = int(round(x))
-            y_int = int(round(y))
-
-            C_D_cutout = kernel_util.cutout_source(x_int, y_int, self._image_model_class.Data.C_D, len(kernel_low_i),
-                                                   shift=False)
-            residuals_i = np.abs(kernel_low - kernel_low_i)
-            residuals_i -= np.sqrt(C_D_cutout) / amp_i
-            residuals_i[residuals_i < 0] = 0
-            error_map_list[i, :, :] = residuals_i**2
+        residuals = np.abs(kernel_low - kernel_low_list)
+        residuals -= np.sqrt(C_D_cutouts) / np.array(point_amp, dtype=float)[:, np.newaxis, np.newaxis]
+        residuals[residuals < 0] = 0
+        error_map_list = residuals ** 2
 
         error_map = np.median(error_map_list, axis=0)
         error_map[kernel_low > 0] /= kernel_low[kernel_low > 0] ** 2
@@ -567,3 +642,140 @@ class PsfFitting(object):
                 mask_point = 1 - mask_util.mask_azimuthal(x_grid, y_grid, x_pos[k], y_pos[k], radius)
                 mask *= mask_point
         return util.array2image(mask)
+
+
+class _StarWorkspace(object):
+    """
+    persistent per-star quantities of the PSF iteration. With the model parameters fixed, the positions of the point
+    sources, their masks, noise cutouts and sub-pixel shift operators are the same in every iteration. They are computed
+    once; per iteration only the residual cutouts are updated, for all stars at once in array form.
+    """
+    def __init__(self, data_class, likelihood_mask, ra_image, dec_image):
+        """
+
+        :param data_class: ImageData instance
+        :param likelihood_mask: 2d array, likelihood mask of the image
+        :param ra_image: position in angular units of the point sources
+        :param dec_image: position in angular units of the point sources
+        """
+        self._data = data_class
+        self._likelihood_mask = likelihood_mask
+        self._ra_image = np.array(ra_image, dtype=float)
+        self._dec_image = np.array(dec_image, dtype=float)
+        x, y = data_class.map_coord2pix(self._ra_image, self._dec_image)
+        self.x, self.y = np.atleast_1d(x), np.atleast_1d(y)
+        self.x_int = np.array([int(round(x_i)) for x_i in self.x], dtype=int)
+        self.y_int = np.array([int(round(y_i)) for y_i in self.y], dtype=int)
+        self._index_cache = {}
+        self._mask_cache = {}
+        self._noise_cache = {}
+        self._phase_cache = {}
+
+    def matches(self, ra_image, dec_image):
+        """
+
+        :param ra_image: position in angular units of the point sources
+        :param dec_image: position in angular units of the point sources
+        :return: bool, True if the workspace was built for these point source positions
+        """
+        return np.array_equal(self._ra_image, ra_image) and np.array_equal(self._dec_image, dec_image)
+
+    def cutouts(self, image, cutout_size):
+        """
+        cutouts of all stars centered on their closest pixel, with zeros outside the image
+        (as kernel_util.cutout_source() with shift=False)
+
+        :param image: 2d array
+        :param cutout_size: odd integer, size of cutout
+        :return: 3d array (number of stars, cutout_size, cutout_size)
+        """
+        if cutout_size not in self._index_cache:
+            if cutout_size % 2 == 0:
+                raise ValueError("even pixel number kernel size not supported!")
+            ny, nx = np.shape(image)
+            offset = np.arange(cutout_size) - int((cutout_size - 1) / 2)
+            rows = self.y_int[:, np.newaxis] + offset
+            cols = self.x_int[:, np.newaxis] + offset
+            inside = ((rows >= 0) & (rows < ny))[:, :, np.newaxis] & ((cols >= 0) & (cols < nx))[:, np.newaxis, :]
+            rows = np.clip(rows, 0, ny - 1)[:, :, np.newaxis]
+            cols = np.clip(cols, 0, nx - 1)[:, np.newaxis, :]
+            self._index_cache[cutout_size] = rows, cols, inside
+        rows, cols, inside = self._index_cache[cutout_size]
+        return np.asarray(image)[rows, cols] * inside
+
+    def mask_cutouts(self, radius, cutout_size):
+        """
+        cutouts of the likelihood mask around each star with the neighbouring point sources masked out
+
+        :param radius: radius to mask out the other point sources
+        :param cutout_size: odd integer, size of cutout
+        :return: 3d array (number of stars, cutout_size, cutout_size)
+        """
+        key = (radius, cutout_size)
+        if key not in self._mask_cache:
+            ra_grid, dec_grid = self._data.pixel_coordinates
+            ra_grid = util.image2array(ra_grid)
+            dec_grid = util.image2array(dec_grid)
+            mask_list = np.zeros((len(self.x), cutout_size, cutout_size))
+            for i in range(len(self.x)):
+                mask_point_source = PsfFitting.mask_point_source(self._ra_image, self._dec_image, ra_grid, dec_grid,
+                                                                 radius, i=i)
+                mask_list[i] = self.cutouts(self._likelihood_mask * mask_point_source, cutout_size)[i]
+            self._mask_cache[key] = mask_list
+        return self._mask_cache[key]
+
+    def noise_cutouts(self, cutout_size):
+        """
+
+        :param cutout_size: odd integer, size of cutout
+        :return: cutouts of the data covariance (C_D) around each star
+        """
+        if cutout_size not in self._noise_cache:
+            self._noise_cache[cutout_size] = self.cutouts(self._data.C_D, cutout_size)
+        return self._noise_cache[cutout_size]
+
+    def shift(self, cutouts, shift_x, shift_y, method='interpol'):
+        """
+        sub-pixel shifts of the star cutouts
+
+        :param cutouts: 3d array (number of stars, ny, nx)
+        :param shift_x: shifts in x-direction in pixels (one per star)
+        :param shift_y: shifts in y-direction in pixels (one per star)
+        :param method: 'interpol' (linear interpolation as ndimage.shift(order=1)) or 'fourier' (phase ramps applied
+         to the cutouts padded with their background level, as kernel_util.de_shift_kernel_fourier())
+        :return: shifted cutouts
+        """
+        if method == 'interpol':
+            shifted = np.zeros_like(cutouts)
+            for i in range(len(cutouts)):
+                shifted[i] = ndimage.shift(cutouts[i], shift=[shift_y[i], shift_x[i]], order=1)
+            return shifted
+        elif method == 'fourier':
+            num_pad, phase = self._phase_ramps(np.shape(cutouts)[1:], shift_x, shift_y)
+            background = (cutouts[:, 0, 0] + cutouts[:, 0, -1] + cutouts[:, -1, 0] + cutouts[:, -1, -1]) / 4.
+            background = background[:, np.newaxis, np.newaxis]
+            cutouts_pad = np.pad(cutouts - background, ((0, 0), (num_pad, num_pad), (num_pad, num_pad)))
+            shifted = np.real(np.fft.ifft2(np.fft.fft2(cutouts_pad) * phase))
+            return shifted[:, num_pad:-num_pad, num_pad:-num_pad] + background
+        else:
+            raise ValueError("shift_method must be 'interpol' or 'fourier', %s is not supported." % method)
+
+    def _phase_ramps(self, shape, shift_x, shift_y):
+        """
+        Fourier phase ramps of the sub-pixel shifts of all stars, computed once per cutout shape and shifts
+
+        :param shape: shape (ny, nx) of the cutouts
+        :param shift_x: shifts in x-direction in pixels (one per star)
+        :param shift_y: shifts in y-direction in pixels (one per star)
+        :return: number of padded pixels per side, 3d array of phase ramps of the padded cutouts
+        """
+        key = (tuple(shape), tuple(shift_x), tuple(shift_y))
+        if key not in self._phase_cache:
+            num_pad = int(np.ceil(np.max(np.abs(np.append(shift_x, shift_y))))) + 1
+            ny, nx = shape[0] + 2 * num_pad, shape[1] + 2 * num_pad
+            k_y = np.fft.fftfreq(ny)[np.newaxis, :, np.newaxis]
+            k_x = np.fft.fftfreq(nx)[np.newaxis, np.newaxis, :]
+            shift_x = np.asarray(shift_x)[:, np.newaxis, np.newaxis]
+            shift_y = np.asarray(shift_y)[:, np.newaxis, np.newaxis]
+            self._phase_cache[key] = num_pad, np.exp(-2j * np.pi * (k_y * shift_y + k_x * shift_x))
+        return self._phase_cache[key]
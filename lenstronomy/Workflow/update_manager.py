@@ -194,20 +194,34 @@ class UpdateManager(object):
 
         :return: instance of the Param class with the recent options and bounds
         """
+        return Param(**self.kwargs_param_class)
+
+    @property
+    def kwargs_param_class(self):
+        """
+        keyword arguments to create the Param() class with the recent options and bounds (see param_class)
+
+        :return: keyword arguments of Param()
+        """
         kwargs_fixed_lens, kwargs_fixed_source, kwargs_fixed_lens_light, kwargs_fixed_ps, kwargs_fixed_special, kwargs_fixed_extinction = self.fixed_kwargs
         kwargs_lower_lens, kwargs_lower_source, kwargs_lower_lens_light, kwargs_lower_ps, kwargs_lower_special, kwargs_lower_extinction = self._lower_kwargs
         kwargs_upper_lens, kwargs_upper_source, kwargs_upper_lens_light, kwargs_upper_ps, kwargs_upper_special, kwargs_upper_extinction = self._upper_kwargs
-        kwargs_model = self.kwargs_model
-        kwargs_constraints = self.kwargs_constraints
-        lens_temp = self._kwargs_temp['kwargs_lens']
-        param_class = Param(kwargs_model, kwargs_fixed_lens, kwargs_fixed_source,
-                            kwargs_fixed_lens_light, kwargs_fixed_ps, kwargs_fixed_special, kwargs_fixed_extinction,
-                            kwargs_lower_lens, kwargs_lower_source, kwargs_lower_lens_light, kwargs_lower_ps,
-                            kwargs_lower_special, kwargs_lower_extinction,
-                            kwargs_upper_lens, kwargs_upper_source, kwargs_upper_lens_light, kwargs_upper_ps,
-                            kwargs_upper_special, kwargs_upper_extinction,
-                            kwargs_lens_init=lens_temp, **kwargs_constraints)
-        return param_class
+        kwargs_param = {'kwargs_model': self.kwargs_model,
+                        'kwargs_fixed_lens': kwargs_fixed_lens, 'kwargs_fixed_source': kwargs_fixed_source,
+                        'kwargs_fixed_lens_light': kwargs_fixed_lens_light, 'kwargs_fixed_ps': kwargs_fixed_ps,
+                        'kwargs_fixed_special': kwargs_fixed_special,
+                        'kwargs_fixed_extinction': kwargs_fixed_extinction,
+                        'kwargs_lower_lens': kwargs_lower_lens, 'kwargs_lower_source': kwargs_lower_source,
+                        'kwargs_lower_lens_light': kwargs_lower_lens_light, 'kwargs_lower_ps': kwargs_lower_ps,
+                        'kwargs_lower_special': kwargs_lower_special,
+                        'kwargs_lower_extinction': kwargs_lower_extinction,
+                        'kwargs_upper_lens': kwargs_upper_lens, 'kwargs_upper_source': kwargs_upper_source,
+                        'kwargs_upper_lens_light': kwargs_upper_lens_light, 'kwargs_upper_ps': kwargs_upper_ps,
+                        'kwargs_upper_special': kwargs_upper_special,
+                        'kwargs_upper_extinction': kwargs_upper_extinction,
+                        'kwargs_lens_init': self._kwargs_temp['kwargs_lens']}
+        kwargs_param.update(self.kwargs_constraints)
+        return kwargs_param
 
     def update_options(self, kwargs_model=None, kwargs_constraints=None, kwargs_likelihood=None):
         """
@@ -4,3 +4,15 @@ __version__ = '1.11.1'
 __credits__ = 'ETH Zurich, UCLA, Stanford, Stony Brook'
 
 from .Util.package_util import short, laconic
+
+# sub-packages are imported at their first access as attribute, e.g. lenstronomy.LensModel (PEP 562), such that
+# 'import lenstronomy' itself stays cheap
+_subpackages = ['Analysis', 'Conf', 'Cosmo', 'Data', 'GalKin', 'ImSim', 'LensModel', 'LightModel', 'Plots',
+                'PointSource', 'Sampling', 'SimulationAPI', 'Util', 'Workflow']
+
+
+def __getattr__(name):
+    if name in _subpackages:
+        import importlib
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
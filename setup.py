@@ -89,5 +89,6 @@ setup(
         "Programming Language :: Python :: 3.9",
     ],
     tests_require=tests_require,
+    entry_points={'console_scripts': ['lenstronomy-warmup=lenstronomy.Util.numba_warmup:main']},
     cmdclass={'test': PyTest},  # 'build_ext':build_ext,
 )
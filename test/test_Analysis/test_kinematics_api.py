@@ -121,6 +121,17 @@ class TestKinematicsAPI(object):
                                                                             theta_E=None, gamma=None)
         npt.assert_almost_equal(kwargs_profile['gamma'], 2, decimal=2)
 
+        kinematicAPI = KinematicsAPI(z_lens, z_source, kwargs_model, kwargs_aperture=[kwargs_aperture],
+                                     kwargs_seeing=[kwargs_psf], analytic_kinematics=True, grid_kinematics=True,
+                                     anisotropy_model=anisotropy_model, multi_observations=True,
+                                     kwargs_mge_light=kwargs_mge, kwargs_mge_mass=kwargs_mge, sampling_number=1000)
+        aperture_grid_list = kinematicAPI._aperture_grid()
+        assert len(aperture_grid_list) == 1
+        galkin, kwargs_profile, kwargs_light = kinematicAPI.galkin_settings(kwargs_lens, kwargs_lens_light, r_eff=None,
+                                                                            theta_E=None, gamma=None)
+        assert kinematicAPI._aperture_grid() is aperture_grid_list
+        assert galkin._aperture_grid_list is aperture_grid_list
+
     def test_kinematic_light_profile(self):
         z_lens = 0.5
         z_source = 1.5
@@ -244,6 +255,60 @@ class TestKinematicsAPI(object):
         print(vel_disp_numerical, vel_disp_analytic)
         npt.assert_almost_equal(vel_disp_numerical, vel_disp_analytic, decimal=-1)
 
+        # deterministic grid integration
+        kin_api.kinematics_modeling_settings(anisotropy_model, kwargs_numerics_galkin, analytic_kinematics=False,
+                                             grid_kinematics=True)
+        vel_disp_grid = kin_api.velocity_dispersion_map(kwargs_lens, kwargs_lens_light, kwargs_anisotropy,
+                                                        r_eff=r_eff, theta_E=theta_E, gamma=2)
+        npt.assert_allclose(vel_disp_grid, vel_disp_numerical, rtol=0.02)
+        vel_disp_grid_2 = kin_api.velocity_dispersion_map(kwargs_lens, kwargs_lens_light, kwargs_anisotropy,
+                                                          r_eff=r_eff, theta_E=theta_E, gamma=2)
+        npt.assert_almost_equal(vel_disp_grid_2, vel_disp_grid, decimal=10)
+        # the aperture grid is created once and passed to the Galkin instances of the following calls
+        aperture_grid = kin_api._aperture_grid()
+        galkin, _, _ = kin_api.galkin_settings(kwargs_lens, kwargs_lens_light, r_eff=r_eff, theta_E=theta_E, gamma=2)
+        assert galkin._aperture_grid(None, 5) is aperture_grid
+        kin_api.kinematics_modeling_settings(anisotropy_model, kwargs_numerics_galkin, analytic_kinematics=False,
+                                             grid_kinematics=True, kwargs_grid_kinematics={'supersampling_factor': 3})
+        aperture_grid_2 = kin_api._aperture_grid()
+        assert aperture_grid_2 is not aperture_grid
+        assert aperture_grid_2.settings == (None, 3)
+        galkin, _, _ = kin_api.galkin_settings(kwargs_lens, kwargs_lens_light, r_eff=r_eff, theta_E=theta_E, gamma=2)
+        assert galkin._aperture_grid(None, 3) is aperture_grid_2
+        kin_api.kinematics_modeling_settings(anisotropy_model, kwargs_numerics_galkin, analytic_kinematics=False)
+        assert kin_api._aperture_grid() is None
+
+    def test_velocity_dispersion_grid(self):
+        np.random.seed(42)
+        kwargs_options = {'lens_model_list': ['SIS'], 'lens_light_model_list': ['HERNQUIST']}
+        r_eff = 1.
+        theta_E = 1
+        kwargs_lens = [{'theta_E': theta_E, 'center_x': 0, 'center_y': 0}]
+        kwargs_lens_light = [{'amp': 1, 'Rs': r_eff * 0.551, 'center_x': 0, 'center_y': 0}]
+        kwargs_anisotropy = {'r_ani': 1}
+        kwargs_aperture = {'aperture_type': 'slit', 'length': 1., 'width': 0.3, 'center_ra': 0, 'center_dec': 0,
+                           'angle': 0}
+        kwargs_seeing = {'psf_type': 'GAUSSIAN', 'fwhm': 0.7}
+        kwargs_numerics_galkin = {'interpol_grid_num': 500, 'log_integration': True,
+                                  'max_integrate': 10, 'min_integrate': 0.001}
+        kin_api = KinematicsAPI(0.5, 1.5, kwargs_options, kwargs_aperture=kwargs_aperture,
+                                kwargs_seeing=kwargs_seeing, anisotropy_model='OM',
+                                kwargs_numerics_galkin=kwargs_numerics_galkin, sampling_number=5000)
+        vel_disp = kin_api.velocity_dispersion(kwargs_lens, kwargs_lens_light, kwargs_anisotropy, r_eff=r_eff,
+                                               theta_E=theta_E)
+        kin_api = KinematicsAPI(0.5, 1.5, kwargs_options, kwargs_aperture=kwargs_aperture,
+                                kwargs_seeing=kwargs_seeing, anisotropy_model='OM',
+                                kwargs_numerics_galkin=kwargs_numerics_galkin, grid_kinematics=True,
+                                kwargs_grid_kinematics={'delta_pix': 0.05, 'supersampling_factor': 3})
+        vel_disp_grid = kin_api.velocity_dispersion(kwargs_lens, kwargs_lens_light, kwargs_anisotropy, r_eff=r_eff,
+                                                    theta_E=theta_E)
+        npt.assert_allclose(vel_disp_grid, vel_disp, rtol=0.02)
+        vel_disp_grid_kappa = kin_api.velocity_dispersion(kwargs_lens, kwargs_lens_light, kwargs_anisotropy,
+                                                          r_eff=r_eff, theta_E=theta_E, kappa_ext=0.1)
+        npt.assert_almost_equal(vel_disp_grid_kappa, vel_disp_grid * np.sqrt(0.9), decimal=8)
+        vel_disp_analytic = kin_api.velocity_dispersion_analytical(theta_E, gamma=2, r_eff=r_eff, r_ani=1)
+        npt.assert_allclose(vel_disp_analytic, vel_disp_grid, rtol=0.02)
+
     def test_interpolated_sersic(self):
         from lenstronomy.Analysis.light2mass import light2mass_interpol
         kwargs_light = [{'n_sersic': 2, 'R_sersic': 0.5, 'amp': 1, 'center_x': 0.01, 'center_y': 0.01}]
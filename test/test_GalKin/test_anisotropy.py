@@ -138,13 +138,15 @@ class TestAnisotropy(object):
         K_gom = gom.K(r, R, **kwargs_gom)
         K_om = om.K(r, R, **kwargs_om)
         npt.assert_almost_equal(K_gom, K_om, decimal=3)
-        assert hasattr(gom._model, '_f_12_interp')
-        assert hasattr(gom._model, '_f_32_interp')
+        # the tables of the hypergeometric functions are shared and kept for other anisotropy parameters
+        from lenstronomy.GalKin import anisotropy
+        assert 0.5 in anisotropy._F_tables and 1.5 in anisotropy._F_tables
         gom.delete_anisotropy_cache()
-        if hasattr(gom._model, '_f_12_interp'):
-            assert False
-        if hasattr(gom._model, '_f_32_interp'):
-            assert False
+        anisotropy.GeneralizedOM().delete_cache()
+        assert 0.5 in anisotropy._F_tables and 1.5 in anisotropy._F_tables
+        kwargs_gom = {'r_ani': 1.5, 'beta_inf': 0.6}
+        K_gom_2 = Anisotropy(anisotropy_type='GOM').K(r, R, **kwargs_gom)
+        npt.assert_almost_equal(K_gom_2, gom.K(r, R, **kwargs_gom), decimal=10)
 
         from lenstronomy.GalKin.anisotropy import GeneralizedOM
         gom_class = GeneralizedOM()
@@ -152,6 +154,23 @@ class TestAnisotropy(object):
         _F_array = gom_class._F(a=3 / 2., z=np.array([0.5]), beta_inf=1)
         npt.assert_almost_equal(_F_array[0], _F, decimal=5)
 
+        # interpolated hypergeometric function, including the values outside of the table
+        z = np.array([0, -1e-3, -0.5, -10, -1e4, -1e8, -1e12])
+        for a in [1 / 2., 3 / 2.]:
+            for beta_inf in [-1, -0.37, 0, 0.5, 0.83, 1, 1.2]:
+                _F_interp = gom_class._F_interp(a=a, z=z, beta_inf=beta_inf)
+                _F_array = gom_class._F(a=a, z=z, beta_inf=beta_inf)
+                npt.assert_allclose(_F_interp, _F_array, rtol=1e-6)
+        # largest errors of the table, between the nodes in beta_inf and at the lower end of z
+        z = -np.expm1(np.array([12.5125, 24.9875, 25.]))
+        for a in [1 / 2., 3 / 2.]:
+            for beta_inf in [-0.99875, -0.50125, 0.50125, 0.99875]:
+                _F_interp = gom_class._F_interp(a=a, z=z, beta_inf=beta_inf)
+                _F_array = np.array(gom_class._F(a=a, z=z, beta_inf=beta_inf), dtype=float)
+                npt.assert_allclose(_F_interp, _F_array, rtol=2e-7)
+        _F = gom_class._F_interp(a=1 / 2., z=-0.5, beta_inf=0.3)
+        npt.assert_almost_equal(_F, float(gom_class._F(a=1 / 2., z=-0.5, beta_inf=0.3)), decimal=8)
+
 
 class TestRaise(unittest.TestCase):
 
@@ -1,5 +1,8 @@
 from lenstronomy.GalKin.aperture import Aperture
 
+import numpy as np
+import numpy.testing as npt
+
 import pytest
 import unittest
 
@@ -36,6 +39,23 @@ class TestAperture(object):
         assert bool is False
         assert frame.num_segments == 1
 
+    def test_max_radius(self):
+        slit = Aperture(aperture_type='slit', length=2, width=0.5, center_ra=0.3, center_dec=0.4, angle=0.2)
+        npt.assert_almost_equal(slit.max_radius, 0.5 + np.sqrt(1 + 0.25 ** 2), decimal=10)
+        shell = Aperture(aperture_type='shell', r_in=0.2, r_out=1., center_ra=0, center_dec=0.1)
+        npt.assert_almost_equal(shell.max_radius, 1.1, decimal=10)
+        frame = Aperture(aperture_type='frame', width_outer=1, width_inner=0.5, center_ra=0, center_dec=0)
+        npt.assert_almost_equal(frame.max_radius, np.sqrt(0.5), decimal=10)
+        ifu = Aperture(aperture_type='IFU_shells', r_bins=np.linspace(0, 2, 5), center_ra=0, center_dec=0)
+        npt.assert_almost_equal(ifu.max_radius, 2, decimal=10)
+
+        # no selected point is outside of max_radius
+        np.random.seed(41)
+        for aperture in [slit, shell, frame, ifu]:
+            for ra, dec in np.random.uniform(-3, 3, (1000, 2)):
+                if aperture.aperture_select(ra, dec)[0] is True:
+                    assert np.sqrt(ra ** 2 + dec ** 2) <= aperture.max_radius
+
 
 class TestRaise(unittest.TestCase):
 
@@ -0,0 +1,49 @@
+from lenstronomy.GalKin.aperture_grid import ApertureGrid
+from lenstronomy.GalKin.observation import GalkinObservation
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+import unittest
+
+
+class TestApertureGrid(object):
+
+    def setup_method(self):
+        pass
+
+    def test_aperture_sum(self):
+        kwargs_aperture = {'aperture_type': 'IFU_shells', 'r_bins': np.array([0, 0.5, 1.]), 'center_ra': 0,
+                           'center_dec': 0}
+        observation = GalkinObservation(kwargs_aperture=kwargs_aperture,
+                                        kwargs_psf={'psf_type': 'GAUSSIAN', 'fwhm': 0.001})
+        grid = ApertureGrid(observation, delta_pix=0.02, supersampling_factor=5)
+        # the grid covers the aperture and no super-sampled pixel is at the origin
+        assert np.max(grid.radius) > 1
+        assert np.min(grid.radius) > 0
+        # area of the shells for a uniform surface density without seeing
+        area = grid.aperture_sum(np.ones_like(grid.radius)) * 0.02 ** 2
+        npt.assert_allclose(area, [np.pi * 0.5 ** 2, np.pi * (1 - 0.5 ** 2)], rtol=1e-3)
+
+        # the convolution conserves the flux of a compact source
+        observation = GalkinObservation(kwargs_aperture={'aperture_type': 'shell', 'r_in': 0, 'r_out': 3},
+                                        kwargs_psf={'psf_type': 'GAUSSIAN', 'fwhm': 0.5})
+        grid = ApertureGrid(observation, supersampling_factor=3)
+        values = np.exp(- grid.radius ** 2 / 2 / 0.1 ** 2)
+        flux = np.sum(values) / 9.
+        npt.assert_allclose(grid.aperture_sum(values), flux, rtol=1e-6)
+
+
+class TestRaise(unittest.TestCase):
+
+    def test_raise(self):
+        observation = GalkinObservation(kwargs_aperture={'aperture_type': 'shell', 'r_in': 0, 'r_out': 1},
+                                        kwargs_psf={'psf_type': 'GAUSSIAN', 'fwhm': 0.5})
+        with self.assertRaises(ValueError):
+            ApertureGrid(observation, delta_pix=0)
+        with self.assertRaises(ValueError):
+            ApertureGrid(observation, supersampling_factor=0)
+
+
+if __name__ == '__main__':
+    pytest.main()
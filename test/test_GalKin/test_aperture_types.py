@@ -1,6 +1,7 @@
 from lenstronomy.GalKin import aperture_types
 import pytest
 import numpy as np
+import numpy.testing as npt
 
 
 class TestApertureTypes(object):
@@ -50,6 +51,42 @@ class TestApertureTypes(object):
         assert bool_select is False
 
 
+    def test_select_array(self):
+        np.random.seed(41)
+        ra, dec = np.random.uniform(-2, 2, (2, 1000))
+        kwargs_list = [('slit', aperture_types.slit_select, {'length': 2, 'width': 0.5, 'center_ra': 0.1,
+                                                             'center_dec': -0.2, 'angle': 0.7}),
+                       ('frame', aperture_types.frame_select, {'width_outer': 2, 'width_inner': 0.6, 'center_ra': 0.1,
+                                                               'center_dec': 0, 'angle': 0.3}),
+                       ('shell', aperture_types.shell_select, {'r_in': 0.5, 'r_out': 1.5, 'center_ra': 0,
+                                                               'center_dec': 0.2})]
+        for name, select, kwargs in kwargs_list:
+            bool_select = select(ra, dec, **kwargs)
+            assert bool_select.dtype == bool and bool_select.shape == ra.shape
+            for i in range(len(ra)):
+                assert bool_select[i] == select(ra[i], dec[i], **kwargs)
+            assert 0 < np.count_nonzero(bool_select) < len(ra)
+
+        r_bin = np.array([0.2, 0.5, 1., 1.5])
+        bool_select, index = aperture_types.shell_ifu_select(ra, dec, r_bin, center_ra=0.1, center_dec=0)
+        assert index.dtype.kind == 'i'
+        for i in range(len(ra)):
+            bool_i, index_i = aperture_types.shell_ifu_select(ra[i], dec[i], r_bin, center_ra=0.1, center_dec=0)
+            assert bool_select[i] == bool_i
+            assert index[i] == (index_i if bool_i else -1)
+        assert set(index) == {-1, 0, 1, 2}
+
+        # aperture classes
+        slit = aperture_types.Slit(length=2, width=0.5)
+        bool_select, index = slit.aperture_select(ra, dec)
+        npt.assert_array_equal(index, np.where(bool_select, 0, -1))
+        bool_select, index = slit.aperture_select(0.5, 0)
+        assert bool_select is True and index == 0
+        ifu = aperture_types.IFUShells(r_bins=r_bin)
+        bool_select, index = ifu.aperture_select(np.array([0.1, 0.6, 2.]), np.zeros(3))
+        npt.assert_array_equal(bool_select, [False, True, False])
+        npt.assert_array_equal(index, [-1, 1, -1])
+
 
 if __name__ == '__main__':
     pytest.main()
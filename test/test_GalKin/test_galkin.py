@@ -285,6 +285,59 @@ class TestGalkin(object):
                                     kwargs_anisotropy=kwargs_anisotropy, sampling_number=1000)
         npt.assert_almost_equal(sigma_v, sigma_v_ifu[0], decimal=-1)
 
+    def test_dispersion_map_grid(self):
+        """
+        tests the deterministic grid integration against the spectral rendering
+        """
+        kwargs_light = [{'Rs': 0.551 * 1.5, 'amp': 1.}]
+        kwargs_mass = [{'theta_E': 1.2, 'gamma': 2.}]
+        kwargs_anisotropy = {'r_ani': 2.}
+        kwargs_model = {'mass_profile_list': ['SPP'], 'light_profile_list': ['HERNQUIST'], 'anisotropy_model': 'OM'}
+        kwargs_cosmo = {'d_d': 1000, 'd_s': 1500, 'd_ds': 800}
+        kwargs_numerics = {'interpol_grid_num': 500, 'log_integration': True, 'max_integrate': 100,
+                           'min_integrate': 0.001}
+        kwargs_ifu = {'aperture_type': 'IFU_shells', 'r_bins': np.linspace(0, 2, 4), 'center_ra': 0, 'center_dec': 0}
+        kwargs_slit = {'aperture_type': 'slit', 'length': 1., 'width': 0.3, 'center_ra': 0.1, 'center_dec': 0,
+                       'angle': 0.5}
+        kwargs_psf_gaussian = {'psf_type': 'GAUSSIAN', 'fwhm': 0.7}
+        kwargs_psf_moffat = {'psf_type': 'MOFFAT', 'fwhm': 0.7, 'moffat_beta': 2.6}
+        for kwargs_aperture in [kwargs_ifu, kwargs_slit]:
+            for kwargs_psf in [kwargs_psf_gaussian, kwargs_psf_moffat]:
+                galkin = Galkin(kwargs_model, kwargs_aperture, kwargs_psf, kwargs_cosmo, kwargs_numerics)
+                sigma_v_grid = galkin.dispersion_map_grid(kwargs_mass, kwargs_light, kwargs_anisotropy)
+                sigma_v = galkin.dispersion_map(kwargs_mass, kwargs_light, kwargs_anisotropy, num_kin_sampling=2000,
+                                                num_psf_sampling=100)
+                assert len(sigma_v_grid) == galkin.num_segments
+                npt.assert_allclose(sigma_v_grid, sigma_v, rtol=0.01)
+
+        # deterministic and converged with the resolution of the grid
+        sigma_v_grid_2 = galkin.dispersion_map_grid(kwargs_mass, kwargs_light, kwargs_anisotropy)
+        npt.assert_almost_equal(sigma_v_grid_2, sigma_v_grid, decimal=10)
+        sigma_v_grid_2 = galkin.dispersion_map_grid(kwargs_mass, kwargs_light, kwargs_anisotropy, delta_pix=0.05,
+                                                    supersampling_factor=7)
+        npt.assert_allclose(sigma_v_grid_2, sigma_v_grid, rtol=0.003)
+
+        # whole aperture, consistent with the segments
+        galkin = Galkin(kwargs_model, kwargs_ifu, kwargs_psf_gaussian, kwargs_cosmo, kwargs_numerics)
+        sigma_v_grid = galkin.dispersion_grid(kwargs_mass, kwargs_light, kwargs_anisotropy)
+        sigma_v = galkin.dispersion(kwargs_mass, kwargs_light, kwargs_anisotropy, sampling_number=5000)
+        npt.assert_allclose(sigma_v_grid, sigma_v, rtol=0.01)
+        sigma_v_map_grid = galkin.dispersion_map_grid(kwargs_mass, kwargs_light, kwargs_anisotropy)
+        assert np.min(sigma_v_map_grid) < sigma_v_grid < np.max(sigma_v_map_grid)
+        galkin = Galkin(kwargs_model, kwargs_slit, kwargs_psf_gaussian, kwargs_cosmo, kwargs_numerics)
+        sigma_v_grid = galkin.dispersion_grid(kwargs_mass, kwargs_light, kwargs_anisotropy)
+        sigma_v_map_grid = galkin.dispersion_map_grid(kwargs_mass, kwargs_light, kwargs_anisotropy)
+        npt.assert_almost_equal(sigma_v_grid, sigma_v_map_grid[0], decimal=10)
+
+        # analytic kinematics
+        galkin = Galkin(kwargs_model, kwargs_slit, kwargs_psf_gaussian, kwargs_cosmo, kwargs_numerics={},
+                        analytic_kinematics=True)
+        sigma_v_analytic = galkin.dispersion_map_grid(kwargs_mass={'theta_E': 1.2, 'gamma': 2.},
+                                                      kwargs_light={'r_eff': 1.5}, kwargs_anisotropy=kwargs_anisotropy)
+        galkin = Galkin(kwargs_model, kwargs_slit, kwargs_psf_gaussian, kwargs_cosmo, kwargs_numerics)
+        sigma_v_numeric = galkin.dispersion_map_grid(kwargs_mass, kwargs_light, kwargs_anisotropy)
+        npt.assert_allclose(sigma_v_analytic, sigma_v_numeric, rtol=0.005)
+
     def test_projected_integral_vs_3d_rendering(self):
 
         lum_weight_int_method = True
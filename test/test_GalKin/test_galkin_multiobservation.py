@@ -1,5 +1,7 @@
 import pytest
+import numpy.testing as npt
 from lenstronomy.GalKin.galkin_multiobservation import GalkinMultiObservation
+from lenstronomy.GalKin.galkin import Galkin
 
 
 class TestGalkinMultiObservation(object):
@@ -47,6 +49,15 @@ class TestGalkinMultiObservation(object):
         assert len(sigma_v_list) == 2
         assert sigma_v_list[0] > sigma_v_list[1]
 
+        sigma_v_grid_list = galkin_multiobs.dispersion_map_grid(kwargs_mass=kwargs_mass, kwargs_light=kwargs_light,
+                                                                kwargs_anisotropy=kwargs_anisotropy)
+        assert len(sigma_v_grid_list) == 2
+        npt.assert_allclose(sigma_v_grid_list, sigma_v_list, rtol=0.02)
+        for i, (kwargs_aperture, kwargs_psf) in enumerate(zip(kwargs_aperture_list, kwargs_psf_list)):
+            galkin = Galkin(kwargs_model, kwargs_aperture, kwargs_psf, kwargs_cosmo, kwargs_numerics=kwargs_numerics)
+            sigma_v = galkin.dispersion_map_grid(kwargs_mass, kwargs_light, kwargs_anisotropy)
+            npt.assert_almost_equal(sigma_v[0], sigma_v_grid_list[i], decimal=8)
+
 
 if __name__ == '__main__':
     pytest.main()
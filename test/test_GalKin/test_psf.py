@@ -1,5 +1,6 @@
 from lenstronomy.GalKin.psf import PSF
 import numpy as np
+import numpy.testing as npt
 import unittest
 
 
@@ -21,6 +22,23 @@ class TestPSF(object):
         assert x != 0
         assert y != 0
 
+    def test_convolution_kernel(self):
+        psf = PSF(psf_type='GAUSSIAN', fwhm=1)
+        assert psf.fwhm == 1
+        kernel = psf.convolution_kernel(delta_pix=0.1, num_pix=31)
+        assert kernel.shape == (31, 31)
+        npt.assert_almost_equal(np.sum(kernel), 1, decimal=10)
+        assert np.argmax(kernel) == 15 * 31 + 15
+        # half maximum at half of the FWHM
+        npt.assert_almost_equal(kernel[15, 20] / kernel[15, 15], 0.5, decimal=10)
+
+        psf = PSF(psf_type='MOFFAT', fwhm=1, moffat_beta=2.6)
+        assert psf.fwhm == 1
+        kernel = psf.convolution_kernel(delta_pix=0.1, num_pix=31)
+        npt.assert_almost_equal(np.sum(kernel), 1, decimal=10)
+        npt.assert_almost_equal(kernel[15, 20] / kernel[15, 15], 0.5, decimal=10)
+        npt.assert_almost_equal(kernel, kernel.T, decimal=10)
+
 
 class TestRaise(unittest.TestCase):
 
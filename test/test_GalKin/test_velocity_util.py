@@ -57,6 +57,22 @@ class TestVelocityUtil(object):
         assert x_d != x
         assert y_d != y
 
+    def test_displace_PSF_array(self):
+        np.random.seed(41)
+        x, y = np.zeros(10000), np.ones(10000)
+        FWHM = 1
+        x_d, y_d = velocity_util.displace_PSF_gaussian(x, y, FWHM)
+        assert x_d.shape == x.shape and y_d.shape == y.shape
+        sigma = FWHM / (2 * np.sqrt(2 * np.log(2)))
+        npt.assert_almost_equal(np.std(x_d), sigma, decimal=2)
+        npt.assert_almost_equal(np.mean(y_d), 1, decimal=2)
+
+        x_d, y_d = velocity_util.displace_PSF_moffat(x, y, FWHM, beta=2.6)
+        assert x_d.shape == x.shape and y_d.shape == y.shape
+        npt.assert_almost_equal(np.mean(x_d), 0, decimal=1)
+        r = velocity_util.draw_moffat_r(FWHM, beta=2.6, size=(100, 100))
+        assert r.shape == (100, 100)
+
     def test_project_2d_random(self):
         r = 1
         R, x, y = velocity_util.project2d_random(r=r)
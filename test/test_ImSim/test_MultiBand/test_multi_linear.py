@@ -1,5 +1,7 @@
 __author__ = 'sibirrer'
 
+import copy
+import pickle
 import numpy.testing as npt
 import pytest
 import numpy as np
@@ -74,6 +76,7 @@ class TestImageModel(object):
         kwargs_model = {'lens_model_list': lens_model_list, 'source_light_model_list': source_model_list,
                         'point_source_model_list': ['SOURCE_POSITION'], 'fixed_magnification_list': [True]}
         self.imageModel = MultiLinear(multi_band_list, kwargs_model, likelihood_mask_list=None, compute_bool=None)
+        self.multi_band_list, self.kwargs_model = multi_band_list, kwargs_model
 
     def test_image_linear_solve(self):
         model, error_map, cov_param, param = self.imageModel.image_linear_solve(self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps, inv_bool=False)
@@ -90,6 +93,49 @@ class TestImageModel(object):
                                                                self.kwargs_ps, source_marg=True)
         npt.assert_almost_equal(logL - logLmarg, 0, decimal=-2)
 
+    def test_num_band_threads(self):
+        multi_band_list = self.multi_band_list * 3
+        kwargs_model = copy.deepcopy(self.kwargs_model)
+        kwargs_model['source_light_model_list'] = ['SERSIC_ELLIPSE'] * 2
+        kwargs_model['index_source_light_model_list'] = [[0], [1], [0]]
+        kwargs_source = [copy.deepcopy(self.kwargs_source[0]) for _ in range(2)]
+        compute_bool = [True, True, False]
+        image_model_serial = MultiLinear(multi_band_list, kwargs_model, compute_bool=compute_bool)
+        image_model_thread = MultiLinear(multi_band_list, kwargs_model, compute_bool=compute_bool,
+                                         num_band_threads=3)
+
+        kwargs_source_serial, kwargs_ps_serial = copy.deepcopy(kwargs_source), copy.deepcopy(self.kwargs_ps)
+        logL_serial = image_model_serial.likelihood_data_given_model(self.kwargs_lens, kwargs_source_serial,
+                                                                     self.kwargs_lens_light, kwargs_ps_serial,
+                                                                     source_marg=True)
+        kwargs_source_thread, kwargs_ps_thread = copy.deepcopy(kwargs_source), copy.deepcopy(self.kwargs_ps)
+        logL_thread = image_model_thread.likelihood_data_given_model(self.kwargs_lens, kwargs_source_thread,
+                                                                     self.kwargs_lens_light, kwargs_ps_thread,
+                                                                     source_marg=True)
+        assert logL_serial == logL_thread
+        for kwargs_serial, kwargs_thread in zip(kwargs_source_serial, kwargs_source_thread):
+            assert kwargs_serial['amp'] == kwargs_thread['amp']
+        assert kwargs_ps_serial[0]['source_amp'] == kwargs_ps_thread[0]['source_amp']
+
+        model_serial, _, _, param_serial = image_model_serial.image_linear_solve(self.kwargs_lens, kwargs_source,
+                                                                                  self.kwargs_lens_light, self.kwargs_ps)
+        model_thread, _, _, param_thread = image_model_thread.image_linear_solve(self.kwargs_lens, kwargs_source,
+                                                                                  self.kwargs_lens_light, self.kwargs_ps)
+        assert model_thread[2] is None
+        for i in range(2):
+            npt.assert_array_equal(model_thread[i], model_serial[i])
+            npt.assert_array_equal(param_thread[i], param_serial[i])
+
+        # the thread pool is not pickled but re-created when needed
+        image_model_copy = pickle.loads(pickle.dumps(image_model_thread))
+        logL_copy = image_model_copy.likelihood_data_given_model(self.kwargs_lens, kwargs_source,
+                                                                 self.kwargs_lens_light, self.kwargs_ps,
+                                                                 source_marg=True)
+        assert logL_copy == logL_serial
+
+        with pytest.raises(ValueError):
+            MultiLinear(multi_band_list, kwargs_model, num_band_threads=0)
+
     def test_numData_evaluate(self):
         numData = self.imageModel.num_data_evaluate
         assert numData == 10000
@@ -177,6 +177,30 @@ class TestNumerics(object):
         delta = (self.image_true - image_conv) / self.image_true
         npt.assert_almost_equal(delta[self._conv_pixels_partial], 0, decimal=1)
 
+    def test_adjoint(self):
+        # convolve() and convolve_adjoint() as well as re_size_convolve_adjoint() are the transposes of the forward
+        # operations, for the full frame and for a sub-frame
+        np.random.seed(41)
+        kwargs_numerics_super = {'supersampling_factor': 2, 'compute_mode': 'regular', 'supersampling_convolution': False}
+        for kwargs_numerics in [kwargs_numerics_super, self.kwargs_numerics_partial]:
+            image_model = ImageModel(self.pixel_grid, self.psf_class, lens_light_model_class=self.lightModel,
+                                     kwargs_numerics=kwargs_numerics)
+            numerics = image_model.ImageNumerics
+            numerics.check_adjoint()
+            flux = np.random.normal(size=len(numerics.coordinates_evaluate[0]))
+            image = np.random.normal(size=(61, 61))
+            image_resized = numerics.re_size_convolve(flux, unconvolved=True)
+            npt.assert_almost_equal(numerics.convolve(image_resized), numerics.re_size_convolve(flux), decimal=10)
+            npt.assert_almost_equal(np.sum(numerics.convolve(image_resized) * image),
+                                    np.sum(image_resized * numerics.convolve_adjoint(image)), decimal=8)
+            npt.assert_almost_equal(np.sum(numerics.re_size_convolve(flux) * image),
+                                    np.sum(flux * numerics.re_size_convolve_adjoint(image)), decimal=8)
+
+        image_model = ImageModel(self.pixel_grid, self.psf_class, lens_light_model_class=self.lightModel,
+                                 kwargs_numerics=self.kwargs_numerics_true)
+        with pytest.raises(ValueError):
+            image_model.ImageNumerics.check_adjoint()
+
     def test_property_access(self):
         image_model = ImageModel(self.pixel_grid, self.psf_class, lens_light_model_class=self.lightModel,
                                  kwargs_numerics=self.kwargs_numerics_true)
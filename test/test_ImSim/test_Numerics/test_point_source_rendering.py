@@ -1,6 +1,7 @@
 from lenstronomy.ImSim.Numerics.point_source_rendering import PointSourceRendering
 from lenstronomy.Data.pixel_grid import PixelGrid
 from lenstronomy.Data.psf import PSF
+from lenstronomy.Util import kernel_util, util
 
 import numpy as np
 import numpy.testing as npt
@@ -42,6 +43,29 @@ class TestPointSourceRendering(object):
         model = self._ps_rendering.point_source_rendering(ra_pos, dec_pos, amp)
         npt.assert_almost_equal(np.sum(model), 2, decimal=8)
 
+    def test_point_source_rendering_sparse(self):
+        Mpix2coord = np.array([[1, 0], [0, 1]]) * 0.1
+        kwargs_grid = {'ra_at_xy_0': -2, 'dec_at_xy_0': -2,
+                       'transform_pix2angle': Mpix2coord, 'nx': 40, 'ny': 40}
+        pixel_grid = PixelGrid(**kwargs_grid)
+        kernel = kernel_util.kernel_gaussian(kernel_numPix=11, deltaPix=0.1, fwhm=0.3)
+        psf_class = PSF(psf_type='PIXEL', kernel_point_source=kernel)
+        # including point sources at the edge and outside of the frame
+        ra_pos, dec_pos = np.array([0.13, -1.95, 1.9, 2.3, 10]), np.array([0.21, 0.5, -1.97, 0.1, 10])
+        amp = [1, 2, 3, 4, 5]
+        for supersampling_factor in [1, 2, 3]:
+            ps_rendering = PointSourceRendering(pixel_grid, supersampling_factor=supersampling_factor, psf=psf_class)
+            model = util.image2array(ps_rendering.point_source_rendering(ra_pos, dec_pos, amp))
+            index, values = ps_rendering.point_source_rendering_sparse(ra_pos, dec_pos, amp)
+            model_sparse = np.zeros_like(model)
+            model_sparse[index] = values
+            npt.assert_almost_equal(model_sparse, model, decimal=10)
+            assert len(index) < len(model) / 5
+
+        index, values = self._ps_rendering.point_source_rendering_sparse([50], [50], [1])
+        assert len(index) == 0
+        assert len(values) == 0
+
 
 class TestRaise(unittest.TestCase):
 
@@ -58,6 +82,8 @@ class TestRaise(unittest.TestCase):
         self._ps_rendering = PointSourceRendering(pixel_grid, supersampling_factor=1, psf=psf_class)
         with self.assertRaises(ValueError):
             self._ps_rendering.point_source_rendering(ra_pos=[1, 1], dec_pos=[0, 1], amp=[1])
+        with self.assertRaises(ValueError):
+            self._ps_rendering.point_source_rendering_sparse(ra_pos=[1, 1], dec_pos=[0, 1], amp=[1])
 
 
 if __name__ == '__main__':
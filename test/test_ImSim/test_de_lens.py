@@ -25,6 +25,56 @@ class TestDeLens(object):
         npt.assert_almost_equal(result_new[1], result[1], decimal=10)
         npt.assert_almost_equal(image_new[0], image[0], decimal=10)
 
+    def test_normal_equations_sparse(self):
+        np.random.seed(42)
+        A = np.random.normal(size=(20, 4))
+        # the last two responses are only non-zero on a few data points
+        A[:15, 2] = 0
+        A[5:, 3] = 0
+        C_D_inv = np.random.uniform(0.5, 2, size=20)
+        d = np.random.normal(size=20)
+        M, R = de_lens.normal_equations(A, C_D_inv, d)
+        sparse_index_list = [None, None, np.arange(15, 20), np.arange(0, 5)]
+        M_sparse, R_sparse = de_lens.normal_equations(A, C_D_inv, d, sparse_index_list=sparse_index_list)
+        npt.assert_almost_equal(M_sparse, M, decimal=10)
+        npt.assert_almost_equal(R_sparse, R, decimal=10)
+
+        result, cov_error, image = de_lens.get_param_WLS(A, C_D_inv, d)
+        result_sparse, cov_error_sparse, image_sparse = de_lens.get_param_WLS(A, C_D_inv, d,
+                                                                              sparse_index_list=sparse_index_list)
+        npt.assert_almost_equal(result_sparse, result, decimal=8)
+        npt.assert_almost_equal(cov_error_sparse, cov_error, decimal=8)
+
+    def test_get_param_cg(self):
+        np.random.seed(42)
+        A = np.random.normal(size=(30, 5))
+        C_D_inv = np.random.uniform(0.5, 2, size=30)
+        d = np.random.normal(size=30)
+        M, R = de_lens.normal_equations(A, C_D_inv, d)
+        result, cov_error, image = de_lens.get_param_WLS(A, C_D_inv, d, inv_bool=False)
+        apply_M = lambda x: M.dot(x)
+        result_cg, num_iter = de_lens.get_param_cg(apply_M, R, M_diag=np.diag(M), tol=1e-12)
+        npt.assert_almost_equal(result_cg, result, decimal=8)
+        assert num_iter <= 10
+        result_cg, num_iter = de_lens.get_param_cg(apply_M, R, x0=result, tol=1e-12)
+        npt.assert_almost_equal(result_cg, result, decimal=8)
+        result_cg, num_iter = de_lens.get_param_cg(apply_M, np.zeros(5))
+        npt.assert_almost_equal(result_cg, 0, decimal=8)
+        assert num_iter == 0
+
+    def test_log_det_lanczos(self):
+        np.random.seed(42)
+        A = np.random.normal(size=(200, 40))
+        M = A.T.dot(A)
+        sign, log_det = np.linalg.slogdet(M)
+        log_det_lanczos = de_lens.log_det_lanczos(lambda x: M.dot(x), num=40, num_probes=100, num_steps=40)
+        npt.assert_almost_equal(log_det_lanczos / log_det, 1, decimal=2)
+        # deterministic for a fixed seed
+        log_det_lanczos2 = de_lens.log_det_lanczos(lambda x: M.dot(x), num=40, num_probes=100, num_steps=40)
+        assert log_det_lanczos == log_det_lanczos2
+        log_det_lanczos = de_lens.log_det_lanczos(lambda x: -M.dot(x), num=40, num_probes=1, num_steps=40)
+        assert np.isnan(log_det_lanczos)
+
     def test_wls_stability(self):
         A = np.array([[1, 2, 3], [3, 2, 1]]).T
         C_D_inv = np.array([0, 0, 0])
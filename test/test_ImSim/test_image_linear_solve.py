@@ -1,6 +1,7 @@
 __author__ = 'sibirrer'
 
 from lenstronomy.ImSim.image_linear_solve import ImageLinearFit
+from lenstronomy.ImSim.linear_response_operator import LinearResponseOperator
 import lenstronomy.Util.param_util as param_util
 from lenstronomy.LensModel.lens_model import LensModel
 from lenstronomy.LightModel.light_model import LightModel
@@ -8,6 +9,10 @@ from lenstronomy.PointSource.point_source import PointSource
 import lenstronomy.Util.simulation_util as sim_util
 from lenstronomy.Data.imaging_data import ImageData
 from lenstronomy.Data.psf import PSF
+from lenstronomy.Util import kernel_util
+import numpy as np
+import numpy.testing as npt
+import pytest
 
 
 class TestImageLinearFit(object):
@@ -57,4 +62,188 @@ class TestImageLinearFit(object):
         param = self.imageModel.linear_param_from_kwargs(self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps)
         assert param[0] == self.kwargs_source[0]['amp']
         assert param[1] == self.kwargs_lens_light[0]['amp']
-        assert param[2] == self.kwargs_ps[0]['source_amp']
\ No newline at end of file
+        assert param[2] == self.kwargs_ps[0]['source_amp']
+
+    def test_freeze_extended_response(self):
+        A = self.imageModel.linear_response_matrix(self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light,
+                                                   self.kwargs_ps)
+        self.imageModel.freeze_extended_response(True)
+        A_frozen = self.imageModel.linear_response_matrix(self.kwargs_lens, self.kwargs_source,
+                                                          self.kwargs_lens_light, self.kwargs_ps)
+        npt.assert_almost_equal(A_frozen, A, decimal=8)
+        # the frozen responses ignore changes of the extended model parameters
+        kwargs_source = [dict(self.kwargs_source[0], R_sersic=2 * self.kwargs_source[0]['R_sersic'])]
+        A_frozen = self.imageModel.linear_response_matrix(self.kwargs_lens, kwargs_source, self.kwargs_lens_light,
+                                                          self.kwargs_ps)
+        npt.assert_almost_equal(A_frozen, A, decimal=8)
+        self.imageModel.freeze_extended_response(False)
+        A_new = self.imageModel.linear_response_matrix(self.kwargs_lens, kwargs_source, self.kwargs_lens_light,
+                                                       self.kwargs_ps)
+        assert np.max(np.abs(A_new[0] - A[0])) > 0
+
+class TestImageLinearFitMatrixFree(object):
+
+    def setup_method(self):
+        np.random.seed(41)
+        kwargs_data = sim_util.data_configure_simple(numPix=50, deltaPix=0.05, exposure_time=100, background_rms=0.05)
+        data_class = ImageData(**kwargs_data)
+        kernel = kernel_util.kernel_gaussian(kernel_numPix=11, deltaPix=0.05, fwhm=0.15)
+        psf_class = PSF(psf_type='PIXEL', kernel_point_source=kernel)
+        lens_model_class = LensModel(lens_model_list=['SIE'])
+        self.kwargs_lens = [{'theta_E': 1., 'e1': 0.1, 'e2': 0, 'center_x': 0, 'center_y': 0}]
+        source_model_class = LightModel(light_model_list=['SHAPELETS'])
+        self.kwargs_source = [{'n_max': 6, 'beta': 0.2, 'center_x': 0.05, 'center_y': 0}]
+        lens_light_model_class = LightModel(light_model_list=['SERSIC'])
+        self.kwargs_lens_light = [{'R_sersic': 0.5, 'n_sersic': 2, 'center_x': 0, 'center_y': 0}]
+        point_source_class = PointSource(point_source_type_list=['LENSED_POSITION'], fixed_magnification_list=[False])
+        self.kwargs_ps = [{'ra_image': np.array([1.0, -0.9]), 'dec_image': np.array([0.1, -0.2])}]
+        kwargs_numerics = {'supersampling_factor': 2}
+        likelihood_mask = np.ones((50, 50))
+        likelihood_mask[:5, :] = 0
+
+        self.imageModel = ImageLinearFit(data_class, psf_class, lens_model_class, source_model_class,
+                                         lens_light_model_class, point_source_class, kwargs_numerics=kwargs_numerics,
+                                         likelihood_mask=likelihood_mask)
+        param = np.random.uniform(0, 10, size=self.imageModel.num_param_linear(self.kwargs_lens, self.kwargs_source,
+                                                                               self.kwargs_lens_light, self.kwargs_ps))
+        A = self.imageModel.linear_response_matrix(self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light,
+                                                   self.kwargs_ps)
+        image = self.imageModel.array_masked2image(A.T.dot(param))
+        data_class.update_data(image + np.random.normal(0, 0.05, size=image.shape))
+        self.imageModel_mf = ImageLinearFit(data_class, psf_class, lens_model_class, source_model_class,
+                                            lens_light_model_class, point_source_class,
+                                            kwargs_numerics=kwargs_numerics, likelihood_mask=likelihood_mask,
+                                            kwargs_matrix_free={'tolerance': 1e-10, 'num_probes': 50})
+        self.A = A
+
+    def test_linear_response_operator(self):
+        operator = self.imageModel_mf.linear_response_operator(self.kwargs_lens, self.kwargs_source,
+                                                               self.kwargs_lens_light, self.kwargs_ps)
+        assert operator.num_param == len(self.A)
+        x = np.random.normal(size=operator.num_param)
+        y = np.random.normal(size=len(self.A.T))
+        npt.assert_almost_equal(operator.forward(x), self.A.T.dot(x), decimal=10)
+        npt.assert_almost_equal(operator.adjoint(y), self.A.dot(y), decimal=10)
+        weights = np.ones(len(y))
+        diag = operator.normal_diagonal(weights)
+        npt.assert_almost_equal(diag[-2:], np.sum(self.A[-2:] ** 2, axis=1), decimal=10)
+        npt.assert_almost_equal(operator.normal_dot(x, weights, regularization=2),
+                                self.A.dot(self.A.T.dot(x)) + 2 * x, decimal=8)
+
+    def test_linear_response_operator_storage(self):
+        # mixture of sparse and dense basis responses, stored per component
+        image_numerics = self.imageModel_mf.ImageNumerics
+        # responses at the resolution of the pixels
+        basis_response = [np.random.normal(size=50 * 50) for _ in range(3)]
+        sparse_response = np.zeros(50 * 50)
+        sparse_response[100:150] = 1
+        basis_response.append(sparse_response)
+        mask1d = self.imageModel_mf._mask1d
+        kwargs = {'ps_index_list': [], 'ps_value_list': [], 'image_numerics': image_numerics, 'mask1d': mask1d,
+                  'num_pixel_axes': (50, 50)}
+        operator = LinearResponseOperator(basis_response, **kwargs)
+        operator_sparse = LinearResponseOperator(basis_response, sparse_threshold=1.1, **kwargs)
+        operator_dense = LinearResponseOperator(basis_response, sparse_threshold=0, **kwargs)
+        assert len(operator._dense_basis) == 3
+        x = np.random.normal(size=4)
+        y = np.random.normal(size=int(np.sum(mask1d)))
+        for operator_ in [operator_sparse, operator_dense]:
+            npt.assert_almost_equal(operator_.forward(x), operator.forward(x), decimal=10)
+            npt.assert_almost_equal(operator_.adjoint(y), operator.adjoint(y), decimal=10)
+            npt.assert_almost_equal(operator_.normal_diagonal(np.ones(len(y))),
+                                    operator.normal_diagonal(np.ones(len(y))), decimal=10)
+
+    def test_image_linear_solve(self):
+        model, error_map, cov_param, param = self.imageModel.image_linear_solve(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps, inv_bool=False)
+        model_mf, error_map_mf, cov_param_mf, param_mf = self.imageModel_mf.image_linear_solve(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps, inv_bool=False)
+        assert cov_param_mf is None
+        npt.assert_almost_equal(param_mf / param, 1, decimal=5)
+        npt.assert_almost_equal(model_mf, model, decimal=5)
+
+    def test_likelihood_data_given_model(self):
+        logL = self.imageModel.likelihood_data_given_model(self.kwargs_lens, self.kwargs_source,
+                                                           self.kwargs_lens_light, self.kwargs_ps, source_marg=False)
+        logL_mf = self.imageModel_mf.likelihood_data_given_model(self.kwargs_lens, self.kwargs_source,
+                                                                 self.kwargs_lens_light, self.kwargs_ps,
+                                                                 source_marg=False)
+        npt.assert_almost_equal(logL_mf, logL, decimal=3)
+
+        logL = self.imageModel.likelihood_data_given_model(self.kwargs_lens, self.kwargs_source,
+                                                           self.kwargs_lens_light, self.kwargs_ps, source_marg=True)
+        logL_mf = self.imageModel_mf.likelihood_data_given_model(self.kwargs_lens, self.kwargs_source,
+                                                                 self.kwargs_lens_light, self.kwargs_ps,
+                                                                 source_marg=True)
+        # stochastic estimate of the log determinant
+        npt.assert_almost_equal(logL_mf / logL, 1, decimal=2)
+
+    def test_marginalization_normalization(self):
+        # the matrix-free marginalization term has the same normalization as the dense one, with and without
+        # linear_prior (which limits the eigenvalues of the covariance matrix)
+        image_model_mf = ImageLinearFit(self.imageModel.Data, self.imageModel.PSF, self.imageModel.LensModel,
+                                        self.imageModel.SourceModel, self.imageModel.LensLightModel,
+                                        self.imageModel.PointSource, kwargs_numerics={'supersampling_factor': 2},
+                                        likelihood_mask=self.imageModel.likelihood_mask,
+                                        kwargs_matrix_free={'tolerance': 1e-10, 'num_probes': 200,
+                                                            'num_lanczos_steps': len(self.A)})
+        args = (self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps)
+        logL = self.imageModel.likelihood_data_given_model(*args, source_marg=False)
+        logL_mf = image_model_mf.likelihood_data_given_model(*args, source_marg=False)
+        for linear_prior in [None, 1e3, 0.1]:
+            marg = self.imageModel.likelihood_data_given_model(*args, source_marg=True,
+                                                               linear_prior=linear_prior) - logL
+            marg_mf = image_model_mf.likelihood_data_given_model(*args, source_marg=True,
+                                                                 linear_prior=linear_prior) - logL_mf
+            npt.assert_allclose(marg_mf, marg, rtol=0.01)
+
+    def test_marginalization_regularization(self):
+        # the marginalization term is computed by the solve of each likelihood evaluation
+        image_model = ImageLinearFit(self.imageModel_mf.Data, self.imageModel_mf.PSF, self.imageModel_mf.LensModel,
+                                     self.imageModel_mf.SourceModel, self.imageModel_mf.LensLightModel,
+                                     self.imageModel_mf.PointSource, kwargs_numerics={'supersampling_factor': 2},
+                                     likelihood_mask=self.imageModel_mf.likelihood_mask,
+                                     kwargs_matrix_free={'tolerance': 1e-10})
+        logL = image_model.likelihood_data_given_model(self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light,
+                                                       self.kwargs_ps, source_marg=True)
+        assert np.isfinite(logL)
+        logL_no_marg = image_model.likelihood_data_given_model(self.kwargs_lens, self.kwargs_source,
+                                                               self.kwargs_lens_light, self.kwargs_ps,
+                                                               source_marg=False)
+        assert logL_no_marg != logL
+
+        # parameters without regularization do not contribute to the prior normalization
+        num_param = len(self.A)
+        regularization = np.zeros(num_param)
+        regularization[0] = 1e-4
+        image_model_reg = ImageLinearFit(self.imageModel_mf.Data, self.imageModel_mf.PSF,
+                                         self.imageModel_mf.LensModel, self.imageModel_mf.SourceModel,
+                                         self.imageModel_mf.LensLightModel, self.imageModel_mf.PointSource,
+                                         kwargs_numerics={'supersampling_factor': 2},
+                                         likelihood_mask=self.imageModel_mf.likelihood_mask,
+                                         kwargs_matrix_free={'tolerance': 1e-10, 'regularization': regularization})
+        logL_reg = image_model_reg.likelihood_data_given_model(self.kwargs_lens, self.kwargs_source,
+                                                               self.kwargs_lens_light, self.kwargs_ps,
+                                                               source_marg=True)
+        assert np.isfinite(logL_reg)
+        with pytest.raises(ValueError):
+            image_model_reg.likelihood_data_given_model(self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light,
+                                                        self.kwargs_ps, source_marg=True, linear_prior=1)
+
+    def test_raise(self):
+        with pytest.raises(ValueError):
+            ImageLinearFit(self.imageModel_mf.Data, self.imageModel_mf.PSF,
+                           source_model_class=self.imageModel_mf.SourceModel,
+                           kwargs_matrix_free={'regularization': -1})
+        # numerics settings without adjoint convolution are rejected at construction
+        kwargs_data = sim_util.data_configure_simple(numPix=10, deltaPix=0.05, exposure_time=100, background_rms=0.05)
+        psf_class = PSF(psf_type='GAUSSIAN', fwhm=0.1)
+        with pytest.raises(ValueError):
+            ImageLinearFit(ImageData(**kwargs_data), psf_class, source_model_class=LightModel(['GAUSSIAN']),
+                           kwargs_matrix_free={})
+        psf_class = PSF(psf_type='PIXEL', kernel_point_source=np.ones((3, 3)) / 9.)
+        for kwargs_numerics in [{'compute_mode': 'adaptive', 'supersampled_indexes': np.ones((10, 10), dtype=bool)},
+                                {'supersampling_factor': 2, 'supersampling_convolution': True}]:
+            with pytest.raises(ValueError):
+                ImageLinearFit(ImageData(**kwargs_data), psf_class, source_model_class=LightModel(['GAUSSIAN']),
+                               kwargs_numerics=kwargs_numerics, kwargs_matrix_free={})
@@ -271,6 +271,21 @@ class TestImageModel(object):
         assert y_pos[0] == 0
         assert y_shift[0] == kwargs_special['delta_y_image'][0]
 
+    @pytest.mark.parametrize('convolution_type', ['fft', 'grid'])
+    def test_pickle(self, convolution_type):
+        import pickle
+        import copy
+        kwargs_numerics = {'supersampling_factor': 2, 'supersampling_convolution': False,
+                           'convolution_type': convolution_type}
+        image_model = ImageLinearFit(self.imageModel.Data, self.imageModel.PSF, self.imageModel.LensModel,
+                                     self.imageModel.SourceModel, self.imageModel.LensLightModel,
+                                     self.imageModel.PointSource, kwargs_numerics=kwargs_numerics)
+        image = image_model.image(self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps)
+        for image_model_copy in [pickle.loads(pickle.dumps(image_model)), copy.deepcopy(image_model)]:
+            image_copy = image_model_copy.image(self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light,
+                                                self.kwargs_ps)
+            npt.assert_almost_equal(image_copy, image, decimal=10)
+
 
 if __name__ == '__main__':
     pytest.main()
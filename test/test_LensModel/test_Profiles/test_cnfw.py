@@ -4,6 +4,7 @@ from lenstronomy.LensModel.Profiles.cnfw import CNFW
 from lenstronomy.LensModel.Profiles.nfw import NFW
 
 import numpy as np
+from scipy.integrate import quad
 import numpy.testing as npt
 import pytest
 
@@ -23,6 +24,17 @@ class Testcnfw(object):
         pot2 = self.n.function(x=2, y=0, Rs=1, alpha_Rs=1)
         npt.assert_almost_equal(pot1/pot2, 1, decimal=3)
 
+        # vectorized potential against the numerical integral of the deflection angle
+        Rs, alpha_Rs, r_core = 2., 1.5, 0.6
+        rho0 = self.cn._alpha2rho0(alpha_Rs, Rs, r_core)
+        x = np.array([[0.01, 0.8], [3., 50.]])
+        pot = self.cn.function(x, 0, Rs, alpha_Rs, r_core)
+        assert pot.shape == x.shape
+        for pot_i, r_i in zip(pot.ravel(), x.ravel()):
+            pot_num = quad(self.cn.alpha_r, 0, r_i, args=(Rs, rho0, r_core), epsrel=1e-10, limit=200)[0]
+            npt.assert_almost_equal(pot_i / pot_num, 1, decimal=6)
+        npt.assert_almost_equal(self.cn.function(3., 0, Rs, alpha_Rs, r_core), pot[1, 0], decimal=12)
+
     def _kappa_integrand(self, x, y, Rs, m0, r_core):
 
         return 2*np.pi*x * self.cn.density_2d(x, y, Rs, m0, r_core)
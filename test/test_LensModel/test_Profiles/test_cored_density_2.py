@@ -3,6 +3,7 @@ __author__ = 'sibirrer'
 from lenstronomy.LensModel.Profiles.cored_density_2 import CoredDensity2
 
 import numpy as np
+from scipy.integrate import quad
 import numpy.testing as npt
 import pytest
 
@@ -30,6 +31,13 @@ class TestCoredDensity(object):
         f_list = self.model.function(np.array([1]), 0, sigma0, r_core)
         npt.assert_almost_equal(f_, f_list[0], decimal=8)
 
+        # closed form against the numerical integral of the deflection angle
+        x = np.array([[0.5, 3.], [20., 0.1]])
+        f_ = self.model.function(x, 1., sigma0, r_core, center_x=0, center_y=1)
+        for f_i, r_i in zip(f_.ravel(), np.abs(x.ravel())):
+            f_num = quad(self.model.alpha_r, 0, r_i, args=(sigma0, r_core))[0]
+            npt.assert_almost_equal(f_i, f_num, decimal=8)
+
     def test_derivatives(self):
         pass
 
@@ -1,7 +1,7 @@
 __author__ = 'lynevdv'
 
 
-from lenstronomy.LensModel.Profiles.elliptical_density_slice import ElliSLICE
+from lenstronomy.LensModel.Profiles.elliptical_density_slice import ElliSLICE, ElliSLICEStack
 
 import numpy as np
 import pytest
@@ -88,6 +88,94 @@ class TestElliSLICE(object):
         values = self.ElliSLICE.hessian(x, y, a, b, psi, sigma_0)
         npt.assert_almost_equal((values[0][2]+values[3][2])/2., 5., decimal=6)
 
+        # analytic second derivatives against central differences of the deflection, inside, outside and on the axes
+        x = np.array([0.5, 3., -1., 2.5 * np.cos(psi) + 0.1, -2. * np.sin(psi) + 0.1, 0.])
+        y = np.array([0.1, 1.5, -2., 2.5 * np.sin(psi) - 0.2, 2. * np.cos(psi) - 0.2, 4.])
+        f_xx, f_xy, f_yx, f_yy = self.ElliSLICE.hessian(x, y, a, b, psi, sigma_0, 0.1, -0.2)
+        diff = 1e-5
+        f_x_dx, f_y_dx = self.ElliSLICE.derivatives(x + diff, y, a, b, psi, sigma_0, 0.1, -0.2)
+        f_x_dx_, f_y_dx_ = self.ElliSLICE.derivatives(x - diff, y, a, b, psi, sigma_0, 0.1, -0.2)
+        f_x_dy, f_y_dy = self.ElliSLICE.derivatives(x, y + diff, a, b, psi, sigma_0, 0.1, -0.2)
+        f_x_dy_, f_y_dy_ = self.ElliSLICE.derivatives(x, y - diff, a, b, psi, sigma_0, 0.1, -0.2)
+        npt.assert_almost_equal(f_xx, (f_x_dx - f_x_dx_) / (2 * diff), decimal=8)
+        npt.assert_almost_equal(f_xy, (f_x_dy - f_x_dy_) / (2 * diff), decimal=8)
+        npt.assert_almost_equal(f_yx, (f_y_dx - f_y_dx_) / (2 * diff), decimal=8)
+        npt.assert_almost_equal(f_yy, (f_y_dy - f_y_dy_) / (2 * diff), decimal=8)
+        npt.assert_almost_equal(f_xy, f_yx, decimal=14)
+
+    def test_vectorized(self):
+        # the array evaluation matches the evaluation point by point, including points on the axes of the ellipse
+        a, b, psi, sigma_0 = 2., 1., 30 * np.pi / 180., 5.
+        x = np.array([0.5, 3., np.sqrt(3), -np.sqrt(3), 0., 4., -0.5, 0.1])
+        y = np.array([0.1, 1.5, 1., -1., 0., 0., 3., -2.])
+        values = self.ElliSLICE.function(x, y, a, b, psi, sigma_0, 0.1, -0.2)
+        f_x, f_y = self.ElliSLICE.derivatives(x, y, a, b, psi, sigma_0, 0.1, -0.2)
+        for i in range(len(x)):
+            npt.assert_almost_equal(values[i], self.ElliSLICE.function(x[i], y[i], a, b, psi, sigma_0, 0.1, -0.2),
+                                    decimal=12)
+            f_x_i, f_y_i = self.ElliSLICE.derivatives(x[i], y[i], a, b, psi, sigma_0, 0.1, -0.2)
+            npt.assert_almost_equal(f_x[i], f_x_i, decimal=12)
+            npt.assert_almost_equal(f_y[i], f_y_i, decimal=12)
+        values_2d = self.ElliSLICE.function(x.reshape(2, 4), y.reshape(2, 4), a, b, psi, sigma_0, 0.1, -0.2)
+        npt.assert_almost_equal(values_2d.flatten(), values, decimal=12)
+
+        # continuity across the border of the slice
+        x_rot = np.array([a - 1e-9, a + 1e-9, 0, 0])
+        y_rot = np.array([0, 0, b - 1e-9, b + 1e-9])
+        x = x_rot * np.cos(psi) - y_rot * np.sin(psi)
+        y = x_rot * np.sin(psi) + y_rot * np.cos(psi)
+        values = self.ElliSLICE.function(x, y, a, b, psi, sigma_0)
+        f_x, f_y = self.ElliSLICE.derivatives(x, y, a, b, psi, sigma_0)
+        npt.assert_almost_equal(values[0], values[1], decimal=6)
+        npt.assert_almost_equal(values[2], values[3], decimal=6)
+        npt.assert_almost_equal(f_x[0], f_x[1], decimal=6)
+        npt.assert_almost_equal(f_y[2], f_y[3], decimal=6)
+
+
+class TestElliSLICEStack(object):
+    """
+    tests the stack of elliptical slices
+    """
+    def setup_method(self):
+        self.ElliSLICE = ElliSLICE()
+        self.stack = ElliSLICEStack()
+        self.kwargs = {'a': np.array([0.5, 1., 2.]), 'b': np.array([0.3, 0.8, 1.]), 'psi': np.array([0., 0.3, -0.5]),
+                       'sigma_0': np.array([3., 2., 1.]), 'center_x': 0.1, 'center_y': np.array([0, 0.1, -0.1])}
+
+    def _sum(self, func, x, y):
+        kwargs = {key: np.broadcast_to(value, (3,)) for key, value in self.kwargs.items()}
+        return sum(np.array(func(x, y, **{key: value[i] for key, value in kwargs.items()})) for i in range(3))
+
+    def test_function(self):
+        x = np.linspace(-3, 3, 15)
+        y = np.linspace(2, -1, 15)
+        values = self.stack.function(x, y, **self.kwargs)
+        npt.assert_almost_equal(values, self._sum(self.ElliSLICE.function, x, y), decimal=10)
+        values = self.stack.function(0.5, 0.2, **self.kwargs)
+        npt.assert_almost_equal(values, self._sum(self.ElliSLICE.function, 0.5, 0.2), decimal=10)
+
+    def test_derivatives(self):
+        x = np.linspace(-3, 3, 15).reshape(3, 5)
+        y = np.linspace(2, -1, 15).reshape(3, 5)
+        f_x, f_y = self.stack.derivatives(x, y, **self.kwargs)
+        assert f_x.shape == (3, 5)
+        f_x_sum, f_y_sum = self._sum(self.ElliSLICE.derivatives, x, y)
+        npt.assert_almost_equal(f_x, f_x_sum, decimal=10)
+        npt.assert_almost_equal(f_y, f_y_sum, decimal=10)
+
+    def test_hessian(self):
+        x = np.array([0.1, 3.])
+        y = np.array([0., 1.])
+        f_xx, f_xy, f_yx, f_yy = self.stack.hessian(x, y, **self.kwargs)
+        # convergence inside all the slices and outside of all the slices
+        npt.assert_almost_equal((f_xx + f_yy) / 2., [6., 0.], decimal=12)
+        npt.assert_almost_equal(f_xy, f_yx, decimal=12)
+
+        x = np.linspace(-3, 3, 15)
+        y = np.linspace(2, -1, 15)
+        values = self.stack.hessian(x, y, **self.kwargs)
+        npt.assert_almost_equal(values, self._sum(self.ElliSLICE.hessian, x, y), decimal=10)
+
 
 if __name__ == '__main__':
    pytest.main()
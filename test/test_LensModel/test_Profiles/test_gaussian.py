@@ -81,6 +81,49 @@ class TestGaussianKappa(object):
         self.gaussian_kappa = GaussianKappa()
         self.gaussian = Gaussian()
 
+    def test_function(self):
+        from scipy.integrate import quad
+        amp, sigma = 1.3, 0.7
+        c = 1. / (2 * sigma ** 2)
+        r = np.array([0, 1e-4, 0.3, 1.2, 5., 300.])
+        f = self.gaussian_kappa.function(r, 0, amp, sigma)
+        for i in range(len(r)):
+            # potential as integral of the deflection alpha(r') = amp / (pi r') (1 - exp(-c r'^2))
+            f_quad = quad(lambda x: -np.expm1(-c * x ** 2) / x if x > 0 else 0, 0, r[i], epsrel=1e-12,
+                          limit=200)[0] * amp / np.pi
+            npt.assert_almost_equal(f[i] / (1 + abs(f_quad)), f_quad / (1 + abs(f_quad)), decimal=10)
+        f_scalar = self.gaussian_kappa.function(1.2, 0, amp, sigma)
+        assert isinstance(f_scalar, float)
+        npt.assert_almost_equal(f_scalar, f[3], decimal=14)
+
+        # arrays of amplitudes and widths are broadcast
+        x = np.array([[0.5], [1.5]])
+        f = self.gaussian_kappa.function(x, 0.2, np.array([1., 2.]), np.array([0.5, 1.]))
+        npt.assert_almost_equal(f[:, 1], self.gaussian_kappa.function(x[:, 0], 0.2, 2., 1.), decimal=14)
+
+    def test_set(self):
+        x = np.array([0., 0.5, -2., 7.])
+        y = np.array([0., 1., 0.3, -1.])
+        amp = np.array([1., 3., 0.5])
+        sigma = np.array([0.1, 1., 4.])
+        for method in ['function', 'derivatives', 'hessian', 'density_2d']:
+            values_set = getattr(self.gaussian_kappa, method + '_set')(x, y, amp, sigma, 0.2, -0.1)
+            values = 0
+            for i in range(len(amp)):
+                values += np.array(getattr(self.gaussian_kappa, method)(x, y, amp[i], sigma[i], 0.2, -0.1))
+            npt.assert_almost_equal(values_set, values, decimal=12)
+        f_x, f_y = self.gaussian_kappa.derivatives_set(x[1], y[1], amp, sigma, 0.2, -0.1)
+        npt.assert_almost_equal(f_x, self.gaussian_kappa.derivatives_set(x, y, amp, sigma, 0.2, -0.1)[0][1],
+                                decimal=12)
+
+        # the coordinates are processed in chunks
+        f_x, f_y = self.gaussian_kappa.sum_components(
+            lambda x_, y_, amp_, sigma_: self.gaussian_kappa.derivatives(x_, y_, amp_, sigma_), x, y, amp, sigma,
+            chunk_size=6)
+        f_x_set, f_y_set = self.gaussian_kappa.derivatives_set(x, y, amp, sigma)
+        npt.assert_almost_equal(f_x, f_x_set, decimal=12)
+        npt.assert_almost_equal(f_y, f_y_set, decimal=12)
+
     def test_derivatives(self):
         x = np.linspace(0, 5, 10)
         y = np.linspace(0, 5, 10)
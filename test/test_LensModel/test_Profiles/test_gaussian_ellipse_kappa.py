@@ -50,6 +50,64 @@ class TestGaussianEllipseKappa(object):
 
         npt.assert_almost_equal(f_, f_sphere, decimal=4)
 
+    def test_function_elliptical(self):
+        """
+        Test the `function()` method against a numerical integration of the deflection along the ray from the center.
+        """
+        from scipy.integrate import quad
+        amp, sigma, e1, e2 = 2., 0.8, 0.3, -0.1
+        x = np.array([0.1, 0.05, 1.5, -3., 20.])
+        y = np.array([0.2, -0.1, 0.5, 2.5, -40.])
+        f = self.gaussian_kappa_ellipse.function(x, y, amp, sigma, e1, e2, 0.1, 0.2)
+        npt.assert_almost_equal(f[0], 0, decimal=12)
+        for i in range(1, len(x)):
+            dx, dy = x[i] - 0.1, y[i] - 0.2
+
+            def integrand(s):
+                f_x, f_y = self.gaussian_kappa_ellipse.derivatives(0.1 + s * dx, 0.2 + s * dy, amp, sigma, e1, e2,
+                                                                   0.1, 0.2)
+                return f_x * dx + f_y * dy
+            f_quad = quad(integrand, 0, 1, epsrel=1e-12, limit=200)[0]
+            npt.assert_almost_equal(f[i] / f_quad, 1, decimal=8)
+
+        f_scalar = self.gaussian_kappa_ellipse.function(x[2], y[2], amp, sigma, e1, e2, 0.1, 0.2)
+        npt.assert_almost_equal(f_scalar, f[2], decimal=12)
+        f_grid = self.gaussian_kappa_ellipse.function(np.reshape(x[1:], (2, 2)), np.reshape(y[1:], (2, 2)), amp,
+                                                      sigma, e1, e2, 0.1, 0.2)
+        npt.assert_almost_equal(f_grid.flatten(), f[1:], decimal=12)
+
+    def test_function_set(self):
+        """
+        Test the `function_set()` method against the sum of the individual components.
+        """
+        x = np.linspace(-3, 4, 20)
+        y = np.linspace(2, -1, 20)
+        amp = np.array([1., 2., 0.5])
+        sigma = np.array([0.1, 1., 3.])
+        for e1, e2 in [(0.2, 0.1), (0., 0.)]:
+            f_set = self.gaussian_kappa_ellipse.function_set(x, y, amp, sigma, e1, e2, 0.2, -0.1)
+            f = np.zeros_like(x)
+            for i in range(len(amp)):
+                f += self.gaussian_kappa_ellipse.function(x, y, amp[i], sigma[i], e1, e2, 0.2, -0.1)
+            npt.assert_almost_equal(f_set, f, decimal=10)
+
+            for method in ['derivatives', 'hessian', 'density_2d']:
+                values_set = getattr(self.gaussian_kappa_ellipse, method + '_set')(x, y, amp, sigma, e1, e2, 0.2,
+                                                                                   -0.1)
+                values = 0
+                for i in range(len(amp)):
+                    values += np.array(getattr(self.gaussian_kappa_ellipse, method)(x, y, amp[i], sigma[i], e1, e2,
+                                                                                    0.2, -0.1))
+                npt.assert_almost_equal(values_set, values, decimal=10)
+
+        # scalar and 2d coordinates
+        f_x, f_y = self.gaussian_kappa_ellipse.derivatives_set(x[3], y[3], amp, sigma, 0.2, 0.1)
+        f_x_grid, f_y_grid = self.gaussian_kappa_ellipse.derivatives_set(x.reshape(4, 5), y.reshape(4, 5), amp,
+                                                                         sigma, 0.2, 0.1)
+        assert f_x_grid.shape == (4, 5)
+        npt.assert_almost_equal(f_x_grid[0, 3], f_x, decimal=12)
+        npt.assert_almost_equal(f_y_grid[0, 3], f_y, decimal=12)
+
     def test_derivatives(self):
         """
         Test the `derivatives()` method at the spherical limit.
@@ -164,6 +222,29 @@ class TestGaussianEllipseKappa(object):
         npt.assert_almost_equal(f_x_sp, f_x_ap, decimal=4)
         npt.assert_almost_equal(f_y_sp, f_y_ap, decimal=4)
 
+    def test_sigma_function_numba(self):
+        """
+        Test the compiled `sigma_function()` against the evaluation with `scipy.special.wofz()`.
+
+        :return:
+        :rtype:
+        """
+        gauss_scipy = GaussianEllipseKappa(use_numba_wofz=False)
+        x, y = np.meshgrid(np.linspace(-20, 20, 41), np.linspace(-20, 20, 41))
+        for q in [0.3, 0.9]:
+            sig_re, sig_im = self.gaussian_kappa_ellipse.sigma_function(x, y, q)
+            sig_re_sp, sig_im_sp = gauss_scipy.sigma_function(x, y, q)
+            assert sig_re.shape == x.shape
+            npt.assert_allclose(sig_re, sig_re_sp, rtol=1e-12, atol=1e-14)
+            npt.assert_allclose(sig_im, sig_im_sp, rtol=1e-12, atol=1e-14)
+        sig_re, sig_im = self.gaussian_kappa_ellipse.sigma_function(0.5, -0.2, 0.7)
+        sig_re_sp, sig_im_sp = gauss_scipy.sigma_function(0.5, -0.2, 0.7)
+        npt.assert_almost_equal([sig_re, sig_im], [sig_re_sp, sig_im_sp], decimal=12)
+
+        kwargs = {'amp': 2., 'sigma': 0.7, 'e1': 0.2, 'e2': -0.1}
+        npt.assert_almost_equal(self.gaussian_kappa_ellipse.hessian(x, y, **kwargs),
+                                gauss_scipy.hessian(x, y, **kwargs), decimal=12)
+
 
 if __name__ == '__main__':
     pytest.main()
@@ -6,6 +6,7 @@ from lenstronomy.LensModel.lens_model import LensModel
 from scipy.integrate import quad
 from lenstronomy.LensModel.Profiles.splcore import SPLCORE
 
+import numpy as np
 import numpy.testing as npt
 import pytest
 
@@ -56,6 +57,33 @@ class TestGNFW(object):
         m2d_num = quad(integrand, 0, 10.)[0]
         npt.assert_almost_equal(m2d_num/m2d, 1.0, 5)
 
+    def test_use_table(self):
+        gnfw_table = GNFW(use_table=True)
+        x = np.linspace(-5, 5, 21)
+        y = np.linspace(-3, 4, 21)
+        kwargs = {'alpha_Rs': 2.1, 'Rs': 1.5, 'gamma_inner': 1.3, 'gamma_outer': 2.8}
+        f_x, f_y = self.gnfw.derivatives(x, y, **kwargs)
+        f_x_, f_y_ = gnfw_table.derivatives(x, y, **kwargs)
+        npt.assert_almost_equal(f_x_, f_x, decimal=7)
+        npt.assert_almost_equal(f_y_, f_y, decimal=7)
+        f_xx, f_xy, f_yx, f_yy = self.gnfw.hessian(x, y, **kwargs)
+        f_xx_, f_xy_, f_yx_, f_yy_ = gnfw_table.hessian(x, y, **kwargs)
+        npt.assert_almost_equal(f_xx_, f_xx, decimal=7)
+        npt.assert_almost_equal(f_xy_, f_xy, decimal=7)
+        npt.assert_almost_equal(f_yy_, f_yy, decimal=7)
+        # the normalization at Rs is not interpolated
+        alpha_rs = gnfw_table.derivatives(1.5, 0.0, **kwargs)[0]
+        npt.assert_almost_equal(alpha_rs, kwargs['alpha_Rs'], 8)
+
+        # the option is passed through kwargs_interp, which the 'INTERPOL' models still accept alongside it
+        lens_model = LensModel(['GNFW', 'INTERPOL'], kwargs_interp={'use_table': True, 'grid': True})
+        assert lens_model.lens_model.func_list[0]._use_table is True
+        assert lens_model.lens_model.func_list[1]._grid is True
+        f_x_, f_y_ = lens_model.alpha(x, y, [kwargs, {'grid_interp_x': x, 'grid_interp_y': x, 'f_': np.zeros((21, 21)),
+                                                      'f_x': np.zeros((21, 21)), 'f_y': np.zeros((21, 21))}])
+        npt.assert_almost_equal(f_x_, f_x, decimal=7)
+        assert LensModel(['GNFW']).lens_model.func_list[0]._use_table is False
+
     def test_spl_core_match(self):
 
         rs = 1.5
@@ -0,0 +1,89 @@
+from lenstronomy.LensModel.Profiles import radial_table as radial_table_module
+from lenstronomy.LensModel.Profiles.radial_table import RadialTable, radial_table, set_table_dir, clear_tables
+from lenstronomy.LensModel.Profiles.general_nfw import GNFW
+from lenstronomy.LensModel.Profiles.nfw import NFW
+
+import os
+import numpy as np
+import numpy.testing as npt
+import pytest
+import unittest
+
+
+class TestRadialTable(object):
+
+    def setup_method(self):
+        clear_tables()
+
+    def teardown_method(self):
+        set_table_dir(None)
+        clear_tables()
+
+    def test_accuracy(self):
+        table = RadialTable(NFW._g, rtol=1e-8)
+        x = np.logspace(-4, 4, 1000)
+        npt.assert_allclose(table(x), NFW._g(x), rtol=1e-7)
+        # function with negative values is interpolated linearly in f
+        table = RadialTable(lambda x: np.sin(np.log(x)), x_min=0.1, x_max=10)
+        x = np.linspace(0.1, 10, 100)
+        npt.assert_allclose(table(x), np.sin(np.log(x)), atol=1e-7)
+
+    def test_parameters(self):
+        gnfw = GNFW()
+        table = radial_table('GNFW_f', gnfw._f, params=(1.5, 3.))
+        x = np.logspace(-3, 3, 100)
+        npt.assert_allclose(table(x), gnfw._f(x, 1.5, 3.), rtol=1e-7)
+
+    def test_shape(self):
+        table = RadialTable(NFW._g, x_min=0.01, x_max=100)
+        x = np.ones((3, 4))
+        assert table(x).shape == (3, 4)
+        value = table(1.)
+        assert isinstance(value, float)
+        npt.assert_almost_equal(value, NFW._g(np.array([1.]))[0], decimal=10)
+        # values outside of the range are computed with the function
+        x = np.array([1e-3, 1., 1e3])
+        npt.assert_allclose(table(x), NFW._g(x), rtol=1e-8)
+
+    def test_cache(self):
+        table = radial_table('NFW_g', NFW._g)
+        assert radial_table('NFW_g', NFW._g) is table
+        assert radial_table('NFW_g', NFW._g, rtol=1e-6) is not table
+        clear_tables()
+        assert radial_table('NFW_g', NFW._g) is not table
+
+    def test_table_dir(self, tmp_path):
+        set_table_dir(str(tmp_path))
+        table = radial_table('NFW_g', NFW._g, params=())
+        file_list = os.listdir(str(tmp_path))
+        assert len(file_list) == 1 and file_list[0].startswith('NFW_g_')
+        clear_tables()
+
+        def func_raise(x):
+            raise ValueError('the table is expected to be read from disk.')
+        table_file = radial_table('NFW_g', func_raise)
+        assert table_file.num == table.num
+        x = np.logspace(-3, 3, 20)
+        npt.assert_almost_equal(table_file(x), table(x), decimal=12)
+
+    def test_max_num_tables(self):
+        for i in range(radial_table_module._max_num_tables + 1):
+            radial_table('power_law', lambda x, a: x ** a, params=(i,), x_min=1, x_max=10)
+        assert len(radial_table_module._tables) == radial_table_module._max_num_tables
+
+
+class TestRaise(unittest.TestCase):
+
+    def test_raise(self):
+        with self.assertRaises(ValueError):
+            RadialTable(NFW._g, x_min=0, x_max=1)
+        with self.assertRaises(ValueError):
+            RadialTable(NFW._g, x_min=10, x_max=1)
+
+    def test_warning(self):
+        with self.assertWarns(Warning):
+            RadialTable(lambda x: 2 + np.sin(20 * np.log(x)), x_min=1, x_max=10, rtol=1e-12, max_num=129)
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -5,6 +5,7 @@ from lenstronomy.LensModel.Profiles.sersic import Sersic
 from lenstronomy.LightModel.Profiles.sersic import Sersic as Sersic_light
 from lenstronomy.LensModel.Profiles.sersic_ellipse_kappa import SersicEllipseKappa
 from lenstronomy.Util.param_util import ellipticity2phi_q
+from lenstronomy.Util import param_util
 
 import numpy as np
 import pytest
@@ -209,6 +210,43 @@ class TestSersic(object):
 
         npt.assert_almost_equal(kappa_ellipse, 0.5*(fxx + fyy), decimal=5)
 
+    def test_sersic_ellipse_kappa_quad(self):
+        # the Gauss-Legendre integration agrees with the adaptive quadrature
+        x = np.array([0.01, 0.3, 1., 2.5, 7, 30])
+        y = np.array([0.02, -0.5, 0.7, 2, -3, 10])
+        R_sersic, k_eff, e1, e2, center_x, center_y = 1.3, 0.7, 0.3, -0.1, 0.1, -0.1
+        phi_G, gam = param_util.shear_cartesian2polar(e1, e2)
+        q = 1 - gam
+        x_, y_ = self.sersic_2._coord_rotate(x, y, phi_G, center_x, center_y)
+        for n_sersic in [0.5, 1., 4., 8.]:
+            f_x, f_y = self.sersic_2.derivatives(x, y, n_sersic, R_sersic, k_eff, e1, e2, center_x, center_y)
+            alpha_quad = np.array([self.sersic_2._compute_derivative_atcoord(x_i, y_i, n_sersic, R_sersic, k_eff,
+                                                                             phi_G, q) for x_i, y_i in zip(x_, y_)])
+            f_x_quad, f_y_quad = self.sersic_2._coord_rotate(alpha_quad[:, 0], alpha_quad[:, 1], -phi_G, 0, 0)
+            npt.assert_allclose(f_x, f_x_quad, rtol=1e-6, atol=1e-10)
+            npt.assert_allclose(f_y, f_y_quad, rtol=1e-6, atol=1e-10)
+
+            # hessian with finite differences of the deflection
+            diff = 1e-5
+            f_xx, f_xy, f_yx, f_yy = self.sersic_2.hessian(x, y, n_sersic, R_sersic, k_eff, e1, e2, center_x, center_y)
+            f_x_dx, f_y_dx = self.sersic_2.derivatives(x + diff, y, n_sersic, R_sersic, k_eff, e1, e2, center_x,
+                                                       center_y)
+            f_x_dy, f_y_dy = self.sersic_2.derivatives(x, y + diff, n_sersic, R_sersic, k_eff, e1, e2, center_x,
+                                                       center_y)
+            npt.assert_allclose(f_xx, (f_x_dx - f_x) / diff, rtol=1e-3, atol=1e-6)
+            npt.assert_allclose(f_xy, (f_x_dy - f_x) / diff, rtol=1e-3, atol=1e-6)
+            npt.assert_allclose(f_yx, (f_y_dx - f_y) / diff, rtol=1e-3, atol=1e-6)
+            npt.assert_allclose(f_yy, (f_y_dy - f_y) / diff, rtol=1e-3, atol=1e-6)
+
+        # scalar and 2d input
+        f_x, f_y = self.sersic_2.derivatives(1., 0.5, 2., R_sersic, k_eff, e1, e2)
+        assert isinstance(f_x, float)
+        x_grid, y_grid = np.meshgrid(np.linspace(-2, 2, 5), np.linspace(-2, 2, 4))
+        f_x_grid, _ = self.sersic_2.derivatives(x_grid, y_grid, 2., R_sersic, k_eff, e1, e2)
+        assert f_x_grid.shape == (4, 5)
+        f_x_flat, _ = self.sersic_2.derivatives(x_grid.ravel(), y_grid.ravel(), 2., R_sersic, k_eff, e1, e2)
+        npt.assert_almost_equal(f_x_grid.ravel(), f_x_flat, decimal=12)
+
     def test_sersic_util(self):
         n = 1.
         Re = 2.
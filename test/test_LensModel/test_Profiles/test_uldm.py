@@ -1,6 +1,7 @@
 __author__ = 'lucateo'
 
 from lenstronomy.LensModel.Profiles.uldm import Uldm
+from lenstronomy.LensModel.lens_model import LensModel
 
 import numpy as np
 import numpy.testing as npt
@@ -68,6 +69,19 @@ class TestUldm(object):
         m3d_lens = self.model.mass_3d_lens(r, kappa_0, theta_c, slope)
         npt.assert_almost_equal(m3d, m3d_lens, decimal=8)
 
+    def test_use_table(self):
+        model_table = Uldm(use_table=True)
+        x = np.linspace(-20, 20, 41)
+        y = 0.5
+        kappa_0, theta_c, slope = 0.1, 3, 6.
+        f = self.model.function(x, y, kappa_0, theta_c, 0, 0, slope)
+        f_table = model_table.function(x, y, kappa_0, theta_c, 0, 0, slope)
+        npt.assert_allclose(f_table, f, rtol=1e-7)
+        f_table = model_table.function(1., y, kappa_0, theta_c, 0, 0, slope)
+        npt.assert_almost_equal(f_table, self.model.function(1., y, kappa_0, theta_c, 0, 0, slope), decimal=8)
+        lens_model = LensModel(['ULDM'], kwargs_interp={'use_table': True})
+        assert lens_model.lens_model.func_list[0]._use_table is True
+
 
 if __name__ == '__main__':
     pytest.main()
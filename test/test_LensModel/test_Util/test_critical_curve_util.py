@@ -0,0 +1,38 @@
+from lenstronomy.LensModel.Util import critical_curve_util
+import numpy as np
+import numpy.testing as npt
+
+
+def test_zero_contours_circle():
+    func = lambda x, y: x ** 2 + y ** 2 - 1
+    x_list, y_list = critical_curve_util.zero_contours(func, x_min=-2, y_min=-2, start_scale=0.5, num_cells=8,
+                                                       num_levels=5)
+    assert len(x_list) == 1
+    x, y = x_list[0], y_list[0]
+    assert x[0] == x[-1] and y[0] == y[-1]
+    npt.assert_almost_equal(np.hypot(x, y), 1, decimal=3)
+
+    def gradient(x, y):
+        return 2 * x, 2 * y
+    for func_gradient in [None, gradient]:
+        x_list, y_list = critical_curve_util.zero_contours(func, x_min=-2, y_min=-2, start_scale=0.5, num_cells=8,
+                                                           num_levels=2, func_gradient=func_gradient, num_newton=3)
+        npt.assert_almost_equal(np.hypot(x_list[0], y_list[0]), 1, decimal=8)
+
+
+def test_zero_contours_two_curves():
+    func = lambda x, y: np.minimum((x - 1) ** 2 + y ** 2 - 0.5 ** 2, (x + 1) ** 2 + y ** 2 - 0.3 ** 2)
+    x_list, y_list = critical_curve_util.zero_contours(func, x_min=-2, y_min=-2, start_scale=0.25, num_cells=16,
+                                                       num_levels=4)
+    assert len(x_list) == 2
+    # longest curve first
+    npt.assert_almost_equal(np.mean(x_list[0][:-1]), 1, decimal=2)
+    npt.assert_almost_equal(np.mean(x_list[1][:-1]), -1, decimal=2)
+
+
+def test_link_segments():
+    curves = critical_curve_util.link_segments([1, 3, 2, 10], [2, 1, 3, 11])
+    assert len(curves) == 2
+    assert curves[0][0] == curves[0][-1]
+    assert len(curves[0]) == 4
+    assert sorted(curves[1]) == [10, 11]
@@ -0,0 +1,38 @@
+from lenstronomy.LensModel.Util.faddeeva_util import wofz, wofz_array
+from scipy.special import wofz as wofz_scipy
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+
+def test_wofz():
+    # upper half-plane, including the real axis and large |z|
+    x = np.append(-np.logspace(-6, 8, 50), np.append(0, np.logspace(-6, 8, 50)))
+    y = np.append(0, np.logspace(-8, 8, 50))
+    x, y = np.meshgrid(x, y)
+    z = x + 1j * y
+    w = wofz(z)
+    assert w.shape == z.shape
+    npt.assert_array_less(np.abs(w - wofz_scipy(z)) / np.abs(wofz_scipy(z)), 3e-14)
+    # random points covering the transition to the continued fraction, and the real axis where the largest relative
+    # errors occur (as documented in the module)
+    rng = np.random.RandomState(0)
+    z = rng.uniform(-12, 12, 200000) + 1j * rng.uniform(0, 12, 200000)
+    z = np.append(z, rng.uniform(-12, 12, 200000) + 1j * rng.uniform(0, 0.1, 200000))
+    npt.assert_array_less(np.abs(wofz(z) - wofz_scipy(z)) / np.abs(wofz_scipy(z)), 3e-14)
+
+    # lower half-plane
+    x, y = np.meshgrid(np.linspace(-5, 5, 21), np.linspace(-5, 0, 11))
+    z = x + 1j * y
+    npt.assert_allclose(wofz(z), wofz_scipy(z), rtol=1e-13)
+    npt.assert_allclose(wofz_array(z.ravel()), wofz_scipy(z.ravel()), rtol=1e-13)
+
+    # scalars
+    w = wofz(1 + 2j)
+    assert isinstance(w, complex)
+    npt.assert_almost_equal(w, wofz_scipy(1 + 2j), decimal=14)
+    npt.assert_almost_equal(wofz(0.5), wofz_scipy(0.5), decimal=14)
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -60,6 +60,27 @@ class TestLensModelExtensions(object):
             mag = lens_model.magnification(ra_crit, dec_crit, kwargs_lens)
             assert np.all(np.abs(mag) > 1000)
 
+    def test_critical_curves_adaptive(self):
+        lens_model_list = ['EPL', 'SHEAR']
+        kwargs_lens = [{'theta_E': 1., 'gamma': 2.1, 'e1': 0.1, 'e2': -0.05, 'center_x': 0, 'center_y': 0},
+                       {'gamma1': 0.05, 'gamma2': 0.02}]
+        lens_model = LensModel(lens_model_list)
+        lensModelExtensions = LensModelExtensions(lens_model)
+        ra_crit_list, dec_crit_list, ra_caustic_list, dec_caustic_list = \
+            lensModelExtensions.critical_curve_caustics_adaptive(kwargs_lens, compute_window=5, grid_scale=0.01,
+                                                                 num_newton=2)
+        ra_crit, dec_crit = ra_crit_list[0], dec_crit_list[0]
+        mag = lens_model.magnification(ra_crit, dec_crit, kwargs_lens)
+        assert np.all(np.abs(mag) > 10 ** 6)
+        assert ra_crit[0] == ra_crit[-1]
+        ra_caustic, dec_caustic = lens_model.ray_shooting(ra_crit, dec_crit, kwargs_lens)
+        npt.assert_almost_equal(ra_caustic_list[0], ra_caustic)
+
+        ra_crit_grid, dec_crit_grid, _, _ = lensModelExtensions.critical_curve_caustics(kwargs_lens, compute_window=5,
+                                                                                        grid_scale=0.01)
+        npt.assert_almost_equal(np.mean(np.hypot(ra_crit, dec_crit)),
+                                np.mean(np.hypot(ra_crit_grid[0], dec_crit_grid[0])), decimal=2)
+
     def test_critical_curves_tiling(self):
         lens_model_list = ['SPEP']
         phi, q = 1., 0.8
@@ -243,6 +264,40 @@ class TestLensModelExtensions(object):
         sb_true = source_model.surface_brightness(bx, by, kwargs_source)
         npt.assert_equal(True, flux_array[1] == sb_true)
 
+    def test_magnification_finite_adaptive_batch(self):
+        lens_model_list = ['EPL', 'SHEAR']
+        z_source = 1.5
+        kwargs_lens = [{'theta_E': 1., 'gamma': 2., 'e1': 0.02, 'e2': -0.09, 'center_x': 0, 'center_y': 0},
+                       {'gamma1': 0.01, 'gamma2': 0.03}]
+        lensmodel = LensModel(lens_model_list)
+        extension = LensModelExtensions(lensmodel)
+        source_x, source_y = 0.07, 0.03
+        x_image, y_image = LensEquationSolver(lensmodel).findBrightImage(source_x, source_y, kwargs_lens)
+
+        npt.assert_almost_equal(x_image, [0.88298852, -0.44612306, 0.28800246, -0.82523632], decimal=7)
+        npt.assert_almost_equal(y_image, [0.71226790, -0.87853754, -0.91013935, 0.37138532], decimal=7)
+
+        source_fwhm_list = [10., 25., 40.]
+        mag_table = extension.magnification_finite_adaptive_batch(x_image, y_image, source_x, source_y, kwargs_lens,
+                                                                  source_fwhm_list, z_source, cosmo=self.cosmo)
+        assert mag_table.shape == (3, 4)
+        # reference values of the implementation iterating over the images and source sizes (before the batched
+        # evaluation), with grid_radius_arcsec=auto_raytracing_grid_size(40.) and
+        # grid_resolution=auto_raytracing_grid_resolution(10.)
+        mag_reference = [[4.645519214302667, 11.791834835713065, 9.463881682703466, 4.639743552991467],
+                         [4.645656580100122, 11.805167662378917, 9.477497273968625, 4.640288785778410],
+                         [4.645913296799368, 11.829564001622035, 9.501963638197678, 4.641308974806425]]
+        npt.assert_almost_equal(mag_table, mag_reference, decimal=8)
+
+        mag_point_source = abs(lensmodel.magnification(x_image, y_image, kwargs_lens))
+        npt.assert_array_less(mag_table / mag_point_source - 1, 0.01)
+
+        mag_table = extension.magnification_finite_adaptive_batch(x_image[0], y_image[0], source_x, source_y,
+                                                                  kwargs_lens, 40., z_source, cosmo=self.cosmo,
+                                                                  fixed_aperture_size=True)
+        assert mag_table.shape == (1, 1)
+        npt.assert_almost_equal(mag_table[0, 0], 4.631979230159406, decimal=8)
+
     def test_zoom_source(self):
         lens_model_list = ['SIE', 'SHEAR']
         lensModel = LensModel(lens_model_list=lens_model_list)
@@ -277,3 +332,8 @@ class TestLensModelExtensions(object):
         area = lensModelExtensions.caustic_area(kwargs_lens=kwargs_lens, kwargs_caustic_num=kwargs_caustic_num,
                                                 index_vertices=0)
         npt.assert_almost_equal(area, 0.08445866728739478, decimal=3)
+
+        kwargs_caustic_num = {'compute_window': 3, 'grid_scale': 0.005, 'center_x': 0, 'center_y': 0}
+        area = lensModelExtensions.caustic_area(kwargs_lens=kwargs_lens, kwargs_caustic_num=kwargs_caustic_num,
+                                                index_vertices=0, adaptive=True)
+        npt.assert_almost_equal(area, 0.08445866728739478, decimal=5)
@@ -2,6 +2,7 @@ __author__ = 'sibirrer'
 
 import pytest
 import numpy.testing as npt
+import numpy as np
 from lenstronomy.LensModel.lens_param import LensParam
 
 
@@ -98,6 +99,42 @@ class TestParam(object):
         num, param_list = lensParam.num_param()
         assert num == 5
 
+    def test_elli_slice_stack(self):
+        kwargs_fixed = [{'a': np.array([0.5, 1., 2.]), 'b': np.array([0.3, 0.8, 1.]), 'center_y': 0.1}]
+        lensParam = LensParam(['ElliSLICE_STACK'], kwargs_fixed=kwargs_fixed)
+        kwargs_lens = [{'a': np.array([0.5, 1., 2.]), 'b': np.array([0.3, 0.8, 1.]), 'psi': 0.2,
+                        'sigma_0': np.array([3., 2., 1.]), 'center_x': -0.1, 'center_y': 0.1}]
+        args = lensParam.set_params(kwargs_lens)
+        assert len(args) == 5
+        kwargs_out, i = lensParam.get_params(args, i=0)
+        assert i == 5
+        npt.assert_almost_equal(kwargs_out[0]['sigma_0'], kwargs_lens[0]['sigma_0'], decimal=10)
+        assert kwargs_out[0]['psi'] == 0.2
+        assert kwargs_out[0]['center_y'] == 0.1
+        num, param_list = lensParam.num_param()
+        assert num == 5
+        assert param_list.count('sigma_0_lens0') == 3
+        # default bounds of the densities apply to all slices
+        lower = lensParam.set_params(lensParam.lower_limit)
+        upper = lensParam.set_params(lensParam.upper_limit)
+        assert len(lower) == len(upper) == 5
+
+        from lenstronomy.Sampling.parameters import Param
+        param = Param(kwargs_model={'lens_model_list': ['ElliSLICE_STACK']}, kwargs_fixed_lens=kwargs_fixed)
+        args = param.kwargs2args(kwargs_lens=kwargs_lens)
+        kwargs_return = param.args2kwargs(args)
+        npt.assert_almost_equal(kwargs_return['kwargs_lens'][0]['sigma_0'], kwargs_lens[0]['sigma_0'], decimal=10)
+        lower, upper = param.param_limits()
+        assert len(lower) == len(upper) == param.num_param()[0] == 5
+
+        lensParam = LensParam(['ElliSLICE_STACK'], kwargs_fixed=[{'a': np.array([0.5, 1.])}])
+        with pytest.raises(ValueError):
+            lensParam.num_param()
+        with pytest.raises(ValueError):
+            lensParam.set_params(kwargs_lens)
+        with pytest.raises(ValueError):
+            lensParam.get_params(args, i=0)
+
 
 if __name__ == '__main__':
     pytest.main()
@@ -0,0 +1,117 @@
+import os
+import pickle
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.Sampling.Pool.shared_memory import SharedDataStore, SharedArray, SharedLikelihoodModule, attach
+from lenstronomy.Sampling.Pool import shared_memory
+from lenstronomy.Sampling.Pool.multiprocessing import MultiPool
+from lenstronomy.Sampling.likelihood import LikelihoodModule
+from lenstronomy.Sampling.parameters import Param
+from lenstronomy.SimulationAPI.sim_api import SimAPI
+
+
+class TestSharedMemory(object):
+
+    def setup_method(self):
+        kwargs_band = {'read_noise': 1, 'pixel_scale': 0.1, 'ccd_gain': 10, 'exposure_time': 100,
+                       'sky_brightness': 22, 'magnitude_zero_point': 25, 'num_exposures': 1, 'seeing': 0.3,
+                       'psf_type': 'GAUSSIAN'}
+        self.kwargs_model = {'lens_model_list': ['SIS'], 'source_light_model_list': ['SERSIC']}
+        sim = SimAPI(numpix=40, kwargs_single_band=kwargs_band, kwargs_model=self.kwargs_model)
+        self.kwargs_lens = [{'theta_E': 1., 'center_x': 0, 'center_y': 0}]
+        self.kwargs_source = [{'amp': 1, 'R_sersic': 0.3, 'n_sersic': 2, 'center_x': 0.1, 'center_y': 0}]
+        image_model = sim.image_model_class({'supersampling_factor': 1})
+        image = image_model.image(self.kwargs_lens, self.kwargs_source)
+        kwargs_data = sim.kwargs_data
+        kwargs_data['image_data'] = image + sim.noise_for_model(image, seed=1)
+        self.kwargs_data_joint = {'multi_band_list': [[kwargs_data, sim.kwargs_psf, {'supersampling_factor': 1}]],
+                                  'multi_band_type': 'single-band'}
+        self.kwargs_param = {'kwargs_model': self.kwargs_model,
+                             'kwargs_fixed_source': [{'n_sersic': 2}],
+                             'kwargs_lower_lens': [{'theta_E': 0.1, 'center_x': -1, 'center_y': -1}],
+                             'kwargs_upper_lens': [{'theta_E': 3, 'center_x': 1, 'center_y': 1}],
+                             'kwargs_lower_source': [{'R_sersic': 0.01, 'center_x': -1, 'center_y': -1}],
+                             'kwargs_upper_source': [{'R_sersic': 3, 'center_x': 1, 'center_y': 1}]}
+        self.kwargs_likelihood = {'source_marg': False, 'check_bounds': True}
+        param = Param(**self.kwargs_param)
+        self.likelihood = LikelihoodModule(self.kwargs_data_joint, self.kwargs_model, param, **self.kwargs_likelihood)
+        self.args = param.kwargs2args(kwargs_lens=self.kwargs_lens, kwargs_source=self.kwargs_source)
+
+    def test_share_attach(self):
+        with SharedDataStore(min_size=10) as store:
+            array = np.arange(100.).reshape(10, 10)
+            obj = {'a': [array, 1, (array[:2], 'b')], 'c': np.ones(3)}
+            shared = store.share(obj)
+            assert isinstance(shared['a'][0], SharedArray)
+            assert isinstance(shared['a'][2][0], SharedArray)
+            assert isinstance(shared['c'], np.ndarray)
+            restored = attach(pickle.loads(pickle.dumps(shared)))
+            npt.assert_array_equal(restored['a'][0], array)
+            npt.assert_array_equal(restored['a'][2][0], array[:2])
+            assert restored['a'][1] == 1
+            assert restored['a'][2][1] == 'b'
+            # read-only mapping
+            with pytest.raises(ValueError):
+                restored['a'][0][0, 0] = 5
+            npt.assert_array_equal(np.load(shared['a'][0].filename), array)
+            directory = store.directory
+            assert os.path.isdir(directory)
+        assert not os.path.isdir(directory)
+        with pytest.raises(ValueError):
+            store.share_array(array)
+
+    def test_likelihood(self):
+        store = SharedDataStore()
+        shared_likelihood = SharedLikelihoodModule(self.kwargs_data_joint, self.kwargs_model, self.kwargs_param,
+                                                   self.kwargs_likelihood, store)
+        logL = self.likelihood.logL(self.args)
+        npt.assert_almost_equal(shared_likelihood.logL(self.args), logL, decimal=8)
+        npt.assert_almost_equal(shared_likelihood(self.args), logL, decimal=8)
+        npt.assert_almost_equal(shared_likelihood.negativelogL(self.args), -logL, decimal=8)
+        npt.assert_almost_equal(shared_likelihood.likelihood(self.args), logL, decimal=8)
+        npt.assert_array_equal(shared_likelihood.param_limits[0], self.likelihood.param_limits[0])
+
+        # the pickled instance does not carry the data
+        assert len(pickle.dumps(shared_likelihood)) < len(pickle.dumps(self.likelihood)) / 5
+        shared_likelihood.release()
+        likelihood_copy = pickle.loads(pickle.dumps(shared_likelihood))
+        npt.assert_almost_equal(likelihood_copy.logL(self.args), logL, decimal=8)
+        with pytest.raises(AttributeError):
+            likelihood_copy._not_an_attribute
+
+        # placeholder of the MPI worker ranks: parameter handling only, nothing written
+        worker_likelihood = SharedLikelihoodModule(None, None, self.kwargs_param, None, None)
+        npt.assert_array_equal(worker_likelihood.param_limits[1], self.likelihood.param_limits[1])
+        assert worker_likelihood.param.num_param() == self.likelihood.param.num_param()
+        with pytest.raises(ValueError):
+            worker_likelihood.logL(self.args)
+
+        pool = MultiPool(processes=2)
+        logL_list = list(pool.map(shared_likelihood.logL, [self.args] * 4))
+        pool.close()
+        npt.assert_almost_equal(logL_list, logL, decimal=8)
+        shared_likelihood.release()
+        store.close()
+
+    def test_release_process(self):
+        # a process keeps only the likelihood it currently evaluates (e.g. MPI worker ranks between fitting steps)
+        store = SharedDataStore()
+        likelihood_1 = SharedLikelihoodModule(self.kwargs_data_joint, self.kwargs_model, self.kwargs_param,
+                                              self.kwargs_likelihood, store)
+        likelihood_2 = SharedLikelihoodModule(self.kwargs_data_joint, self.kwargs_model, self.kwargs_param,
+                                              self.kwargs_likelihood, store)
+        logL = likelihood_1.logL(self.args)
+        assert likelihood_1._token in shared_memory._likelihood_cache
+        npt.assert_almost_equal(likelihood_2.logL(self.args), logL, decimal=8)
+        assert likelihood_1._token not in shared_memory._likelihood_cache
+        assert likelihood_1._token not in shared_memory._param_cache
+        assert likelihood_2._token in shared_memory._likelihood_cache
+        likelihood_2.release()
+        assert len(shared_memory._likelihood_cache) == 0
+        store.close()
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -51,6 +51,18 @@ class TestParam(object):
         assert len(list) == num_param
         assert num_param == 9
 
+    def test_update_lens_model(self):
+        # the lens model is only re-created when the sampled redshifts change
+        lens_model_class = self.param_class._lens_model_class
+        self.param_class._update_lens_model({'z_sampling': [0.5]})
+        assert self.param_class._lens_model_class is lens_model_class
+        self.param_class._update_lens_model({'z_sampling': [0.6]})
+        assert self.param_class._lens_model_class is not lens_model_class
+        lens_model_class = self.param_class._lens_model_class
+        self.param_class._update_lens_model({'z_sampling': [0.6]})
+        assert self.param_class._lens_model_class is lens_model_class
+        assert self.param_class.model_redshifts({'lens_redshift_list': np.array([0.5, 1])}) == ((0.5, 1), None)
+
     def test_num_param_linear(self):
         num_param = self.param_class.num_param_linear()
         assert num_param == 4
@@ -9,10 +9,17 @@ from lenstronomy.Sampling.likelihood import LikelihoodModule
 from lenstronomy.Sampling.parameters import Param
 from lenstronomy.LensModel.lens_model import LensModel
 from lenstronomy.LightModel.light_model import LightModel
-from lenstronomy.Sampling.sampler import Sampler, choose_pool
+from lenstronomy.Sampling.sampler import Sampler, choose_pool, _close_pool
+from lenstronomy.Sampling.Pool.multiprocessing import MultiPool
+from lenstronomy.Util.profiler import StageProfiler
 from lenstronomy.Data.imaging_data import ImageData
 from lenstronomy.Data.psf import PSF
 
+def _run_stage(profiler):
+    # the counters are not flushed by the task, nor registered to be flushed when the worker exits
+    with profiler.stage('worker'):
+        pass
+
 
 class TestSampler(object):
     """
@@ -158,5 +165,42 @@ class TestSampler(object):
                                                      miniter_callback=miniter_callback)
         assert len(samples_mi) == n_walkers * n_run
 
+    def test_close_pool(self, tmp_path):
+        # the workers of a multiprocessing pool write their counters when the pool is closed
+        profiler = StageProfiler(directory=str(tmp_path / 'profile'))
+        pool = MultiPool(processes=2)
+        pool.map(_run_stage, [profiler] * 6)
+        _close_pool(pool, profiler)
+        assert profiler.collect()['worker']['calls'] == 6
+
+        # each worker rank of an MPI pool receives the flush task
+        from schwimmbad.mpi import MPIPool
+
+        class Comm(object):
+            def __init__(self):
+                self.results = {}
+
+            def send(self, task, dest, tag):
+                func, arg = task
+                self.results[dest] = func(arg)
+
+            def recv(self, source, tag):
+                return self.results.pop(source)
+
+        profiler.reset()
+        _run_stage(profiler)
+        pool = MPIPool.__new__(MPIPool)
+        pool.comm, pool.master, pool.rank, pool.workers = Comm(), 0, 0, {1, 2}
+        _close_pool(pool, profiler)
+        assert pool.comm.results == {}
+        assert profiler.collect()['worker']['calls'] == 1
+
+        # without profiler
+        pool = MultiPool(processes=2)
+        _close_pool(pool)
+        with pytest.raises(ValueError):
+            pool.map(_run_stage, [profiler])
+
+
 if __name__ == '__main__':
     pytest.main()
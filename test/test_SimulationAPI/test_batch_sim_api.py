@@ -0,0 +1,120 @@
+from lenstronomy.SimulationAPI.batch_sim_api import BatchSimAPI
+from lenstronomy.SimulationAPI.sim_api import SimAPI
+import lenstronomy.SimulationAPI.observation_constructor as constructor
+import numpy as np
+import numpy.testing as npt
+import pytest
+import os
+
+
+class TestBatchSimAPI(object):
+
+    def setup_method(self):
+        numpix = 20
+        kwargs_single_band = constructor.observation_constructor(instrument_name='LSST',
+                                                                 observation_name='LSST_g_band')
+        kwargs_single_band['data_count_unit'] = 'e-'
+        self.kwargs_model = {'lens_model_list': ['SIS'], 'source_light_model_list': ['GAUSSIAN'],
+                             'lens_light_model_list': ['SERSIC'], 'point_source_model_list': ['LENSED_POSITION']}
+        self.kwargs_numerics = {'supersampling_factor': 2}
+        self.sim = BatchSimAPI(numpix, kwargs_single_band, self.kwargs_model, kwargs_numerics=self.kwargs_numerics)
+        self.sim_api = SimAPI(numpix, kwargs_single_band, self.kwargs_model)
+
+        num = 7
+        np.random.seed(41)
+        self.kwargs_table = {'kwargs_lens': [{'theta_E': np.random.uniform(0.8, 1.2, num), 'center_x': 0,
+                                              'center_y': 0}],
+                             'kwargs_source_mag': [{'magnitude': np.random.uniform(20, 22, num), 'sigma': 0.1,
+                                                    'center_x': np.random.uniform(-0.1, 0.1, num), 'center_y': 0}],
+                             'kwargs_lens_light_mag': [{'magnitude': 20, 'R_sersic': 0.5, 'n_sersic': 3,
+                                                        'center_x': 0, 'center_y': 0}],
+                             'kwargs_ps_mag': [{'magnitude': np.random.uniform(20, 22, (num, 2)),
+                                                'ra_image': [np.array([1., -0.9])] * num,
+                                                'dec_image': np.random.uniform(-0.1, 0.1, (num, 2))}]}
+        self.num = num
+
+    def test_num_systems(self):
+        assert self.sim.num_systems(self.kwargs_table) == self.num
+        kwargs_table = {'kwargs_lens': [{'theta_E': np.ones(3), 'center_x': np.zeros(2)}]}
+        with pytest.raises(ValueError):
+            self.sim.num_systems(kwargs_table)
+        with pytest.raises(ValueError):
+            self.sim.num_systems({'kwargs_lens': [{'theta_E': 1}]})
+        with pytest.raises(ValueError):
+            self.sim.num_systems({'kwargs_lensed': [{'theta_E': np.ones(3)}]})
+
+    def test_kwargs_system(self):
+        i = 3
+        kwargs = self.sim.kwargs_system(self.kwargs_table, i)
+        assert kwargs['kwargs_lens'][0]['theta_E'] == self.kwargs_table['kwargs_lens'][0]['theta_E'][i]
+        kwargs_mag = {key: [{name: value if np.ndim(value) == 0 else value[i] for name, value in kw.items()}
+                            for kw in kwargs_list] for key, kwargs_list in self.kwargs_table.items()}
+        kwargs_lens_light, kwargs_source, kwargs_ps = self.sim_api.magnitude2amplitude(
+            kwargs_mag['kwargs_lens_light_mag'], kwargs_mag['kwargs_source_mag'], kwargs_mag['kwargs_ps_mag'])
+        assert kwargs['kwargs_source'][0]['amp'] == kwargs_source[0]['amp']
+        npt.assert_almost_equal(kwargs['kwargs_ps'][0]['point_amp'], kwargs_ps[0]['point_amp'], decimal=10)
+
+        kwargs_table = dict(self.kwargs_table, kwargs_source=[{'amp': 1, 'sigma': 0.1, 'center_x': 0,
+                                                               'center_y': 0}])
+        with pytest.raises(ValueError):
+            self.sim.kwargs_system(kwargs_table, i)
+
+    def test_simulate(self):
+        images, models = self.sim.simulate(self.kwargs_table, seed=42)
+        assert images.shape == (self.num, 20, 20)
+        # same as the images of individual image models and noise realizations
+        image_model = self.sim_api.image_model_class(kwargs_numerics=self.kwargs_numerics)
+        for i in [0, self.num - 1]:
+            kwargs = self.sim.kwargs_system(self.kwargs_table, i)
+            npt.assert_almost_equal(models[i], image_model.image(**kwargs), decimal=10)
+        seed_list = np.random.default_rng(np.random.SeedSequence(42, spawn_key=(0,))).integers(0, 2 ** 31 - 1,
+                                                                                             size=self.num)
+        noise = self.sim_api.noise_for_model(models[2], seed=int(seed_list[2]))
+        npt.assert_almost_equal(images[2], models[2] + noise, decimal=10)
+
+        # reproducible
+        images_2, _ = self.sim.simulate(self.kwargs_table, seed=42)
+        npt.assert_almost_equal(images_2, images, decimal=10)
+        images_2, _ = self.sim.simulate(self.kwargs_table, seed=42, chunk_index=1)
+        assert np.max(np.abs(images_2 - images)) > 0
+        images_2, _ = self.sim.simulate(self.kwargs_table, add_noise=False)
+        npt.assert_almost_equal(images_2, models, decimal=10)
+
+    def test_simulate_chunks(self):
+        chunk_list = list(self.sim.simulate_chunks(self.kwargs_table, chunk_size=3, seed=42))
+        assert [start for start, _, _ in chunk_list] == [0, 3, 6]
+        images = np.concatenate([images for _, images, _ in chunk_list])
+        images_chunk, _ = self.sim.simulate(self.sim.kwargs_slice(self.kwargs_table, 3, 6), seed=42, chunk_index=1)
+        npt.assert_almost_equal(images[3:6], images_chunk, decimal=10)
+
+        # independent of the number of processes
+        chunk_list_pool = list(self.sim.simulate_chunks(self.kwargs_table, chunk_size=3, seed=42, num_processes=2))
+        images_pool = np.concatenate([images for _, images, _ in chunk_list_pool])
+        npt.assert_almost_equal(images_pool, images, decimal=10)
+
+    def test_simulate_to_file(self, tmp_path):
+        filename = os.path.join(str(tmp_path), 'images.npy')
+        seed = self.sim.simulate_to_file(self.kwargs_table, filename, chunk_size=3, seed=None, save_model=True)
+        images_file = np.load(filename)
+        models_file = np.load(os.path.join(str(tmp_path), 'images_model.npy'))
+        images = np.concatenate([images for _, images, _ in
+                                 self.sim.simulate_chunks(self.kwargs_table, chunk_size=3, seed=seed)])
+        npt.assert_almost_equal(images_file, images, decimal=10)
+        _, models = self.sim.simulate(self.kwargs_table, add_noise=False)
+        npt.assert_almost_equal(models_file, models, decimal=10)
+
+        try:
+            import h5py
+        except ImportError:
+            with pytest.raises(ImportError):
+                self.sim.simulate_to_file(self.kwargs_table, os.path.join(str(tmp_path), 'images.h5'))
+        else:
+            filename = os.path.join(str(tmp_path), 'images.h5')
+            self.sim.simulate_to_file(self.kwargs_table, filename, chunk_size=3, seed=seed)
+            with h5py.File(filename, 'r') as f:
+                npt.assert_almost_equal(f['image'][:], images, decimal=10)
+                assert int(f.attrs['seed']) == seed
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -78,6 +78,74 @@ class TestClassCreator(object):
                                                  image_likelihood_mask_list=None, band_index=0)
         assert multi_band.LensModel.lens_model_list[0] == 'SIS'
 
+    def test_cache(self):
+        import lenstronomy.Util.kernel_util as kernel_util
+        from lenstronomy.Util.profiler import StageProfiler
+        kwargs_psf = {'psf_type': 'PIXEL', 'kernel_point_source': kernel_util.kernel_gaussian(5, 1, 2)}
+        kwargs_numerics = {'supersampling_factor': 2}
+        multi_band_list = [[self.kwargs_data, kwargs_psf, kwargs_numerics]]
+        class_creator.set_cache(True, max_size=2)
+        try:
+            im_sim = class_creator.create_im_sim(multi_band_list, 'single-band', self.kwargs_model_2)
+            # the data array does not enter the key, the numerics are shared
+            kwargs_data = {'image_data': np.zeros((10, 10))}
+            im_sim_2 = class_creator.create_im_sim([[kwargs_data, dict(kwargs_psf), kwargs_numerics]], 'single-band',
+                                                   self.kwargs_model_2)
+            info = class_creator.cache_info()
+            assert info['hits'] == 1 and info['misses'] == 1 and info['size'] == 1
+            assert im_sim_2.ImageNumerics is im_sim.ImageNumerics
+            # all other instances are independent
+            assert im_sim_2.Data is not im_sim.Data
+            assert im_sim_2.PSF is not im_sim.PSF
+            assert im_sim_2.LensModel is not im_sim.LensModel
+            assert im_sim_2.PointSource is not im_sim.PointSource
+            im_sim_2.set_profiler(StageProfiler(enabled=True))
+            assert im_sim._profiler is not im_sim_2._profiler
+            # the shared numerics do not depend on the instances of the first caller
+            im_sim.Data.shift_coordinate_system(1, 1)
+            x, y = im_sim_2.ImageNumerics.coordinates_evaluate
+            x_2, y_2 = class_creator.create_image_numerics(im_sim_2.Data, im_sim_2.PSF, kwargs_psf,
+                                                           kwargs_numerics).coordinates_evaluate
+            np.testing.assert_almost_equal(x, x_2)
+            class_creator.set_cache(False)
+            x_2, y_2 = class_creator.create_image_numerics(im_sim_2.Data, im_sim_2.PSF, kwargs_psf,
+                                                           kwargs_numerics).coordinates_evaluate
+            np.testing.assert_almost_equal(x, x_2)
+            class_creator.set_cache(True, max_size=2)
+
+            # the models computed with shared numerics match the ones without
+            kwargs_lens = [{'theta_E': 1, 'center_x': 0, 'center_y': 0}]
+            kwargs_source = [{'amp': 1, 'R_sersic': 1, 'n_sersic': 2, 'center_x': 0, 'center_y': 0}]
+            image = class_creator.create_im_sim(multi_band_list, 'single-band', self.kwargs_model_2).image(
+                kwargs_lens, kwargs_source, kwargs_source, point_source_add=False)
+            class_creator.set_cache(False)
+            image_2 = class_creator.create_im_sim(multi_band_list, 'single-band', self.kwargs_model_2).image(
+                kwargs_lens, kwargs_source, kwargs_source, point_source_add=False)
+            np.testing.assert_almost_equal(image, image_2)
+            class_creator.set_cache(True, max_size=2)
+
+            # the PSF, the numerics settings and the pixel grid are part of the key
+            class_creator.create_im_sim([[self.kwargs_data, self.kwargs_psf, kwargs_numerics]], 'single-band',
+                                        self.kwargs_model_2)
+            class_creator.create_im_sim([[self.kwargs_data, kwargs_psf, {}]], 'single-band', self.kwargs_model_2)
+            kwargs_data = {'image_data': np.ones((10, 10)), 'ra_at_xy_0': 1}
+            im_sim_3 = class_creator.create_image_model(kwargs_data, kwargs_psf, kwargs_numerics, self.kwargs_model_2)
+            assert im_sim_3.ImageNumerics is not im_sim.ImageNumerics
+            info = class_creator.cache_info()
+            assert info['misses'] == 3 and info['size'] == 2
+
+            class_creator.clear_cache()
+            assert class_creator.cache_info()['size'] == 0
+            assert class_creator.create_im_sim(multi_band_list, 'single-band',
+                                               self.kwargs_model_2).ImageNumerics is not im_sim.ImageNumerics
+        finally:
+            class_creator.set_cache(False)
+        assert class_creator.cache_info()['size'] == 0
+        im_sim = class_creator.create_im_sim(multi_band_list, 'single-band', self.kwargs_model_2)
+        im_sim_2 = class_creator.create_im_sim(multi_band_list, 'single-band', self.kwargs_model_2)
+        assert im_sim_2.ImageNumerics is not im_sim.ImageNumerics
+        assert class_creator.cache_info()['misses'] == 0
+
 
 class TestRaise(unittest.TestCase):
 
@@ -88,6 +156,9 @@ class TestRaise(unittest.TestCase):
         with self.assertRaises(ValueError):
             class_creator.create_im_sim(multi_band_list=[[], []], multi_band_type='multi-linear', linear_solver=False,
                                         kwargs_model=None, bands_compute=None, image_likelihood_mask_list=None, band_index=0)
+        with self.assertRaises(ValueError):
+            class_creator.create_im_sim(multi_band_list=[[], []], multi_band_type='joint-linear', kwargs_model=None,
+                                        num_band_threads=2)
 
 
 if __name__ == '__main__':
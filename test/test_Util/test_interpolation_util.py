@@ -0,0 +1,51 @@
+import lenstronomy.Util.interpolation_util as interpolation_util
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+
+class TestInterpolationUtil(object):
+
+    def setup_method(self):
+        self.x_0, self.step = -1., 0.25
+        self.x_grid = self.x_0 + self.step * np.arange(21)
+        # within the grid, including the first and last points and the edge intervals
+        self.x_eval = np.array([-1., -0.9, -0.3, 0.01, 2.6, 3.9, 4.])
+
+    def test_cubic_polynomial(self):
+        # the 4-point Lagrange interpolation is exact for polynomials up to cubic order
+        func = lambda x: 0.3 * x ** 3 - 1.2 * x ** 2 + 0.5 * x + 2.
+        f = interpolation_util.cubic_interpolation(self.x_eval, self.x_0, self.step, func(self.x_grid))
+        npt.assert_almost_equal(f, func(self.x_eval), decimal=12)
+
+    def test_log_values(self):
+        func = lambda x: np.exp(0.1 * x ** 2 - x)
+        f = interpolation_util.cubic_interpolation(self.x_eval, self.x_0, self.step, np.log(func(self.x_grid)),
+                                                   log_values=True)
+        npt.assert_allclose(f, func(self.x_eval), rtol=1e-12)
+
+    def test_table(self):
+        # the columns of a 2d table are interpolated along its first axis
+        table = np.array([np.sin(self.x_grid), np.cos(self.x_grid), self.x_grid ** 3]).T
+        f = interpolation_util.cubic_interpolation(self.x_eval, self.x_0, self.step, table)
+        assert f.shape == (len(self.x_eval), 3)
+        for i in range(3):
+            f_i = interpolation_util.cubic_interpolation(self.x_eval, self.x_0, self.step, table[:, i])
+            npt.assert_almost_equal(f[:, i], f_i, decimal=14)
+
+    def test_numba_python(self):
+        # the compiled kernel and the numpy version agree
+        values = np.sin(self.x_grid)
+        f_numba = interpolation_util._interpolate_numba(self.x_eval, self.x_0, self.step, values, False)
+        numba_enabled = interpolation_util.numba_enabled
+        try:
+            interpolation_util.numba_enabled = False
+            f = interpolation_util.cubic_interpolation(self.x_eval, self.x_0, self.step, values)
+        finally:
+            interpolation_util.numba_enabled = numba_enabled
+        npt.assert_almost_equal(f_numba, f, decimal=14)
+        npt.assert_almost_equal(f, np.sin(self.x_eval), decimal=4)
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -144,6 +144,61 @@ def test_de_shift():
     npt.assert_almost_equal(kernel_de_shifted[2, 2], kernel[2, 2], decimal=2)
 
 
+def _gaussian_kernel_pixel(kernel_size, subgrid_res, sigma, center_x=0, center_y=0):
+    # pixel-integrated Gaussian kernel, normalized to one
+    num_sub = 9
+    x_grid, y_grid = util.make_grid(kernel_size * subgrid_res * num_sub, 1. / subgrid_res / num_sub)
+    flux = util.array2image(gaussian.function(x_grid, y_grid, amp=1, sigma=sigma, center_x=center_x,
+                                              center_y=center_y))
+    kernel = util.averaging(flux, numGrid=kernel_size * subgrid_res * num_sub, numPix=kernel_size * subgrid_res)
+    return kernel / np.sum(kernel)
+
+
+def test_de_shift_kernel_fourier():
+    kernel = _gaussian_kernel_pixel(kernel_size=21, subgrid_res=1, sigma=1.5)
+    shift_x, shift_y = 0.3, -0.4
+    kernel_shifted = _gaussian_kernel_pixel(kernel_size=21, subgrid_res=1, sigma=1.5, center_x=-shift_x,
+                                            center_y=-shift_y)
+    kernel_de_shifted = kernel_util.de_shift_kernel_fourier(kernel_shifted, shift_x, shift_y)
+    npt.assert_almost_equal(kernel_de_shifted / np.max(kernel), kernel / np.max(kernel), decimal=4)
+    # more accurate than the iterative de-shifting of the linear interpolation
+    kernel_de_shifted_iter = kernel_util.de_shift_kernel(kernel_shifted, shift_x, shift_y, iterations=20)
+    assert np.max(np.abs(kernel_de_shifted - kernel)) < np.max(np.abs(kernel_de_shifted_iter - kernel)) / 100
+
+    # integer shifts are exact
+    kernel_shifted = np.roll(kernel, shift=(-2, 1), axis=(0, 1))
+    kernel_de_shifted = kernel_util.de_shift_kernel_fourier(kernel_shifted, shift_x=-1, shift_y=2)
+    npt.assert_almost_equal(kernel_de_shifted[3:-3, 3:-3], kernel[3:-3, 3:-3], decimal=10)
+
+    # non-square kernel
+    kernel_de_shifted = kernel_util.de_shift_kernel_fourier(kernel[:, 2:-1], shift_x=0.2, shift_y=0.1)
+    assert np.shape(kernel_de_shifted) == (21, 18)
+
+
+def test_subgrid_kernel_fourier():
+    kernel_size, subgrid_res, sigma = 21, 3, 1.5
+    kernel = _gaussian_kernel_pixel(kernel_size, subgrid_res=1, sigma=sigma)
+    kernel_true = _gaussian_kernel_pixel(kernel_size, subgrid_res=subgrid_res, sigma=sigma)
+    kernel_subgrid = kernel_util.subgrid_kernel_fourier(kernel, subgrid_res=subgrid_res, odd=True)
+    assert np.shape(kernel_subgrid) == (kernel_size * subgrid_res, kernel_size * subgrid_res)
+    npt.assert_almost_equal(np.sum(kernel_subgrid), 1, decimal=10)
+    npt.assert_almost_equal(kernel_subgrid / np.max(kernel_true), kernel_true / np.max(kernel_true), decimal=3)
+    # more accurate than the iterative approach
+    kernel_subgrid_iter = kernel_util.subgrid_kernel(kernel, subgrid_res=subgrid_res, odd=True, num_iter=10)
+    assert np.max(np.abs(kernel_subgrid - kernel_true)) < np.max(np.abs(kernel_subgrid_iter - kernel_true)) / 10
+
+    # averaging the supersampled kernel reproduces the original kernel
+    kernel_pixel = util.averaging(kernel_subgrid, numGrid=kernel_size * subgrid_res, numPix=kernel_size)
+    npt.assert_almost_equal(kernel_pixel / np.sum(kernel_pixel), kernel, decimal=10)
+    kernel_subgrid = kernel_util.subgrid_kernel_fourier(kernel, subgrid_res=2, odd=False)
+    assert np.shape(kernel_subgrid) == (42, 42)
+
+    kernel_subgrid = kernel_util.subgrid_kernel_fourier(kernel, subgrid_res=2, odd=True)
+    assert np.shape(kernel_subgrid) == (41, 41)
+    assert np.max(kernel_subgrid) == kernel_subgrid[20, 20]
+    assert kernel_util.subgrid_kernel_fourier(kernel, subgrid_res=1) is kernel
+
+
 def test_deshift_subgrid():
     # test the de-shifting with a sharpened subgrid kernel
     kernel_size = 5
@@ -0,0 +1,86 @@
+import os
+import sys
+import subprocess
+import pytest
+import numpy.testing as npt
+
+from lenstronomy.Util import numba_warmup, numba_util
+
+
+class TestNumbaWarmup(object):
+
+    def test_warmup(self):
+        kernel_list = numba_warmup.kernel_list()
+        assert 'LensModel.Profiles.epl_numba' in kernel_list
+        assert 'ImSim.Numerics.numba_convolution' in kernel_list
+        time_dict = numba_warmup.warmup(kernels=['Util.util', 'Util.param_util'], verbose=True)
+        assert list(time_dict.keys()) == ['Util.util', 'Util.param_util']
+        assert time_dict['Util.util'] >= 0
+
+        @numba_warmup.register('test_kernel')
+        def _warmup_test():
+            numba_util.nan_to_num(1.)
+        assert 'test_kernel' in numba_warmup.kernel_list()
+        time_dict = numba_warmup.warmup(kernels=['test_kernel'])
+        assert len(time_dict) == 1
+        del numba_warmup._warmup_registry['test_kernel']
+
+        with pytest.raises(ValueError):
+            numba_warmup.warmup(kernels=['not_a_kernel'])
+
+    def test_main(self):
+        assert numba_warmup.main(['--list']) == {}
+        time_dict = numba_warmup.main(['--kernels', 'Util.numba_util', '--quiet'])
+        assert list(time_dict.keys()) == ['Util.numba_util']
+
+    @pytest.mark.skipif(not numba_util.numba_enabled, reason='numba is not enabled')
+    def test_registry_coverage(self, tmp_path):
+        # every numba kernel of lenstronomy is compiled by the warm-up. Runs in a separate process with an empty
+        # cache directory, such that all the kernels (including the ones only called by other kernels) are compiled
+        script = """
+import os
+import importlib
+from numba.core.dispatcher import Dispatcher
+import lenstronomy
+from lenstronomy.Util import numba_warmup
+numba_warmup.warmup()
+root = os.path.dirname(lenstronomy.__file__)
+not_compiled = []
+for dirpath, _, filenames in os.walk(root):
+    for filename in filenames:
+        path = os.path.join(dirpath, filename)
+        if not filename.endswith('.py') or 'numba_util' not in open(path).read():
+            continue
+        module_name = 'lenstronomy.' + os.path.relpath(path, root)[:-3].replace(os.sep, '.')
+        module = importlib.import_module(module_name)
+        objects = list(vars(module).items())
+        for name, obj in vars(module).items():
+            if isinstance(obj, type) and obj.__module__ == module_name:
+                objects += [(name + '.' + key, value.__func__ if isinstance(value, staticmethod) else value)
+                            for key, value in vars(obj).items()]
+        for name, obj in objects:
+            if isinstance(obj, Dispatcher) and obj.py_func.__module__ == module_name \\
+                    and obj.targetoptions.get('inline', 'never') != 'always' and len(obj.signatures) == 0:
+                not_compiled.append(module_name + '.' + name)
+print(not_compiled)
+"""
+        env = dict(os.environ, NUMBA_CACHE_DIR=str(tmp_path))
+        output = subprocess.run([sys.executable, '-c', script], env=env, capture_output=True, text=True, check=True)
+        assert output.stdout.strip().splitlines()[-1] == '[]'
+
+    def test_set_cache_dir(self, tmp_path):
+        cache_dir_env = os.environ.get('NUMBA_CACHE_DIR', None)
+        numba_util.set_cache_dir(str(tmp_path))
+        assert os.environ['NUMBA_CACHE_DIR'] == str(tmp_path)
+        if numba_util.numba_enabled:
+            npt.assert_string_equal(numba_util.numba.config.CACHE_DIR, str(tmp_path))
+        if cache_dir_env is None:
+            del os.environ['NUMBA_CACHE_DIR']
+            if numba_util.numba_enabled:
+                numba_util.numba.config.CACHE_DIR = ''
+        else:
+            numba_util.set_cache_dir(cache_dir_env)
+
+
+if __name__ == '__main__':
+    pytest.main()
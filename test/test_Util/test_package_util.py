@@ -1,4 +1,8 @@
+import os
+import sys
 import types
+import subprocess
+import pytest
 
 
 def test_short_and_laconic():
@@ -48,3 +52,36 @@ def test_short_and_laconic():
     assert isinstance(ls.LensModel, types.ModuleType)
     assert hasattr(ls, 'LensModel_')
     assert isinstance(ls.LensModel_, type)
+
+
+def test_lazy_subpackages():
+    import lenstronomy as ls
+    import pytest
+    assert isinstance(ls.Util, types.ModuleType)
+    with pytest.raises(AttributeError):
+        ls.not_a_subpackage
+
+
+def test_measure_import():
+    from lenstronomy.Util.package_util import measure_import
+    time_import, modules_imported = measure_import('import lenstronomy', modules=['numpy', 'lenstronomy'])
+    assert time_import >= 0
+    assert modules_imported == ['lenstronomy']
+
+    # heavy dependencies are only imported by the features using them
+    _, modules_imported = measure_import('import lenstronomy.Workflow.fitting_sequence',
+                                         modules=['astropy.cosmology', 'scipy.stats', 'scipy.signal', 'matplotlib'])
+    assert modules_imported == []
+
+
+def test_import_budget():
+    # the import time and imported modules stay within IMPORT_BUDGET of benchmarks/bench_import.py
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if not os.path.isfile(os.path.join(root, 'benchmarks', 'bench_import.py')):
+        pytest.skip('benchmarks are not available')
+    script = """
+from benchmarks.bench_import import check_budget
+print(check_budget(verbose=False))
+"""
+    output = subprocess.run([sys.executable, '-c', script], cwd=root, capture_output=True, text=True, check=True)
+    assert output.stdout.strip().splitlines()[-1] == '[]', output.stdout
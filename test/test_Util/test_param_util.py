@@ -184,5 +184,47 @@ def test_transform_e1e2_square_average():
     npt.assert_almost_equal(np.sum(x**2 + y**2), np.sum(x_**2+y_**2), decimal=8)
 
 
+def test_rotated_frame():
+    x, y = np.linspace(-1, 1, 10), np.linspace(2, -1, 10)
+    e1, e2, center_x, center_y = 0.1, -0.2, 0.3, -0.1
+    phi, q = param_util.ellipticity2phi_q(e1, e2)
+    x_, y_ = param_util.rotated_frame(x, y, e1, e2, center_x, center_y)
+    x_rot, y_rot = util.rotate(x - center_x, y - center_y, phi)
+    npt.assert_almost_equal(x_, x_rot, decimal=12)
+    npt.assert_almost_equal(y_, y_rot, decimal=12)
+    assert param_util.rotated_frame(x, y, e1, e2, center_x, center_y)[0] is not x_
+
+    with param_util.transform_cache():
+        x_cache, y_cache = param_util.rotated_frame(x, y, e1, e2, center_x, center_y)
+        npt.assert_equal(x_cache, x_)
+        npt.assert_equal(y_cache, y_)
+        assert param_util.rotated_frame(x, y, e1, e2, center_x, center_y)[0] is x_cache
+        with param_util.transform_cache():
+            assert param_util.rotated_frame(x, y, e1, e2, center_x, center_y)[1] is y_cache
+        assert param_util.rotated_frame(x, y, e1, e2, center_x, center_y)[0] is x_cache
+        # different center, eccentricities or arrays
+        assert param_util.rotated_frame(x, y, e1, e2, center_x + 0.1, center_y)[0] is not x_cache
+        assert param_util.rotated_frame(x, y, e1, -e2, center_x, center_y)[0] is not x_cache
+        assert param_util.rotated_frame(x.copy(), y, e1, e2, center_x, center_y)[0] is not x_cache
+        with pytest.raises(ValueError):
+            x_cache[0] = 1
+        # the transforms based on the frame are unchanged
+        x_1, y_1 = param_util.transform_e1e2_product_average(x, y, e1, e2, center_x, center_y)
+        x_2, y_2 = param_util.transform_e1e2_square_average(x, y, e1, e2, center_x, center_y)
+    npt.assert_equal(x_1, param_util.transform_e1e2_product_average(x, y, e1, e2, center_x, center_y)[0])
+    npt.assert_equal(y_2, param_util.transform_e1e2_square_average(x, y, e1, e2, center_x, center_y)[1])
+    assert param_util.rotated_frame(x, y, e1, e2, center_x, center_y)[0] is not x_cache
+
+    # only the frames shared by several profiles of the list are stored
+    kwargs_list = [{'e1': e1, 'e2': e2, 'center_x': center_x, 'center_y': center_y, 'amp': 1},
+                   {'e1': e1, 'e2': e2, 'center_x': center_x, 'center_y': center_y, 'amp': 2},
+                   {'center_x': center_x, 'center_y': center_y}]
+    with param_util.transform_cache(kwargs_list):
+        x_cache, _ = param_util.rotated_frame(x, y, e1, e2, center_x, center_y)
+        assert param_util.rotated_frame(x, y, e1, e2, center_x, center_y)[0] is x_cache
+        x_0, _ = param_util.rotated_frame(x, y, 0, 0, center_x, center_y)
+        assert param_util.rotated_frame(x, y, 0, 0, center_x, center_y)[0] is not x_0
+
+
 if __name__ == '__main__':
     pytest.main()
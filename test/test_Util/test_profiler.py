@@ -0,0 +1,105 @@
+import os
+import pickle
+import multiprocessing
+import numpy.testing as npt
+
+from lenstronomy.Util.profiler import StageProfiler
+
+
+def _run_stage(profiler):
+    with profiler.stage('worker'):
+        pass
+    profiler.flush()
+    return os.getpid()
+
+
+def _run_step(profiler):
+    with profiler.stage('worker'):
+        pass
+    profiler.step()
+    return os.getpid()
+
+
+class TestStageProfiler(object):
+
+    def test_stage(self):
+        profiler = StageProfiler()
+        for i in range(3):
+            with profiler.stage('a'):
+                pass
+        profiler.add('b', time_elapsed=2., num_calls=4)
+        counters = profiler.counters
+        assert counters['a']['calls'] == 3
+        assert counters['a']['time'] >= 0
+        npt.assert_almost_equal(counters['b']['time'], 2.)
+        assert profiler.collect() == counters
+        report = StageProfiler.report(counters, title='test')
+        assert report.split('\n')[0] == 'test'
+        assert report.split('\n')[2].startswith('b')
+        profiler.reset()
+        assert profiler.counters == {}
+
+    def test_disabled(self):
+        profiler = StageProfiler(enabled=False)
+        assert profiler.enabled is False
+        with profiler.stage('a'):
+            pass
+        profiler.flush()
+        assert profiler.counters == {}
+
+    def test_directory(self, tmp_path):
+        directory = str(tmp_path / 'profile')
+        profiler = StageProfiler(directory=directory)
+        with profiler.stage('a'):
+            pass
+        # copies unpickled in the same process accumulate into the same counters
+        profiler_copy = pickle.loads(pickle.dumps(profiler))
+        with profiler_copy.stage('a'):
+            pass
+        profiler.flush()
+        assert profiler.counters['a']['calls'] == 2
+
+        ctx = multiprocessing.get_context('spawn')
+        with ctx.Pool(2) as pool:
+            pool.map(_run_stage, [profiler] * 4)
+        counters = profiler.collect()
+        assert counters['a']['calls'] == 2
+        assert counters['worker']['calls'] == 4
+
+        profiler.reset()
+        assert profiler.collect() == {}
+        profiler.close()
+        assert not os.path.exists(directory)
+        # no flush into a removed directory
+        with profiler.stage('a'):
+            pass
+        profiler.flush()
+        assert not os.path.exists(directory)
+
+    def test_step(self, tmp_path):
+        directory = str(tmp_path / 'profile')
+        profiler = StageProfiler(directory=directory, flush_every=3, flush_interval=1000)
+        for i in range(2):
+            with profiler.stage('a'):
+                pass
+            profiler.step()
+        assert len(os.listdir(directory)) == 0
+        with profiler.stage('a'):
+            pass
+        profiler.step()
+        assert len(os.listdir(directory)) == 1
+
+        profiler_time = StageProfiler(directory=directory, flush_every=1000, flush_interval=0)
+        with profiler_time.stage('a'):
+            pass
+        profiler_time.step()
+        assert len(os.listdir(directory)) == 2
+
+        # the workers of a pool write their counters when they exit
+        profiler = StageProfiler(directory=directory, flush_every=1000, flush_interval=1000)
+        ctx = multiprocessing.get_context('fork')
+        with ctx.Pool(2) as pool:
+            pool.map(_run_step, [profiler] * 4)
+            pool.close()
+            pool.join()
+        assert profiler.collect()['worker']['calls'] == 4
@@ -197,6 +197,64 @@ class TestFittingSequence(object):
         assert kwargs_set['kwargs_source'][0]['n_sersic'] == 2.993
         assert kwargs_set['kwargs_ps'][0]['ra_source'] == 0.007
 
+    def test_shared_data(self):
+        fittingSequence = FittingSequence(self.kwargs_data_joint, self.kwargs_model, self.kwargs_constraints,
+                                          self.kwargs_likelihood, self.kwargs_params, shared_data=True)
+        kwargs_pso = {'sigma_scale': 1, 'n_particles': 4, 'n_iterations': 2, 'threadCount': 2}
+        chain_list = fittingSequence.fit_sequence([['PSO', kwargs_pso]])
+        assert chain_list[0][0] == 'PSO'
+        assert np.all(np.isfinite(chain_list[0][1][0]))
+
+    def test_shared_data_mpi_ranks(self, monkeypatch, tmp_path):
+        # with MPI, only the master rank writes the shared data, the worker ranks only build the parameter handling
+        import sys
+        import types
+        from lenstronomy.Sampling.Pool.shared_memory import SharedLikelihoodModule, SharedDataStore
+
+        class Comm(object):
+            rank = 1
+
+            def Get_rank(self):
+                return self.rank
+        comm = Comm()
+        monkeypatch.setitem(sys.modules, 'mpi4py', types.SimpleNamespace(MPI=types.SimpleNamespace(COMM_WORLD=comm)))
+        # the node-local default directory is not accessible by the ranks on other nodes
+        with pytest.raises(ValueError):
+            FittingSequence(self.kwargs_data_joint, self.kwargs_model, self.kwargs_constraints,
+                            self.kwargs_likelihood, self.kwargs_params, mpi=True, shared_data=True)
+        fittingSequence = FittingSequence(self.kwargs_data_joint, self.kwargs_model, self.kwargs_constraints,
+                                          self.kwargs_likelihood, self.kwargs_params, mpi=True, shared_data=True,
+                                          shared_data_directory=str(tmp_path))
+        assert fittingSequence._shared_data_store(threadCount=1) is None
+        likelihood = fittingSequence._pool_likelihood(None)
+        assert isinstance(likelihood, SharedLikelihoodModule)
+        assert likelihood.param.num_param() == fittingSequence.param_class.num_param()
+        comm.rank = 0
+        data_store = fittingSequence._shared_data_store(threadCount=1)
+        assert isinstance(data_store, SharedDataStore)
+        assert data_store.directory.startswith(str(tmp_path))
+        data_store.close()
+
+    def test_profile(self):
+        fittingSequence = FittingSequence(self.kwargs_data_joint, self.kwargs_model, self.kwargs_constraints,
+                                          self.kwargs_likelihood, self.kwargs_params, shared_data=True, profile=True)
+        kwargs_pso = {'sigma_scale': 1, 'n_particles': 4, 'n_iterations': 2, 'threadCount': 2}
+        fitting_list = [['PSO', kwargs_pso], ['update_settings', {}], ['PSO', dict(kwargs_pso, threadCount=1)]]
+        fittingSequence.fit_sequence(fitting_list)
+        profile_list = fittingSequence.profile_list
+        assert len(profile_list) == 2
+        for fitting_type, counters in profile_list:
+            assert fitting_type == 'PSO'
+            assert counters['logL']['calls'] >= 4 * 2
+            assert counters['ImageLikelihood.logL']['calls'] <= counters['logL']['calls']
+            assert counters['args2kwargs']['calls'] == counters['logL']['calls']
+            assert 'get_param_WLS' in counters
+
+        # the temporary profile directory is not accessible by the ranks on other nodes
+        with pytest.raises(ValueError):
+            FittingSequence(self.kwargs_data_joint, self.kwargs_model, self.kwargs_constraints,
+                            self.kwargs_likelihood, self.kwargs_params, mpi=True, profile=True)
+
     def test_zeus(self):
         np.random.seed(42)
         # we make a very basic lens+source model to feed to check zeus can be run through fitting sequence
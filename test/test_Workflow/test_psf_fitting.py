@@ -2,6 +2,7 @@ __author__ = 'sibirrer'
 
 import pytest
 import numpy as np
+import numpy.testing as npt
 import copy
 import lenstronomy.Util.util as util
 import lenstronomy.Util.simulation_util as sim_util
@@ -161,6 +162,115 @@ class TestPSFIteration(object):
         mask_point_source = self.psf_fitting.mask_point_source(ra_image, dec_image, x_grid, y_grid, radius, i=0)
         assert mask_point_source[10, 10] == 1
 
+    def test_update_iterative_fourier(self):
+        fwhm = 0.5
+        sigma = util.fwhm2sigma(fwhm)
+        x_grid, y_grid = util.make_grid(numPix=31, deltapix=0.05)
+        from lenstronomy.LightModel.Profiles.gaussian import Gaussian
+        gaussian = Gaussian()
+        kernel_point_source = gaussian.function(x_grid, y_grid, amp=1., sigma=sigma, center_x=0, center_y=0)
+        kernel_point_source /= np.sum(kernel_point_source)
+        kernel_point_source = util.array2image(kernel_point_source)
+        kwargs_psf = {'psf_type': 'PIXEL', 'kernel_point_source': kernel_point_source}
+        kwargs_psf_iter = {'stacking_method': 'median', 'psf_symmetry': 2, 'psf_iter_factor': 0.2,
+                           'block_center_neighbour': 0.1, 'error_map_radius': 0.5, 'shift_method': 'fourier'}
+        kwargs_params = copy.deepcopy(self.kwargs_params)
+        kwargs_psf_new = self.psf_fitting.update_iterative(kwargs_psf, kwargs_params, **kwargs_psf_iter)
+        kernel_new = kwargs_psf_new['kernel_point_source']
+        kernel_true = self.kwargs_psf['kernel_point_source']
+        diff_old = np.sum((kernel_point_source - kernel_true) ** 2)
+        diff_new = np.sum((kernel_new - kernel_true) ** 2)
+        assert diff_old > diff_new
+        # the workspace only persists during the iterations
+        assert self.psf_fitting._star_workspace is None
+        assert self.psf_fitting._model_cache is None
+
+        with pytest.raises(ValueError):
+            self.psf_fitting.update_psf(kwargs_psf, kwargs_params, shift_method='wrong')
+
+    def test_likelihood_after(self):
+        # the likelihood after the update is the one of likelihood_data_given_model(), as the likelihood before
+        kwargs_psf = copy.deepcopy(self.kwargs_psf)
+        kwargs_psf_iter = {'stacking_method': 'median', 'error_map_radius': 0.5}
+        kwargs_psf_new, logL_after, error_map = self.psf_fitting.update_psf(kwargs_psf, self.kwargs_params,
+                                                                            **kwargs_psf_iter)
+        assert self.psf_fitting._model_cache is None
+        self.imageModel.update_psf(PSF(**kwargs_psf_new))
+        logL = self.imageModel.likelihood_data_given_model(**self.kwargs_params)
+        npt.assert_almost_equal(logL_after, logL, decimal=8)
+
+        # during the iterations, the model is only kept when the likelihood can be computed from it
+        assert self.psf_fitting._model_likelihood_consistent()
+        self.psf_fitting._keep_workspace = True
+        kwargs_psf_new, logL_after, error_map = self.psf_fitting.update_psf(kwargs_psf, self.kwargs_params,
+                                                                            **kwargs_psf_iter)
+        assert self.psf_fitting._model_cache is not None
+        self.imageModel.update_psf(PSF(**kwargs_psf_new))
+        npt.assert_almost_equal(logL_after, self.imageModel.likelihood_data_given_model(**self.kwargs_params),
+                                decimal=8)
+
+        from lenstronomy.ImSim.MultiBand.single_band_multi_model import SingleBandMultiModel
+        kwargs_data = {'image_data': self.imageModel.Data.data, 'background_rms': 0.01, 'exposure_time': 100,
+                       'transform_pix2angle': np.array([[-0.05, 0], [0, 0.05]]), 'ra_at_xy_0': 2.475,
+                       'dec_at_xy_0': -2.475}
+        kwargs_model = {'lens_model_list': ['SPEP', 'SHEAR'], 'source_light_model_list': ['SERSIC_ELLIPSE'],
+                        'lens_light_model_list': ['SERSIC'], 'point_source_model_list': ['SOURCE_POSITION'],
+                        'fixed_magnification_list': [True]}
+        kwargs_numerics = {'supersampling_factor': 3, 'point_source_supersampling_factor': 3}
+        multi_band_list = [[kwargs_data, self.kwargs_psf, kwargs_numerics]]
+        image_model = SingleBandMultiModel(multi_band_list, kwargs_model, linear_solver=False)
+        psf_fitting = PsfFitting(image_model)
+        psf_fitting._keep_workspace = True
+        assert not psf_fitting._model_likelihood_consistent()
+        kwargs_psf_new, logL_after, error_map = psf_fitting.update_psf(kwargs_psf, self.kwargs_params,
+                                                                       **kwargs_psf_iter)
+        assert psf_fitting._model_cache is None
+        image_model.update_psf(PSF(**kwargs_psf_new))
+        npt.assert_almost_equal(logL_after, image_model.likelihood_data_given_model(**self.kwargs_params), decimal=8)
+
+    def test_star_workspace(self):
+        from lenstronomy.Workflow.psf_fitting import _StarWorkspace
+        import lenstronomy.Util.kernel_util as kernel_util
+        from scipy import ndimage
+        data_class = self.imageModel.Data
+        image = np.random.normal(size=(100, 100))
+        # second star close to the edge of the image
+        ra_image, dec_image = data_class.map_pix2coord(np.array([40.3, 2.8]), np.array([60.6, 97.4]))
+        workspace = _StarWorkspace(data_class, self.imageModel.likelihood_mask, ra_image, dec_image)
+        assert workspace.matches(ra_image, dec_image)
+        assert not workspace.matches(ra_image + 0.1, dec_image)
+        cutouts = workspace.cutouts(image, 11)
+        for i in range(2):
+            cutout = kernel_util.cutout_source(workspace.x_int[i], workspace.y_int[i], image, 11, shift=False)
+            npt.assert_almost_equal(cutouts[i], cutout, decimal=14)
+        npt.assert_almost_equal(workspace.noise_cutouts(11)[1],
+                                kernel_util.cutout_source(workspace.x_int[1], workspace.y_int[1], data_class.C_D, 11,
+                                                          shift=False), decimal=14)
+        mask_cutouts = workspace.mask_cutouts(0.5, 11)
+        assert mask_cutouts.shape == (2, 11, 11)
+        assert workspace.mask_cutouts(0.5, 11) is mask_cutouts
+
+        shift_x, shift_y = np.array([0.3, -0.2]), np.array([-0.4, 0.1])
+        shifted = workspace.shift(cutouts, shift_x, shift_y, method='interpol')
+        shifted_fourier = workspace.shift(cutouts, shift_x, shift_y, method='fourier')
+        for i in range(2):
+            npt.assert_almost_equal(shifted[i], ndimage.shift(cutouts[i], shift=[shift_y[i], shift_x[i]], order=1),
+                                    decimal=14)
+        # smooth kernels shifted with the phase ramps as kernel_util.de_shift_kernel_fourier()
+        x_grid, y_grid = util.make_grid(numPix=21, deltapix=1)
+        from lenstronomy.LightModel.Profiles.gaussian import Gaussian
+        kernel = util.array2image(Gaussian().function(x_grid, y_grid, amp=1., sigma=2.))
+        kernels = np.array([kernel, 2 * kernel])
+        shifted_fourier = workspace.shift(kernels, shift_x, shift_y, method='fourier')
+        for i in range(2):
+            kernel_shifted = kernel_util.de_shift_kernel_fourier(kernels[i], shift_x[i], shift_y[i])
+            npt.assert_almost_equal(shifted_fourier[i] / np.max(kernels[i]), kernel_shifted / np.max(kernels[i]),
+                                    decimal=5)
+        with pytest.raises(ValueError):
+            workspace.shift(cutouts, shift_x, shift_y, method='wrong')
+        with pytest.raises(ValueError):
+            workspace.cutouts(image, 10)
+
 
 class TestPSFIterationOld(object):
     """